@@ -0,0 +1,40 @@
+"""add label language count
+
+Revision ID: 3d9b6f0a2c57
+Revises: c8e2d5f71b94
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d9b6f0a2c57"
+down_revision: Union[str, None] = "c8e2d5f71b94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track how many Wikidata languages use each label.
+
+    Existing labels count as one language until the next import updates them.
+    """
+    op.add_column(
+        "wikidata_entity_labels",
+        sa.Column(
+            "language_count",
+            sa.Integer(),
+            server_default=sa.text("1"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove the label language count."""
+    op.drop_column("wikidata_entity_labels", "language_count")
@@ -0,0 +1,69 @@
+"""add search index state and label updated_at index
+
+Revision ID: 6fb5e038e0d8
+Revises: 2b42a3abde91
+Create Date: 2026-10-18 21:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6fb5e038e0d8"
+down_revision: Union[str, None] = "2b42a3abde91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add search index watermark table and updated_at tracking for labels."""
+    op.create_table(
+        "search_index_state",
+        sa.Column("index_name", sa.String(), nullable=False),
+        sa.Column("indexed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("index_name"),
+    )
+
+    op.create_index(
+        "idx_wikidata_entity_labels_updated_at",
+        "wikidata_entity_labels",
+        ["updated_at"],
+        unique=False,
+    )
+
+    for table in ["search_index_state", "wikidata_entity_labels"]:
+        op.execute(f"""
+        CREATE TRIGGER trigger_update_{table}_updated_at
+        BEFORE UPDATE ON {table}
+        FOR EACH ROW
+        EXECUTE FUNCTION update_updated_at_column();
+        """)
+
+
+def downgrade() -> None:
+    """Remove search index watermark table and label updated_at tracking."""
+    for table in ["search_index_state", "wikidata_entity_labels"]:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trigger_update_{table}_updated_at ON {table}"
+        )
+
+    op.drop_index(
+        "idx_wikidata_entity_labels_updated_at", table_name="wikidata_entity_labels"
+    )
+    op.drop_table("search_index_state")
@@ -0,0 +1,64 @@
+"""add llm response cache
+
+Revision ID: 7b1e4c9a3d52
+Revises: 3d9b6f0a2c57
+Create Date: 2026-10-20 10:15:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e4c9a3d52"
+down_revision: Union[str, None] = "3d9b6f0a2c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add cache of parsed LLM responses."""
+    op.create_table(
+        "llm_responses",
+        sa.Column("request_hash", sa.String(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("hits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("request_hash"),
+    )
+    op.create_index(
+        "idx_llm_responses_updated_at", "llm_responses", ["updated_at"], unique=False
+    )
+
+    op.execute("""
+    CREATE TRIGGER trigger_update_llm_responses_updated_at
+    BEFORE UPDATE ON llm_responses
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Remove cache of parsed LLM responses."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_update_llm_responses_updated_at "
+        "ON llm_responses"
+    )
+    op.drop_index("idx_llm_responses_updated_at", table_name="llm_responses")
+    op.drop_table("llm_responses")
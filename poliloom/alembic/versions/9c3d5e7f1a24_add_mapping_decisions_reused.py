@@ -0,0 +1,34 @@
+"""add mapping decisions reused
+
+Revision ID: 9c3d5e7f1a24
+Revises: e4a8c2f61b07
+Create Date: 2026-10-27 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3d5e7f1a24"
+down_revision: Union[str, None] = "e4a8c2f61b07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Mark mapping decisions taken from earlier ones."""
+    op.add_column(
+        "mapping_decisions",
+        sa.Column(
+            "reused", sa.Boolean(), server_default=sa.text("false"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove the reused flag of mapping decisions."""
+    op.drop_column("mapping_decisions", "reused")
@@ -0,0 +1,60 @@
+"""add search embeddings
+
+Revision ID: a41c7e9d2f13
+Revises: 6fb5e038e0d8
+Create Date: 2026-10-18 22:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7e9d2f13"
+down_revision: Union[str, None] = "6fb5e038e0d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add embedding cache for search documents."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.create_table(
+        "search_embeddings",
+        sa.Column("text_hash", sa.String(), nullable=False),
+        sa.Column("embedding", Vector(1536), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("text_hash"),
+    )
+
+    op.execute("""
+    CREATE TRIGGER trigger_update_search_embeddings_updated_at
+    BEFORE UPDATE ON search_embeddings
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Remove embedding cache for search documents."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_update_search_embeddings_updated_at "
+        "ON search_embeddings"
+    )
+    op.drop_table("search_embeddings")
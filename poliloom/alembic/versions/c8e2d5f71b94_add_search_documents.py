@@ -0,0 +1,69 @@
+"""add search documents
+
+Revision ID: c8e2d5f71b94
+Revises: a41c7e9d2f13
+Create Date: 2026-10-18 23:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2d5f71b94"
+down_revision: Union[str, None] = "a41c7e9d2f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add searchable document table for the Postgres search backend."""
+    op.create_table(
+        "search_documents",
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("types", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("text_hash", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"], ["wikidata_entities.wikidata_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("entity_id"),
+    )
+    op.create_index(
+        "idx_search_documents_text_hash",
+        "search_documents",
+        ["text_hash"],
+        unique=False,
+    )
+
+    op.execute("""
+    CREATE TRIGGER trigger_update_search_documents_updated_at
+    BEFORE UPDATE ON search_documents
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Remove searchable document table for the Postgres search backend."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_update_search_documents_updated_at "
+        "ON search_documents"
+    )
+    op.drop_index("idx_search_documents_text_hash", table_name="search_documents")
+    op.drop_table("search_documents")
@@ -0,0 +1,87 @@
+"""add mapping decisions
+
+Revision ID: e4a8c2f61b07
+Revises: 7b1e4c9a3d52
+Create Date: 2026-10-24 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a8c2f61b07"
+down_revision: Union[str, None] = "7b1e4c9a3d52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add mapping decisions reused across politicians."""
+    op.create_table(
+        "mapping_decisions",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_type", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("country_id", sa.String(), nullable=True),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("politician_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"], ["wikidata_entities.wikidata_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["politician_id"], ["politicians.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_mapping_decisions_key",
+        "mapping_decisions",
+        ["entity_type", "name", "country_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_mapping_decisions_entity_id",
+        "mapping_decisions",
+        ["entity_id"],
+        unique=False,
+    )
+
+    op.execute("""
+    CREATE TRIGGER trigger_update_mapping_decisions_updated_at
+    BEFORE UPDATE ON mapping_decisions
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Remove mapping decisions."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_update_mapping_decisions_updated_at "
+        "ON mapping_decisions"
+    )
+    op.drop_index("idx_mapping_decisions_entity_id", table_name="mapping_decisions")
+    op.drop_index("idx_mapping_decisions_key", table_name="mapping_decisions")
+    op.drop_table("mapping_decisions")
@@ -5,6 +5,7 @@ Revises: 3111e43b8ec0
 Create Date: 2025-10-10 13:44:50.323094
 
 """
+
 from typing import Sequence, Union
 
 from alembic import op
@@ -12,8 +13,8 @@ import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
-revision: str = 'ed77bf57de13'
-down_revision: Union[str, None] = '3111e43b8ec0'
+revision: str = "ed77bf57de13"
+down_revision: Union[str, None] = "3111e43b8ec0"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -21,18 +22,45 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # 1. Create new table and indexes
-    op.create_table('wikidata_entity_labels',
-    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-    sa.Column('entity_id', sa.String(), nullable=False),
-    sa.Column('label', sa.Text(), nullable=False),
-    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-    sa.ForeignKeyConstraint(['entity_id'], ['wikidata_entities.wikidata_id'], ),
-    sa.PrimaryKeyConstraint('id')
+    op.create_table(
+        "wikidata_entity_labels",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("label", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"],
+            ["wikidata_entities.wikidata_id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_wikidata_entity_labels_entity_id",
+        "wikidata_entity_labels",
+        ["entity_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_wikidata_entity_labels_label_gin",
+        "wikidata_entity_labels",
+        ["label"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"label": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "uq_wikidata_entity_labels_entity_label",
+        "wikidata_entity_labels",
+        ["entity_id", "label"],
+        unique=True,
     )
-    op.create_index('idx_wikidata_entity_labels_entity_id', 'wikidata_entity_labels', ['entity_id'], unique=False)
-    op.create_index('idx_wikidata_entity_labels_label_gin', 'wikidata_entity_labels', ['label'], unique=False, postgresql_using='gin', postgresql_ops={'label': 'gin_trgm_ops'})
-    op.create_index('uq_wikidata_entity_labels_entity_label', 'wikidata_entity_labels', ['entity_id', 'label'], unique=True)
 
     # 2. Migrate data from array to separate table
     op.execute("""
@@ -48,13 +76,18 @@ def upgrade() -> None:
     """)
 
     # 4. Drop labels column
-    op.drop_column('wikidata_entities', 'labels')
+    op.drop_column("wikidata_entities", "labels")
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # 1. Recreate labels column
-    op.add_column('wikidata_entities', sa.Column('labels', postgresql.ARRAY(sa.TEXT()), autoincrement=False, nullable=True))
+    op.add_column(
+        "wikidata_entities",
+        sa.Column(
+            "labels", postgresql.ARRAY(sa.TEXT()), autoincrement=False, nullable=True
+        ),
+    )
 
     # 2. Migrate data back to array
     op.execute("""
@@ -69,7 +102,16 @@ def downgrade() -> None:
     """)
 
     # 3. Drop new table and indexes
-    op.drop_index('uq_wikidata_entity_labels_entity_label', table_name='wikidata_entity_labels')
-    op.drop_index('idx_wikidata_entity_labels_label_gin', table_name='wikidata_entity_labels', postgresql_using='gin', postgresql_ops={'label': 'gin_trgm_ops'})
-    op.drop_index('idx_wikidata_entity_labels_entity_id', table_name='wikidata_entity_labels')
-    op.drop_table('wikidata_entity_labels')
+    op.drop_index(
+        "uq_wikidata_entity_labels_entity_label", table_name="wikidata_entity_labels"
+    )
+    op.drop_index(
+        "idx_wikidata_entity_labels_label_gin",
+        table_name="wikidata_entity_labels",
+        postgresql_using="gin",
+        postgresql_ops={"label": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "idx_wikidata_entity_labels_entity_id", table_name="wikidata_entity_labels"
+    )
+    op.drop_table("wikidata_entity_labels")
@@ -3,7 +3,13 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from ..llm import close_openai_client
 from ..logging import setup_logging
+from ..search import (
+    close_async_search_client,
+    get_async_search_client,
+    search_cache,
+)
 from ..sse import event_bus
 from .politicians import router as politicians_router
 from .sources import router as sources_router
@@ -19,7 +25,15 @@ setup_logging()
 async def lifespan(app: FastAPI):
     ready = event_bus.start()
     await ready.wait()
+    # Drop cached search results when another process changes the index
+    event_bus.add_handler(search_cache.handle_event)
+    # Shared pooled search client for all requests and enrichment tasks
+    get_async_search_client()
     yield
+    # Governed OpenAI client shared by enrichment tasks, created on first use
+    await close_openai_client()
+    await close_async_search_client()
+    event_bus.remove_handler(search_cache.handle_event)
     await event_bus.stop()
 
 
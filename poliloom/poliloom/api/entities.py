@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select, func, and_, case
 
 from ..database import get_db_session
-from ..search import SearchService
+from ..search import AsyncSearchClient, get_search_client
 from ..models import (
     Language,
     Country,
@@ -172,12 +172,12 @@ async def search_entities(
     limit: int = Query(default=50, le=100, description="Maximum number of results"),
     db: Session = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
+    search_client: AsyncSearchClient = Depends(get_search_client),
 ):
     """Search entities by name/label using semantic similarity."""
     model_class = ENTITY_TYPE_MODELS[type]
 
-    search_service = SearchService()
-    entity_ids = model_class.find_similar(q, search_service, limit=limit)
+    entity_ids = await model_class.find_similar(q, search_client, limit=limit)
     if not entity_ids:
         return []
 
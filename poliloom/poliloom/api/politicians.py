@@ -10,8 +10,12 @@ from sqlalchemy import and_, case, exists, func, or_, select
 from sqlalchemy.orm import Session, selectinload
 
 from ..database import get_db_session
-from ..scheduling import process_source_task, process_next_politician
-from ..search import SearchService
+from ..scheduling import (
+    process_next_politician,
+    process_source_task,
+    unchanged_wikipedia_urls,
+)
+from ..search import AsyncSearchClient, get_search_client
 from ..models import (
     Source,
     SourceLanguage,
@@ -264,14 +268,14 @@ async def search_politicians(
     ),
     db: Session = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
+    search_client: AsyncSearchClient = Depends(get_search_client),
 ):
     """
     Search politicians by name/label using semantic similarity.
 
     Returns matching politicians ranked by relevance with their properties.
     """
-    search_service = SearchService()
-    entity_ids = Politician.find_similar(q, search_service, limit=limit)
+    entity_ids = await Politician.find_similar(q, search_client, limit=limit)
     if not entity_ids:
         return []
 
@@ -372,7 +376,9 @@ async def get_politician(
 
     new_sources = []
     if politician.needs_enrichment:
-        new_sources = politician.schedule_enrichment(db)
+        new_sources = politician.schedule_enrichment(
+            db, skip_urls=await unchanged_wikipedia_urls(db, politician)
+        )
 
     response = build_politician_response(politician)
 
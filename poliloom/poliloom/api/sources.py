@@ -55,7 +55,7 @@ async def get_source_html(
         )
 
     try:
-        content = read_archived_content(source.path_root, "html")
+        content = await read_archived_content(source.path_root, "html")
         return HTMLResponse(content=content, media_type="text/html")
     except FileNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -12,6 +12,7 @@ from ..database import get_db_session
 from ..models import Evaluation, Politician, Property, PropertyReference
 from ..models.base import PropertyType
 from ..models.wikidata import WikidataEntity
+from ..search import search_cache
 from .auth import User, get_current_user
 
 router = APIRouter()
@@ -23,6 +24,27 @@ class EvaluationCountResponse(BaseModel):
     total: int
 
 
+class SearchCacheStatsResponse(BaseModel):
+    """Response schema for search cache metrics of one API worker."""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int
+    max_entries: int
+    invalidations: int
+
+
+@router.get("/search-cache", response_model=SearchCacheStatsResponse)
+async def get_search_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get hit-rate metrics of the search result cache of the worker serving the request.
+    """
+    return SearchCacheStatsResponse(**search_cache.stats())
+
+
 @router.get("/count", response_model=EvaluationCountResponse)
 async def get_evaluation_count(
     db: Session = Depends(get_db_session),
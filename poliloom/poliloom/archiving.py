@@ -1,24 +1,23 @@
 """Archiving: page fetching, storage, and source processing pipeline."""
 
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Awaitable, List, Optional
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 from sqlalchemy.orm import Session
-from unmhtml import MHTMLConverter
 
 from . import __version__, __repo_url__
-from .enrichment import extract_and_store
+from .enrichment import SourceDocument, extract_and_store, extract_and_store_sources
 from .models import (
     Source,
     SourceError,
     SourceStatus,
     Politician,
 )
+from .segmenter import extract_main_text, segment_html
 from .storage import StorageFactory
 
 logger = logging.getLogger(__name__)
@@ -57,6 +56,8 @@ def convert_mhtml_to_html(mhtml_content: Optional[str]) -> Optional[str]:
     if not mhtml_content:
         return None
 
+    from unmhtml import MHTMLConverter
+
     try:
         converter = MHTMLConverter()
         return converter.convert(mhtml_content)
@@ -83,6 +84,7 @@ async def fetch_page(url: str) -> FetchedPage:
     from playwright.async_api import (
         TimeoutError as PlaywrightTimeoutError,
         Error as PlaywrightError,
+        async_playwright,
     )
 
     async with async_playwright() as p:
@@ -139,7 +141,7 @@ async def fetch_page(url: str) -> FetchedPage:
 # --- Archived content storage ---
 
 
-def read_archived_content(path_root: str, extension: str) -> str:
+async def read_archived_content(path_root: str, extension: str) -> str:
     """Read content for a source.
 
     Args:
@@ -157,14 +159,13 @@ def read_archived_content(path_root: str, extension: str) -> str:
     file_path = os.path.join(archive_root, f"{path_root}.{extension}")
 
     backend = StorageFactory.get_backend(file_path)
-    if not backend.exists(file_path):
+    if not await backend.aexists(file_path):
         raise FileNotFoundError(f"Archived file not found: {file_path}")
 
-    with backend.open(file_path, "r") as f:
-        return f.read()
+    return await backend.aread(file_path, "r")
 
 
-def save_archived_content(
+async def save_archived_content(
     path_root: str,
     extension: str,
     content: str,
@@ -184,8 +185,7 @@ def save_archived_content(
     file_path = os.path.join(archive_root, f"{path_root}.{extension}")
 
     backend = StorageFactory.get_backend(file_path)
-    with backend.open(file_path, "w") as f:
-        f.write(content)
+    await backend.awrite(file_path, content)
 
     return file_path
 
@@ -207,6 +207,8 @@ def extract_permanent_url(html_content: str) -> Optional[str]:
         The permanent URL with oldid (e.g., "https://en.wikipedia.org/w/index.php?title=Page&oldid=123456789"),
         or None if not found
     """
+    from bs4 import BeautifulSoup
+
     try:
         soup = BeautifulSoup(html_content, "html.parser")
         permalink_element = soup.find(id="t-permalink")
@@ -229,18 +231,28 @@ def extract_permanent_url(html_content: str) -> Optional[str]:
         return None
 
 
-async def process_source(db: Session, source: Source, politician: Politician) -> int:
-    """Fetch, archive, and extract properties from a source.
+async def archive_source(
+    db: Session,
+    source: Source,
+    page_fetch: Optional[Awaitable[FetchedPage]] = None,
+) -> Optional[SourceDocument]:
+    """Fetch and archive a source and read the text to extract from.
 
-    Handles status transitions and error recording on the source.
-    Caller is responsible for providing the session and loading entities.
+    Fetch errors and pages without content are recorded on the source, which
+    is then done.
+
+    Args:
+        db: Database session
+        source: Source to archive
+        page_fetch: Fetch of the page already under way, e.g. alongside other
+            sources. Defaults to fetching the page now.
 
     Returns:
-        Number of properties extracted (0 on error or empty content).
+        The source's text, or None if there is nothing to extract from.
     """
     try:
         # Fetch & archive
-        fetched = await fetch_page(source.url)
+        fetched = await (page_fetch or fetch_page(source.url))
         now = datetime.now(timezone.utc)
 
         if source.wikipedia_project_id and fetched.html:
@@ -257,36 +269,31 @@ async def process_source(db: Session, source: Source, politician: Politician) ->
         db.flush()
 
         if fetched.mhtml:
-            path = save_archived_content(source.path_root, "mhtml", fetched.mhtml)
+            path = await save_archived_content(source.path_root, "mhtml", fetched.mhtml)
             logger.info(f"Saved MHTML archive: {path}")
         if fetched.html:
-            path = save_archived_content(source.path_root, "html", fetched.html)
+            path = await save_archived_content(source.path_root, "html", fetched.html)
             logger.info(f"Saved HTML: {path}")
         db.commit()
 
         # Read content and extract text
-        html_content = read_archived_content(source.path_root, "html")
+        html_content = await read_archived_content(source.path_root, "html")
         if not html_content:
             source.status = SourceStatus.DONE
             source.error = SourceError.INVALID_CONTENT
             db.commit()
-            return 0
-        soup = BeautifulSoup(html_content, "html.parser")
-        text = soup.get_text(separator=" ")
-        content = " ".join(text.split())
+            return None
+        content = extract_main_text(html_content)
         if not content.strip():
             source.status = SourceStatus.DONE
             source.error = SourceError.INVALID_CONTENT
             db.commit()
-            return 0
-
-        # Extract and store properties
-        count = await extract_and_store(db, content, politician, source)
-
-        source.status = SourceStatus.DONE
-        db.commit()
+            return None
 
-        return count
+        # Wikipedia articles are split into sections, so each extraction
+        # only gets the parts it needs
+        page = segment_html(html_content) if source.wikipedia_project_id else None
+        return SourceDocument(source=source, content=content, page=page)
 
     except PageFetchError as e:
         logger.error(f"Fetch error for source {source.id}: {e}")
@@ -295,10 +302,88 @@ async def process_source(db: Session, source: Source, politician: Politician) ->
         if e.http_status_code is not None:
             source.http_status_code = e.http_status_code
         db.commit()
+        return None
+    except Exception as e:
+        logger.error(f"Pipeline error for source {source.id}: {e}")
+        source.status = SourceStatus.DONE
+        source.error = SourceError.PIPELINE_ERROR
+        db.commit()
+        return None
+
+
+async def process_source(db: Session, source: Source, politician: Politician) -> int:
+    """Fetch, archive, and extract properties from a source.
+
+    Handles status transitions and error recording on the source.
+    Caller is responsible for providing the session and loading entities.
+
+    Returns:
+        Number of properties extracted (0 on error or empty content).
+    """
+    document = await archive_source(db, source)
+    if document is None:
         return 0
+
+    try:
+        count = await extract_and_store(
+            db, document.content, politician, source, page=document.page
+        )
+
+        source.status = SourceStatus.DONE
+        db.commit()
+
+        return count
+
     except Exception as e:
         logger.error(f"Pipeline error for source {source.id}: {e}")
         source.status = SourceStatus.DONE
         source.error = SourceError.PIPELINE_ERROR
         db.commit()
         return 0
+
+
+async def process_sources(
+    db: Session, sources: List[Source], politician: Politician
+) -> int:
+    """Fetch and archive several sources and extract properties from them together.
+
+    Consolidated counterpart of process_source: the sources are fetched
+    concurrently, then archived one after the other, so only one of them
+    uses the session at a time, and extracted in a single pass, so facts
+    they share are only extracted and mapped once.
+
+    Args:
+        db: Database session
+        sources: Sources to process, the primary article first
+        politician: Politician to extract properties for
+
+    Returns:
+        Number of properties extracted (0 on error or empty content).
+    """
+    page_fetches = [asyncio.ensure_future(fetch_page(source.url)) for source in sources]
+    documents = []
+    for source, page_fetch in zip(sources, page_fetches):
+        document = await archive_source(db, source, page_fetch)
+        if document is not None:
+            documents.append(document)
+    if not documents:
+        return 0
+
+    try:
+        count = await extract_and_store_sources(db, documents, politician)
+
+        for document in documents:
+            document.source.status = SourceStatus.DONE
+        db.commit()
+
+        return count
+
+    except Exception as e:
+        logger.error(
+            f"Pipeline error for sources {[str(d.source.id) for d in documents]}: {e}"
+        )
+        for document in documents:
+            document.source.status = SourceStatus.DONE
+            document.source.error = SourceError.PIPELINE_ERROR
+        db.commit()
+        return 0
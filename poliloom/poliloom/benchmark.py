@@ -0,0 +1,1042 @@
+"""Synthetic Wikidata dumps, import benchmarks and search benchmarks.
+
+Generates deterministic dump files shaped like the real Wikidata JSON dump
+(one entity per line inside a JSON array) and times the import pipeline
+against them, so importer changes can be measured without the full dump.
+Search backends are compared on a fixed query set for latency and recall,
+and LLM extraction modes on archived sources for tokens and latency.
+"""
+
+import asyncio
+import logging
+import multiprocessing as mp
+import random
+import resource
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from .models import Politician
+    from .search import SearchBackend
+    from .segmenter import SegmentedPage
+
+logger = logging.getLogger(__name__)
+
+# Real Wikidata QIDs the importers and model hierarchies key on
+HUMAN = "Q5"
+POLITICIAN_OCCUPATION = "Q82955"
+POSITION_ROOT = "Q4164871"
+SETTLEMENT_ROOT = "Q486972"
+ADMIN_ENTITY_ROOT = "Q56061"
+COUNTRY_ROOT = "Q6256"
+LANGUAGE_ROOT = "Q34770"
+WIKIPEDIA_EDITION = "Q10876391"
+UNRELATED_CLASS = "Q13442814"  # scholarly article
+
+ROOT_LABELS = {
+    HUMAN: "human",
+    POLITICIAN_OCCUPATION: "politician",
+    POSITION_ROOT: "position",
+    SETTLEMENT_ROOT: "human settlement",
+    ADMIN_ENTITY_ROOT: "administrative territorial entity",
+    COUNTRY_ROOT: "country",
+    LANGUAGE_ROOT: "language",
+    WIKIPEDIA_EDITION: "Wikipedia language edition",
+    UNRELATED_CLASS: "scholarly article",
+}
+
+# Languages with Wikipedia editions, in rough popularity order
+WIKI_LANGUAGES = [
+    "en", "de", "fr", "es", "it", "ru", "pt", "pl", "nl", "sv",
+    "uk", "ja", "zh", "ar", "fa", "tr", "cs", "ko", "fi", "hu",
+]  # fmt: skip
+
+# Synthetic entities are numbered well above real QIDs to stay recognizable
+SYNTHETIC_QID_BASE = 900_000_000
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ra", "ten", "vo", "shi", "an", "bel", "dor",
+    "es", "fu", "gar", "hol", "in", "jo", "kur", "le", "mar", "nu",
+]  # fmt: skip
+
+
+@dataclass
+class SyntheticDumpConfig:
+    """Shape of a synthetic dump."""
+
+    politicians: int = 10000
+    positions: int = 2000
+    locations: int = 5000
+    countries: int = 50
+    position_classes: int = 100
+    location_classes: int = 40
+    # Entities that match no importer, as most of the real dump does
+    unrelated_entities: int = 20000
+    # Share of politicians generated as very large entities
+    heavy_fraction: float = 0.01
+    heavy_labels: int = 300
+    heavy_positions: int = 200
+    seed: int = 42
+
+
+@dataclass
+class SyntheticDumpStats:
+    """Counts of what a synthetic dump contains."""
+
+    entities: int = 0
+    politicians: int = 0
+    heavy_politicians: int = 0
+    bytes: int = 0
+
+
+class _Generator:
+    """Builds synthetic entities from a seeded random source."""
+
+    def __init__(self, config: SyntheticDumpConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.next_qid = SYNTHETIC_QID_BASE
+        self.statement_count = 0
+
+    def qid(self) -> str:
+        self.next_qid += 1
+        return f"Q{self.next_qid}"
+
+    def name(self, parts: int = 2) -> str:
+        return " ".join(
+            "".join(self.rng.choices(SYLLABLES, k=self.rng.randint(2, 3))).title()
+            for _ in range(parts)
+        )
+
+    def labels(self, value: str, languages: list[str]) -> dict:
+        return {lang: {"language": lang, "value": value} for lang in languages}
+
+    def time_value(self, year: int) -> dict:
+        month = self.rng.randint(1, 12)
+        day = self.rng.randint(1, 28)
+        return {
+            "type": "time",
+            "value": {
+                "time": f"+{year:04d}-{month:02d}-{day:02d}T00:00:00Z",
+                "timezone": 0,
+                "before": 0,
+                "after": 0,
+                "precision": 11,
+                "calendarmodel": "http://www.wikidata.org/entity/Q1985727",
+            },
+        }
+
+    def claim(
+        self,
+        entity_id: str,
+        property_id: str,
+        datavalue: dict,
+        qualifiers: Optional[dict] = None,
+        references: Optional[list] = None,
+    ) -> dict:
+        self.statement_count += 1
+        claim = {
+            "mainsnak": {
+                "snaktype": "value",
+                "property": property_id,
+                "datavalue": datavalue,
+            },
+            "type": "statement",
+            "id": f"{entity_id}$S{self.statement_count:010d}",
+            "rank": "normal",
+        }
+        if qualifiers:
+            claim["qualifiers"] = qualifiers
+        if references:
+            claim["references"] = references
+        return claim
+
+    def item_claim(self, entity_id: str, property_id: str, target: str, **kwargs):
+        return self.claim(
+            entity_id,
+            property_id,
+            {"type": "wikibase-entityid", "value": {"id": target}},
+            **kwargs,
+        )
+
+    def string_claim(self, entity_id: str, property_id: str, value: str):
+        return self.claim(entity_id, property_id, {"type": "string", "value": value})
+
+    def reference(self) -> list:
+        return [
+            {
+                "hash": f"{self.rng.getrandbits(64):016x}",
+                "snaks": {
+                    "P854": [
+                        {
+                            "snaktype": "value",
+                            "property": "P854",
+                            "datavalue": {
+                                "type": "string",
+                                "value": f"https://example.org/{self.rng.getrandbits(32):08x}",
+                            },
+                        }
+                    ]
+                },
+            }
+        ]
+
+    def term_qualifiers(self, start_year: int) -> dict:
+        end_year = start_year + self.rng.randint(1, 8)
+        return {
+            "P580": [
+                {
+                    "snaktype": "value",
+                    "property": "P580",
+                    "datavalue": self.time_value(start_year),
+                }
+            ],
+            "P582": [
+                {
+                    "snaktype": "value",
+                    "property": "P582",
+                    "datavalue": self.time_value(end_year),
+                }
+            ],
+        }
+
+    def entity(
+        self,
+        entity_id: str,
+        label: str,
+        claims: list[dict],
+        languages: Optional[list[str]] = None,
+        description: Optional[str] = None,
+        sitelinks: Optional[dict] = None,
+    ) -> dict:
+        grouped: dict[str, list] = {}
+        for claim in claims:
+            grouped.setdefault(claim["mainsnak"]["property"], []).append(claim)
+        languages = languages or ["en"]
+        entity = {
+            "type": "item",
+            "id": entity_id,
+            "labels": self.labels(label, languages),
+            "descriptions": (
+                {"en": {"language": "en", "value": description}} if description else {}
+            ),
+            "claims": grouped,
+            "sitelinks": sitelinks or {},
+        }
+        return entity
+
+    def class_tree(self, roots: list[str], count: int, noun: str) -> list[dict]:
+        """Subclass hierarchy below the given roots, several levels deep."""
+        classes = []
+        parents = list(roots)
+        for _ in range(count):
+            class_id = self.qid()
+            parent = self.rng.choice(parents)
+            classes.append(
+                self.entity(
+                    class_id,
+                    f"{self.name(1)} {noun}",
+                    [self.item_claim(class_id, "P279", parent)],
+                )
+            )
+            parents.append(class_id)
+        return classes
+
+    def generate(self) -> Iterator[dict]:
+        config = self.config
+        rng = self.rng
+
+        for qid, label in ROOT_LABELS.items():
+            yield self.entity(qid, label, [])
+
+        languages = []
+        for code in WIKI_LANGUAGES:
+            language_id = self.qid()
+            languages.append((language_id, code))
+            yield self.entity(
+                language_id,
+                f"{code} language",
+                [
+                    self.item_claim(language_id, "P31", LANGUAGE_ROOT),
+                    self.string_claim(language_id, "P424", code),
+                ],
+            )
+
+        for language_id, code in languages:
+            project_id = self.qid()
+            yield self.entity(
+                project_id,
+                f"{code} Wikipedia",
+                [
+                    self.item_claim(project_id, "P31", WIKIPEDIA_EDITION),
+                    self.item_claim(project_id, "P407", language_id),
+                    self.claim(
+                        project_id,
+                        "P856",
+                        {"type": "string", "value": f"https://{code}.wikipedia.org/"},
+                    ),
+                ],
+            )
+
+        countries = []
+        for i in range(config.countries):
+            country_id = self.qid()
+            countries.append(country_id)
+            language_id, _ = rng.choice(languages)
+            iso = chr(65 + i // 26 % 26) + chr(65 + i % 26)
+            yield self.entity(
+                country_id,
+                self.name(1),
+                [
+                    self.item_claim(country_id, "P31", COUNTRY_ROOT),
+                    self.string_claim(country_id, "P297", iso),
+                    self.item_claim(country_id, "P37", language_id),
+                ],
+                languages=WIKI_LANGUAGES[:10],
+            )
+
+        position_classes = [POSITION_ROOT]
+        for entity in self.class_tree(
+            [POSITION_ROOT], config.position_classes, "office"
+        ):
+            position_classes.append(entity["id"])
+            yield entity
+
+        location_classes = [SETTLEMENT_ROOT, ADMIN_ENTITY_ROOT]
+        for entity in self.class_tree(
+            [SETTLEMENT_ROOT, ADMIN_ENTITY_ROOT], config.location_classes, "place"
+        ):
+            location_classes.append(entity["id"])
+            yield entity
+
+        locations = []
+        for _ in range(config.locations):
+            location_id = self.qid()
+            claims = [
+                self.item_claim(location_id, "P31", rng.choice(location_classes)),
+                self.item_claim(location_id, "P17", rng.choice(countries)),
+            ]
+            if locations:
+                claims.append(
+                    self.item_claim(location_id, "P131", rng.choice(locations))
+                )
+            locations.append(location_id)
+            yield self.entity(
+                location_id,
+                self.name(1),
+                claims,
+                languages=rng.sample(WIKI_LANGUAGES, rng.randint(1, 6)),
+            )
+
+        positions = []
+        for _ in range(config.positions):
+            position_id = self.qid()
+            positions.append(position_id)
+            yield self.entity(
+                position_id,
+                f"Minister of {self.name(1)}",
+                [
+                    self.item_claim(position_id, "P31", rng.choice(position_classes)),
+                    self.item_claim(
+                        position_id, "P1001", rng.choice(countries + locations[:100])
+                    ),
+                ],
+                languages=rng.sample(WIKI_LANGUAGES, rng.randint(1, 4)),
+            )
+
+        # Interleave politicians and unrelated entities like the real dump
+        kinds = ["politician"] * config.politicians + [
+            "unrelated"
+        ] * config.unrelated_entities
+        rng.shuffle(kinds)
+        for kind in kinds:
+            if kind == "unrelated":
+                entity_id = self.qid()
+                yield self.entity(
+                    entity_id,
+                    self.name(3),
+                    [self.item_claim(entity_id, "P31", UNRELATED_CLASS)],
+                )
+            else:
+                heavy = rng.random() < config.heavy_fraction
+                yield self.politician(positions, locations, countries, heavy)
+
+    def politician(
+        self,
+        positions: list[str],
+        locations: list[str],
+        countries: list[str],
+        heavy: bool,
+    ) -> dict:
+        config = self.config
+        rng = self.rng
+        politician_id = self.qid()
+        birth_year = rng.randint(1940, 2000)
+
+        claims = [
+            self.item_claim(politician_id, "P31", HUMAN),
+            self.item_claim(politician_id, "P106", POLITICIAN_OCCUPATION),
+            self.claim(
+                politician_id,
+                "P569",
+                self.time_value(birth_year),
+                references=self.reference(),
+            ),
+            self.item_claim(
+                politician_id, "P19", rng.choice(locations), references=self.reference()
+            ),
+        ]
+        for country in rng.sample(countries, rng.randint(1, 2)):
+            claims.append(self.item_claim(politician_id, "P27", country))
+
+        num_positions = (
+            config.heavy_positions if heavy else rng.choices([0, 1, 2, 3, 5], k=1)[0]
+        )
+        for _ in range(num_positions):
+            claims.append(
+                self.item_claim(
+                    politician_id,
+                    "P39",
+                    rng.choice(positions),
+                    qualifiers=self.term_qualifiers(
+                        rng.randint(birth_year + 25, birth_year + 60)
+                    ),
+                    references=self.reference(),
+                )
+            )
+
+        if heavy:
+            languages = WIKI_LANGUAGES + [
+                f"x{i}" for i in range(config.heavy_labels - len(WIKI_LANGUAGES))
+            ]
+            wikis = WIKI_LANGUAGES
+        else:
+            languages = rng.sample(WIKI_LANGUAGES, rng.randint(1, 5))
+            wikis = languages[: rng.randint(0, len(languages))]
+
+        name = self.name(2)
+        sitelinks = {
+            f"{code}wiki": {"site": f"{code}wiki", "title": name, "badges": []}
+            for code in wikis
+        }
+        entity = self.entity(
+            politician_id,
+            name,
+            claims,
+            languages=languages,
+            description="politician",
+            sitelinks=sitelinks,
+        )
+        if heavy:
+            # Distinct transliterations, so every label survives deduplication
+            for i, label in enumerate(entity["labels"].values()):
+                label["value"] = f"{name} {i}" if i else name
+        return entity
+
+
+def generate_synthetic_dump(
+    path: str, config: Optional[SyntheticDumpConfig] = None
+) -> SyntheticDumpStats:
+    """Write a deterministic synthetic Wikidata dump.
+
+    The same config (including seed) always produces a byte-identical file.
+
+    Args:
+        path: Local path of the JSON dump to write
+        config: Dump shape, defaults to SyntheticDumpConfig()
+
+    Returns:
+        SyntheticDumpStats describing the written dump
+    """
+    config = config or SyntheticDumpConfig()
+    generator = _Generator(config)
+    stats = SyntheticDumpStats()
+
+    with open(path, "wb") as f:
+        f.write(b"[\n")
+        first = True
+        for entity in generator.generate():
+            if not first:
+                f.write(b",\n")
+            f.write(orjson.dumps(entity))
+            first = False
+
+            stats.entities += 1
+            if HUMAN in _instance_ids(entity):
+                stats.politicians += 1
+                if len(entity["labels"]) >= config.heavy_labels:
+                    stats.heavy_politicians += 1
+        f.write(b"\n]\n")
+        stats.bytes = f.tell()
+
+    return stats
+
+
+def _instance_ids(entity: dict) -> set[str]:
+    return {
+        claim["mainsnak"]["datavalue"]["value"]["id"]
+        for claim in entity["claims"].get("P31", [])
+    }
+
+
+@dataclass
+class StageResult:
+    """Timing of one import stage."""
+
+    name: str
+    entities: int
+    seconds: float
+    db_seconds: float
+    workers: int
+    # Peak RSS of the stage's own process and of its largest pool worker, in
+    # megabytes; every stage runs in a fresh process, so peaks are per stage
+    peak_rss_mb: float
+    peak_worker_rss_mb: float
+
+    @property
+    def entities_per_second(self) -> float:
+        return self.entities / self.seconds if self.seconds else 0.0
+
+    @property
+    def db_share(self) -> float:
+        """Share of worker wall time spent waiting on database statements."""
+        worker_seconds = self.seconds * self.workers
+        return min(self.db_seconds / worker_seconds, 1.0) if worker_seconds else 0.0
+
+
+class DatabaseTimer:
+    """Accumulates time spent executing SQL across forked worker processes.
+
+    Listeners are registered on the Engine class, so they apply to the
+    per-worker engines the importers create after fork. The total lives in
+    shared memory allocated before the pool is created.
+    """
+
+    def __init__(self):
+        self.total = mp.Value("d", 0.0)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("benchmark_query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["benchmark_query_start"].pop()
+        with self.total.get_lock():
+            self.total.value += elapsed
+
+    def __enter__(self) -> "DatabaseTimer":
+        event.listen(Engine, "before_cursor_execute", self._before)
+        event.listen(Engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before)
+        event.remove(Engine, "after_cursor_execute", self._after)
+
+    def reset(self) -> None:
+        with self.total.get_lock():
+            self.total.value = 0.0
+
+    @property
+    def seconds(self) -> float:
+        return self.total.value
+
+
+def _peak_rss_mb(who: int) -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+def _run_stage(
+    connection,
+    import_function: Callable,
+    dump_path: str,
+    batch_size: int,
+    workers: int,
+) -> None:
+    """Run one import stage in a child process and send back its peaks.
+
+    ru_maxrss is a lifetime high-water mark, so measuring in a fresh process
+    keeps earlier stages from inflating the peaks of later ones.
+    """
+    try:
+        import_function(dump_path, batch_size=batch_size, num_workers=workers)
+        connection.send(
+            (
+                None,
+                _peak_rss_mb(resource.RUSAGE_SELF),
+                _peak_rss_mb(resource.RUSAGE_CHILDREN),
+            )
+        )
+    except BaseException as e:
+        connection.send((repr(e), 0.0, 0.0))
+    finally:
+        connection.close()
+
+
+def run_import_benchmark(
+    dump_path: str,
+    entities: int,
+    batch_size: int = 1000,
+    stages: Optional[list[tuple[str, Callable]]] = None,
+    workers: Optional[int] = None,
+) -> list[StageResult]:
+    """Run the dump import stages against the configured database and time them.
+
+    Each stage runs in its own process, so peak RSS is measured per stage.
+
+    Args:
+        dump_path: Path to the dump file to import
+        entities: Number of entities in the dump, for throughput
+        batch_size: Database batch size passed to every stage
+        stages: (name, import function) pairs, defaulting to the three
+            import stages in pipeline order. Functions take the dump path,
+            batch_size and num_workers.
+        workers: Pool size passed to every stage (default: CPU count)
+
+    Returns:
+        One StageResult per stage
+
+    Raises:
+        RuntimeError: If a stage fails
+    """
+    workers = workers or mp.cpu_count()
+    if stages is None:
+        from .importer.entity import import_entities
+        from .importer.hierarchy import import_hierarchy_trees
+        from .importer.politician import import_politicians
+
+        stages = [
+            ("import-hierarchy", import_hierarchy_trees),
+            ("import-entities", import_entities),
+            ("import-politicians", import_politicians),
+        ]
+
+    results = []
+    with DatabaseTimer() as timer:
+        for name, import_function in stages:
+            logger.info(f"Benchmarking {name} on {dump_path}")
+            timer.reset()
+            receiver, sender = mp.Pipe(duplex=False)
+            process = mp.Process(
+                target=_run_stage,
+                args=(sender, import_function, dump_path, batch_size, workers),
+            )
+            start = time.perf_counter()
+            process.start()
+            sender.close()
+            error, peak_rss_mb, peak_worker_rss_mb = receiver.recv()
+            process.join()
+            seconds = time.perf_counter() - start
+            if error is not None:
+                raise RuntimeError(f"Stage {name} failed: {error}")
+
+            results.append(
+                StageResult(
+                    name=name,
+                    entities=entities,
+                    seconds=seconds,
+                    db_seconds=timer.seconds,
+                    workers=workers,
+                    peak_rss_mb=peak_rss_mb,
+                    peak_worker_rss_mb=peak_worker_rss_mb,
+                )
+            )
+    return results
+
+
+@dataclass
+class SearchQuery:
+    """One query of a search benchmark query set."""
+
+    text: str
+    entity_type: Optional[str] = None
+
+
+def load_search_queries(path: str) -> list[SearchQuery]:
+    """Load a query set with one query per line.
+
+    Lines are either `query` or `EntityType<TAB>query`; blank lines and lines
+    starting with # are skipped.
+    """
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            if "\t" in line:
+                entity_type, text = line.split("\t", 1)
+                queries.append(SearchQuery(text=text, entity_type=entity_type))
+            else:
+                queries.append(SearchQuery(text=line))
+    return queries
+
+
+def sample_search_queries(session: "Session", per_type: int = 50) -> list[SearchQuery]:
+    """Pick a deterministic query set of labels for each searchable type.
+
+    Labels are ordered by a hash of entity and label, so the same database
+    always yields the same queries.
+    """
+    from sqlalchemy import func, select
+
+    from .models import WikidataEntityLabel, WikidataEntityMixin
+
+    queries = []
+    for model in WikidataEntityMixin.__subclasses__():
+        if not model._search_indexed:
+            continue
+        labels = session.execute(
+            select(WikidataEntityLabel.label)
+            .join(model, model.wikidata_id == WikidataEntityLabel.entity_id)
+            .order_by(
+                func.md5(WikidataEntityLabel.entity_id + WikidataEntityLabel.label)
+            )
+            .limit(per_type)
+        ).scalars()
+        queries.extend(
+            SearchQuery(text=label, entity_type=model.__name__) for label in labels
+        )
+    return queries
+
+
+def _percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+
+@dataclass
+class SearchBenchmarkResult:
+    """Latency and recall of one search backend on a query set."""
+
+    backend: str
+    latencies_ms: list[float]
+    # Mean share of the reference backend's results also returned, or None
+    # for the reference itself
+    recall: Optional[float]
+
+    def percentile(self, p: float) -> float:
+        return _percentile(self.latencies_ms, p)
+
+    @property
+    def p50_ms(self) -> float:
+        return self.percentile(0.5)
+
+    @property
+    def p95_ms(self) -> float:
+        return self.percentile(0.95)
+
+
+def run_search_benchmark(
+    backends: dict[str, "SearchBackend"],
+    queries: list[SearchQuery],
+    reference: str,
+    limit: int = 10,
+    semantic_ratio: float = 0.0,
+) -> list[SearchBenchmarkResult]:
+    """Run a query set against several search backends.
+
+    Recall is measured against the reference backend: for each query with
+    reference results, the share of the reference's top `limit` IDs that the
+    backend also returned in its top `limit`.
+
+    Args:
+        backends: Backends by display name
+        queries: Query set, run in order against every backend
+        reference: Name of the backend whose results count as ground truth
+        limit: Number of results requested per query
+        semantic_ratio: Hybrid search ratio passed to every backend
+
+    Returns:
+        One result per backend, in the order given
+    """
+    results_by_backend: dict[str, list[list[str]]] = {}
+    latencies: dict[str, list[float]] = {}
+    for name, backend in backends.items():
+        logger.info(f"Benchmarking search backend {name} on {len(queries)} queries")
+        results_by_backend[name] = []
+        latencies[name] = []
+        for query in queries:
+            start = time.perf_counter()
+            ids = backend.search(
+                query.text,
+                entity_type=query.entity_type,
+                limit=limit,
+                semantic_ratio=semantic_ratio,
+            )
+            latencies[name].append((time.perf_counter() - start) * 1000)
+            results_by_backend[name].append(ids)
+
+    expected = results_by_backend[reference]
+    results = []
+    for name in backends:
+        recall = None
+        if name != reference:
+            recalls = [
+                len(set(got) & set(want)) / len(want)
+                for got, want in zip(results_by_backend[name], expected)
+                if want
+            ]
+            recall = sum(recalls) / len(recalls) if recalls else 0.0
+        results.append(
+            SearchBenchmarkResult(
+                backend=name, latencies_ms=latencies[name], recall=recall
+            )
+        )
+    return results
+
+
+@dataclass
+class ExtractionBenchmarkResult:
+    """Token usage and latency of one extraction mode on a set of sources."""
+
+    mode: str
+    sources: int = 0
+    calls: int = 0
+    failed_calls: int = 0
+    input_tokens: int = 0
+    # Input tokens served from the provider's prompt cache
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    def per_source(self, tokens: int) -> float:
+        return tokens / self.sources if self.sources else 0.0
+
+    @property
+    def cached_share(self) -> float:
+        if not self.input_tokens:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+    @property
+    def p50_ms(self) -> float:
+        return _percentile(self.latencies_ms, 0.5)
+
+    @property
+    def p95_ms(self) -> float:
+        return _percentile(self.latencies_ms, 0.95)
+
+
+async def load_archived_pages(session: "Session", count: int) -> list[tuple]:
+    """Load the archived HTML of the most recently processed sources.
+
+    Only sources archived without error are used.
+
+    Returns:
+        Pairs of source and HTML content
+    """
+    from sqlalchemy import select
+
+    from .archiving import read_archived_content
+    from .models import Source, SourceStatus
+
+    rows = session.execute(
+        select(Source)
+        .where(
+            Source.status == SourceStatus.DONE,
+            Source.error.is_(None),
+            Source.fetch_timestamp.is_not(None),
+        )
+        .order_by(Source.fetch_timestamp.desc())
+        .limit(count)
+    ).scalars()
+
+    pages = []
+    for source in rows:
+        try:
+            html = await read_archived_content(source.path_root, "html")
+        except FileNotFoundError:
+            logger.warning(f"No archived HTML for source {source.id}, skipping")
+            continue
+        pages.append((source, html))
+    return pages
+
+
+async def load_extraction_sources(
+    session: "Session", count: int
+) -> list[tuple["Politician", str, Optional["SegmentedPage"]]]:
+    """Load the text of the most recently processed sources.
+
+    Each source is paired with the first politician it was fetched for.
+    Wikipedia articles are segmented as in the enrichment pipeline.
+    """
+    from .segmenter import extract_main_text, segment_html
+
+    sources = []
+    for source, html in await load_archived_pages(session, count):
+        if not source.politicians:
+            continue
+        content = extract_main_text(html)
+        if content:
+            page = segment_html(html) if source.wikipedia_project_id else None
+            sources.append((source.politicians[0], content, page))
+    return sources
+
+
+def soup_text(html_content: str) -> str:
+    """The previous page-to-text conversion, kept as a benchmark baseline."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    return " ".join(soup.get_text(separator=" ").split())
+
+
+@dataclass
+class TextExtractionBenchmarkResult:
+    """CPU time and output size of one page-to-text extractor."""
+
+    extractor: str
+    cpu_seconds: list[float] = field(default_factory=list)
+    tokens: list[int] = field(default_factory=list)
+
+    @property
+    def total_cpu_seconds(self) -> float:
+        return sum(self.cpu_seconds)
+
+    @property
+    def mean_ms(self) -> float:
+        if not self.cpu_seconds:
+            return 0.0
+        return self.total_cpu_seconds / len(self.cpu_seconds) * 1000
+
+    @property
+    def mean_tokens(self) -> float:
+        return sum(self.tokens) / len(self.tokens) if self.tokens else 0.0
+
+
+def run_text_extraction_benchmark(
+    pages: list[str],
+    extractors: Optional[dict[str, Callable[[str], str]]] = None,
+) -> list[TextExtractionBenchmarkResult]:
+    """Time page-to-text extractors on the same pages.
+
+    Measures process CPU time per page and estimates the output's tokens at
+    four characters per token, the same estimate content routing uses.
+
+    Args:
+        pages: HTML of archived pages
+        extractors: Extractors by display name. Defaults to the previous
+            BeautifulSoup conversion and the lxml main-content extractor.
+
+    Returns:
+        One result per extractor, in the order given
+    """
+    from .segmenter import CHARS_PER_TOKEN, extract_main_text
+
+    if extractors is None:
+        extractors = {"beautifulsoup": soup_text, "lxml": extract_main_text}
+
+    results = []
+    for name, extract in extractors.items():
+        result = TextExtractionBenchmarkResult(extractor=name)
+        for html in pages:
+            start = time.process_time()
+            text = extract(html)
+            result.cpu_seconds.append(time.process_time() - start)
+            result.tokens.append(len(text) // CHARS_PER_TOKEN)
+        results.append(result)
+    return results
+
+
+class _UsageRecorder:
+    """OpenAI client wrapper keeping the responses of parse calls."""
+
+    def __init__(self, client: Any):
+        self._client = client
+        self.responses = self
+        self.recorded: list[Any] = []
+
+    async def parse(self, **kwargs: Any) -> Any:
+        response = await self._client.responses.parse(**kwargs)
+        self.recorded.append(response)
+        return response
+
+
+async def run_extraction_benchmark(
+    openai_client: Any,
+    sources: list[tuple["Politician", str, Optional["SegmentedPage"]]],
+    modes: tuple[str, ...] = ("per_property", "single_call"),
+) -> list[ExtractionBenchmarkResult]:
+    """Compare the free-form extraction calls of each mode on the same sources.
+
+    Only the extraction stage is timed: the mapping stage makes the same calls
+    whichever mode extracted the items. Sources are processed one at a time,
+    so latencies are per source. Modes run in the given order on the same
+    content, so later modes may find the article already in the provider's
+    prompt cache; the cached share of input tokens is reported to tell.
+
+    Args:
+        openai_client: OpenAI client, without response caching
+        sources: Politicians with the text content of one of their sources
+            and its segmented page, if any, for routing content
+        modes: Extraction modes to compare
+
+    Returns:
+        One result per mode, in the order given
+    """
+    from .enrichment import (
+        BIRTHPLACES_CONFIG,
+        CITIZENSHIPS_CONFIG,
+        COMBINED_CONFIG,
+        DATES_CONFIG,
+        POSITIONS_CONFIG,
+        parse_extraction,
+    )
+    from .segmenter import route_content
+
+    configs_by_mode = {
+        "per_property": [
+            DATES_CONFIG,
+            POSITIONS_CONFIG,
+            BIRTHPLACES_CONFIG,
+            CITIZENSHIPS_CONFIG,
+        ],
+        "single_call": [COMBINED_CONFIG],
+    }
+
+    results = []
+    for mode in modes:
+        configs = configs_by_mode[mode]
+        result = ExtractionBenchmarkResult(mode=mode)
+        logger.info(f"Benchmarking {mode} extraction on {len(sources)} sources")
+        for politician, content, page in sources:
+            recorder = _UsageRecorder(openai_client)
+            start = time.perf_counter()
+            outcomes = await asyncio.gather(
+                *[
+                    parse_extraction(
+                        recorder,
+                        route_content(page, config.content_route, content),
+                        politician,
+                        config,
+                    )
+                    for config in configs
+                ],
+                return_exceptions=True,
+            )
+            result.latencies_ms.append((time.perf_counter() - start) * 1000)
+            result.sources += 1
+            result.calls += len(configs)
+            result.failed_calls += sum(
+                isinstance(outcome, Exception) for outcome in outcomes
+            )
+            for response in recorder.recorded:
+                usage = getattr(response, "usage", None)
+                if usage is None:
+                    continue
+                result.input_tokens += usage.input_tokens
+                result.output_tokens += usage.output_tokens
+                details = getattr(usage, "input_tokens_details", None)
+                result.cached_input_tokens += getattr(details, "cached_tokens", 0) or 0
+        results.append(result)
+    return results
@@ -4,6 +4,7 @@ import asyncio
 import click
 import logging
 import os
+import time
 from datetime import datetime, timezone
 import httpx
 from poliloom.scheduling import process_next_politician
@@ -26,6 +27,8 @@ from poliloom.models import (
     Location,
     Position,
     Property,
+    SearchEmbedding,
+    SearchIndexState,
     WikidataDump,
     WikidataEntity,
 )
@@ -288,11 +291,17 @@ def dump_extract(input, output):
     is_flag=True,
     help="Only enrich politicians without citizenship data (for bias prevention)",
 )
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Call the model even for requests answered before",
+)
 def enrich_wikipedia(
     count: int | None,
     languages: tuple[str, ...],
     countries: tuple[str, ...],
     stateless: bool,
+    no_llm_cache: bool,
 ) -> None:
     """Enrich a specified number of politicians from Wikipedia.
 
@@ -302,6 +311,11 @@ def enrich_wikipedia(
     data are never enriched by normal user-driven filters (which filter by country/language).
     Use this flag for scheduled enrichment jobs to ensure coverage of all politicians.
 
+    Answers to identical LLM requests are reused from a Postgres cache
+    (LLM_CACHE_MAX_MB); --no-llm-cache bypasses it. SOURCE_MODE=consolidated
+    extracts all Wikipedia articles of a politician in one pass instead of
+    one pass per article.
+
     When using --stateless, enrichment only runs if the number of stateless politicians
     with unevaluated extracted citizenship is below MIN_UNEVALUATED_POLITICIANS threshold
     (default: 10). This prevents over-enrichment when reviewers haven't caught up.
@@ -358,27 +372,76 @@ def enrich_wikipedia(
         if countries_list:
             click.echo(f"   Filtering by countries: {', '.join(countries_list)}")
 
-        enriched_count = 0
-        for i in range(count):
-            politician_found = asyncio.run(
-                process_next_politician(
-                    languages=languages_list,
-                    countries=countries_list,
-                    stateless=stateless,
-                )
-            )
+        from poliloom.enrichment import infobox_stats, mapping_stats
+        from poliloom.llm import response_cache, track_usage
+
+        if no_llm_cache:
+            response_cache.enabled = False
+
+        llm_stats = {}
+
+        async def enrich_all() -> int:
+            from poliloom.llm import close_openai_client
+            from poliloom.search import close_async_search_client
+
+            # One event loop for the whole run, so pooled clients are reused
+            # across politicians and closed once at the end
+            enriched = 0
+            try:
+                for _ in range(count):
+                    politician_found = await process_next_politician(
+                        languages=languages_list,
+                        countries=countries_list,
+                        stateless=stateless,
+                    )
+
+                    if not politician_found:
+                        click.echo("⚠️  No more politicians available to enrich")
+                        break
 
-            if not politician_found:
-                click.echo("⚠️  No more politicians available to enrich")
-                break
+                    enriched += 1
+                    click.echo(f"   Progress: {enriched}/{count}")
+            finally:
+                llm_stats.update(await close_openai_client() or {})
+                await close_async_search_client()
+            return enriched
 
-            enriched_count += 1
-            click.echo(f"   Progress: {enriched_count}/{count}")
+        with track_usage() as usage:
+            enriched_count = asyncio.run(enrich_all())
 
         if enriched_count == 0:
             click.echo("✅ No politicians enriched")
         else:
             click.echo(f"✅ Successfully enriched {enriched_count} politicians")
+        stats = response_cache.stats()
+        if stats["enabled"]:
+            click.echo(
+                f"   LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%})"
+            )
+        if llm_stats:
+            click.echo(
+                f"   LLM calls: {llm_stats['calls']} "
+                f"({llm_stats['rate_limited']} rate limited)"
+            )
+        if usage.calls or usage.cache_hits:
+            click.echo(f"   LLM usage: {usage.summary()}")
+        infobox = infobox_stats.stats()
+        if infobox["hits"] or infobox["partial"] or infobox["misses"]:
+            click.echo(
+                f"   Infobox dates: {infobox['hits']} hits, "
+                f"{infobox['partial']} partial, {infobox['misses']} misses, "
+                f"{infobox['agreement_rate']:.0%} agreement with LLM "
+                f"({infobox['conflicts']} conflicts)"
+            )
+        mapping = mapping_stats.stats()
+        if mapping["items"] or mapping["from_decisions"]:
+            click.echo(
+                f"   Mapping: {mapping['from_decisions']} items from earlier "
+                f"decisions, {mapping['without_llm']}/{mapping['items']} "
+                f"searched items without LLM, {mapping['candidates_sent']} of "
+                f"{mapping['candidates_found']} candidates sent to LLM"
+            )
 
     except Exception as e:
         click.echo(f"❌ Error enriching politicians: {e}")
@@ -899,23 +962,26 @@ def clean_properties(dry_run):
 
 @main.command("index-create")
 def index_create():
-    """Create the Meilisearch entities index.
+    """Create the entities search indexes.
 
-    Creates a single index with type-based filtering for all searchable entities.
-    Safe to run multiple times - Meilisearch handles existing indexes gracefully.
+    With Meilisearch, creates one index per searchable entity type, each with
+    its own settings and embedder. Safe to run multiple times - existing
+    indexes are handled gracefully. The backend is selected with
+    SEARCH_BACKEND (meilisearch or postgres).
     """
-    from poliloom.search import SearchService, INDEX_NAME
+    from poliloom.search import create_search_service
 
-    click.echo("⏳ Creating Meilisearch index...")
+    click.echo("⏳ Creating search index...")
 
-    search_service = SearchService()
+    search_service = create_search_service()
+    index_names = ", ".join(search_service.index_names())
 
     try:
         search_service.create_index()
-        click.echo(f"✅ Successfully created index '{INDEX_NAME}'")
+        click.echo(f"✅ Successfully created indexes: {index_names}")
     except Exception as e:
         if "index_already_exists" in str(e):
-            click.echo(f"⚠️  Index '{INDEX_NAME}' already exists")
+            click.echo(f"⚠️  Indexes already exist: {index_names}")
         else:
             click.echo(f"❌ Error creating index: {e}")
             raise SystemExit(1)
@@ -928,24 +994,26 @@ def index_create():
     help="Confirm deletion without prompting",
 )
 def index_delete(confirm):
-    """Delete the Meilisearch entities index.
+    """Delete the entities search indexes.
 
-    Removes the single entities index containing all searchable data.
+    Removes the indexes of all searchable entity types.
     Use --confirm to skip the confirmation prompt.
     """
-    from poliloom.search import SearchService, INDEX_NAME
+    from poliloom.search import create_search_service
 
     if not confirm:
-        click.echo("⚠️  This will delete the Meilisearch index!")
+        click.echo("⚠️  This will delete the search index!")
         if not click.confirm("Are you sure you want to continue?"):
             click.echo("Aborted.")
             return
 
-    click.echo("⏳ Deleting Meilisearch index...")
+    click.echo("⏳ Deleting search index...")
 
-    search_service = SearchService()
+    search_service = create_search_service()
     search_service.delete_index()
-    click.echo(f"✅ Successfully deleted index '{INDEX_NAME}'")
+    click.echo(
+        f"✅ Successfully deleted indexes: {', '.join(search_service.index_names())}"
+    )
 
 
 @main.command("index-build")
@@ -959,78 +1027,246 @@ def index_delete(confirm):
     is_flag=True,
     help="Delete and recreate index before indexing",
 )
-def index_build(batch_size, rebuild):
-    """Build Meilisearch index from database.
+@click.option(
+    "--workers",
+    default=4,
+    help="Number of threads serializing and sending batches (default: 4)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only index entities changed since the last successful build",
+)
+@click.option(
+    "--embedding-cache/--no-embedding-cache",
+    default=True,
+    help="Send cached embeddings and only embed new document texts (default: on)",
+)
+@click.option(
+    "--max-labels",
+    type=int,
+    default=None,
+    help="Normalized labels kept per document (default: SEARCH_MAX_LABELS or 50, 0 = all)",
+)
+@click.option(
+    "--wait-timeout",
+    default=3600,
+    help="Seconds to wait for the index to apply all batches (default: 3600)",
+)
+@click.option(
+    "--type",
+    "entity_types",
+    multiple=True,
+    help="Only build the index of this entity type, e.g. Position (repeatable)",
+)
+def index_build(
+    batch_size,
+    rebuild,
+    workers,
+    incremental,
+    embedding_cache,
+    max_labels,
+    wait_timeout,
+    entity_types,
+):
+    """Build the search index from the database.
 
     Indexes all searchable entities with aggregated types. Each entity appears
     once with all its types (e.g., an entity can be both Location and Country).
 
+    Rows are streamed from a single server-side cursor while worker threads
+    build, serialize and send the batches. Workers wait while
+    MEILI_MAX_PENDING_TASKS tasks are queued in Meilisearch; failed tasks are
+    sent again up to MEILI_TASK_RETRIES times. Progress reports the documents
+    the index has actually applied, which can exceed the entity count since
+    entities with several types are indexed once per type.
+
     Use --rebuild to delete and recreate the index from scratch.
+
+    With Meilisearch every entity type has its own index, and all of them are
+    built in the same pass. Use --type to build only some types, e.g. after
+    changing one type's settings; other indexes are left untouched.
+
+    Use --incremental to only send entities that gained labels or types since
+    the last successful build and delete documents of entities soft-deleted
+    since then. Falls back to a full build when no previous build is recorded.
+    A build only counts as successful once the index confirmed every batch;
+    otherwise the next incremental build resends the same changes.
+
+    Labels are case-folded, stripped of Latin diacritics, whitespace-collapsed
+    and deduplicated; documents keep the labels used by the most languages,
+    up to --max-labels.
+
+    Running API workers drop their cached search results once the build
+    finishes.
+
+    With the embedding cache, embeddings are stored in Postgres keyed by a hash
+    of the rendered document text and sent along with the documents, so only
+    new or changed texts are embedded. Use --no-embedding-cache to let
+    Meilisearch embed every document itself. The Postgres backend
+    (SEARCH_BACKEND=postgres) relies on the cache for semantic search.
     """
-    from poliloom.search import INDEX_NAME, SearchDocument, SearchService
+    from concurrent.futures import ThreadPoolExecutor
 
-    search_service = SearchService()
+    from poliloom.search import (
+        OpenAIEmbedder,
+        create_search_service,
+        documents_from_rows,
+        notify_index_changed,
+    )
+
+    search_service = create_search_service()
+    entity_types = list(entity_types) or None
+    if entity_types and not search_service.per_type_indexes:
+        click.echo("❌ --type needs a search backend with per-type indexes")
+        raise SystemExit(1)
+    try:
+        index_names = search_service.index_names(entity_types)
+    except ValueError as e:
+        click.echo(f"❌ {e}")
+        raise SystemExit(1)
+    embedder = OpenAIEmbedder() if embedding_cache else None
 
     if rebuild:
-        click.echo("⏳ Rebuilding Meilisearch index...")
-        search_service.delete_index()
-        search_service.create_index()
-        click.echo(f"   Recreated index '{INDEX_NAME}'")
+        click.echo("⏳ Rebuilding search index...")
+        search_service.delete_index(entity_types)
+        search_service.create_index(entity_types)
+        click.echo(f"   Recreated indexes: {', '.join(index_names)}")
     else:
-        click.echo("⏳ Building Meilisearch index...")
-        if search_service.ensure_index():
-            click.echo(f"   Created index '{INDEX_NAME}'")
-
-    # Build query for search index documents
-    query = WikidataEntity.search_index_query()
+        click.echo("⏳ Building search index...")
+        if search_service.ensure_index(entity_types):
+            click.echo(f"   Created missing indexes among: {', '.join(index_names)}")
 
     total_indexed = 0
+    total_embedded = 0
+    total_labels = 0
+    total_kept_labels = 0
     task_uids = []
+    started = time.perf_counter()
 
     with Session(get_engine()) as session:
+        # Changes committed after this point are picked up by the next build
+        build_started_at = session.execute(select(func.now())).scalar()
+
+        changed_since = None
+        if incremental and not rebuild:
+            # Resume from the index that is furthest behind
+            watermarks = [
+                SearchIndexState.get_watermark(session, index_name)
+                for index_name in index_names
+            ]
+            changed_since = None if None in watermarks else min(watermarks)
+            if changed_since is None:
+                click.echo(
+                    "⚠️  No previous build recorded, falling back to a full build"
+                )
+            else:
+                click.echo(f"   Indexing changes since {changed_since.isoformat()}")
+                deleted_ids = WikidataEntity.search_index_deleted_ids(
+                    session, changed_since
+                )
+                if deleted_ids:
+                    for entity_type in entity_types or [None]:
+                        search_service.delete_documents(
+                            deleted_ids, entity_type=entity_type
+                        )
+                    click.echo(f"   Deleted {len(deleted_ids):,} documents")
+
+        # Build query for search index documents
+        query = WikidataEntity.search_index_query(
+            changed_since=changed_since, entity_types=entity_types
+        )
+
         # Count total
         count_query = select(func.count()).select_from(query.subquery())
         total = session.execute(count_query).scalar()
 
         if total == 0:
             click.echo("   No entities to index")
-            return
-
-        click.echo(f"   Found {total:,} entities to index")
-
-        # Process in batches
-        offset_val = 0
-        while offset_val < total:
-            paginated_query = query.offset(offset_val).limit(batch_size)
-            rows = session.execute(paginated_query).fetchall()
-
-            if not rows:
-                break
-
-            # Build search documents
-            documents = [
-                SearchDocument(
-                    id=row.wikidata_id, types=list(row.types), labels=list(row.labels)
-                )
-                for row in rows
-            ]
+        else:
+            click.echo(f"   Found {total:,} entities to index")
+
+        def send_batch(rows) -> tuple[int, int, int, int, list[int]]:
+            documents = documents_from_rows(rows, max_labels=max_labels)
+            embedded = 0
+            if embedder is not None:
+                # Each worker thread needs its own session
+                with Session(get_engine()) as embedding_session:
+                    embedded = SearchEmbedding.attach_embeddings(
+                        embedding_session, documents, embedder
+                    )
+                    embedding_session.commit()
+            return (
+                len(documents),
+                embedded,
+                sum(len(row.labels) for row in rows),
+                sum(len(document["labels"]) for document in documents),
+                search_service.index_documents(documents, entity_types),
+            )
 
-            # Send batch without waiting (enables Meilisearch auto-batching)
-            task_uid = search_service.index_documents(documents)
-            if task_uid is not None:
-                task_uids.append(task_uid)
+        def collect(future) -> None:
+            nonlocal total_indexed, total_embedded, total_labels, total_kept_labels
+            sent, embedded, labels, kept_labels, batch_task_uids = future.result()
+            task_uids.extend(batch_task_uids)
+            total_indexed += sent
+            total_embedded += embedded
+            total_labels += labels
+            total_kept_labels += kept_labels
+            applied = search_service.applied_documents
+            rate = applied / (time.perf_counter() - started)
+            click.echo(
+                f"   Sent: {total_indexed:,}/{total:,}, "
+                f"applied: {applied:,} index documents ({rate:,.0f}/s)"
+            )
 
-            total_indexed += len(documents)
-            offset_val += batch_size
+        # Stream batches from a server-side cursor instead of re-running the
+        # aggregation with OFFSET for every page
+        if total:
+            result = session.execute(query.execution_options(yield_per=batch_size))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = []
+                for rows in result.partitions():
+                    pending.append(executor.submit(send_batch, rows))
+                    # Bound the number of batches held in memory
+                    while len(pending) >= workers * 2:
+                        collect(pending.pop(0))
+                for future in pending:
+                    collect(future)
+
+        click.echo(f"⏳ Waiting for the index to apply {total_indexed:,} documents...")
+        failed = search_service.wait_for_tasks(timeout_ms=wait_timeout * 1000)
+        if failed:
+            click.echo(
+                f"❌ {len(failed)} indexing tasks failed or timed out "
+                f"(first: {failed[0]}), keeping the previous watermark"
+            )
+            raise SystemExit(1)
 
-            click.echo(f"   Sent: {total_indexed:,}/{total:,}")
+        for index_name in index_names:
+            SearchIndexState.set_watermark(session, index_name, build_started_at)
+        # Drop cached search results in running API workers
+        notify_index_changed(session)
+        session.commit()
 
+    elapsed = time.perf_counter() - started
     click.echo(
-        f"✅ Sent {total_indexed:,} documents for indexing ({len(task_uids)} tasks)"
+        f"✅ Indexed {total_indexed:,} documents ({len(task_uids)} tasks, "
+        f"{search_service.retried_tasks} retried) in {elapsed:.1f}s"
     )
     click.echo(
-        "   Indexing continues in the background. Use 'poliloom index-stats' to check progress."
+        f"   Applied {search_service.applied_documents:,} index documents "
+        f"({search_service.applied_documents / elapsed:,.0f}/s)"
     )
+    if total_labels:
+        click.echo(
+            f"   Kept {total_kept_labels:,} of {total_labels:,} labels "
+            f"after normalization ({total_kept_labels / total_labels:.0%})"
+        )
+    if embedder is not None:
+        click.echo(
+            f"   Embedded {total_embedded:,} new texts, "
+            f"reused {total_indexed - total_embedded:,} cached embeddings"
+        )
 
 
 @main.command("index-stats")
@@ -1041,7 +1277,7 @@ def index_stats():
     Useful for monitoring background indexing after index-build.
     """
 
-    from poliloom.search import INDEX_NAME, SearchService
+    from poliloom.search import SearchService
 
     search_service = SearchService()
 
@@ -1053,15 +1289,22 @@ def index_stats():
         click.echo(f"🔴 Meilisearch: unavailable ({e})")
         return
 
-    # Get index stats
+    # Get per-type index stats from a single request
     try:
-        index = search_service.client.index(INDEX_NAME)
-        stats = index.get_stats()
-        click.echo(f"\n📊 Index '{INDEX_NAME}':")
-        click.echo(f"   Documents: {stats.number_of_documents:,}")
-        click.echo(f"   Indexing: {'yes' if stats.is_indexing else 'no'}")
+        all_stats = search_service.client.get_all_stats()
     except Exception as e:
-        click.echo(f"\n📊 Index '{INDEX_NAME}': not found or error ({e})")
+        click.echo(f"\n📊 Indexes: unavailable ({e})")
+    else:
+        click.echo(f"\n📊 Database size: {all_stats['databaseSize'] / 1e6:,.1f} MB")
+        for index_name in search_service.index_names():
+            stats = all_stats["indexes"].get(index_name)
+            if stats is None:
+                click.echo(f"   {index_name}: not found")
+                continue
+            indexing = ", indexing" if stats["isIndexing"] else ""
+            click.echo(
+                f"   {index_name}: {stats['numberOfDocuments']:,} documents{indexing}"
+            )
 
     # Get batch counts by status
     click.echo("\n📋 Batches:")
@@ -1119,5 +1362,275 @@ def index_stats():
                 )
 
 
+@main.command("benchmark-import")
+@click.option(
+    "--politicians",
+    type=int,
+    default=10000,
+    help="Number of politicians in the synthetic dump (default: 10000)",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=42,
+    help="Random seed; the same seed always produces the same dump (default: 42)",
+)
+@click.option(
+    "--dump",
+    "dump_path",
+    default=None,
+    help="Write the synthetic dump to this path and keep it (default: temporary file)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1000,
+    help="Number of entities to process in each database batch (default: 1000)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Worker processes per import stage (default: CPU count)",
+)
+@click.option("--yes", is_flag=True, help="Skip the confirmation prompt")
+def benchmark_import(politicians, seed, dump_path, batch_size, workers, yes):
+    """Benchmark the dump import stages on a synthetic Wikidata dump.
+
+    Generates a deterministic dump and runs import-hierarchy, import-entities
+    and import-politicians against the configured database, reporting
+    entities/sec, database time share and peak RSS per stage. Synthetic
+    entities use QIDs above Q900000000. Point DB_NAME at a scratch database.
+    """
+    import tempfile
+
+    from poliloom.benchmark import (
+        SyntheticDumpConfig,
+        generate_synthetic_dump,
+        run_import_benchmark,
+    )
+
+    db_name = os.getenv("DB_NAME", "poliloom")
+    if not yes:
+        click.echo(f"⚠️  This writes synthetic entities into database '{db_name}'.")
+        if not click.confirm("Do you want to continue?"):
+            click.echo("❌ Benchmark cancelled")
+            return
+
+    temp_dir = None
+    if dump_path is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        dump_path = os.path.join(temp_dir.name, "synthetic-dump.json")
+
+    try:
+        config = SyntheticDumpConfig(
+            politicians=politicians,
+            unrelated_entities=politicians * 2,
+            seed=seed,
+        )
+        click.echo(f"⏳ Generating synthetic dump at {dump_path}...")
+        stats = generate_synthetic_dump(dump_path, config)
+        click.echo(
+            f"✅ Generated {stats.entities:,} entities "
+            f"({stats.politicians:,} politicians, {stats.heavy_politicians} heavy, "
+            f"{stats.bytes / 1024 / 1024:.1f} MB)"
+        )
+
+        results = run_import_benchmark(
+            dump_path, stats.entities, batch_size=batch_size, workers=workers
+        )
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    click.echo("\n📊 Import benchmark:")
+    click.echo(
+        f"   {'stage':<20} {'seconds':>9} {'entities/s':>11} {'db share':>9} "
+        f"{'peak rss':>9} {'worker rss':>11}"
+    )
+    for result in results:
+        click.echo(
+            f"   {result.name:<20} {result.seconds:>9.1f} "
+            f"{result.entities_per_second:>11,.0f} {result.db_share:>9.0%} "
+            f"{result.peak_rss_mb:>7.0f}MB {result.peak_worker_rss_mb:>9.0f}MB"
+        )
+
+
+@main.command("benchmark-search")
+@click.option(
+    "--queries",
+    "queries_path",
+    default=None,
+    help="Query set file, one 'query' or 'EntityType<TAB>query' per line "
+    "(default: labels sampled deterministically from the database)",
+)
+@click.option(
+    "--per-type",
+    type=int,
+    default=50,
+    help="Queries sampled per entity type when no query file is given (default: 50)",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=10,
+    help="Number of results compared per query (default: 10)",
+)
+@click.option(
+    "--semantic-ratio",
+    type=float,
+    default=0.0,
+    help="Hybrid search ratio, 0.0 keyword to 1.0 semantic (default: 0.0)",
+)
+def benchmark_search(queries_path, per_type, limit, semantic_ratio):
+    """Compare the Postgres search backend against Meilisearch.
+
+    Runs the same query set against both backends and reports p50/p95
+    latency, plus recall of the Postgres results relative to Meilisearch.
+    Requires a built Meilisearch index and Postgres search indexes
+    (SEARCH_BACKEND=postgres poliloom index-build).
+    """
+    from poliloom.benchmark import (
+        load_search_queries,
+        run_search_benchmark,
+        sample_search_queries,
+    )
+    from poliloom.search import PostgresSearchBackend, SearchService
+
+    if queries_path:
+        queries = load_search_queries(queries_path)
+    else:
+        with Session(get_engine()) as session:
+            queries = sample_search_queries(session, per_type=per_type)
+    if not queries:
+        click.echo("❌ No queries to run")
+        raise SystemExit(1)
+
+    click.echo(f"⏳ Running {len(queries):,} queries against each backend...")
+    results = run_search_benchmark(
+        {"meilisearch": SearchService(), "postgres": PostgresSearchBackend()},
+        queries,
+        reference="meilisearch",
+        limit=limit,
+        semantic_ratio=semantic_ratio,
+    )
+
+    click.echo(
+        f"\n📊 Search benchmark (limit {limit}, semantic ratio {semantic_ratio}):"
+    )
+    click.echo(f"   {'backend':<12} {'p50 ms':>8} {'p95 ms':>8} {'recall':>8}")
+    for result in results:
+        recall = "ref" if result.recall is None else f"{result.recall:.0%}"
+        click.echo(
+            f"   {result.backend:<12} {result.p50_ms:>8.1f} "
+            f"{result.p95_ms:>8.1f} {recall:>8}"
+        )
+
+
+@main.command("benchmark-extraction")
+@click.option(
+    "--sources",
+    "source_count",
+    type=int,
+    default=20,
+    help="Number of recently processed sources to extract from (default: 20)",
+)
+@click.option(
+    "--mode",
+    "modes",
+    multiple=True,
+    type=click.Choice(["per_property", "single_call"]),
+    help="Extraction mode to benchmark; repeat for several (default: both)",
+)
+def benchmark_extraction(source_count, modes):
+    """Compare LLM token usage and latency of the extraction modes.
+
+    Runs the free-form extraction calls of each mode on the same archived
+    sources and reports tokens and latency per source. Makes real OpenAI
+    calls without the response cache; modes run in order on the same
+    content, so later modes may benefit from the provider's prompt cache.
+    """
+    from poliloom.benchmark import load_extraction_sources, run_extraction_benchmark
+    from poliloom.llm import close_openai_client, get_openai_client
+
+    modes = modes or ("per_property", "single_call")
+
+    async def run():
+        with Session(get_engine()) as session:
+            sources = await load_extraction_sources(session, source_count)
+            if not sources:
+                return None
+            click.echo(
+                f"⏳ Extracting from {len(sources)} sources with {', '.join(modes)}..."
+            )
+            try:
+                return await run_extraction_benchmark(
+                    await get_openai_client(), sources, modes
+                )
+            finally:
+                await close_openai_client()
+
+    results = asyncio.run(run())
+    if results is None:
+        click.echo("❌ No archived sources to extract from")
+        raise SystemExit(1)
+
+    click.echo("\n📊 Extraction benchmark (per source):")
+    click.echo(
+        f"   {'mode':<14} {'calls':>6} {'input':>8} {'cached':>7} {'output':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8}"
+    )
+    for result in results:
+        click.echo(
+            f"   {result.mode:<14} {result.per_source(result.calls):>6.1f} "
+            f"{result.per_source(result.input_tokens):>8,.0f} "
+            f"{result.cached_share:>7.0%} "
+            f"{result.per_source(result.output_tokens):>8,.0f} "
+            f"{result.p50_ms:>8.0f} {result.p95_ms:>8.0f}"
+        )
+        if result.failed_calls:
+            click.echo(f"   ⚠️  {result.failed_calls} {result.mode} calls failed")
+
+
+@main.command("benchmark-text")
+@click.option(
+    "--sources",
+    "source_count",
+    type=int,
+    default=100,
+    help="Number of recently processed sources to convert (default: 100)",
+)
+def benchmark_text(source_count):
+    """Compare page-to-text extractors on archived pages.
+
+    Converts the same archived HTML with the previous BeautifulSoup
+    conversion and the lxml main-content extractor, and reports CPU time and
+    estimated LLM tokens of the output per page.
+    """
+    from poliloom.benchmark import load_archived_pages, run_text_extraction_benchmark
+
+    async def load():
+        with Session(get_engine()) as session:
+            return [
+                html for _, html in await load_archived_pages(session, source_count)
+            ]
+
+    pages = asyncio.run(load())
+    if not pages:
+        click.echo("❌ No archived pages to convert")
+        raise SystemExit(1)
+
+    click.echo(f"⏳ Converting {len(pages)} archived pages...")
+    results = run_text_extraction_benchmark(pages)
+
+    click.echo("\n📊 Text extraction benchmark (per page):")
+    click.echo(f"   {'extractor':<14} {'cpu ms':>8} {'tokens':>8}")
+    for result in results:
+        click.echo(
+            f"   {result.extractor:<14} {result.mean_ms:>8.1f} "
+            f"{result.mean_tokens:>8,.0f}"
+        )
+
+
 if __name__ == "__main__":
     main()
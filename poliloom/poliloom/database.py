@@ -88,7 +88,12 @@ def create_timestamp_triggers(engine: Engine):
             "properties",
             "property_references",
             "wikidata_dumps",
+            "search_index_state",
+            "search_embeddings",
+            "search_documents",
+            "llm_responses",
             "wikidata_entities",
+            "wikidata_entity_labels",
             "wikidata_relations",
             "wikipedia_links",
         ]
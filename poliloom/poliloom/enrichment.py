@@ -3,12 +3,11 @@
 import os
 import logging
 import asyncio
+import random
 from dataclasses import dataclass
-from typing import List, Optional, Literal, Type, Union, Any
+from typing import TYPE_CHECKING, Callable, List, Optional, Literal, Type, Union, Any
 from sqlalchemy.orm import Session, selectinload
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field, field_validator, create_model
-from dicttoxml import dicttoxml
 
 from .models import (
     Politician,
@@ -18,14 +17,28 @@ from .models import (
     Position,
     Location,
     Country,
+    MappingDecision,
     Source,
     WikidataRelation,
     WikidataEntity,
 )
-from .search import SearchService
+from .llm import CachingOpenAI, get_openai_client
+from .rerank import MappingContext, confident_match, normalize_label, rank_candidates
+from .search import AsyncSearchClient, get_async_search_client
+from .segmenter import (
+    BIOGRAPHY_KEYWORDS,
+    CAREER_KEYWORDS,
+    ContentRoute,
+    InfoboxDate,
+    SegmentedPage,
+    route_content,
+)
 from .wikidata.date import WikidataDate
 from . import prompts
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,6 +164,15 @@ class ExtractedCitizenship(QuotedExtraction):
     wikidata_id: str
 
 
+class CombinedExtractionResult(BaseModel):
+    """Response model for extracting all property groups in one call."""
+
+    properties: Optional[List[ExtractedProperty]]
+    positions: Optional[List[FreeFormPosition]]
+    birthplaces: Optional[List[FreeFormBirthplace]]
+    citizenships: Optional[List[FreeFormCitizenship]]
+
+
 @dataclass
 class ExtractionConfig:
     """Base configuration for property extraction."""
@@ -161,6 +183,8 @@ class ExtractionConfig:
     user_prompt_template: str
     analysis_focus_template: str
     result_field_name: str = "properties"  # Field name in result model
+    # Parts of segmented pages to extract from; None sends the full text
+    content_route: Optional[ContentRoute] = None
 
 
 @dataclass
@@ -171,82 +195,194 @@ class TwoStageExtractionConfig(ExtractionConfig):
     mapping_system_prompt: str = ""  # System prompt for mapping stage
     final_model: Type[BaseModel] = None
     search_limit: int = 100  # Number of candidates to retrieve for mapping
+    rerank_top_k: int = 10  # Number of best ranked candidates sent to the LLM
 
 
-async def extract_properties_generic(
-    openai_client: AsyncOpenAI,
+def build_extraction_input(
+    system_prompt: str, user_prompt: str, content: str
+) -> List[dict]:
+    """Build the messages of an extraction call.
+
+    The article content goes first: it is the only part shared by all calls
+    for a source, so this keeps their common prompt prefix cacheable by the
+    provider.
+    """
+    return [
+        {
+            "role": "user",
+            "content": prompts.ARTICLE_CONTENT_TEMPLATE.format(content=content),
+        },
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+async def parse_extraction(
+    openai_client: "AsyncOpenAI",
     content: str,
     politician: Politician,
     config: ExtractionConfig,
-) -> Optional[List[Any]]:
-    """Generic property extraction using provided configuration."""
-    try:
-        # Build comprehensive politician context
-        politician_context = politician.to_xml_context(
-            focus_property_types=config.property_types,
-        )
+) -> Optional[BaseModel]:
+    """Run the structured extraction call of a configuration.
+
+    Returns:
+        The parsed response, or None if the model returned nothing
+    """
+    # Build comprehensive politician context
+    politician_context = politician.to_xml_context(
+        focus_property_types=config.property_types,
+    )
 
-        # Build analysis focus if politician has existing properties
-        analysis_focus = ""
-        existing_properties = politician.get_properties_by_types(config.property_types)
+    # Build analysis focus if politician has existing properties
+    analysis_focus = ""
+    existing_properties = politician.get_properties_by_types(config.property_types)
 
-        if existing_properties:
-            analysis_focus = config.analysis_focus_template
+    if existing_properties:
+        analysis_focus = config.analysis_focus_template
 
-        user_prompt = config.user_prompt_template.format(
-            politician_name=politician.name,
-            politician_context=politician_context,
-            analysis_focus=analysis_focus,
-            content=content,
-        )
+    user_prompt = config.user_prompt_template.format(
+        politician_name=politician.name,
+        politician_context=politician_context,
+        analysis_focus=analysis_focus,
+    )
 
-        logger.debug(f"Extracting {config.property_types} for {politician.name}")
+    logger.debug(f"Extracting {config.property_types} for {politician.name}")
 
-        response = await openai_client.responses.parse(
-            model=os.getenv("OPENAI_MODEL", "gpt-5.4-mini"),
-            input=[
-                {"role": "system", "content": config.system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            text_format=config.result_model,
-            reasoning={"effort": os.getenv("OPENAI_REASONING_EFFORT", "low")},
-        )
+    response = await openai_client.responses.parse(
+        model=os.getenv("OPENAI_MODEL", "gpt-5.4-mini"),
+        input=build_extraction_input(config.system_prompt, user_prompt, content),
+        text_format=config.result_model,
+        reasoning={"effort": os.getenv("OPENAI_REASONING_EFFORT", "low")},
+    )
 
-        if response.output_parsed is None:
-            logger.error(f"OpenAI extraction returned None for {config.property_types}")
+    if response.output_parsed is None:
+        logger.error(f"OpenAI extraction returned None for {config.property_types}")
+    return response.output_parsed
+
+
+async def extract_properties_generic(
+    openai_client: "AsyncOpenAI",
+    content: str,
+    politician: Politician,
+    config: ExtractionConfig,
+) -> Optional[List[Any]]:
+    """Generic property extraction using provided configuration."""
+    try:
+        parsed = await parse_extraction(openai_client, content, politician, config)
+        if parsed is None:
             return None
 
-        return getattr(response.output_parsed, config.result_field_name)
+        return getattr(parsed, config.result_field_name)
 
     except Exception as e:
         logger.error(f"Error extracting {config.property_types} with LLM: {e}")
         return None
 
 
+# Politicians a mapping decision needs before it is reused without reviews
+# (MAPPING_DECISION_MIN_MAPPINGS)
+DEFAULT_DECISION_MIN_MAPPINGS = 3
+
+
+class MappingStats:
+    """Counts of how mapping candidates were narrowed down before the LLM.
+
+    Items mapped from earlier decisions are counted separately; the other
+    counts cover items whose candidates were searched and ranked.
+    """
+
+    def __init__(self):
+        self.from_decisions = 0
+        self.items = 0
+        self.without_llm = 0
+        self.candidates_found = 0
+        self.candidates_sent = 0
+
+    def stats(self) -> dict:
+        """Mapping counts since the process started."""
+        return {
+            "from_decisions": self.from_decisions,
+            "items": self.items,
+            "without_llm": self.without_llm,
+            "candidates_found": self.candidates_found,
+            "candidates_sent": self.candidates_sent,
+        }
+
+
+# Process-wide mapping counters
+mapping_stats = MappingStats()
+
+
+def _mapped_result(
+    config: TwoStageExtractionConfig, free_item: Any, wikidata_id: str
+) -> Any:
+    """Build the extracted item of a free-form item mapped to an entity."""
+    if config.entity_class.MAPPING_ENTITY_NAME == "position":
+        return ExtractedPosition(
+            wikidata_id=wikidata_id,
+            start_date=getattr(free_item, "start_date", None),
+            end_date=getattr(free_item, "end_date", None),
+            supporting_quotes=free_item.supporting_quotes,
+        )
+    elif config.entity_class.MAPPING_ENTITY_NAME == "location":
+        return ExtractedBirthplace(
+            wikidata_id=wikidata_id,
+            supporting_quotes=free_item.supporting_quotes,
+        )
+    else:  # country
+        return ExtractedCitizenship(
+            wikidata_id=wikidata_id,
+            supporting_quotes=free_item.supporting_quotes,
+        )
+
+
+def _record_decision(
+    db: Session,
+    config: TwoStageExtractionConfig,
+    free_item: Any,
+    politician: Politician,
+    context: MappingContext,
+    wikidata_id: str,
+    reused: bool = False,
+) -> None:
+    """Remember a mapping so later politicians can reuse it."""
+    db.add(
+        MappingDecision(
+            entity_type=config.entity_class.MAPPING_ENTITY_NAME,
+            name=normalize_label(free_item.name),
+            country_id=context.country,
+            entity_id=wikidata_id,
+            politician_id=politician.id,
+            reused=reused,
+        )
+    )
+
+
 async def _map_single_item(
-    openai_client: AsyncOpenAI,
+    openai_client: "AsyncOpenAI",
     db: Session,
     free_item: Any,
     politician: Politician,
     config: TwoStageExtractionConfig,
-    search_service: SearchService,
+    entity_ids: List[str],
+    context: MappingContext,
 ) -> Optional[Any]:
     """Helper function to map a single free-form item to Wikidata entity.
 
+    Candidates are ranked locally and only the best rerank_top_k are sent to
+    the LLM; a single exact match agreeing with the politician's countries is
+    taken without asking it.
+
     Args:
         openai_client: Async OpenAI client
         db: Database session
         free_item: Free-form extracted item
         politician: Politician being enriched
         config: Extraction configuration
-        search_service: SearchService for entity lookup
+        entity_ids: Candidate wikidata_ids found by search for this item
+        context: Politician's existing data used to rank candidates
     """
     try:
-        # Entity class handles routing to appropriate backend via find_similar
-        entity_ids = config.entity_class.find_similar(
-            free_item.name, search_service, limit=config.search_limit
-        )
-
         if not entity_ids:
             logger.debug(
                 f"No similar {config.entity_class.MAPPING_ENTITY_NAME}s found for '{free_item.name}'"
@@ -269,7 +405,10 @@ async def _map_single_item(
                         WikidataRelation.deleted_at.is_(None)
                     )
                 )
-                .selectinload(WikidataRelation.parent_entity)
+                .selectinload(WikidataRelation.parent_entity),
+                selectinload(config.entity_class.wikidata_entity).selectinload(
+                    WikidataEntity.labels
+                ),
             )
             .all()
         )
@@ -280,25 +419,45 @@ async def _map_single_item(
             )
             return None
 
-        # Use LLM to map to correct entity
-        candidate_entities = [
-            {
-                "qid": entity.wikidata_id,
-                "name": entity.name,
-                "description": entity.description,
-            }
-            for entity in similar_entities
-        ]
-
-        mapped_qid = await map_to_wikidata_entity(
-            openai_client,
+        # Keep search order among equally ranked candidates
+        order = {qid: i for i, qid in enumerate(entity_ids)}
+        similar_entities.sort(key=lambda entity: order[entity.wikidata_id])
+        by_qid = {entity.wikidata_id: entity for entity in similar_entities}
+        ranked = rank_candidates(
             free_item.name,
-            free_item.supporting_quotes,
-            candidate_entities,
-            politician,
-            config.entity_class.MAPPING_ENTITY_NAME,
-            config.mapping_system_prompt,
+            [entity.wikidata_entity for entity in similar_entities],
+            context,
         )
+        mapping_stats.items += 1
+        mapping_stats.candidates_found += len(ranked)
+
+        match = confident_match(ranked)
+        if match is not None:
+            mapping_stats.without_llm += 1
+            mapped_qid = match.wikidata_id
+        else:
+            top = ranked[: config.rerank_top_k]
+            mapping_stats.candidates_sent += len(top)
+
+            # Use LLM to map to correct entity
+            candidate_entities = [
+                {
+                    "qid": entity.wikidata_id,
+                    "name": entity.name,
+                    "description": entity.description,
+                }
+                for entity in (by_qid[c.entity.wikidata_id] for c in top)
+            ]
+
+            mapped_qid = await map_to_wikidata_entity(
+                openai_client,
+                free_item.name,
+                free_item.supporting_quotes,
+                candidate_entities,
+                politician,
+                config.entity_class.MAPPING_ENTITY_NAME,
+                config.mapping_system_prompt,
+            )
 
         if not mapped_qid:
             return None
@@ -308,27 +467,9 @@ async def _map_single_item(
         if not entity:
             return None
 
-        # Create result based on entity type
-        if config.entity_class.MAPPING_ENTITY_NAME == "position":
-            result = ExtractedPosition(
-                wikidata_id=entity.wikidata_id,
-                start_date=getattr(free_item, "start_date", None),
-                end_date=getattr(free_item, "end_date", None),
-                supporting_quotes=free_item.supporting_quotes,
-            )
-        elif config.entity_class.MAPPING_ENTITY_NAME == "location":
-            result = ExtractedBirthplace(
-                wikidata_id=entity.wikidata_id,
-                supporting_quotes=free_item.supporting_quotes,
-            )
-        else:  # country
-            result = ExtractedCitizenship(
-                wikidata_id=entity.wikidata_id,
-                supporting_quotes=free_item.supporting_quotes,
-            )
-
+        _record_decision(db, config, free_item, politician, context, mapped_qid)
         logger.debug(f"Mapped '{free_item.name}' -> '{entity.name}' ({mapped_qid})")
-        return result
+        return _mapped_result(config, free_item, entity.wikidata_id)
 
     except Exception as e:
         logger.error(
@@ -337,8 +478,43 @@ async def _map_single_item(
         return None
 
 
+async def _find_candidates(
+    config: TwoStageExtractionConfig,
+    names: List[str],
+    search_client: AsyncSearchClient,
+) -> List[List[str]]:
+    """Look up mapping candidates for all extracted names.
+
+    Uses one batched search. If it fails, falls back to one search per name,
+    so a failing search only loses the candidates of its own item.
+    """
+    entity_class = config.entity_class
+    try:
+        return await entity_class.find_similar_many(
+            names, search_client, limit=config.search_limit
+        )
+    except Exception as e:
+        logger.warning(
+            f"Batched {entity_class.MAPPING_ENTITY_NAME} search failed, "
+            f"searching items one by one: {e}"
+        )
+
+    async def find(name: str) -> List[str]:
+        try:
+            return await entity_class.find_similar(
+                name, search_client, limit=config.search_limit
+            )
+        except Exception as e:
+            logger.error(
+                f"Error searching {entity_class.MAPPING_ENTITY_NAME} '{name}': {e}"
+            )
+            return []
+
+    return list(await asyncio.gather(*[find(name) for name in names]))
+
+
 async def extract_two_stage_generic(
-    openai_client: AsyncOpenAI,
+    openai_client: "AsyncOpenAI",
     db: Session,
     content: str,
     politician: Politician,
@@ -353,8 +529,6 @@ async def extract_two_stage_generic(
         politician: Politician being enriched
         config: Extraction configuration
     """
-    search_service = SearchService()
-
     try:
         # Stage 1: Free-form extraction
         free_form_results = await extract_properties_generic(
@@ -372,6 +546,67 @@ async def extract_two_stage_generic(
             f"Stage 1: Extracted {len(free_form_results)} free-form {config.entity_class.MAPPING_ENTITY_NAME}s for {politician.name}: {extracted_names}"
         )
 
+        return await map_free_form_items(
+            openai_client, db, free_form_results, politician, config
+        )
+
+    except Exception as e:
+        logger.error(
+            f"Error extracting {config.entity_class.MAPPING_ENTITY_NAME}s: {e}"
+        )
+        return None
+
+
+async def map_free_form_items(
+    openai_client: "AsyncOpenAI",
+    db: Session,
+    free_form_results: List[Any],
+    politician: Politician,
+    config: TwoStageExtractionConfig,
+) -> Optional[List[Any]]:
+    """Map free-form extracted items to Wikidata entities (stage 2).
+
+    Args:
+        openai_client: Async OpenAI client
+        db: Database session
+        free_form_results: Items extracted in stage 1
+        politician: Politician being enriched
+        config: Extraction configuration
+    """
+    if not free_form_results:
+        return []
+
+    search_client = get_async_search_client()
+
+    try:
+        context = MappingContext.for_politician(politician, config.property_types)
+
+        # Names mapped confidently before, for other politicians of the same
+        # country, skip search and the LLM
+        names = [normalize_label(free_item.name) for free_item in free_form_results]
+        min_mappings = int(
+            os.getenv(
+                "MAPPING_DECISION_MIN_MAPPINGS", str(DEFAULT_DECISION_MIN_MAPPINGS)
+            )
+        )
+        decided = MappingDecision.lookup(
+            db, config.entity_class, names, context.country, min_mappings
+        )
+        pending = [
+            free_item
+            for free_item, name in zip(free_form_results, names)
+            if name not in decided
+        ]
+
+        # Look up candidates for all items in a single search round trip
+        candidate_ids = (
+            await _find_candidates(
+                config, [free_item.name for free_item in pending], search_client
+            )
+            if pending
+            else []
+        )
+
         # Stage 2: Map to Wikidata entities in parallel
         mapping_tasks = [
             _map_single_item(
@@ -380,12 +615,23 @@ async def extract_two_stage_generic(
                 free_item,
                 politician,
                 config,
-                search_service,
+                entity_ids,
+                context,
             )
-            for free_item in free_form_results
+            for free_item, entity_ids in zip(pending, candidate_ids)
         ]
+        mapped = iter(await asyncio.gather(*mapping_tasks))
 
-        mapping_results = await asyncio.gather(*mapping_tasks)
+        mapping_results = []
+        for free_item, name in zip(free_form_results, names):
+            if name not in decided:
+                mapping_results.append(next(mapped))
+                continue
+            mapping_stats.from_decisions += 1
+            _record_decision(
+                db, config, free_item, politician, context, decided[name], reused=True
+            )
+            mapping_results.append(_mapped_result(config, free_item, decided[name]))
 
         mapped_results = [result for result in mapping_results if result is not None]
 
@@ -395,14 +641,12 @@ async def extract_two_stage_generic(
         return mapped_results
 
     except Exception as e:
-        logger.error(
-            f"Error extracting {config.entity_class.MAPPING_ENTITY_NAME}s: {e}"
-        )
+        logger.error(f"Error mapping {config.entity_class.MAPPING_ENTITY_NAME}s: {e}")
         return None
 
 
 async def map_to_wikidata_entity(
-    openai_client: AsyncOpenAI,
+    openai_client: "AsyncOpenAI",
     extracted_name: str,
     supporting_quotes: List[str],
     candidate_entities: List[dict],
@@ -423,6 +667,8 @@ async def map_to_wikidata_entity(
             f"{entity_type.title()}MappingResult", **{field_name: (EntityQidType, None)}
         )
 
+        from dicttoxml import dicttoxml
+
         # Format candidates with XML structure and rich descriptions
         candidates_xml = dicttoxml(
             candidate_entities,
@@ -481,6 +727,7 @@ DATES_CONFIG = ExtractionConfig(
     result_model=PropertyExtractionResult,
     user_prompt_template=prompts.EXTRACTION_USER_PROMPT_TEMPLATE,
     analysis_focus_template=prompts.DATES_ANALYSIS_FOCUS_TEMPLATE,
+    content_route=ContentRoute(token_budget=2000),
 )
 
 POSITIONS_CONFIG = TwoStageExtractionConfig(
@@ -494,6 +741,12 @@ POSITIONS_CONFIG = TwoStageExtractionConfig(
     mapping_system_prompt=prompts.POSITION_MAPPING_SYSTEM_PROMPT,
     final_model=ExtractedPosition,
     search_limit=100,
+    rerank_top_k=10,
+    content_route=ContentRoute(
+        section_keywords=CAREER_KEYWORDS,
+        all_sections_fallback=True,
+        token_budget=8000,
+    ),
 )
 
 BIRTHPLACES_CONFIG = TwoStageExtractionConfig(
@@ -507,6 +760,8 @@ BIRTHPLACES_CONFIG = TwoStageExtractionConfig(
     mapping_system_prompt=prompts.LOCATION_MAPPING_SYSTEM_PROMPT,
     final_model=ExtractedBirthplace,
     search_limit=100,
+    rerank_top_k=10,
+    content_route=ContentRoute(section_keywords=BIOGRAPHY_KEYWORDS, token_budget=2000),
 )
 
 CITIZENSHIPS_CONFIG = TwoStageExtractionConfig(
@@ -520,14 +775,425 @@ CITIZENSHIPS_CONFIG = TwoStageExtractionConfig(
     mapping_system_prompt=prompts.COUNTRY_MAPPING_SYSTEM_PROMPT,
     final_model=ExtractedCitizenship,
     search_limit=25,
+    rerank_top_k=5,
+    content_route=ContentRoute(section_keywords=BIOGRAPHY_KEYWORDS, token_budget=3000),
+)
+
+COMBINED_CONFIG = ExtractionConfig(
+    property_types=[
+        PropertyType.BIRTH_DATE,
+        PropertyType.DEATH_DATE,
+        PropertyType.POSITION,
+        PropertyType.BIRTHPLACE,
+        PropertyType.CITIZENSHIP,
+    ],
+    system_prompt=prompts.COMBINED_EXTRACTION_SYSTEM_PROMPT,
+    result_model=CombinedExtractionResult,
+    user_prompt_template=prompts.COMBINED_USER_PROMPT_TEMPLATE,
+    analysis_focus_template=prompts.COMBINED_ANALYSIS_FOCUS_TEMPLATE,
+    content_route=ContentRoute(
+        section_keywords=CAREER_KEYWORDS + BIOGRAPHY_KEYWORDS,
+        all_sections_fallback=True,
+        token_budget=10000,
+    ),
 )
 
+# How the free-form extraction stage calls the LLM (EXTRACTION_MODE):
+# "per_property" makes one call per property group, "single_call" extracts
+# all groups in one call
+EXTRACTION_MODES = ("per_property", "single_call")
+DEFAULT_EXTRACTION_MODE = "per_property"
+
+# Share of infobox fast path hits still sent to the LLM, to keep measuring
+# agreement (INFOBOX_AUDIT_RATE)
+DEFAULT_INFOBOX_AUDIT_RATE = 0.05
+
+
+class InfoboxStats:
+    """Counts of how infobox dates served the date extraction.
+
+    A hit is a page whose infobox gives every date the person can have, so
+    the date LLM call is skipped; partial pages still call the LLM. Whenever
+    both ran, each infobox date is compared with the LLM's answer.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.partial = 0
+        self.misses = 0
+        self.agreements = 0
+        self.conflicts = 0
+        self.missed_by_llm = 0
+
+    def compare(
+        self,
+        infobox_dates: List[InfoboxDate],
+        properties: Optional[List[ExtractedProperty]],
+    ) -> None:
+        """Record the agreement of infobox dates with the LLM's."""
+        for date in infobox_dates:
+            values = {p.value for p in properties or [] if p.type == date.type}
+            if not values:
+                self.missed_by_llm += 1
+            elif date.value in values:
+                self.agreements += 1
+            else:
+                self.conflicts += 1
+                logger.info(
+                    f"Infobox {date.type.name.lower()} {date.value} differs "
+                    f"from LLM {sorted(values)}"
+                )
+
+    def stats(self) -> dict:
+        """Fast path counts since the process started."""
+        compared = self.agreements + self.conflicts + self.missed_by_llm
+        return {
+            "hits": self.hits,
+            "partial": self.partial,
+            "misses": self.misses,
+            "agreements": self.agreements,
+            "conflicts": self.conflicts,
+            "missed_by_llm": self.missed_by_llm,
+            "agreement_rate": self.agreements / compared if compared else 0.0,
+        }
+
+
+# Process-wide infobox fast path counters
+infobox_stats = InfoboxStats()
+
+
+def _infobox_complete(page: SegmentedPage) -> bool:
+    """Whether the infobox gives every date the person can have."""
+    types = {date.type for date in page.infobox_dates}
+    return PropertyType.BIRTH_DATE in types and (
+        PropertyType.DEATH_DATE in types or page.living
+    )
+
+
+def _merge_infobox_dates(
+    page: SegmentedPage, properties: Optional[List[ExtractedProperty]]
+) -> Optional[List[ExtractedProperty]]:
+    """Replace the LLM's dates with the infobox's where it has them."""
+    if not page.infobox_dates:
+        return properties
+    infobox_types = {date.type for date in page.infobox_dates}
+    return [
+        ExtractedProperty(
+            type=date.type, value=date.value, supporting_quotes=[date.quote]
+        )
+        for date in page.infobox_dates
+    ] + [p for p in properties or [] if p.type not in infobox_types]
+
+
+async def extract_dates(
+    openai_client: "AsyncOpenAI",
+    content: str,
+    politician: Politician,
+    page: Optional[SegmentedPage] = None,
+) -> Optional[List[ExtractedProperty]]:
+    """Extract birth and death dates, reading them from the infobox if possible.
+
+    When the infobox gives every date the person can have, the LLM call is
+    skipped, except for a sample (INFOBOX_AUDIT_RATE) that keeps measuring
+    agreement. Otherwise the LLM is asked and the infobox dates it has take
+    precedence over its answer.
+    """
+    if page is None:
+        return await extract_properties_generic(
+            openai_client, content, politician, DATES_CONFIG
+        )
+    if not page.infobox_dates:
+        infobox_stats.misses += 1
+        return await extract_properties_generic(
+            openai_client, content, politician, DATES_CONFIG
+        )
+
+    if _infobox_complete(page):
+        infobox_stats.hits += 1
+        audit_rate = float(
+            os.getenv("INFOBOX_AUDIT_RATE", str(DEFAULT_INFOBOX_AUDIT_RATE))
+        )
+        if random.random() >= audit_rate:
+            logger.debug(f"Dates of {politician.name} read from infobox")
+            return _merge_infobox_dates(page, [])
+    else:
+        infobox_stats.partial += 1
+
+    properties = await extract_properties_generic(
+        openai_client, content, politician, DATES_CONFIG
+    )
+    if properties is not None:
+        infobox_stats.compare(page.infobox_dates, properties)
+    return _merge_infobox_dates(page, properties)
+
+
+ExtractionResults = tuple[
+    Optional[List[ExtractedProperty]],
+    Optional[List[ExtractedPosition]],
+    Optional[List[ExtractedBirthplace]],
+    Optional[List[ExtractedCitizenship]],
+]
+
+
+async def extract_single_call(
+    openai_client: "AsyncOpenAI",
+    db: Session,
+    content: str,
+    politician: Politician,
+    page: Optional[SegmentedPage] = None,
+) -> ExtractionResults:
+    """Extract all property groups in one call, then map the entities.
+
+    Args:
+        openai_client: Async OpenAI client
+        db: Database session
+        content: Content routed for COMBINED_CONFIG
+        politician: Politician being enriched
+        page: Segmented page whose infobox dates take precedence
+
+    Returns:
+        Dates, positions, birthplaces and citizenships; None for all of them
+        if the extraction call failed
+    """
+    try:
+        parsed = await parse_extraction(
+            openai_client, content, politician, COMBINED_CONFIG
+        )
+    except Exception as e:
+        logger.error(f"Error extracting properties with LLM: {e}")
+        parsed = None
+    if parsed is None:
+        return None, None, None, None
+
+    positions, birthplaces, citizenships = await asyncio.gather(
+        *[
+            map_free_form_items(
+                openai_client,
+                db,
+                getattr(parsed, config.result_field_name) or [],
+                politician,
+                config,
+            )
+            for config in (POSITIONS_CONFIG, BIRTHPLACES_CONFIG, CITIZENSHIPS_CONFIG)
+        ]
+    )
+    properties = parsed.properties
+    if page is not None and page.infobox_dates:
+        # The combined call can't be skipped, so every infobox hit is compared
+        infobox_stats.compare(page.infobox_dates, properties)
+        properties = _merge_infobox_dates(page, properties)
+    return properties, positions, birthplaces, citizenships
+
+
+async def _extract_routed(
+    openai_client: "AsyncOpenAI",
+    db: Session,
+    politician: Politician,
+    routed: Callable[[ExtractionConfig], str],
+    mode: Optional[str],
+    page: Optional[SegmentedPage],
+) -> ExtractionResults:
+    """Extract and map all property groups from the content routed to each."""
+    mode = mode or os.getenv("EXTRACTION_MODE", DEFAULT_EXTRACTION_MODE)
+    if mode == "single_call":
+        return await extract_single_call(
+            openai_client, db, routed(COMBINED_CONFIG), politician, page
+        )
+    if mode != "per_property":
+        raise ValueError(
+            f"Unknown extraction mode {mode!r}, expected one of {EXTRACTION_MODES}"
+        )
+
+    return await asyncio.gather(
+        extract_dates(openai_client, routed(DATES_CONFIG), politician, page),
+        extract_two_stage_generic(
+            openai_client,
+            db,
+            routed(POSITIONS_CONFIG),
+            politician,
+            POSITIONS_CONFIG,
+        ),
+        extract_two_stage_generic(
+            openai_client,
+            db,
+            routed(BIRTHPLACES_CONFIG),
+            politician,
+            BIRTHPLACES_CONFIG,
+        ),
+        extract_two_stage_generic(
+            openai_client,
+            db,
+            routed(CITIZENSHIPS_CONFIG),
+            politician,
+            CITIZENSHIPS_CONFIG,
+        ),
+    )
+
+
+async def extract_all(
+    openai_client: "AsyncOpenAI",
+    db: Session,
+    content: str,
+    politician: Politician,
+    mode: Optional[str] = None,
+    page: Optional[SegmentedPage] = None,
+) -> ExtractionResults:
+    """Extract and map all property groups from text content.
+
+    Args:
+        openai_client: Async OpenAI client
+        db: Database session
+        content: Text content to extract from
+        politician: Politician being enriched
+        mode: One of EXTRACTION_MODES. Defaults to EXTRACTION_MODE env var or
+            per_property.
+        page: Segmented page, routing each configuration only the relevant
+            parts of the content. None sends the full content to all of them.
+
+    Returns:
+        Dates, positions, birthplaces and citizenships
+    """
+
+    def routed(config: ExtractionConfig) -> str:
+        return route_content(page, config.content_route, content)
+
+    return await _extract_routed(openai_client, db, politician, routed, mode, page)
+
+
+@dataclass
+class SourceDocument:
+    """Text of an archived source, ready for extraction."""
+
+    source: Source
+    content: str
+    # Sections of Wikipedia articles, None for other pages
+    page: Optional[SegmentedPage] = None
+
+
+def consolidate_content(
+    documents: List[SourceDocument], config: ExtractionConfig
+) -> str:
+    """Content of several sources for a single extraction call.
+
+    Each source contributes the parts its page routes to the configuration,
+    so token budgets apply per source.
+    """
+    if len(documents) == 1:
+        document = documents[0]
+        return route_content(document.page, config.content_route, document.content)
+    sources = "\n\n".join(
+        prompts.SOURCE_CONTENT_TEMPLATE.format(
+            url=document.source.url,
+            content=route_content(
+                document.page, config.content_route, document.content
+            ),
+        )
+        for document in documents
+    )
+    return prompts.CONSOLIDATED_CONTENT_TEMPLATE.format(
+        count=len(documents), sources=sources
+    )
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _quotable_text(document: SourceDocument) -> str:
+    """The document's text that quotes can come from, normalized.
+
+    Besides the content sent to the LLM, this includes the quotes of the
+    infobox dates read from the document's page, which are stored with
+    those quotes in place of the LLM's.
+    """
+    parts = [document.content]
+    if document.page:
+        parts.extend(date.quote for date in document.page.infobox_dates)
+    return _normalize_text("\n".join(parts))
+
+
+def assign_quotes(
+    items: Optional[List[QuotedExtraction]], documents: List[SourceDocument]
+) -> List[List[QuotedExtraction]]:
+    """Split items extracted from several sources by where their quotes are.
+
+    A quote belongs to every source whose text contains it. Items quoting
+    several sources are stored for each of them with that source's quotes.
+    Quotes found in no source stay with the item's other sources. Items none
+    of whose quotes is found are dropped, as there is no source to reference.
+
+    Returns:
+        The items to store for each document, in document order
+    """
+    texts = [_quotable_text(document) for document in documents]
+    assigned: List[List[QuotedExtraction]] = [[] for _ in documents]
+    for item in items or []:
+        quotes: List[List[str]] = [[] for _ in documents]
+        unmatched = []
+        for quote in item.supporting_quotes:
+            normalized = _normalize_text(quote)
+            matches = [
+                i for i, text in enumerate(texts) if normalized and normalized in text
+            ]
+            if not matches:
+                unmatched.append(quote)
+            for i in matches:
+                quotes[i].append(quote)
+        sources = [i for i, found in enumerate(quotes) if found]
+        if not sources:
+            logger.warning(
+                f"Dropping extracted item with quotes found in no source: "
+                f"{item.supporting_quotes}"
+            )
+            continue
+        for i in sources:
+            assigned[i].append(
+                item.model_copy(update={"supporting_quotes": quotes[i] + unmatched})
+            )
+    return assigned
+
+
+async def extract_all_sources(
+    openai_client: "AsyncOpenAI",
+    db: Session,
+    documents: List[SourceDocument],
+    politician: Politician,
+    mode: Optional[str] = None,
+) -> ExtractionResults:
+    """Extract and map all property groups from several sources at once.
+
+    Every call gets the content of all sources, so facts they share are
+    extracted and mapped once instead of once per source.
+
+    Args:
+        openai_client: Async OpenAI client
+        db: Database session
+        documents: Sources to extract from, the primary article first
+        politician: Politician being enriched
+        mode: Extraction mode, see extract_all
+
+    Returns:
+        Dates, positions, birthplaces and citizenships
+    """
+    # Infobox dates are read from the first article that has them
+    page = next(
+        (d.page for d in documents if d.page and d.page.infobox_dates),
+        documents[0].page,
+    )
+
+    def routed(config: ExtractionConfig) -> str:
+        return consolidate_content(documents, config)
+
+    return await _extract_routed(openai_client, db, politician, routed, mode, page)
+
 
 async def extract_and_store(
     db: Session,
     content: str,
     politician: Politician,
     source: Source,
+    mode: Optional[str] = None,
+    page: Optional[SegmentedPage] = None,
 ) -> int:
     """Extract properties from text content and store them.
 
@@ -538,48 +1204,21 @@ async def extract_and_store(
         content: Plain text content extracted from the source
         politician: Politician to extract properties for
         source: Source to link references to
+        mode: Extraction mode, see extract_all
+        page: Segmented page for routing content, see extract_all
 
     Returns:
         Number of properties extracted.
     """
-    openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    try:
-        (
-            date_properties,
-            positions,
-            birthplaces,
-            citizenships,
-        ) = await asyncio.gather(
-            extract_properties_generic(
-                openai_client,
-                content,
-                politician,
-                DATES_CONFIG,
-            ),
-            extract_two_stage_generic(
-                openai_client,
-                db,
-                content,
-                politician,
-                POSITIONS_CONFIG,
-            ),
-            extract_two_stage_generic(
-                openai_client,
-                db,
-                content,
-                politician,
-                BIRTHPLACES_CONFIG,
-            ),
-            extract_two_stage_generic(
-                openai_client,
-                db,
-                content,
-                politician,
-                CITIZENSHIPS_CONFIG,
-            ),
-        )
-    finally:
-        await openai_client.close()
+    # Shared governed client; identical calls, e.g. when re-enriching an
+    # unchanged article, are answered from the response cache
+    openai_client = CachingOpenAI(await get_openai_client())
+    (
+        date_properties,
+        positions,
+        birthplaces,
+        citizenships,
+    ) = await extract_all(openai_client, db, content, politician, mode, page)
 
     store_extracted_data(
         db,
@@ -598,6 +1237,39 @@ async def extract_and_store(
     )
 
 
+async def extract_and_store_sources(
+    db: Session,
+    documents: List[SourceDocument],
+    politician: Politician,
+    mode: Optional[str] = None,
+) -> int:
+    """Extract properties from several sources together and store them.
+
+    This is the entry point of consolidated enrichment. References are
+    stored for the source each supporting quote comes from, see
+    assign_quotes.
+
+    Args:
+        db: Database session
+        documents: Sources to extract from, the primary article first
+        politician: Politician to extract properties for
+        mode: Extraction mode, see extract_all
+
+    Returns:
+        Number of properties extracted.
+    """
+    openai_client = CachingOpenAI(await get_openai_client())
+    results = await extract_all_sources(openai_client, db, documents, politician, mode)
+
+    by_source = [assign_quotes(items, documents) for items in results]
+    for i, document in enumerate(documents):
+        store_extracted_data(
+            db, politician, document.source, *(groups[i] for groups in by_source)
+        )
+
+    return sum(len(items) for items in results if items)
+
+
 def store_extracted_data(
     db: Session,
     politician: Politician,
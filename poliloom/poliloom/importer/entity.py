@@ -2,7 +2,7 @@
 
 import logging
 import multiprocessing as mp
-from typing import Dict, Tuple, Type
+from typing import Dict, Optional, Tuple, Type
 from dataclasses import dataclass, field
 
 from sqlalchemy.orm import Session
@@ -78,11 +78,12 @@ class EntityCollection:
         for entity in self.entities:
             labels = entity.get("labels")
             if labels:
-                for label in labels:
+                for label, language_count in labels.items():
                     label_data.append(
                         {
                             "entity_id": entity["wikidata_id"],
                             "label": label,
+                            "language_count": language_count,
                         }
                     )
 
@@ -173,9 +174,8 @@ def _process_supporting_entities_chunk(
                 continue  # Skip entities without names - needed for search indexing
 
             entity_description = entity.get_entity_description()
-            entity_labels = (
-                entity.get_all_labels()
-            )  # Get all unique labels across languages
+            # Unique labels across languages with their number of languages
+            entity_labels = entity.get_label_language_counts()
             entity_data = {
                 "wikidata_id": entity_id,
                 "name": entity_name,
@@ -248,6 +248,7 @@ def _process_supporting_entities_chunk(
 def import_entities(
     dump_file_path: str,
     batch_size: int = 1000,
+    num_workers: Optional[int] = None,
 ) -> None:
     """
     Import supporting entities from the Wikidata dump using parallel processing.
@@ -258,6 +259,7 @@ def import_entities(
     Args:
         dump_file_path: Path to the Wikidata JSON dump file
         batch_size: Number of entities to process in each database batch
+        num_workers: Worker processes in the pool (default: CPU count)
     """
     global worker_config
 
@@ -303,7 +305,7 @@ def import_entities(
             f"{len(cfg['ignored'])} ignored"
         )
 
-    num_workers = mp.cpu_count()
+    num_workers = num_workers or mp.cpu_count()
     logger.info(f"Using parallel processing with {num_workers} workers")
 
     # Split file into chunks for parallel processing
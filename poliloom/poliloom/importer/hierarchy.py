@@ -2,7 +2,7 @@
 
 import logging
 import multiprocessing as mp
-from typing import Set, Tuple
+from typing import Optional, Set, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -164,6 +164,7 @@ def _process_second_pass_chunk(
 def import_hierarchy_trees(
     dump_file_path: str,
     batch_size: int = 1000,
+    num_workers: Optional[int] = None,
 ) -> None:
     """
     Import hierarchy trees for positions and locations from Wikidata dump.
@@ -175,10 +176,11 @@ def import_hierarchy_trees(
     Args:
         dump_file_path: Path to the Wikidata JSON dump file
         batch_size: Number of entities to process in each database batch
+        num_workers: Worker processes in the pool (default: CPU count)
     """
     logger.info(f"Importing hierarchy trees from dump file: {dump_file_path}")
 
-    num_workers = mp.cpu_count()
+    num_workers = num_workers or mp.cpu_count()
     logger.info(f"Using {num_workers} parallel workers")
 
     # Split file into chunks for parallel processing
@@ -2,7 +2,7 @@
 
 import logging
 import multiprocessing as mp
-from typing import Tuple
+from typing import Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -110,11 +110,12 @@ def _insert_politicians_batch(politicians: list[dict], session: Session) -> None
     for p in politicians:
         labels = p.get("labels")
         if labels:
-            for label in labels:
+            for label, language_count in labels.items():
                 label_data.append(
                     {
                         "entity_id": p["wikidata_id"],
                         "label": label,
+                        "language_count": language_count,
                     }
                 )
 
@@ -218,9 +219,8 @@ def _process_politicians_chunk(
                         pass
 
                 # Extract all labels for search functionality
-                entity_labels = (
-                    entity.get_all_labels()
-                )  # Get all unique labels across languages
+                # Unique labels across languages with their number of languages
+                entity_labels = entity.get_label_language_counts()
 
                 politician_data = {
                     "wikidata_id": wikidata_id,
@@ -389,6 +389,7 @@ def _process_politicians_chunk(
 def import_politicians(
     dump_file_path: str,
     batch_size: int = 1000,
+    num_workers: Optional[int] = None,
 ) -> None:
     """
     Import politicians from the Wikidata dump using parallel processing.
@@ -396,6 +397,7 @@ def import_politicians(
     Args:
         dump_file_path: Path to the Wikidata JSON dump file
         batch_size: Number of entities to process in each database batch
+        num_workers: Worker processes in the pool (default: CPU count)
     """
     # Load existing entity QIDs from database for filtering
     with Session(get_engine()) as session:
@@ -449,7 +451,7 @@ def import_politicians(
     shared_country_qids = frozenset(country_qids)
     shared_wikipedia_projects = wikipedia_projects
 
-    num_workers = mp.cpu_count()
+    num_workers = num_workers or mp.cpu_count()
     logger.info(f"Using parallel processing with {num_workers} workers")
 
     # Split file into chunks for parallel processing
@@ -0,0 +1,566 @@
+"""Shared plumbing for the structured OpenAI calls made during enrichment.
+
+Enrichment gets its client from get_openai_client(): one pooled AsyncOpenAI
+client per process whose calls go through an LLMGovernor enforcing
+concurrency and tokens-per-minute budgets, wrapped by CachingOpenAI so
+repeated requests are answered from the response cache.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterator, Optional, Type
+
+import orjson
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Default size of the persistent response cache (LLM_CACHE_MAX_MB, 0 disables)
+DEFAULT_LLM_CACHE_MAX_MB = 1024
+
+# Stores between evictions of least recently used responses
+EVICT_EVERY = 100
+
+# Defaults for the process-wide governor: concurrent calls
+# (OPENAI_MAX_CONCURRENCY), tokens per minute (OPENAI_TPM, 0 = no budget) and
+# retries of rate-limited calls (OPENAI_MAX_RETRIES)
+DEFAULT_OPENAI_MAX_CONCURRENCY = 16
+DEFAULT_OPENAI_TPM = 0
+DEFAULT_OPENAI_MAX_RETRIES = 5
+
+# Output and reasoning tokens reserved per call until its usage is known
+ESTIMATED_OUTPUT_TOKENS = 1000
+
+# Prices in USD per million tokens for reporting the cost of enrichment:
+# OPENAI_INPUT_PRICE, OPENAI_CACHED_INPUT_PRICE (defaults to the input price)
+# and OPENAI_OUTPUT_PRICE. No cost is reported without an input price.
+
+
+def request_hash(
+    model: str,
+    reasoning_effort: Optional[str],
+    messages: list[dict],
+    text_format: Type[BaseModel],
+) -> str:
+    """Hash everything that determines the answer of a structured call.
+
+    The response schema is part of the key, so mapping calls offering a
+    different candidate set never share an answer.
+    """
+    payload = orjson.dumps(
+        [model, reasoning_effort, messages, text_format.model_json_schema()],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """Stand-in for a parsed OpenAI response served from the cache."""
+
+    output_parsed: BaseModel
+
+
+class ResponseCache:
+    """Persistent cache of parsed LLM answers, stored in Postgres.
+
+    Counts hits and misses so runs can report how many calls were saved.
+    Entries are written in their own transactions, so answers that were
+    paid for survive a failed enrichment. Lookups and stores block on the
+    database; async callers run them in a worker thread.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, bind=None):
+        """Initialize ResponseCache.
+
+        Args:
+            max_bytes: Total size of cached responses to keep. Defaults to
+                LLM_CACHE_MAX_MB env var or 1024 MB; 0 disables the cache.
+            bind: SQLAlchemy engine or connection. Defaults to the application
+                engine.
+        """
+        if max_bytes is None:
+            max_bytes = (
+                int(os.getenv("LLM_CACHE_MAX_MB", str(DEFAULT_LLM_CACHE_MAX_MB)))
+                * 1024
+                * 1024
+            )
+        self.max_bytes = max_bytes
+        self.bind = bind
+        self.enabled = max_bytes > 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def _session(self):
+        from sqlalchemy.orm import Session
+
+        from .database import get_engine
+
+        return Session(self.bind if self.bind is not None else get_engine())
+
+    def get(self, key: str, text_format: Type[BaseModel]) -> Optional[BaseModel]:
+        """Get a cached answer parsed into its response model."""
+        from .models import LLMResponse
+
+        if not self.enabled:
+            return None
+        with self._session() as session:
+            response = LLMResponse.lookup(session, key)
+            session.commit()
+        with self._lock:
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return text_format.model_validate_json(response)
+
+    def put(self, key: str, model: str, parsed: BaseModel) -> None:
+        """Store an answer, evicting old ones every EVICT_EVERY stores."""
+        from .models import LLMResponse
+
+        if not self.enabled:
+            return
+        with self._session() as session:
+            LLMResponse.store(session, key, model, parsed.model_dump_json())
+            with self._lock:
+                self.stores += 1
+                evict = self.stores % EVICT_EVERY == 0
+            if evict:
+                evicted = LLMResponse.evict(session, self.max_bytes)
+                with self._lock:
+                    self.evicted += evicted
+            session.commit()
+
+    def stats(self) -> dict:
+        """Hit and miss counts since the cache was created."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evicted": self.evicted,
+        }
+
+
+# Process-wide response cache
+response_cache = ResponseCache()
+
+
+def _token_count(usage: Any, *path: str) -> int:
+    """Read a token count from an OpenAI usage object, 0 if it isn't reported."""
+    value = usage
+    for name in path:
+        value = getattr(value, name, None)
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class LLMUsage:
+    """Calls and tokens of the OpenAI calls made within a tracked scope."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+    def record(self, response: Any) -> None:
+        """Add the usage reported with a model response."""
+        usage = getattr(response, "usage", None)
+        self.calls += 1
+        self.input_tokens += _token_count(usage, "input_tokens")
+        self.cached_input_tokens += _token_count(
+            usage, "input_tokens_details", "cached_tokens"
+        )
+        self.output_tokens += _token_count(usage, "output_tokens")
+
+    def cost(self) -> Optional[float]:
+        """Cost in USD at the configured prices, or None without prices."""
+        input_price = os.getenv("OPENAI_INPUT_PRICE")
+        if not input_price:
+            return None
+        input_price = float(input_price)
+        cached_price = float(os.getenv("OPENAI_CACHED_INPUT_PRICE") or input_price)
+        output_price = float(os.getenv("OPENAI_OUTPUT_PRICE") or 0)
+        uncached = self.input_tokens - self.cached_input_tokens
+        return (
+            uncached * input_price
+            + self.cached_input_tokens * cached_price
+            + self.output_tokens * output_price
+        ) / 1_000_000
+
+    def summary(self) -> str:
+        """One-line description for logs and command output."""
+        text = (
+            f"{self.calls} calls, {self.cache_hits} answered from cache, "
+            f"{self.input_tokens} input tokens ({self.cached_input_tokens} "
+            f"cached), {self.output_tokens} output tokens"
+        )
+        cost = self.cost()
+        return text if cost is None else f"{text}, ${cost:.4f}"
+
+
+# Usage trackers of the current task and the scopes it runs in
+_usage_scopes: ContextVar[tuple[LLMUsage, ...]] = ContextVar(
+    "llm_usage_scopes", default=()
+)
+
+
+@contextmanager
+def track_usage() -> Iterator[LLMUsage]:
+    """Count the OpenAI calls made within the block.
+
+    Scopes nest, e.g. per politician within a whole enrichment run, and
+    include calls of tasks started within the block.
+    """
+    usage = LLMUsage()
+    token = _usage_scopes.set(_usage_scopes.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _usage_scopes.reset(token)
+
+
+class _CachedResponses:
+    """responses resource answering parse calls from the cache first."""
+
+    def __init__(self, responses: Any, cache: ResponseCache):
+        self._responses = responses
+        self._cache = cache
+
+    async def parse(
+        self,
+        *,
+        model: str,
+        input: list[dict],
+        text_format: Type[BaseModel],
+        reasoning: Optional[dict] = None,
+        **kwargs: Any,
+    ):
+        effort = (reasoning or {}).get("effort")
+        key = request_hash(model, effort, input, text_format)
+        try:
+            # Off the event loop, so concurrent calls aren't stalled by the
+            # database round trip
+            cached = await asyncio.to_thread(self._cache.get, key, text_format)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed, calling the model: {e}")
+            cached = None
+        if cached is not None:
+            for usage in _usage_scopes.get():
+                usage.cache_hits += 1
+            return CachedResponse(output_parsed=cached)
+
+        response = await self._responses.parse(
+            model=model,
+            input=input,
+            text_format=text_format,
+            reasoning=reasoning,
+            **kwargs,
+        )
+        if response.output_parsed is not None:
+            try:
+                await asyncio.to_thread(
+                    self._cache.put, key, model, response.output_parsed
+                )
+            except Exception as e:
+                logger.warning(f"Storing LLM response in cache failed: {e}")
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._responses, name)
+
+
+class CachingOpenAI:
+    """AsyncOpenAI wrapper serving repeated structured calls from a cache.
+
+    Only responses.parse is cached; everything else goes to the wrapped
+    client unchanged.
+    """
+
+    def __init__(self, client: Any, cache: Optional[ResponseCache] = None):
+        self._client = client
+        self.responses = _CachedResponses(client.responses, cache or response_cache)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Rough token count of a request: ~4 characters per input token."""
+    characters = sum(len(str(message.get("content", ""))) for message in messages)
+    return characters // 4 + ESTIMATED_OUTPUT_TOKENS
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited call.
+
+    Returns:
+        The delay requested by the Retry-After headers, a default of one
+        second without them, or None if the error is not a rate limit
+    """
+    if getattr(error, "status_code", None) != 429:
+        return None
+    response = getattr(error, "response", None)
+    headers = response.headers if response is not None else {}
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        value = headers["retry-after"]
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+            except (TypeError, ValueError):
+                pass
+    return 1.0
+
+
+class LLMGovernor:
+    """Process-wide limits for OpenAI calls.
+
+    Caps concurrent calls, keeps the tokens reserved in the last minute
+    within a budget, and pauses every caller when a call is rate limited
+    until the Retry-After delay has passed. Token reservations use an
+    estimate and are corrected with the usage reported by the response.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize LLMGovernor. Must be called within the event loop using it.
+
+        Args:
+            max_concurrency: Concurrent calls. Defaults to
+                OPENAI_MAX_CONCURRENCY env var or 16.
+            tokens_per_minute: Token budget per minute. Defaults to OPENAI_TPM
+                env var; 0 disables the budget.
+            max_retries: Retries of rate-limited calls. Defaults to
+                OPENAI_MAX_RETRIES env var or 5.
+            clock: Monotonic time source, injectable for tests
+        """
+        if max_concurrency is None:
+            max_concurrency = int(
+                os.getenv("OPENAI_MAX_CONCURRENCY", str(DEFAULT_OPENAI_MAX_CONCURRENCY))
+            )
+        if tokens_per_minute is None:
+            tokens_per_minute = int(os.getenv("OPENAI_TPM", str(DEFAULT_OPENAI_TPM)))
+        if max_retries is None:
+            max_retries = int(
+                os.getenv("OPENAI_MAX_RETRIES", str(DEFAULT_OPENAI_MAX_RETRIES))
+            )
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Callers queue here in order while waiting for token budget
+        self._budget_lock = asyncio.Lock()
+        self._usage: deque[tuple[float, int]] = deque()
+        self._paused_until = 0.0
+        self.calls = 0
+        self.rate_limited = 0
+
+    def _tokens_used(self, now: float) -> int:
+        while self._usage and self._usage[0][0] <= now - 60:
+            self._usage.popleft()
+        return sum(tokens for _, tokens in self._usage)
+
+    async def _reserve(self, tokens: int) -> Optional[tuple[float, int]]:
+        """Wait until the tokens fit in the budget of the last minute.
+
+        Returns:
+            The reservation, or None without a budget
+        """
+        if self.tokens_per_minute <= 0:
+            return None
+        async with self._budget_lock:
+            while True:
+                now = self.clock()
+                used = self._tokens_used(now)
+                # A request larger than the whole budget runs on its own
+                if used + tokens <= self.tokens_per_minute or not self._usage:
+                    break
+                await asyncio.sleep(self._usage[0][0] + 60 - now)
+            reservation = (now, tokens)
+            self._usage.append(reservation)
+            return reservation
+
+    def _release(self, reservation: Optional[tuple[float, int]]) -> None:
+        """Give back the tokens of a call the API rejected without using them."""
+        if reservation is None:
+            return
+        try:
+            self._usage.remove(reservation)
+        except ValueError:
+            # Already outside the window
+            pass
+
+    async def _wait_while_paused(self) -> None:
+        while (delay := self._paused_until - self.clock()) > 0:
+            await asyncio.sleep(delay)
+
+    async def call(
+        self, send: Callable[[], Awaitable[Any]], estimated_tokens: int
+    ) -> Any:
+        """Run an OpenAI call within the limits, retrying on rate limits.
+
+        Args:
+            send: Starts the call; invoked again for each retry
+            estimated_tokens: Tokens to reserve until the actual usage is known
+
+        Returns:
+            The call's response
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._wait_while_paused()
+            reservation = await self._reserve(estimated_tokens)
+            async with self._semaphore:
+                self.calls += 1
+                try:
+                    response = await send()
+                except Exception as e:
+                    delay = retry_after(e)
+                    if delay is None:
+                        raise
+                    self.rate_limited += 1
+                    # The retry reserves its tokens again
+                    self._release(reservation)
+                    # Pause every caller, not only this one
+                    self._paused_until = max(self._paused_until, self.clock() + delay)
+                    if attempt == self.max_retries:
+                        raise
+                    logger.warning(
+                        f"OpenAI rate limit hit, pausing calls for {delay:.1f}s "
+                        f"(retry {attempt + 1}/{self.max_retries})"
+                    )
+                    continue
+
+            usage = getattr(response, "usage", None)
+            total_tokens = getattr(usage, "total_tokens", None)
+            if self.tokens_per_minute > 0 and isinstance(total_tokens, int):
+                # Correct the estimate with what the call actually used
+                self._usage.append((self.clock(), total_tokens - estimated_tokens))
+            return response
+
+    def stats(self) -> dict:
+        """Calls made and rate limits hit since the governor was created."""
+        return {"calls": self.calls, "rate_limited": self.rate_limited}
+
+
+class _GovernedResponses:
+    """responses resource running parse calls through a governor."""
+
+    def __init__(self, responses: Any, governor: LLMGovernor):
+        self._responses = responses
+        self._governor = governor
+
+    async def parse(self, *, input: list[dict], **kwargs: Any):
+        response = await self._governor.call(
+            lambda: self._responses.parse(input=input, **kwargs),
+            estimate_tokens(input),
+        )
+        for usage in _usage_scopes.get():
+            usage.record(response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._responses, name)
+
+
+class GovernedOpenAI:
+    """AsyncOpenAI wrapper sending responses.parse calls through a governor."""
+
+    def __init__(self, client: Any, governor: Optional[LLMGovernor] = None):
+        # Pooled connections and the governor's primitives belong to the
+        # event loop that created them
+        self.loop = asyncio.get_running_loop()
+        self._client = client
+        self.governor = governor or LLMGovernor()
+        self.responses = _GovernedResponses(client.responses, self.governor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def create_openai_client() -> GovernedOpenAI:
+    """Create a pooled, governed OpenAI client.
+
+    Must be called from within a running event loop. The SDK's own retries
+    are disabled, so rate-limited calls are retried by the governor.
+    """
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+    import httpx
+
+    governor = LLMGovernor()
+    client = AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=governor.max_concurrency,
+                max_keepalive_connections=governor.max_concurrency,
+            )
+        ),
+    )
+    return GovernedOpenAI(client, governor)
+
+
+# Process-wide client, replaced when used from a different event loop
+_openai_client: Optional[GovernedOpenAI] = None
+
+
+async def get_openai_client() -> GovernedOpenAI:
+    """Get the shared OpenAI client for the running event loop.
+
+    Every enrichment in the process, whether started by the CLI or by API
+    requests, shares its connection pool and limits. A client left by a
+    previous event loop is closed before it is replaced.
+    """
+    global _openai_client
+    loop = asyncio.get_running_loop()
+    if _openai_client is not None and _openai_client.loop is not loop:
+        previous, _openai_client = _openai_client, None
+        try:
+            await previous.close()
+        except Exception as e:
+            logger.warning(f"Closing the previous event loop's OpenAI client: {e}")
+    if _openai_client is None:
+        _openai_client = create_openai_client()
+    return _openai_client
+
+
+async def close_openai_client() -> Optional[dict]:
+    """Close the shared OpenAI client, if any.
+
+    Returns:
+        The governor stats of the closed client, or None if there was none
+    """
+    global _openai_client
+    if _openai_client is None:
+        return None
+    stats = _openai_client.governor.stats()
+    await _openai_client.close()
+    _openai_client = None
+    return stats
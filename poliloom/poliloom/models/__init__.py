@@ -19,6 +19,9 @@ from .wikidata import (
     CurrentImportStatement,
     DownloadAlreadyCompleteError,
     DownloadInProgressError,
+    SearchEmbedding,
+    SearchIndexDocument,
+    SearchIndexState,
     WikidataEntity,
     WikidataEntityLabel,
     WikidataEntityMixin,
@@ -41,9 +44,15 @@ from .source import (
     PoliticianSource,
 )
 
+# LLM response cache
+from .llm import LLMResponse
+
 # Property domain
 from .property import Property, PropertyReference
 
+# Mapping decisions
+from .mapping import MappingDecision
+
 # Politician domain
 from .politician import (
     Politician,
@@ -67,6 +76,9 @@ __all__ = [
     "CurrentImportStatement",
     "DownloadAlreadyCompleteError",
     "DownloadInProgressError",
+    "SearchEmbedding",
+    "SearchIndexDocument",
+    "SearchIndexState",
     "WikidataEntity",
     "WikidataEntityLabel",
     "WikidataDump",
@@ -85,6 +97,10 @@ __all__ = [
     "SourceLanguage",
     "SourceStatus",
     "PoliticianSource",
+    # LLM
+    "LLMResponse",
+    # Mapping
+    "MappingDecision",
     # Politician
     "Politician",
     "Property",
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import List
 
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import Column, DateTime, String, func, or_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, declarative_base
 
@@ -75,6 +75,9 @@ class UpsertMixin:
     _upsert_conflict_columns = None
     # Override this in subclasses to specify the index WHERE clause for partial indexes
     _upsert_index_where = None
+    # Only update conflicting rows whose update columns actually changed, so
+    # updated_at keeps meaning "changed" for rows re-imported as-is
+    _upsert_skip_unchanged = False
 
     @classmethod
     def upsert_batch(cls, session: Session, data: List[dict], returning_columns=None):
@@ -109,6 +112,15 @@ class UpsertMixin:
             update_dict = {
                 col: getattr(stmt.excluded, col) for col in cls._upsert_update_columns
             }
+            if cls._upsert_skip_unchanged:
+                conflict_kwargs["where"] = or_(
+                    *[
+                        cls.__table__.c[col].is_distinct_from(
+                            getattr(stmt.excluded, col)
+                        )
+                        for col in cls._upsert_update_columns
+                    ]
+                )
             stmt = stmt.on_conflict_do_update(set_=update_dict, **conflict_kwargs)
         else:
             stmt = stmt.on_conflict_do_nothing(**conflict_kwargs)
@@ -0,0 +1,91 @@
+"""LLM response cache model."""
+
+from typing import Optional
+
+from sqlalchemy import Column, Index, Integer, String, Text, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from .base import Base, TimestampMixin
+
+
+class LLMResponse(Base, TimestampMixin):
+    """Parsed answer of a structured LLM call, keyed by a hash of the request.
+
+    Lets enrichment reuse answers to identical calls, e.g. when re-enriching
+    an unchanged article. Every hit bumps updated_at, so eviction drops the
+    least recently used answers first.
+    """
+
+    __tablename__ = "llm_responses"
+    __table_args__ = (Index("idx_llm_responses_updated_at", "updated_at"),)
+
+    request_hash = Column(String, primary_key=True)
+    model = Column(String, nullable=False)
+    response = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    hits = Column(Integer, nullable=False, server_default="0")
+
+    @classmethod
+    def lookup(cls, session: Session, request_hash: str) -> Optional[str]:
+        """Get a cached response and mark it as used.
+
+        Args:
+            session: Database session
+            request_hash: Hash of the request
+
+        Returns:
+            The cached response JSON, or None if not cached
+        """
+        stmt = (
+            cls.__table__.update()
+            .where(cls.request_hash == request_hash)
+            .values(hits=cls.hits + 1)
+            .returning(cls.response)
+        )
+        return session.execute(stmt).scalar()
+
+    @classmethod
+    def store(
+        cls, session: Session, request_hash: str, model: str, response: str
+    ) -> None:
+        """Store a response, keeping an existing entry for the same request."""
+        stmt = (
+            insert(cls)
+            .values(
+                request_hash=request_hash,
+                model=model,
+                response=response,
+                size_bytes=len(response.encode()),
+            )
+            .on_conflict_do_nothing(index_elements=["request_hash"])
+        )
+        session.execute(stmt)
+
+    @classmethod
+    def evict(cls, session: Session, max_bytes: int) -> int:
+        """Delete the least recently used responses beyond a total size.
+
+        Args:
+            session: Database session
+            max_bytes: Total response size to keep
+
+        Returns:
+            Number of responses deleted
+        """
+        running = (
+            select(
+                cls.request_hash,
+                func.sum(cls.size_bytes)
+                .over(order_by=(cls.updated_at.desc(), cls.request_hash))
+                .label("running_bytes"),
+            )
+        ).subquery()
+        stmt = delete(cls).where(
+            cls.request_hash.in_(
+                select(running.c.request_hash).where(
+                    running.c.running_bytes > max_bytes
+                )
+            )
+        )
+        return session.execute(stmt).rowcount
@@ -0,0 +1,146 @@
+"""Mapping decision model."""
+
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    String,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from .base import Base, TimestampMixin
+from .property import Property
+from .user import Evaluation
+from .wikidata import WikidataEntity
+
+
+class MappingDecision(Base, TimestampMixin):
+    """An extracted name mapped to a Wikidata entity for a politician.
+
+    The same free-form names ("Mayor of Paris", "Member of the Bundestag")
+    are extracted for many politicians. Decisions are keyed by entity type,
+    normalized name and the politician's country, so a name mapped the same
+    way often enough can be mapped again without the LLM. Reuses are
+    recorded too, so reviews of their properties count, but only mappings
+    made independently count towards trusting a decision. Reviews are
+    evaluations of the property the decision led to for its politician,
+    confirming or rejecting it.
+
+    Decisions are deleted with their target entity, so they expire when
+    hierarchy cleanup removes it.
+    """
+
+    __tablename__ = "mapping_decisions"
+    __table_args__ = (
+        Index("idx_mapping_decisions_key", "entity_type", "name", "country_id"),
+        Index("idx_mapping_decisions_entity_id", "entity_id"),
+    )
+
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    # MAPPING_ENTITY_NAME of the entity class: position, location or country
+    entity_type = Column(String, nullable=False)
+    # Extracted name, normalized
+    name = Column(String, nullable=False)
+    # The politician's citizenship; NULL when unknown or ambiguous
+    country_id = Column(String, nullable=True)
+    entity_id = Column(
+        String,
+        ForeignKey("wikidata_entities.wikidata_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    politician_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("politicians.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Taken from an earlier decision instead of made by search and the LLM
+    reused = Column(Boolean, nullable=False, server_default=text("false"))
+
+    @classmethod
+    def lookup(
+        cls,
+        session: Session,
+        entity_class: Type,
+        names: List[str],
+        country_id: Optional[str],
+        min_mappings: int,
+    ) -> Dict[str, str]:
+        """Find confident decisions for normalized names.
+
+        A decision is confident when its target is the only one for the name
+        that no reviewer rejected, and it was either accepted by a reviewer
+        or made independently for at least min_mappings politicians; reuses
+        don't confirm the decision they reuse. Targets no longer in the
+        entity class's table are ignored.
+
+        Args:
+            session: Database session
+            entity_class: Position, Location or Country
+            names: Normalized extracted names
+            country_id: The politician's context country
+            min_mappings: Politicians a decision needs without reviews
+
+        Returns:
+            Target QIDs keyed by name, for the names with a confident decision
+        """
+        if not names:
+            return {}
+
+        def reviewed(accepted: bool):
+            # A review of the property the decision led to for its politician
+            return (
+                select(Evaluation.id)
+                .join(Property, Property.id == Evaluation.property_id)
+                .where(
+                    Property.politician_id == cls.politician_id,
+                    Property.entity_id == cls.entity_id,
+                    Evaluation.is_accepted.is_(accepted),
+                )
+                .exists()
+            )
+
+        country_match = (
+            cls.country_id.is_(None)
+            if country_id is None
+            else cls.country_id == country_id
+        )
+        stmt = (
+            select(
+                cls.name,
+                cls.entity_id,
+                func.count(func.distinct(cls.politician_id))
+                .filter(cls.reused.is_(False))
+                .label("mappings"),
+                func.bool_or(reviewed(True)).label("accepted"),
+                func.bool_or(reviewed(False)).label("rejected"),
+            )
+            .join(entity_class, entity_class.wikidata_id == cls.entity_id)
+            .join(WikidataEntity, WikidataEntity.wikidata_id == cls.entity_id)
+            .where(
+                cls.entity_type == entity_class.MAPPING_ENTITY_NAME,
+                cls.name.in_(names),
+                country_match,
+                WikidataEntity.deleted_at.is_(None),
+            )
+            .group_by(cls.name, cls.entity_id)
+        )
+
+        targets: Dict[str, list] = {}
+        for row in session.execute(stmt):
+            if not row.rejected:
+                targets.setdefault(row.name, []).append(row)
+
+        return {
+            name: rows[0].entity_id
+            for name, rows in targets.items()
+            if len(rows) == 1 and (rows[0].accepted or rows[0].mappings >= min_mappings)
+        }
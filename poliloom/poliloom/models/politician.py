@@ -2,9 +2,8 @@
 
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Collection, List, Optional
 
-from dicttoxml import dicttoxml
 from sqlalchemy import (
     Column,
     DateTime,
@@ -108,17 +107,26 @@ class Politician(
         result = db.execute(query)
         return result.fetchall()
 
-    def schedule_enrichment(self, db: Session) -> list["Source"]:
+    def schedule_enrichment(
+        self, db: Session, skip_urls: Collection[str] = ()
+    ) -> list["Source"]:
         """Create sources for this politician's priority Wikipedia links.
 
         Sets enriched_at to now to prevent re-selection.
         Caller manages commit/rollback.
 
+        Args:
+            db: Database session
+            skip_urls: Links not to create sources for, e.g. articles that
+                haven't changed since they were last extracted
+
         Returns:
             List of newly created Source objects (empty if no suitable links).
         """
         sources = []
         for url, wikipedia_project_id in self.get_priority_wikipedia_links(db):
+            if url in skip_urls:
+                continue
             source = Source(url=url, wikipedia_project_id=wikipedia_project_id)
             db.add(source)
             db.flush()
@@ -204,6 +212,8 @@ class Politician(
                 if citizenship_items:
                     context_data["existing_wikidata_citizenships"] = citizenship_items
 
+        from dicttoxml import dicttoxml
+
         xml_bytes = dicttoxml(
             context_data,
             custom_root="politician_context",
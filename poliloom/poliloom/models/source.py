@@ -4,6 +4,9 @@ import hashlib
 import logging
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
 from sqlalchemy import (
     CheckConstraint,
     Column,
@@ -151,6 +154,53 @@ class Source(Base, TimestampMixin):
         """Generate a hash of the URL for deduplication and storage paths."""
         return hashlib.sha256(url.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def _parse_revision_id(permanent_url: Optional[str]) -> Optional[int]:
+        """Parse the oldid of a Wikipedia permanent URL."""
+        if not permanent_url:
+            return None
+        oldid = parse_qs(urlsplit(permanent_url).query).get("oldid", [""])[0]
+        return int(oldid) if oldid.isdigit() else None
+
+    @property
+    def revision_id(self) -> Optional[int]:
+        """Wikipedia revision archived for this source, from its permanent URL."""
+        return self._parse_revision_id(self.permanent_url)
+
+    @classmethod
+    def latest_revisions(
+        cls, db: Session, politician_id, urls: List[str]
+    ) -> Dict[str, int]:
+        """Revisions last extracted from Wikipedia articles for a politician.
+
+        Only sources processed without errors count, so an article whose
+        last extraction failed is not considered done.
+
+        Returns:
+            Revision ID of the latest such source keyed by URL
+        """
+        if not urls:
+            return {}
+        query = (
+            select(cls.url, cls.permanent_url)
+            .join(PoliticianSource, PoliticianSource.source_id == cls.id)
+            .where(
+                PoliticianSource.politician_id == politician_id,
+                cls.url.in_(urls),
+                cls.status == SourceStatus.DONE,
+                cls.error.is_(None),
+                cls.permanent_url.is_not(None),
+            )
+            .order_by(cls.url, cls.fetch_timestamp.desc())
+            .distinct(cls.url)
+        )
+        revisions = {}
+        for url, permanent_url in db.execute(query):
+            revision = cls._parse_revision_id(permanent_url)
+            if revision is not None:
+                revisions[url] = revision
+        return revisions
+
     @property
     def path_root(self) -> str:
         """Get the path root (timestamp/url_hash structure) for this source."""
@@ -2,15 +2,29 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Set
-
-from poliloom.search import SearchService
+from typing import Optional, Set
+
+from poliloom.search import (
+    EMBEDDER_NAME,
+    EMBEDDING_DIMENSIONS,
+    AsyncSearchClient,
+    Embedder,
+    SearchDocument,
+    SearchRequest,
+    embedding_hash,
+    notify_index_changed,
+    render_document,
+    search_cache,
+    searchable_types,
+)
 
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
     Index,
+    Integer,
     String,
     Text,
     Enum as SQLEnum,
@@ -27,7 +41,7 @@ from sqlalchemy import (
     union_all,
     update,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, aggregate_order_by
 from sqlalchemy.orm import Session, declared_attr, relationship
 
 from .base import (
@@ -123,30 +137,80 @@ class WikidataEntityMixin:
     _search_semantic_ratio: float = 0.0
 
     @classmethod
-    def find_similar(
+    async def find_similar(
         cls,
         query: str,
-        search_service: SearchService,
+        search_client: AsyncSearchClient,
         limit: int = 100,
     ) -> list[str]:
         """Find similar entities by searching the search index.
 
         Uses hybrid search (keyword + semantic) when _search_semantic_ratio > 0.
+        Results are served from the process-wide search cache when possible.
 
         Args:
             query: Search query text
-            search_service: SearchService instance
+            search_client: Async search client
             limit: Maximum number of results
 
         Returns:
             List of wikidata_ids ordered by relevance
         """
-        return search_service.search(
+        key = search_cache.key(cls.__name__, query, limit, cls._search_semantic_ratio)
+        cached = search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        results = await search_client.search(
             query,
             entity_type=cls.__name__,
             limit=limit,
             semantic_ratio=cls._search_semantic_ratio,
         )
+        search_cache.put(key, results)
+        return results
+
+    @classmethod
+    async def find_similar_many(
+        cls,
+        queries: list[str],
+        search_client: AsyncSearchClient,
+        limit: int = 100,
+    ) -> list[list[str]]:
+        """Find similar entities for several queries in one batched search.
+
+        Args:
+            queries: Search query texts
+            search_client: Async search client
+            limit: Maximum number of results per query
+
+        Returns:
+            One list of wikidata_ids ordered by relevance per query
+        """
+        keys = [
+            search_cache.key(cls.__name__, query, limit, cls._search_semantic_ratio)
+            for query in queries
+        ]
+        results = [search_cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        found = await search_client.search_many(
+            [
+                SearchRequest(
+                    queries[i],
+                    entity_type=cls.__name__,
+                    limit=limit,
+                    semantic_ratio=cls._search_semantic_ratio,
+                )
+                for i in missing
+            ]
+        )
+        for i, result in zip(missing, found):
+            search_cache.put(keys[i], result)
+            results[i] = result
+        return results
 
     # Default hierarchy configuration - override in subclasses
     _hierarchy_roots = None
@@ -484,10 +548,24 @@ class WikidataEntityMixin:
         deleted_ids = [row[0] for row in deleted_rows]
         stats["entities_removed"] = len(deleted_ids)
 
+        if deleted_ids:
+            from .mapping import MappingDecision
+
+            # Expire mapping decisions that point at the removed entities
+            session.execute(
+                delete(MappingDecision).where(
+                    MappingDecision.entity_id.in_(deleted_ids)
+                )
+            )
+
         # Clean up search index
         if deleted_ids:
-            search_service = SearchService()
-            search_service.delete_documents(deleted_ids)
+            from poliloom.search import create_search_service
+
+            search_service = create_search_service()
+            # The entities may still be searchable as another type
+            search_service.delete_documents(deleted_ids, entity_type=cls.__name__)
+            notify_index_changed(session)
 
         return stats
 
@@ -637,16 +715,32 @@ class WikidataEntity(Base, TimestampMixin, SoftDeleteMixin, UpsertMixin):
         return result.rowcount
 
     @classmethod
-    def search_index_query(cls):
+    def search_index_query(
+        cls,
+        changed_since: Optional[datetime] = None,
+        entity_types: Optional[list[str]] = None,
+    ):
         """Build query for search index documents.
 
         Creates a query that returns all searchable entities with their
         aggregated types and labels. Only includes non-deleted entities.
+        Labels are ordered by the number of languages using them, so the
+        most widely used forms survive when documents are capped.
+
+        Args:
+            changed_since: If set, only return entities whose search document
+                may have changed since this time: entities that gained a label
+                or a searchable type. Entity rows themselves are touched on
+                every import, so their updated_at is not used here.
+            entity_types: If set, only include these types, e.g. when
+                rebuilding a single type's search index.
 
         Returns:
             SQLAlchemy select query with columns: wikidata_id, types, labels
         """
         models = [m for m in WikidataEntityMixin.__subclasses__() if m._search_indexed]
+        if entity_types is not None:
+            models = [m for m in models if m.__name__ in entity_types]
 
         # Build UNION of all model tables with their type names
         entity_unions = union_all(
@@ -659,27 +753,74 @@ class WikidataEntity(Base, TimestampMixin, SoftDeleteMixin, UpsertMixin):
             ]
         ).subquery("entity_types")
 
-        # Main query: aggregate types and labels per entity
-        return (
+        # Aggregate types first, so every label is joined once per entity
+        entity_types = (
             select(
                 entity_unions.c.wikidata_id,
                 func.array_agg(func.distinct(entity_unions.c.type)).label("types"),
-                func.array_agg(func.distinct(WikidataEntityLabel.label)).label(
-                    "labels"
-                ),
             )
-            .select_from(entity_unions)
+            .group_by(entity_unions.c.wikidata_id)
+            .subquery("entity_type_sets")
+        )
+
+        # Main query: aggregate ranked labels per entity
+        query = (
+            select(
+                entity_types.c.wikidata_id,
+                entity_types.c.types,
+                func.array_agg(
+                    aggregate_order_by(
+                        WikidataEntityLabel.label,
+                        WikidataEntityLabel.language_count.desc(),
+                        WikidataEntityLabel.label,
+                    )
+                ).label("labels"),
+            )
+            .select_from(entity_types)
             .join(
                 WikidataEntityLabel,
-                entity_unions.c.wikidata_id == WikidataEntityLabel.entity_id,
+                entity_types.c.wikidata_id == WikidataEntityLabel.entity_id,
             )
             .join(
                 cls,
-                entity_unions.c.wikidata_id == cls.wikidata_id,
+                entity_types.c.wikidata_id == cls.wikidata_id,
             )
             .where(cls.deleted_at.is_(None))
-            .group_by(entity_unions.c.wikidata_id)
+            .group_by(entity_types.c.wikidata_id, entity_types.c.types)
         )
+        if changed_since is None:
+            return query
+
+        changed_ids = union_all(
+            select(WikidataEntityLabel.entity_id).where(
+                WikidataEntityLabel.updated_at > changed_since
+            ),
+            *[
+                select(model.wikidata_id).where(model.created_at > changed_since)
+                for model in models
+            ],
+        )
+        return query.where(entity_types.c.wikidata_id.in_(changed_ids))
+
+    @classmethod
+    def search_index_deleted_ids(cls, session: Session, since: datetime) -> list[str]:
+        """Get IDs of entities soft-deleted since a given time.
+
+        Soft-deleting bumps updated_at, so the updated_at index narrows the scan.
+
+        Args:
+            session: Database session
+            since: Only return entities deleted after this time
+
+        Returns:
+            List of wikidata_ids whose search documents should be removed
+        """
+        query = select(cls.wikidata_id).where(
+            cls.updated_at > since,
+            cls.deleted_at.is_not(None),
+            cls.deleted_at > since,
+        )
+        return list(session.execute(query).scalars())
 
 
 class WikidataEntityLabel(Base, TimestampMixin, UpsertMixin):
@@ -694,11 +835,13 @@ class WikidataEntityLabel(Base, TimestampMixin, UpsertMixin):
             unique=True,
         ),
         Index("idx_wikidata_entity_labels_entity_id", "entity_id"),
+        Index("idx_wikidata_entity_labels_updated_at", "updated_at"),
     )
 
     # UpsertMixin configuration
     _upsert_conflict_columns = ["entity_id", "label"]
-    _upsert_update_columns = []  # No updates needed - labels are immutable
+    _upsert_update_columns = ["language_count"]
+    _upsert_skip_unchanged = True
 
     id = Column(
         UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
@@ -709,6 +852,8 @@ class WikidataEntityLabel(Base, TimestampMixin, UpsertMixin):
         nullable=False,
     )
     label = Column(Text, nullable=False)
+    # Number of Wikidata languages using this label, ranks labels for search
+    language_count = Column(Integer, nullable=False, server_default=text("1"))
 
     # Relationships
     entity = relationship("WikidataEntity", back_populates="labels")
@@ -903,6 +1048,138 @@ class WikidataDump(Base, TimestampMixin):
         session.flush()
 
 
+class SearchIndexState(Base, TimestampMixin, UpsertMixin):
+    """Watermark of the last successful search index build, per index."""
+
+    __tablename__ = "search_index_state"
+
+    # UpsertMixin configuration
+    _upsert_update_columns = ["indexed_at"]
+
+    index_name = Column(String, primary_key=True)
+    # Database time at which the last successful build started reading
+    indexed_at = Column(DateTime(timezone=True), nullable=False)
+
+    @classmethod
+    def get_watermark(cls, session: Session, index_name: str) -> Optional[datetime]:
+        """Get the watermark of the last successful build of an index."""
+        return session.execute(
+            select(cls.indexed_at).where(cls.index_name == index_name)
+        ).scalar_one_or_none()
+
+    @classmethod
+    def set_watermark(
+        cls, session: Session, index_name: str, indexed_at: datetime
+    ) -> None:
+        """Record a successful build of an index. Caller commits."""
+        cls.upsert_batch(
+            session, [{"index_name": index_name, "indexed_at": indexed_at}]
+        )
+
+
+class SearchEmbedding(Base, TimestampMixin, UpsertMixin):
+    """Embedding of a rendered search document text, keyed by its hash.
+
+    Lets index rebuilds send precomputed vectors to Meilisearch so only new or
+    changed document texts are sent to the embedding API.
+    """
+
+    __tablename__ = "search_embeddings"
+
+    text_hash = Column(String, primary_key=True)
+    embedding = Column(Vector(EMBEDDING_DIMENSIONS), nullable=False)
+
+    @classmethod
+    def attach_embeddings(
+        cls, session: Session, documents: list[SearchDocument], embedder: Embedder
+    ) -> int:
+        """Attach cached or freshly computed embeddings to search documents.
+
+        Missing embeddings are computed with the embedder and stored; the
+        caller commits. Documents get a `_vectors` entry with regenerate
+        disabled so Meilisearch uses the vector as-is. Documents whose types
+        are all searched without a semantic ratio are never searched by
+        embedding, so they are left without one.
+
+        Args:
+            session: Database session
+            documents: Documents to update in place
+            embedder: Embedder used for texts that are not cached yet
+
+        Returns:
+            Number of texts sent to the embedder
+        """
+        semantic_types = {
+            entity_type
+            for entity_type, ratio in searchable_types().items()
+            if ratio > 0
+        }
+        documents = [
+            doc for doc in documents if semantic_types.intersection(doc["types"])
+        ]
+        if not documents:
+            return 0
+
+        hashes = [embedding_hash(render_document(doc)) for doc in documents]
+
+        cached = dict(
+            session.execute(
+                select(cls.text_hash, cls.embedding).where(
+                    cls.text_hash.in_(set(hashes))
+                )
+            ).all()
+        )
+
+        # Embed each distinct missing text once
+        missing = {}
+        for doc, text_hash in zip(documents, hashes):
+            if text_hash not in cached and text_hash not in missing:
+                missing[text_hash] = render_document(doc)
+
+        if missing:
+            embeddings = embedder.embed(list(missing.values()))
+            computed = dict(zip(missing, embeddings))
+            # Sorted keys keep concurrent batches from deadlocking on inserts
+            cls.upsert_batch(
+                session,
+                [
+                    {"text_hash": text_hash, "embedding": computed[text_hash]}
+                    for text_hash in sorted(computed)
+                ],
+            )
+            cached.update(computed)
+
+        for doc, text_hash in zip(documents, hashes):
+            doc["_vectors"] = {
+                EMBEDDER_NAME: {"embeddings": cached[text_hash], "regenerate": False}
+            }
+
+        return len(missing)
+
+
+class SearchIndexDocument(Base, TimestampMixin, UpsertMixin):
+    """Entity searchable through the Postgres search backend.
+
+    Mirrors the documents sent to Meilisearch without the labels, which are
+    searched in wikidata_entity_labels directly. text_hash links the entity
+    to its embedding in search_embeddings.
+    """
+
+    __tablename__ = "search_documents"
+    __table_args__ = (Index("idx_search_documents_text_hash", "text_hash"),)
+
+    # UpsertMixin configuration
+    _upsert_update_columns = ["types", "text_hash"]
+
+    entity_id = Column(
+        String,
+        ForeignKey("wikidata_entities.wikidata_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    types = Column(ARRAY(String), nullable=False)
+    text_hash = Column(String, nullable=True)
+
+
 class CurrentImportEntity(Base):
     """Temporary tracking table for entities seen during current import."""
 
@@ -934,7 +1211,7 @@ class CurrentImportEntity(Base):
         Returns:
             Number of entities that were soft-deleted
         """
-        from poliloom.search import SearchService
+        from poliloom.search import create_search_service
 
         # Only delete if: NOT in current dump AND older than previous dump
         deleted_result = session.execute(
@@ -955,8 +1232,9 @@ class CurrentImportEntity(Base):
 
         # Remove deleted entities from search index
         if deleted_ids:
-            search_service = SearchService()
+            search_service = create_search_service()
             search_service.delete_documents(deleted_ids)
+            notify_index_changed(session)
 
         return len(deleted_ids)
 
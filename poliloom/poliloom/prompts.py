@@ -194,38 +194,78 @@ ALWAYS map the country even if it already appears in the politician's existing W
 </rejection_criteria>"""
 
 # User prompt templates
-EXTRACTION_USER_PROMPT_TEMPLATE = """Extract personal properties of {politician_name} from the web page content below.
-
-{politician_context}
-{analysis_focus}
-
-<article_content>
+#
+# The article content is sent as the first message of every extraction call,
+# ahead of the differing system prompts and politician context, so all calls
+# for a source share a prompt prefix that the provider can cache.
+ARTICLE_CONTENT_TEMPLATE = """<article_content>
 {content}
 </article_content>"""
 
-POSITIONS_USER_PROMPT_TEMPLATE = """Extract all political positions held by {politician_name} from the web page content below.
+# Consolidated extraction sends all of a politician's articles as one content
+# block, so each fact is extracted and mapped once
+CONSOLIDATED_CONTENT_TEMPLATE = """The web page content below combines {count} articles about the same person, such as different language editions of Wikipedia. List each fact only once, even if several articles state it, with supporting quotes from every article that does. Copy each quote verbatim from a single article, in that article's language.
 
-{politician_context}
-{analysis_focus}
+{sources}"""
 
-<article_content>
+SOURCE_CONTENT_TEMPLATE = """<source url="{url}">
 {content}
-</article_content>"""
+</source>"""
 
-BIRTHPLACES_USER_PROMPT_TEMPLATE = """Extract the birthplace of {politician_name} from the web page content below.
+EXTRACTION_USER_PROMPT_TEMPLATE = """Extract personal properties of {politician_name} from the web page content above.
 
 {politician_context}
-{analysis_focus}
+{analysis_focus}"""
 
-<article_content>
-{content}
-</article_content>"""
+POSITIONS_USER_PROMPT_TEMPLATE = """Extract all political positions held by {politician_name} from the web page content above.
+
+{politician_context}
+{analysis_focus}"""
 
-CITIZENSHIPS_USER_PROMPT_TEMPLATE = """Extract all citizenships of {politician_name} from the web page content below.
+BIRTHPLACES_USER_PROMPT_TEMPLATE = """Extract the birthplace of {politician_name} from the web page content above.
 
 {politician_context}
-{analysis_focus}
+{analysis_focus}"""
 
-<article_content>
-{content}
-</article_content>"""
+CITIZENSHIPS_USER_PROMPT_TEMPLATE = """Extract all citizenships of {politician_name} from the web page content above.
+
+{politician_context}
+{analysis_focus}"""
+
+# Single-call extraction prompts, covering all property groups at once
+COMBINED_EXTRACTION_SYSTEM_PROMPT = """You are a political data analyst extracting structured biographical information from web pages.
+
+<extraction_scope>
+Extract the following groups of information about the person when found:
+- properties: birth_date and death_date only. Use format YYYY-MM-DD, or YYYY-MM, YYYY for incomplete dates
+- positions: political offices, government roles, elected positions, or political appointments, with start_date and end_date when stated
+- birthplaces: the birthplace as mentioned in the source (city, town, village or region)
+- citizenships: all current, former and dual citizenships explicitly stated for the person
+</extraction_scope>
+
+<extraction_rules>
+- Only extract information explicitly stated in the text
+- Use partial dates if full dates aren't available; omit a position's end_date if it is current or unknown
+- When the article clearly indicates the jurisdiction, enhance position names with it in parentheses (e.g., "Minister of Defence (Myanmar)")
+- When the article clearly indicates the geographic context, enhance birthplaces with state/country information (e.g., "Yangon, Myanmar")
+- Only add jurisdictional or geographic context when you have high confidence from the article content
+- Use country names as they are commonly known for citizenships (e.g., "United States" not "USA")
+- Return an empty list for every group the content has no information on
+</extraction_rules>
+
+<supporting_quotes_requirements>
+- Each extracted item must include one or more exact verbatim quotes from the web page content that support it
+- Each quote must be copied exactly as it appears in the source, word-for-word
+- Each quote must include enough surrounding context to serve as self-explanatory evidence for the property
+- Each quote must actually exist in the provided content
+- Do not merge or combine separate passages - keep each quote as a separate item
+</supporting_quotes_requirements>"""
+
+COMBINED_ANALYSIS_FOCUS_TEMPLATE = """<analysis_focus>
+The politician already has known data (listed above). Extract everything you find in the text, including data that already exists — the existing data is provided to help you recognize dates, positions, locations and countries that may appear in different formats or wordings.
+</analysis_focus>"""
+
+COMBINED_USER_PROMPT_TEMPLATE = """Extract the birth and death dates, political positions, birthplace and citizenships of {politician_name} from the web page content above.
+
+{politician_context}
+{analysis_focus}"""
@@ -0,0 +1,172 @@
+"""Rank mapping candidates locally before the LLM chooses between them.
+
+Searches return up to search_limit candidates per extracted name, most of
+them clearly unrelated: namesakes in other countries, or offices of another
+level of government. rank_candidates() scores each candidate by how closely
+one of its labels matches the extracted name, whether its country or
+jurisdiction is one of the politician's citizenships, and whether it sits
+next to entities the politician already has in the hierarchy. Only the best
+few go into the mapping prompt, and confident_match() picks the answer
+without the LLM when it isn't in doubt.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING, List, Optional
+
+from .models.base import PropertyType, RelationType
+
+if TYPE_CHECKING:
+    from .models import Politician, WikidataEntity
+
+# Score weights; label similarity is in [0, 1], the others add a bonus
+LABEL_WEIGHT = 1.0
+COUNTRY_WEIGHT = 0.5
+HIERARCHY_WEIGHT = 0.25
+
+# Relations pointing at the country or jurisdiction an entity belongs to
+_COUNTRY_RELATIONS = {
+    RelationType.COUNTRY,
+    RelationType.APPLIES_TO_JURISDICTION,
+    RelationType.LOCATED_IN,
+    RelationType.PART_OF,
+}
+
+# Relations placing an entity in the position or location hierarchy
+_HIERARCHY_RELATIONS = {
+    RelationType.INSTANCE_OF,
+    RelationType.SUBCLASS_OF,
+    RelationType.PART_OF,
+}
+
+
+def normalize_label(label: str) -> str:
+    """Normalize a label for comparison: no case, accents or punctuation."""
+    decomposed = unicodedata.normalize("NFKD", label)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[\W_]+", " ", stripped.casefold()).split())
+
+
+def _parent_ids(entity: "WikidataEntity", relation_types: set) -> set[str]:
+    return {
+        relation.parent_entity_id
+        for relation in entity.parent_relations
+        if relation.relation_type in relation_types and relation.deleted_at is None
+    }
+
+
+@dataclass
+class MappingContext:
+    """What is known about the politician when mapping their extracted items.
+
+    Args:
+        countries: QIDs of the politician's citizenships
+        related: QIDs of the politician's entities of the mapped property
+            types and of their parents in the hierarchy
+    """
+
+    countries: set[str] = field(default_factory=set)
+    related: set[str] = field(default_factory=set)
+
+    @classmethod
+    def for_politician(
+        cls, politician: "Politician", property_types: List[PropertyType]
+    ) -> "MappingContext":
+        """Build the context from the politician's existing properties."""
+        countries = {
+            prop.entity_id
+            for prop in politician.get_properties_by_types([PropertyType.CITIZENSHIP])
+            if prop.entity_id
+        }
+        related = set()
+        for prop in politician.get_properties_by_types(property_types):
+            if prop.entity is None:
+                continue
+            related.add(prop.entity_id)
+            related |= _parent_ids(prop.entity, _HIERARCHY_RELATIONS)
+        return cls(countries=countries, related=related)
+
+    @property
+    def country(self) -> Optional[str]:
+        """The politician's country, if they have exactly one citizenship."""
+        return next(iter(self.countries)) if len(self.countries) == 1 else None
+
+
+@dataclass
+class RankedCandidate:
+    """A mapping candidate with its local score."""
+
+    entity: "WikidataEntity"
+    score: float
+    # One of its labels equals the extracted name after normalization
+    exact: bool
+    # Its country or jurisdiction is one of the politician's citizenships
+    country_agrees: bool
+
+
+def rank_candidates(
+    name: str, entities: List["WikidataEntity"], context: MappingContext
+) -> List[RankedCandidate]:
+    """Score mapping candidates, best first.
+
+    Entities need their labels and parent relations loaded.
+
+    Args:
+        name: Extracted name being mapped
+        entities: Candidate entities found by search
+        context: The politician's existing data
+
+    Returns:
+        Candidates sorted by descending score; ties keep search order
+    """
+    query = normalize_label(name)
+    # SequenceMatcher caches details of its second sequence, so set it once
+    matcher = SequenceMatcher(autojunk=False)
+    matcher.set_seq2(query)
+
+    ranked = []
+    for entity in entities:
+        labels = {normalize_label(entity.name or "")}
+        labels.update(normalize_label(label.label) for label in entity.labels)
+        labels.discard("")
+
+        similarity = 0.0
+        for label in labels:
+            matcher.set_seq1(label)
+            if matcher.real_quick_ratio() > similarity:
+                similarity = max(similarity, matcher.ratio())
+
+        countries = _parent_ids(entity, _COUNTRY_RELATIONS) | {entity.wikidata_id}
+        country_agrees = bool(countries & context.countries)
+        hierarchy = {entity.wikidata_id} | _parent_ids(entity, _HIERARCHY_RELATIONS)
+        near = bool(hierarchy & context.related)
+
+        ranked.append(
+            RankedCandidate(
+                entity=entity,
+                score=LABEL_WEIGHT * similarity
+                + COUNTRY_WEIGHT * country_agrees
+                + HIERARCHY_WEIGHT * near,
+                exact=query in labels,
+                country_agrees=country_agrees,
+            )
+        )
+
+    ranked.sort(key=lambda candidate: candidate.score, reverse=True)
+    return ranked
+
+
+def confident_match(ranked: List[RankedCandidate]) -> Optional["WikidataEntity"]:
+    """The candidate to map to without asking the LLM, if there is one.
+
+    That is the only candidate whose label matches the extracted name
+    exactly, and only if its country agrees with the politician's
+    citizenships. Namesakes elsewhere, or politicians without known
+    citizenships, still go to the LLM.
+    """
+    exact = [candidate for candidate in ranked if candidate.exact]
+    if len(exact) == 1 and exact[0].country_agrees:
+        return exact[0].entity
+    return None
@@ -0,0 +1,142 @@
+"""Look up the current revision of Wikipedia articles.
+
+Re-enrichment fetches a politician's articles again once the cooldown runs
+out. A single MediaWiki API call per wiki tells whether an article changed
+since it was last archived, so unchanged articles needn't be rendered,
+archived and extracted again.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import httpx
+
+from .archiving import USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# Timeout of revision lookups in seconds; a failed lookup just means the
+# article is fetched as usual
+REVISION_LOOKUP_TIMEOUT = 10.0
+
+# Titles per request accepted by the MediaWiki API
+_MAX_TITLES = 50
+
+
+def article_title(url: str) -> Optional[Tuple[str, str]]:
+    """Split a Wikipedia article URL into its wiki's API endpoint and title.
+
+    Returns:
+        Tuple of API URL and page title, or None for other URLs
+    """
+    parts = urlsplit(url)
+    if not parts.netloc or not parts.path.startswith("/wiki/"):
+        return None
+    title = unquote(parts.path[len("/wiki/") :]).replace("_", " ")
+    if not title:
+        return None
+    return f"{parts.scheme or 'https'}://{parts.netloc}/w/api.php", title
+
+
+async def _query_revisions(
+    client: httpx.AsyncClient, api_url: str, titles: List[str]
+) -> Dict[str, int]:
+    """Latest revision ID of pages on one wiki, keyed by the requested title."""
+    response = await client.get(
+        api_url,
+        params={
+            "action": "query",
+            "prop": "revisions",
+            "rvprop": "ids",
+            "titles": "|".join(titles),
+            "redirects": "1",
+            "format": "json",
+            "formatversion": "2",
+        },
+    )
+    response.raise_for_status()
+    query = response.json().get("query", {})
+
+    # Follow title normalization and redirects to the page the API returns
+    renames = {
+        item["from"]: item["to"]
+        for key in ("normalized", "redirects")
+        for item in query.get(key, [])
+    }
+    revisions = {
+        page["title"]: page["revisions"][0]["revid"]
+        for page in query.get("pages", [])
+        if page.get("revisions")
+    }
+
+    result = {}
+    for title in titles:
+        resolved = title
+        for _ in range(len(renames)):
+            if resolved not in renames:
+                break
+            resolved = renames[resolved]
+        if resolved in revisions:
+            result[title] = revisions[resolved]
+    return result
+
+
+async def latest_revision_ids(
+    urls: List[str], client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, int]:
+    """Look up the current revision of Wikipedia articles.
+
+    Sends one request per wiki, concurrently. Articles whose lookup fails are
+    left out, so callers fall back to fetching them.
+
+    Args:
+        urls: Wikipedia article URLs
+        client: HTTP client to use, e.g. one serving canned responses in tests
+
+    Returns:
+        Current revision ID keyed by URL
+    """
+    by_api: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+    for url in urls:
+        parsed = article_title(url)
+        if parsed:
+            api_url, title = parsed
+            by_api[api_url][title].append(url)
+    if not by_api:
+        return {}
+
+    owns_client = client is None
+    if owns_client:
+        client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT}, timeout=REVISION_LOOKUP_TIMEOUT
+        )
+
+    async def lookup(api_url: str, titles: List[str]) -> Dict[str, int]:
+        try:
+            return await _query_revisions(client, api_url, titles)
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.warning(f"Revision lookup failed for {api_url}: {e}")
+            return {}
+
+    batches = []
+    for api_url, urls_by_title in by_api.items():
+        titles = list(urls_by_title)
+        for start in range(0, len(titles), _MAX_TITLES):
+            batches.append((api_url, titles[start : start + _MAX_TITLES]))
+    try:
+        answers = await asyncio.gather(
+            *(lookup(api_url, titles) for api_url, titles in batches)
+        )
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    result = {}
+    for (api_url, _), revisions in zip(batches, answers):
+        for title, revision in revisions.items():
+            for url in by_api[api_url][title]:
+                result[url] = revision
+    return result
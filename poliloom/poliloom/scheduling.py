@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, List, Optional
@@ -9,8 +10,9 @@ from typing import Any, List, Optional
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
-from .archiving import process_source
+from .archiving import process_source, process_sources
 from .database import get_engine
+from .llm import track_usage
 from .models import (
     Politician,
     Property,
@@ -18,10 +20,20 @@ from .models import (
     WikidataEntity,
     WikidataRelation,
 )
+from .revisions import latest_revision_ids
 from .sse import EnrichmentCompleteEvent, event_bus
 
 logger = logging.getLogger(__name__)
 
+# How a politician's sources are extracted (SOURCE_MODE): "per_source"
+# extracts each article on its own, "consolidated" extracts all of them in a
+# single pass
+SOURCE_MODES = ("per_source", "consolidated")
+DEFAULT_SOURCE_MODE = "per_source"
+
+# Politicians tried when others are claimed by concurrent workers first
+SCHEDULE_ATTEMPTS = 3
+
 
 @dataclass
 class ScheduledEnrichment:
@@ -29,9 +41,27 @@ class ScheduledEnrichment:
 
     politician_id: Any
     source_ids: list
+    politician_name: Optional[str] = None
+
+
+async def unchanged_wikipedia_urls(db: Session, politician: Politician) -> set[str]:
+    """Priority Wikipedia links whose article hasn't changed since extraction.
+
+    Compares the revision of the last successful extraction, recorded in the
+    source's permanent URL, with the article's current revision. Articles
+    never extracted, or whose revision can't be looked up, count as changed.
+    The properties and references of the previous extraction stay in place,
+    so skipping an unchanged article reuses them.
+    """
+    urls = [url for url, _ in politician.get_priority_wikipedia_links(db)]
+    extracted = Source.latest_revisions(db, politician.id, urls)
+    if not extracted:
+        return set()
+    current = await latest_revision_ids(list(extracted))
+    return {url for url, revision in extracted.items() if current.get(url) == revision}
 
 
-def schedule_enrichment(
+async def schedule_enrichment(
     db: Session,
     languages: Optional[List[str]] = None,
     countries: Optional[List[str]] = None,
@@ -40,6 +70,9 @@ def schedule_enrichment(
     """Pick the next politician and create sources for its Wikipedia links.
 
     Sets enriched_at immediately to prevent re-selection by other workers.
+    Unchanged articles are looked up before the politician's row is locked,
+    so the lock isn't held during the network round trip; if another worker
+    claims the politician meanwhile, the next one is picked.
 
     Returns:
         ScheduledEnrichment if a politician was found, None otherwise.
@@ -58,21 +91,42 @@ def schedule_enrichment(
             Politician.wikidata_id_numeric.desc(),
         )
         .limit(1)
-        .with_for_update(skip_locked=True)
     )
 
-    politician = db.scalars(query).first()
+    for _ in range(SCHEDULE_ATTEMPTS):
+        candidate = db.scalars(query).first()
+        if not candidate:
+            return None
+
+        unchanged = await unchanged_wikipedia_urls(db, candidate)
 
-    if not politician:
+        # Claim the politician unless another worker did since it was picked
+        politician = db.scalars(
+            select(Politician)
+            .where(
+                Politician.id == candidate.id,
+                Politician.enriched_at.is_not_distinct_from(candidate.enriched_at),
+            )
+            .with_for_update(skip_locked=True)
+        ).first()
+        if politician:
+            break
+        db.rollback()
+    else:
         return None
 
     try:
-        sources = politician.schedule_enrichment(db)
+        sources = politician.schedule_enrichment(db, skip_urls=unchanged)
 
-        if not sources:
+        if not sources and not unchanged:
             db.commit()
             return None
 
+        if unchanged:
+            logger.info(
+                f"Skipping {len(unchanged)} unchanged Wikipedia articles for "
+                f"{politician.name}: {sorted(unchanged)}"
+            )
         logger.info(
             f"Processing {len(sources)} Wikipedia sources for {politician.name}: "
             f"{[f'{s.wikipedia_project_id} ({s.url})' for s in sources]}"
@@ -83,6 +137,7 @@ def schedule_enrichment(
         return ScheduledEnrichment(
             politician_id=politician.id,
             source_ids=[s.id for s in sources],
+            politician_name=politician.name,
         )
 
     except Exception as e:
@@ -95,6 +150,25 @@ def schedule_enrichment(
         return None
 
 
+def _load_politician(db: Session, politician_id) -> Politician:
+    """Load a politician with everything extraction reads."""
+    return db.execute(
+        select(Politician)
+        .where(Politician.id == politician_id)
+        .options(
+            selectinload(Politician.wikidata_entity),
+            selectinload(Politician.properties.and_(Property.deleted_at.is_(None)))
+            .selectinload(Property.entity)
+            .selectinload(
+                WikidataEntity.parent_relations.and_(
+                    WikidataRelation.deleted_at.is_(None)
+                )
+            )
+            .selectinload(WikidataRelation.parent_entity),
+        )
+    ).scalar_one()
+
+
 async def process_source_task(source_id, politician_id) -> int:
     """Background task entry point: opens a session and processes a source.
 
@@ -112,47 +186,83 @@ async def process_source_task(source_id, politician_id) -> int:
             .options(selectinload(Source.politicians))
         ).scalar_one()
 
-        politician = db.execute(
-            select(Politician)
-            .where(Politician.id == politician_id)
-            .options(
-                selectinload(Politician.wikidata_entity),
-                selectinload(Politician.properties.and_(Property.deleted_at.is_(None)))
-                .selectinload(Property.entity)
-                .selectinload(
-                    WikidataEntity.parent_relations.and_(
-                        WikidataRelation.deleted_at.is_(None)
-                    )
-                )
-                .selectinload(WikidataRelation.parent_entity),
-            )
-        ).scalar_one()
+        politician = _load_politician(db, politician_id)
 
         return await process_source(db, source, politician)
 
 
+async def process_sources_task(source_ids: list, politician_id) -> int:
+    """Background task entry point: processes sources in a consolidated pass.
+
+    Args:
+        source_ids: Source UUIDs, the primary article first
+        politician_id: Politician UUID to extract properties for
+
+    Returns:
+        Number of properties extracted.
+    """
+    with Session(get_engine()) as db:
+        by_id = {
+            source.id: source
+            for source in db.scalars(
+                select(Source)
+                .where(Source.id.in_(source_ids))
+                .options(selectinload(Source.politicians))
+            )
+        }
+        sources = [by_id[source_id] for source_id in source_ids]
+
+        politician = _load_politician(db, politician_id)
+
+        return await process_sources(db, sources, politician)
+
+
 async def process_next_politician(
     languages: Optional[List[str]] = None,
     countries: Optional[List[str]] = None,
     stateless: bool = False,
+    source_mode: Optional[str] = None,
 ) -> bool:
     """Schedule and process enrichment for a single politician.
 
+    Args:
+        languages: Language QIDs to filter politicians by
+        countries: Country QIDs to filter politicians by
+        stateless: Only enrich politicians without citizenship
+        source_mode: One of SOURCE_MODES. Defaults to SOURCE_MODE env var or
+            per_source.
+
     Returns:
         True if a politician was found, False if no politician available.
     """
+    source_mode = source_mode or os.getenv("SOURCE_MODE", DEFAULT_SOURCE_MODE)
+    if source_mode not in SOURCE_MODES:
+        raise ValueError(
+            f"Unknown source mode {source_mode!r}, expected one of {SOURCE_MODES}"
+        )
+
     with Session(get_engine()) as db:
-        scheduled = schedule_enrichment(db, languages, countries, stateless)
+        scheduled = await schedule_enrichment(db, languages, countries, stateless)
 
     if not scheduled:
         return False
 
-    counts = await asyncio.gather(
-        *(
-            process_source_task(source_id, scheduled.politician_id)
-            for source_id in scheduled.source_ids
-        )
-    )
+    with track_usage() as usage:
+        if source_mode == "consolidated" and len(scheduled.source_ids) > 1:
+            counts = [
+                await process_sources_task(
+                    scheduled.source_ids, scheduled.politician_id
+                )
+            ]
+        else:
+            counts = await asyncio.gather(
+                *(
+                    process_source_task(source_id, scheduled.politician_id)
+                    for source_id in scheduled.source_ids
+                )
+            )
+    if scheduled.source_ids:
+        logger.info(f"LLM usage for {scheduled.politician_name}: {usage.summary()}")
 
     if sum(counts) > 0:
         with Session(get_engine()) as db:
@@ -1,19 +1,32 @@
-"""Meilisearch client for entity search.
+"""Search backends for entity search.
 
-Provides a thin wrapper around Meilisearch for indexing and searching entities.
-Uses a single 'entities' index with a 'type' field for filtering.
-Supports hybrid search (keyword + semantic) using OpenAI embeddings.
+Provides a common SearchBackend interface with two implementations:
+SearchService wraps Meilisearch, keeping one index per searchable entity type
+and using federated multi-search for cross-type queries;
+PostgresSearchBackend searches labels and cached embeddings directly in
+Postgres. Both support hybrid search (keyword +
+semantic) using OpenAI embeddings. The backend is selected with the
+SEARCH_BACKEND environment variable.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Optional, TypedDict
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, NotRequired, Optional, Protocol, TypedDict
 
-import meilisearch
+import orjson
 from dotenv import load_dotenv
 
 
-# Single index for all searchable entities
+# Prefix of the per-type Meilisearch indexes (entities_location, ...)
 INDEX_NAME = "entities"
 
 # Embedder name for hybrid search
@@ -23,6 +36,24 @@ EMBEDDER_NAME = "openai"
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
 
+# Text Meilisearch embeds for each document, mirrored by render_document
+DOCUMENT_TEMPLATE = "{{doc.labels | join: ', '}}"
+
+# Rendered templates longer than this are truncated before embedding. Set
+# explicitly on the embedder rather than relying on Meilisearch's default.
+DOCUMENT_TEMPLATE_MAX_BYTES = 1000
+
+# Default cap on normalized labels per document (SEARCH_MAX_LABELS, 0 = no cap)
+DEFAULT_MAX_LABELS = 50
+
+# Default cap on document tasks enqueued or processing at once
+# (MEILI_MAX_PENDING_TASKS) and resubmissions of a failed task (MEILI_TASK_RETRIES)
+DEFAULT_MAX_PENDING_TASKS = 8
+DEFAULT_TASK_RETRIES = 2
+
+# Seconds between task status polls
+TASK_POLL_INTERVAL = 0.5
+
 
 class SearchDocument(TypedDict):
     """Document format for Meilisearch indexing."""
@@ -30,6 +61,81 @@ class SearchDocument(TypedDict):
     id: str
     types: list[str]  # Entity types (e.g., ['Location', 'Country'])
     labels: list[str]
+    # Precomputed embeddings, keyed by embedder name
+    _vectors: NotRequired[dict]
+
+
+@dataclass
+class PendingTask:
+    """A document task submitted to Meilisearch and not yet applied."""
+
+    uid: int
+    # Sends the same write again and returns the new task's UID
+    resubmit: Callable[[], int]
+    # Documents added by the task, 0 for deletions
+    documents: int
+    attempts: int = 1
+
+
+@dataclass
+class SearchRequest:
+    """One query of a batched search_many call."""
+
+    query: str
+    entity_type: Optional[str] = None
+    limit: int = 100
+    semantic_ratio: float = 0.0
+
+
+class Embedder(Protocol):
+    """Turns document texts into embedding vectors."""
+
+    def embed(self, texts: list[str]) -> list[list[float]]: ...
+
+
+class OpenAIEmbedder:
+    """Embedder using the same OpenAI model Meilisearch is configured with."""
+
+    def __init__(self, batch_size: int = 1000):
+        from openai import OpenAI
+
+        self.client = OpenAI()
+        self.batch_size = batch_size
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in batches, preserving input order."""
+        embeddings = []
+        for i in range(0, len(texts), self.batch_size):
+            response = self.client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts[i : i + self.batch_size],
+                dimensions=EMBEDDING_DIMENSIONS,
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
+
+
+def render_document(document: SearchDocument) -> str:
+    """Render the text Meilisearch would embed for a document.
+
+    Joins labels like DOCUMENT_TEMPLATE and truncates the UTF-8 text to
+    DOCUMENT_TEMPLATE_MAX_BYTES on a character boundary, like Meilisearch
+    does with documentTemplateMaxBytes.
+    """
+    text = ", ".join(document["labels"])
+    encoded = text.encode()
+    if len(encoded) <= DOCUMENT_TEMPLATE_MAX_BYTES:
+        return text
+    return encoded[:DOCUMENT_TEMPLATE_MAX_BYTES].decode(errors="ignore")
+
+
+def embedding_hash(text: str) -> str:
+    """Hash a rendered document text together with the embedding model.
+
+    Including the model means switching models never reuses stale vectors.
+    """
+    key = f"{EMBEDDING_MODEL}:{EMBEDDING_DIMENSIONS}\n{text}"
+    return hashlib.sha256(key.encode()).hexdigest()
 
 
 load_dotenv()
@@ -37,116 +143,501 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-class SearchService:
+def _is_latin(char: str) -> bool:
+    return char < "\u0250" or "\u1e00" <= char <= "\u1eff"
+
+
+def normalize_label(label: str) -> str:
+    """Normalize a label for indexing.
+
+    Case-folds, strips diacritics from Latin letters and collapses whitespace.
+    Combining marks of other scripts (e.g. Devanagari vowel signs) carry
+    meaning and are kept.
+    """
+    chars = []
+    latin_base = False
+    for char in unicodedata.normalize("NFKD", label.casefold()):
+        if unicodedata.combining(char):
+            if latin_base:
+                continue
+        else:
+            latin_base = _is_latin(char)
+        chars.append(char)
+    return " ".join(unicodedata.normalize("NFC", "".join(chars)).split())
+
+
+def normalize_labels(labels: Iterable[str], max_labels: int = 0) -> list[str]:
+    """Normalize labels, drop duplicates and keep the first max_labels.
+
+    Labels are expected most widely used first (see search_index_query), so
+    the first occurrence of each normalized form decides its rank.
+    """
+    normalized = dict.fromkeys(normalize_label(label) for label in labels)
+    normalized.pop("", None)
+    result = list(normalized)
+    return result[:max_labels] if max_labels > 0 else result
+
+
+def documents_from_rows(
+    rows: Iterable, max_labels: Optional[int] = None
+) -> list[SearchDocument]:
+    """Build search documents from WikidataEntity.search_index_query rows.
+
+    Args:
+        rows: Rows with wikidata_id, types and ranked labels
+        max_labels: Cap on normalized labels per document. Defaults to
+            SEARCH_MAX_LABELS env var or DEFAULT_MAX_LABELS, 0 disables the cap.
+    """
+    if max_labels is None:
+        max_labels = int(os.getenv("SEARCH_MAX_LABELS", str(DEFAULT_MAX_LABELS)))
+    return [
+        SearchDocument(
+            id=row.wikidata_id,
+            types=list(row.types),
+            labels=normalize_labels(row.labels, max_labels),
+        )
+        for row in rows
+    ]
+
+
+def index_uid(entity_type: str) -> str:
+    """Name of the Meilisearch index holding one entity type."""
+    return f"{INDEX_NAME}_{entity_type.lower()}"
+
+
+def searchable_types() -> dict[str, float]:
+    """Searchable entity types mapped to their semantic ratio.
+
+    Types with a semantic ratio of 0 never run hybrid searches, so their
+    indexes are created without an embedder.
+    """
+    from .models import WikidataEntityMixin
+
+    return {
+        model.__name__: model._search_semantic_ratio
+        for model in WikidataEntityMixin.__subclasses__()
+        if model._search_indexed
+    }
+
+
+def _search_params(limit: Optional[int], semantic_ratio: float) -> dict:
+    """Build Meilisearch search parameters."""
+    # Federated queries take their limit from the federation instead
+    search_params: dict = {} if limit is None else {"limit": limit}
+
+    # Use hybrid search when semantic_ratio > 0
+    if semantic_ratio > 0:
+        search_params["hybrid"] = {
+            "semanticRatio": semantic_ratio,
+            "embedder": EMBEDDER_NAME,
+        }
+    return search_params
+
+
+def _type_params(
+    entity_types: dict[str, float],
+    entity_type: str,
+    limit: Optional[int],
+    semantic_ratio: float,
+) -> dict:
+    """Build search parameters for one type index.
+
+    Indexes without an embedder fall back to keyword search.
+    """
+    if entity_types.get(entity_type, 0.0) <= 0:
+        semantic_ratio = 0.0
+    return _search_params(limit, semantic_ratio)
+
+
+def _type_query(
+    entity_types: dict[str, float],
+    entity_type: str,
+    query: str,
+    limit: Optional[int],
+    semantic_ratio: float,
+) -> dict:
+    """Build one multi-search query against a type index."""
+    return {
+        "indexUid": index_uid(entity_type),
+        "q": query,
+        **_type_params(entity_types, entity_type, limit, semantic_ratio),
+    }
+
+
+def _federated_queries(
+    entity_types: dict[str, float], query: str, semantic_ratio: float
+) -> list[dict]:
+    """Build the per-index queries of a federated cross-type search."""
+    return [
+        _type_query(entity_types, entity_type, query, None, semantic_ratio)
+        for entity_type in entity_types
+    ]
+
+
+def _hit_ids(hits: list[dict]) -> list[str]:
+    """Document IDs of search hits, without entities found in several indexes."""
+    return list(dict.fromkeys(hit["id"] for hit in hits))
+
+
+class SearchBackend(ABC):
+    """Interface shared by all search backends."""
+
+    # Name under which index builds are recorded (see SearchIndexState)
+    index_name: str = INDEX_NAME
+
+    # Whether each entity type lives in its own index that can be built alone
+    per_type_indexes: bool = False
+
+    # Progress counters: documents the index has applied so far, and failed
+    # writes that were sent again
+    applied_documents: int = 0
+    retried_tasks: int = 0
+
+    def index_names(self, entity_types: Optional[list[str]] = None) -> list[str]:
+        """Names under which builds of the given entity types are recorded.
+
+        Backends without per-type indexes record every build under one name.
+        """
+        return [self.index_name]
+
+    @abstractmethod
+    def create_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Create the index and its settings.
+
+        Args:
+            entity_types: Types whose indexes to create, defaults to all.
+                Ignored by backends without per-type indexes.
+        """
+
+    @abstractmethod
+    def delete_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Delete the index if it exists.
+
+        Args:
+            entity_types: Types whose indexes to delete, defaults to all.
+                Ignored by backends without per-type indexes.
+        """
+
+    @abstractmethod
+    def ensure_index(self, entity_types: Optional[list[str]] = None) -> bool:
+        """Create the index if it doesn't exist.
+
+        Returns:
+            True if an index was created, False if all already existed.
+        """
+
+    @abstractmethod
+    def index_documents(
+        self,
+        documents: list[SearchDocument],
+        entity_types: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Add or replace documents.
+
+        Args:
+            documents: Documents to index
+            entity_types: Only index documents into these types' indexes,
+                defaults to all. Ignored by backends without per-type indexes.
+
+        Returns:
+            Task UIDs for backends that index asynchronously, otherwise empty
+        """
+
+    @abstractmethod
+    def delete_documents(
+        self,
+        document_ids: list[str],
+        batch_size: int = 10000,
+        entity_type: Optional[str] = None,
+    ) -> int:
+        """Delete documents by ID.
+
+        Args:
+            document_ids: Document IDs (wikidata_ids) to delete
+            batch_size: Number of IDs per request
+            entity_type: Only remove the documents from this type, e.g. when
+                an entity left one type's hierarchy. Defaults to all types.
+
+        Returns:
+            Number of documents requested for deletion
+        """
+
+    def wait_for_tasks(self, timeout_ms: int = 3_600_000) -> list[int]:
+        """Wait until all writes submitted by this backend are applied.
+
+        Backends applying writes synchronously have nothing to wait for.
+
+        Returns:
+            UIDs of tasks that failed or did not finish within the timeout
+        """
+        return []
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        limit: int = 100,
+        semantic_ratio: float = 0.0,
+    ) -> list[str]:
+        """Search entities by label.
+
+        Args:
+            query: Search query text
+            entity_type: Optional type filter (e.g., 'Location', 'Politician')
+            limit: Maximum number of results
+            semantic_ratio: Balance between keyword (0.0) and semantic (1.0) search
+
+        Returns:
+            List of document IDs (wikidata_ids) ordered by relevance
+        """
+
+    def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches, batched where the backend supports it.
+
+        Returns:
+            One list of document IDs per request, in request order
+        """
+        return [
+            self.search(
+                request.query,
+                entity_type=request.entity_type,
+                limit=request.limit,
+                semantic_ratio=request.semantic_ratio,
+            )
+            for request in requests
+        ]
+
+
+class SearchService(SearchBackend):
     """Meilisearch client for entity search.
 
-    Uses a single 'entities' index with type-based filtering.
+    Keeps one index per searchable entity type, each with its own settings
+    and embedder, so types can be searched and rebuilt independently. An
+    entity with several types (e.g. Location and Country) has a document in
+    each of their indexes. Cross-type searches use federated multi-search.
     """
 
-    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+    per_type_indexes = True
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        entity_types: Optional[dict[str, float]] = None,
+    ):
         """Initialize SearchService with Meilisearch connection.
 
         Args:
             url: Meilisearch server URL. Defaults to MEILI_URL env var
                  or http://localhost:7700.
             api_key: Meilisearch API key. Defaults to MEILI_MASTER_KEY env var.
+            entity_types: Searchable types mapped to their semantic ratio.
+                Defaults to searchable_types().
         """
         self.url = url or os.getenv("MEILI_URL", "http://localhost:7700")
         self.api_key = api_key or os.getenv("MEILI_MASTER_KEY")
-        self.client = meilisearch.Client(self.url, self.api_key)
+        # Imported lazily so importing this module stays cheap for the CLI/API
+        import meilisearch
 
-    def create_index(self) -> None:
-        """Create the entities index with proper settings and OpenAI embedder."""
-        logger.info(f"Creating index '{INDEX_NAME}'")
-        task = self.client.create_index(INDEX_NAME, {"primaryKey": "id"})
-        self.client.wait_for_task(task.task_uid)
+        self.client = meilisearch.Client(self.url, self.api_key)
+        self.entity_types = entity_types or searchable_types()
 
-        # Configure index settings
-        index = self.client.index(INDEX_NAME)
-        task = index.update_settings(
-            {
-                "searchableAttributes": ["labels"],
-                "filterableAttributes": ["types"],
-                "displayedAttributes": ["id", "types", "labels"],
-            }
+        # Submission window: writers block while this many document tasks
+        # are enqueued or processing, so a build can't flood Meilisearch
+        max_pending = int(
+            os.getenv("MEILI_MAX_PENDING_TASKS", str(DEFAULT_MAX_PENDING_TASKS))
+        )
+        self.task_retries = int(
+            os.getenv("MEILI_TASK_RETRIES", str(DEFAULT_TASK_RETRIES))
         )
-        self.client.wait_for_task(task.task_uid)
+        self._window = threading.Semaphore(max_pending)
+        self._tasks_changed = threading.Condition()
+        self._pending: dict[int, PendingTask] = {}
+        self._watcher: Optional[threading.Thread] = None
+        # UIDs of tasks that failed after all retries, reported by wait_for_tasks
+        self._failed: list[int] = []
 
-        # Configure OpenAI embedder for hybrid search
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required")
+    def _selected_types(self, entity_types: Optional[list[str]]) -> list[str]:
+        """Validate requested types, defaulting to all searchable types."""
+        if entity_types is None:
+            return list(self.entity_types)
+        unknown = set(entity_types) - set(self.entity_types)
+        if unknown:
+            raise ValueError(f"Unknown entity types: {', '.join(sorted(unknown))}")
+        return list(entity_types)
 
-        logger.info(f"Configuring OpenAI embedder '{EMBEDDER_NAME}'")
-        task = index.update_embedders(
-            {
+    def index_names(self, entity_types: Optional[list[str]] = None) -> list[str]:
+        """Names of the indexes holding the given entity types."""
+        return [index_uid(t) for t in self._selected_types(entity_types)]
+
+    def index_settings(self, entity_type: str) -> dict:
+        """Settings of one type's index, including its embedder."""
+        settings: dict = {
+            "searchableAttributes": ["labels"],
+            "displayedAttributes": ["id", "types", "labels"],
+        }
+        if self.entity_types[entity_type] > 0:
+            openai_api_key = os.getenv("OPENAI_API_KEY")
+            if not openai_api_key:
+                raise ValueError("OPENAI_API_KEY environment variable is required")
+            settings["embedders"] = {
                 EMBEDDER_NAME: {
                     "source": "openAi",
                     "apiKey": openai_api_key,
                     "model": EMBEDDING_MODEL,
                     "dimensions": EMBEDDING_DIMENSIONS,
-                    "documentTemplate": "{{doc.labels | join: ', '}}",
+                    "documentTemplate": DOCUMENT_TEMPLATE,
+                    "documentTemplateMaxBytes": DOCUMENT_TEMPLATE_MAX_BYTES,
                 }
             }
-        )
-        self.client.wait_for_task(task.task_uid)
-        logger.info("OpenAI embedder configured successfully")
+        return settings
 
-    def delete_index(self) -> None:
-        """Delete the entities index if it exists."""
-        try:
-            logger.info(f"Deleting index '{INDEX_NAME}'")
-            task = self.client.delete_index(INDEX_NAME)
-            self.client.wait_for_task(task.task_uid)
-        except meilisearch.errors.MeilisearchApiError as e:
-            if "index_not_found" not in str(e):
-                raise
-            logger.debug(f"Index '{INDEX_NAME}' does not exist, nothing to delete")
-
-    def ensure_index(self) -> bool:
-        """Create the index if it doesn't exist.
+    def _wait_all(self, task_uids: list[int]) -> None:
+        """Wait for index management tasks, raising on the first failure."""
+        for task_uid in task_uids:
+            task = self.client.wait_for_task(task_uid)
+            if task.status != "succeeded":
+                raise RuntimeError(f"Task {task_uid} {task.status}: {task.error}")
+
+    def create_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Create type indexes with their settings and embedders.
+
+        All tasks are enqueued before waiting, so Meilisearch sets up the
+        indexes concurrently.
+        """
+        types = self._selected_types(entity_types)
+        task_uids = []
+        for entity_type in types:
+            logger.info(f"Creating index '{index_uid(entity_type)}'")
+            task = self.client.create_index(
+                index_uid(entity_type), {"primaryKey": "id"}
+            )
+            task_uids.append(task.task_uid)
+        for entity_type in types:
+            task = self.client.index(index_uid(entity_type)).update_settings(
+                self.index_settings(entity_type)
+            )
+            task_uids.append(task.task_uid)
+        self._wait_all(task_uids)
+
+    def delete_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Delete type indexes if they exist.
+
+        Deleting all types also removes the single 'entities' index used
+        before indexes were split per type.
+        """
+        names = self.index_names(entity_types)
+        if entity_types is None:
+            names.append(INDEX_NAME)
+        from meilisearch.errors import MeilisearchApiError
+
+        task_uids = []
+        for name in names:
+            try:
+                logger.info(f"Deleting index '{name}'")
+                task_uids.append(self.client.delete_index(name).task_uid)
+            except MeilisearchApiError as e:
+                if "index_not_found" not in str(e):
+                    raise
+                logger.debug(f"Index '{name}' does not exist, nothing to delete")
+        # A failed task only means the index was already gone
+        for task_uid in task_uids:
+            self.client.wait_for_task(task_uid)
+
+    def ensure_index(self, entity_types: Optional[list[str]] = None) -> bool:
+        """Create the type indexes that don't exist yet.
 
         Returns:
-            True if index was created, False if it already existed.
+            True if an index was created, False if all already existed.
         """
-        try:
-            self.client.get_index(INDEX_NAME)
-            logger.debug(f"Index '{INDEX_NAME}' already exists")
-            return False
-        except meilisearch.errors.MeilisearchApiError as e:
-            if "index_not_found" not in str(e):
-                raise
-            self.create_index()
-            return True
+        from meilisearch.errors import MeilisearchApiError
+
+        missing = []
+        for entity_type in self._selected_types(entity_types):
+            try:
+                self.client.get_index(index_uid(entity_type))
+                logger.debug(f"Index '{index_uid(entity_type)}' already exists")
+            except MeilisearchApiError as e:
+                if "index_not_found" not in str(e):
+                    raise
+                missing.append(entity_type)
+        if missing:
+            self.create_index(missing)
+        return bool(missing)
 
-    def index_documents(self, documents: list[SearchDocument]) -> Optional[int]:
-        """Index documents to Meilisearch.
+    def index_documents(
+        self,
+        documents: list[SearchDocument],
+        entity_types: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Index documents to the indexes of their types.
 
-        Returns immediately without waiting, allowing Meilisearch's
-        auto-batching to combine consecutive requests for faster indexing.
+        Returns without waiting for the documents to be applied, allowing
+        Meilisearch's auto-batching to combine consecutive requests for faster
+        indexing. Blocks while MEILI_MAX_PENDING_TASKS tasks are enqueued or
+        processing, so builds can't queue more than Meilisearch keeps up with.
 
         Args:
-            documents: List of SearchDocument dicts with 'id', 'type', and 'labels'
+            documents: List of SearchDocument dicts with 'id', 'types', and 'labels'
+            entity_types: Only index into these types' indexes, defaults to all
 
         Returns:
-            Task UID for tracking, or None if no documents
+            Task UIDs for tracking, one per index receiving documents
         """
-        if not documents:
-            return None
+        batches: dict[str, list[SearchDocument]] = {
+            entity_type: [] for entity_type in self._selected_types(entity_types)
+        }
+        for document in documents:
+            for entity_type in document["types"]:
+                if entity_type in batches:
+                    batches[entity_type].append(document)
 
-        index = self.client.index(INDEX_NAME)
-        task = index.add_documents(documents)
+        task_uids = []
+        for entity_type, batch in batches.items():
+            if not batch:
+                continue
+            if self.entity_types[entity_type] <= 0:
+                # No embedder on this index, cached vectors would be rejected
+                batch = [
+                    {k: v for k, v in document.items() if k != "_vectors"}
+                    for document in batch
+                ]
+            # orjson serializes large batches several times faster than json,
+            # including numpy vectors loaded from the embedding cache
+            payload = orjson.dumps(batch, option=orjson.OPT_SERIALIZE_NUMPY)
+            task_uids.append(
+                self._submit(
+                    partial(self._add_documents, index_uid(entity_type), payload),
+                    documents=len(batch),
+                )
+            )
+        return task_uids
+
+    def _add_documents(self, name: str, payload: bytes) -> int:
+        task = self.client.index(name).add_documents_raw(
+            payload, content_type="application/json"
+        )
         return task.task_uid
 
-    def delete_documents(self, document_ids: list[str], batch_size: int = 10000) -> int:
+    def _delete_documents(self, name: str, document_ids: list[str]) -> int:
+        return self.client.index(name).delete_documents(document_ids).task_uid
+
+    def delete_documents(
+        self,
+        document_ids: list[str],
+        batch_size: int = 10000,
+        entity_type: Optional[str] = None,
+    ) -> int:
         """Delete documents from Meilisearch by ID.
 
-        Sends deletes in batches without waiting, matching the fire-and-forget
-        pattern used by index_documents and letting Meilisearch auto-batch.
+        Sends deletes in batches without waiting for them to be applied,
+        like index_documents, letting Meilisearch auto-batch.
 
         Args:
             document_ids: List of document IDs (wikidata_ids) to delete
             batch_size: Number of IDs per batch (default 10000)
+            entity_type: Only delete from this type's index, defaults to all
 
         Returns:
             Number of documents requested for deletion
@@ -154,13 +645,122 @@ class SearchService:
         if not document_ids:
             return 0
 
-        index = self.client.index(INDEX_NAME)
-        for i in range(0, len(document_ids), batch_size):
-            batch = document_ids[i : i + batch_size]
-            index.delete_documents(batch)
+        types = self._selected_types([entity_type] if entity_type else None)
+        for name in map(index_uid, types):
+            for i in range(0, len(document_ids), batch_size):
+                batch = document_ids[i : i + batch_size]
+                self._submit(partial(self._delete_documents, name, batch), documents=0)
 
         return len(document_ids)
 
+    def _submit(self, send: Callable[[], int], documents: int) -> int:
+        """Send a document write once the submission window has room.
+
+        Blocks while the window is full. The write is kept until Meilisearch
+        applied it, so it can be sent again if its task fails.
+
+        Returns:
+            UID of the submitted task
+        """
+        self._window.acquire()
+        try:
+            task_uid = send()
+        except BaseException:
+            self._window.release()
+            raise
+        with self._tasks_changed:
+            self._pending[task_uid] = PendingTask(task_uid, send, documents)
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch_tasks, name="meili-task-watcher", daemon=True
+                )
+                self._watcher.start()
+        return task_uid
+
+    def _watch_tasks(self) -> None:
+        """Poll pending tasks in the background until none are left."""
+        while True:
+            time.sleep(TASK_POLL_INTERVAL)
+            with self._tasks_changed:
+                if not self._pending:
+                    self._watcher = None
+                    return
+                task_uids = list(self._pending)
+            try:
+                tasks = self.client.get_tasks(
+                    {"uids": [str(uid) for uid in task_uids], "limit": len(task_uids)}
+                ).results
+            except Exception as e:
+                logger.warning(f"Polling {len(task_uids)} tasks failed: {e}")
+                continue
+            for task in tasks:
+                if task.status not in ("enqueued", "processing"):
+                    self._finish_task(task)
+
+    def _finish_task(self, task) -> None:
+        """Account for a finished task, resubmitting it if it failed."""
+        with self._tasks_changed:
+            pending = self._pending.pop(task.uid, None)
+        # Tasks given up on by wait_for_tasks are no longer tracked
+        if pending is None:
+            return
+
+        resubmitted = None
+        if task.status != "succeeded" and pending.attempts <= self.task_retries:
+            logger.warning(
+                f"Task {task.uid} {task.status} ({task.error}), sending it again"
+            )
+            try:
+                resubmitted = pending.resubmit()
+            except Exception as e:
+                logger.error(f"Resubmitting task {task.uid} failed: {e}")
+        elif task.status != "succeeded":
+            logger.error(f"Task {task.uid} {task.status}: {task.error}")
+
+        with self._tasks_changed:
+            if resubmitted is not None:
+                # The retry keeps the window slot of the failed task
+                pending.uid = resubmitted
+                pending.attempts += 1
+                self._pending[resubmitted] = pending
+                self.retried_tasks += 1
+            else:
+                if task.status == "succeeded":
+                    self.applied_documents += pending.documents
+                else:
+                    self._failed.append(task.uid)
+                self._window.release()
+            self._tasks_changed.notify_all()
+
+    def wait_for_tasks(self, timeout_ms: int = 3_600_000) -> list[int]:
+        """Wait for all document tasks submitted since the last call.
+
+        Failed tasks are resubmitted up to MEILI_TASK_RETRIES times before
+        they count as failed.
+
+        Args:
+            timeout_ms: Total time to wait for all tasks
+
+        Returns:
+            UIDs of tasks that failed or did not finish within the timeout
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        with self._tasks_changed:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._tasks_changed.wait(remaining)
+
+            # Stop tracking unfinished tasks so the next build starts clean
+            timed_out = list(self._pending)
+            for task_uid in timed_out:
+                logger.error(f"Task {task_uid} did not finish in time")
+                self._window.release()
+            self._pending.clear()
+            failed, self._failed = self._failed + timed_out, []
+        return failed
+
     def search(
         self,
         query: str,
@@ -183,17 +783,674 @@ class SearchService:
         Returns:
             List of document IDs (wikidata_ids) ordered by relevance
         """
-        index = self.client.index(INDEX_NAME)
-        search_params: dict = {"limit": limit}
-        if entity_type:
-            search_params["filter"] = f"types = '{entity_type}'"
+        if entity_type is None:
+            # Rare cross-type search: merge all type indexes by ranking score
+            results = self.client.multi_search(
+                _federated_queries(self.entity_types, query, semantic_ratio),
+                federation={"limit": limit},
+            )
+            return _hit_ids(results["hits"])
+
+        index = self.client.index(index_uid(entity_type))
+        results = index.search(
+            query, _type_params(self.entity_types, entity_type, limit, semantic_ratio)
+        )
+        return [hit["id"] for hit in results["hits"]]
+
+    def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches in one round trip via the multi-search endpoint.
+
+        Cross-type requests need a federated search of their own each.
+        """
+        typed = [i for i, request in enumerate(requests) if request.entity_type]
+        results: list[Optional[list[str]]] = [None] * len(requests)
+        if typed:
+            response = self.client.multi_search(
+                [
+                    _type_query(
+                        self.entity_types,
+                        requests[i].entity_type,
+                        requests[i].query,
+                        requests[i].limit,
+                        requests[i].semantic_ratio,
+                    )
+                    for i in typed
+                ]
+            )
+            for i, result in zip(typed, response["results"]):
+                results[i] = [hit["id"] for hit in result["hits"]]
+
+        for i, request in enumerate(requests):
+            if results[i] is None:
+                results[i] = self.search(
+                    request.query, None, request.limit, request.semantic_ratio
+                )
+        return results
+
+
+# Indexes only the Postgres backend needs; created by create_index so
+# Meilisearch deployments don't pay for them on every import
+PG_LABEL_TRGM_INDEX = "idx_search_pg_labels_trgm"
+PG_EMBEDDING_HNSW_INDEX = "idx_search_pg_embeddings_hnsw"
+
+# Upper bound for HNSW candidates fetched before type filtering
+PG_MAX_VECTOR_CANDIDATES = 1000
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Search backend running inside Postgres.
+
+    Keyword search uses pg_trgm word similarity over wikidata_entity_labels,
+    semantic search an HNSW index over the cached document embeddings.
+    Indexing only records which entities are searchable, with their types and
+    the hash of their embedded text, in the search_documents table.
+    """
+
+    index_name = "postgres"
+
+    def __init__(self, bind=None, embedder: Optional[Embedder] = None):
+        """Initialize PostgresSearchBackend.
+
+        Args:
+            bind: SQLAlchemy engine or connection. Defaults to the application
+                engine.
+            embedder: Embedder for search queries. Defaults to OpenAIEmbedder,
+                created on first semantic search.
+        """
+        from .database import get_engine
+
+        self.bind = bind if bind is not None else get_engine()
+        self._embedder = embedder
+        self._lock = threading.Lock()
 
-        # Use hybrid search when semantic_ratio > 0
-        if semantic_ratio > 0:
-            search_params["hybrid"] = {
-                "semanticRatio": semantic_ratio,
-                "embedder": EMBEDDER_NAME,
+    @property
+    def embedder(self) -> Embedder:
+        if self._embedder is None:
+            self._embedder = OpenAIEmbedder()
+        return self._embedder
+
+    def _session(self):
+        from sqlalchemy.orm import Session
+
+        return Session(self.bind)
+
+    def create_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Create the trigram and HNSW indexes used for searching."""
+        from sqlalchemy import text
+
+        logger.info("Creating Postgres search indexes")
+        with self._session() as session:
+            session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            session.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {PG_LABEL_TRGM_INDEX} "
+                    "ON wikidata_entity_labels USING gin (label gin_trgm_ops)"
+                )
+            )
+            session.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {PG_EMBEDDING_HNSW_INDEX} "
+                    "ON search_embeddings USING hnsw (embedding vector_cosine_ops)"
+                )
+            )
+            session.commit()
+
+    def delete_index(self, entity_types: Optional[list[str]] = None) -> None:
+        """Drop the search indexes and forget all indexed documents."""
+        from sqlalchemy import text
+
+        logger.info("Deleting Postgres search indexes")
+        with self._session() as session:
+            session.execute(text(f"DROP INDEX IF EXISTS {PG_LABEL_TRGM_INDEX}"))
+            session.execute(text(f"DROP INDEX IF EXISTS {PG_EMBEDDING_HNSW_INDEX}"))
+            session.execute(text("DELETE FROM search_documents"))
+            session.commit()
+
+    def ensure_index(self, entity_types: Optional[list[str]] = None) -> bool:
+        """Create the search indexes if any of them is missing."""
+        from sqlalchemy import text
+
+        with self._session() as session:
+            existing = session.execute(
+                text("SELECT count(*) FROM pg_indexes WHERE indexname IN (:a, :b)"),
+                {"a": PG_LABEL_TRGM_INDEX, "b": PG_EMBEDDING_HNSW_INDEX},
+            ).scalar()
+        if existing == 2:
+            return False
+        self.create_index()
+        return True
+
+    def index_documents(
+        self,
+        documents: list[SearchDocument],
+        entity_types: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Record documents as searchable. Labels are read from Postgres directly."""
+        from .models import SearchIndexDocument
+
+        if not documents:
+            return []
+
+        rows = {
+            doc["id"]: {
+                "entity_id": doc["id"],
+                "types": doc["types"],
+                "text_hash": embedding_hash(render_document(doc)),
             }
+            for doc in documents
+        }
+        with self._session() as session:
+            # Sorted keys keep concurrent batches from deadlocking on upserts
+            SearchIndexDocument.upsert_batch(
+                session, [rows[entity_id] for entity_id in sorted(rows)]
+            )
+            session.commit()
+        with self._lock:
+            self.applied_documents += len(rows)
+        return []
 
-        results = index.search(query, search_params)
-        return [hit["id"] for hit in results["hits"]]
+    def delete_documents(
+        self,
+        document_ids: list[str],
+        batch_size: int = 10000,
+        entity_type: Optional[str] = None,
+    ) -> int:
+        """Remove documents from the searchable set.
+
+        With an entity type, only that type is dropped from the documents;
+        documents left without types are removed.
+        """
+        from sqlalchemy import delete, func, update
+
+        from .models import SearchIndexDocument
+
+        if not document_ids:
+            return 0
+
+        with self._session() as session:
+            for i in range(0, len(document_ids), batch_size):
+                batch = document_ids[i : i + batch_size]
+                if entity_type:
+                    session.execute(
+                        update(SearchIndexDocument)
+                        .where(SearchIndexDocument.entity_id.in_(batch))
+                        .values(
+                            types=func.array_remove(
+                                SearchIndexDocument.types, entity_type
+                            )
+                        )
+                    )
+                    session.execute(
+                        delete(SearchIndexDocument).where(
+                            SearchIndexDocument.entity_id.in_(batch),
+                            func.cardinality(SearchIndexDocument.types) == 0,
+                        )
+                    )
+                else:
+                    session.execute(
+                        delete(SearchIndexDocument).where(
+                            SearchIndexDocument.entity_id.in_(batch)
+                        )
+                    )
+            session.commit()
+        return len(document_ids)
+
+    def search(
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        limit: int = 100,
+        semantic_ratio: float = 0.0,
+    ) -> list[str]:
+        """Search entities by label.
+
+        Keyword and semantic scores are both in [0, 1] and blended as
+        (1 - semantic_ratio) * keyword + semantic_ratio * semantic, so 0.0 is
+        pure keyword search and 1.0 pure semantic search, as in Meilisearch.
+        """
+        return self.search_many(
+            [SearchRequest(query, entity_type, limit, semantic_ratio)]
+        )[0]
+
+    def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches on one connection with a single embedder call."""
+        semantic = [request.query for request in requests if request.semantic_ratio > 0]
+        vectors = dict(zip(semantic, self.embedder.embed(semantic))) if semantic else {}
+
+        results = []
+        with self._session() as session:
+            for request in requests:
+                ratio = request.semantic_ratio
+                scores: dict[str, float] = {}
+                if ratio < 1:
+                    for entity_id, score in self._keyword_scores(
+                        session, request.query, request.entity_type, request.limit
+                    ):
+                        scores[entity_id] = (1 - ratio) * score
+                if ratio > 0:
+                    for entity_id, score in self._vector_scores(
+                        session,
+                        vectors[request.query],
+                        request.entity_type,
+                        request.limit,
+                    ):
+                        scores[entity_id] = scores.get(entity_id, 0.0) + ratio * score
+
+                ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+                results.append([entity_id for entity_id, _ in ranked[: request.limit]])
+        return results
+
+    def _keyword_scores(self, session, query, entity_type, limit):
+        from sqlalchemy import text
+
+        # Matches the raw labels, not the normalized document labels, so the
+        # query is used as typed (trigrams are case-insensitive already)
+        type_filter = "AND :entity_type = ANY(d.types)" if entity_type else ""
+        return session.execute(
+            text(
+                f"""
+                SELECT l.entity_id, max(word_similarity(:query, l.label)) AS score
+                FROM wikidata_entity_labels l
+                JOIN search_documents d ON d.entity_id = l.entity_id
+                WHERE :query <% l.label {type_filter}
+                GROUP BY l.entity_id
+                ORDER BY score DESC, l.entity_id
+                LIMIT :limit
+                """
+            ),
+            {"query": query, "entity_type": entity_type, "limit": limit},
+        ).all()
+
+    def _vector_scores(self, session, vector, entity_type, limit):
+        """Score documents by cosine similarity to a query vector.
+
+        Nearest neighbours are taken from the HNSW index over all embeddings
+        and filtered by type afterwards. When fewer than limit documents of
+        the type survive (types with few documents among many others), the
+        filtered documents are scanned exactly instead, so small types keep
+        their recall.
+        """
+        from sqlalchemy import text
+
+        vector_literal = "[" + ",".join(str(float(v)) for v in vector) + "]"
+
+        # Oversample nearest neighbours since the type filter runs afterwards
+        candidates = min(max(limit * 10, 100), PG_MAX_VECTOR_CANDIDATES)
+        session.execute(text(f"SET LOCAL hnsw.ef_search = {candidates}"))
+
+        type_filter = "WHERE :entity_type = ANY(d.types)" if entity_type else ""
+        rows = session.execute(
+            text(
+                f"""
+                WITH nearest AS (
+                    SELECT text_hash,
+                           embedding <=> CAST(:vector AS vector) AS distance
+                    FROM search_embeddings
+                    ORDER BY distance
+                    LIMIT :candidates
+                )
+                SELECT d.entity_id, 1 - min(n.distance) AS score
+                FROM nearest n
+                JOIN search_documents d ON d.text_hash = n.text_hash
+                {type_filter}
+                GROUP BY d.entity_id
+                ORDER BY score DESC, d.entity_id
+                LIMIT :limit
+                """
+            ),
+            {
+                "vector": vector_literal,
+                "candidates": candidates,
+                "entity_type": entity_type,
+                "limit": limit,
+            },
+        ).all()
+        if not entity_type or len(rows) >= limit:
+            return rows
+
+        # Ordering by the score expression rather than the distance operator
+        # keeps the planner off the unfiltered HNSW index
+        return session.execute(
+            text(
+                """
+                SELECT d.entity_id,
+                       1 - (e.embedding <=> CAST(:vector AS vector)) AS score
+                FROM search_documents d
+                JOIN search_embeddings e ON e.text_hash = d.text_hash
+                WHERE :entity_type = ANY(d.types)
+                ORDER BY score DESC, d.entity_id
+                LIMIT :limit
+                """
+            ),
+            {"vector": vector_literal, "entity_type": entity_type, "limit": limit},
+        ).all()
+
+
+def create_search_service() -> SearchBackend:
+    """Create the search backend selected by SEARCH_BACKEND.
+
+    Supported values are 'meilisearch' (default) and 'postgres'.
+    """
+    backend = os.getenv("SEARCH_BACKEND", "meilisearch")
+    if backend == "meilisearch":
+        return SearchService()
+    if backend == "postgres":
+        return PostgresSearchBackend()
+    raise ValueError(f"Unknown SEARCH_BACKEND: {backend}")
+
+
+class AsyncSearchClient(ABC):
+    """Async search interface used by the API and the enrichment pipeline."""
+
+    def __init__(self):
+        # Pooled connections belong to the event loop that created them
+        self.loop = asyncio.get_running_loop()
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        limit: int = 100,
+        semantic_ratio: float = 0.0,
+    ) -> list[str]:
+        """Search entities by label, see SearchBackend.search."""
+
+    @abstractmethod
+    async def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches, see SearchBackend.search_many."""
+
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+
+
+class AsyncMeilisearchClient(AsyncSearchClient):
+    """Meilisearch client with a pooled keep-alive HTTP connection pool.
+
+    Only covers searching; index management stays on SearchService.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        transport=None,
+        entity_types: Optional[dict[str, float]] = None,
+    ):
+        """Initialize AsyncMeilisearchClient.
+
+        Args:
+            url: Meilisearch server URL. Defaults to MEILI_URL env var
+                 or http://localhost:7700.
+            api_key: Meilisearch API key. Defaults to MEILI_MASTER_KEY env var.
+            max_connections: Size of the connection pool. Defaults to
+                MEILI_MAX_CONNECTIONS env var or 20.
+            transport: Optional httpx transport, e.g. a mock transport in tests
+            entity_types: Searchable types mapped to their semantic ratio.
+                Defaults to searchable_types().
+        """
+        import httpx
+
+        super().__init__()
+        self.entity_types = entity_types or searchable_types()
+        url = url or os.getenv("MEILI_URL", "http://localhost:7700")
+        api_key = api_key or os.getenv("MEILI_MASTER_KEY")
+        max_connections = max_connections or int(
+            os.getenv("MEILI_MAX_CONNECTIONS", "20")
+        )
+
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        self.client = httpx.AsyncClient(
+            base_url=url,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(10.0),
+            transport=transport,
+        )
+
+    async def _post(self, path: str, body: dict) -> dict:
+        response = await self.client.post(path, content=orjson.dumps(body))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def search(
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        limit: int = 100,
+        semantic_ratio: float = 0.0,
+    ) -> list[str]:
+        """Search entities by label, see SearchBackend.search."""
+        if entity_type is None:
+            result = await self._post(
+                "/multi-search",
+                {
+                    "federation": {"limit": limit},
+                    "queries": _federated_queries(
+                        self.entity_types, query, semantic_ratio
+                    ),
+                },
+            )
+            return _hit_ids(result["hits"])
+
+        result = await self._post(
+            f"/indexes/{index_uid(entity_type)}/search",
+            {
+                "q": query,
+                **_type_params(self.entity_types, entity_type, limit, semantic_ratio),
+            },
+        )
+        return [hit["id"] for hit in result["hits"]]
+
+    async def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches in one multi-search request.
+
+        Cross-type requests run as concurrent federated searches of their own.
+        """
+        typed = [i for i, request in enumerate(requests) if request.entity_type]
+        untyped = [i for i, request in enumerate(requests) if not request.entity_type]
+        results: list[Optional[list[str]]] = [None] * len(requests)
+
+        async def search_typed() -> None:
+            if not typed:
+                return
+            queries = [
+                _type_query(
+                    self.entity_types,
+                    requests[i].entity_type,
+                    requests[i].query,
+                    requests[i].limit,
+                    requests[i].semantic_ratio,
+                )
+                for i in typed
+            ]
+            response = await self._post("/multi-search", {"queries": queries})
+            for i, result in zip(typed, response["results"]):
+                results[i] = [hit["id"] for hit in result["hits"]]
+
+        async def search_untyped(i: int) -> None:
+            request = requests[i]
+            results[i] = await self.search(
+                request.query, None, request.limit, request.semantic_ratio
+            )
+
+        await asyncio.gather(search_typed(), *[search_untyped(i) for i in untyped])
+        return results
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class ThreadedSearchClient(AsyncSearchClient):
+    """Async adapter running a synchronous SearchBackend in worker threads."""
+
+    def __init__(self, backend: SearchBackend):
+        super().__init__()
+        self.backend = backend
+
+    async def search(
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        limit: int = 100,
+        semantic_ratio: float = 0.0,
+    ) -> list[str]:
+        """Search entities by label, see SearchBackend.search."""
+        return await asyncio.to_thread(
+            self.backend.search, query, entity_type, limit, semantic_ratio
+        )
+
+    async def search_many(self, requests: list[SearchRequest]) -> list[list[str]]:
+        """Run several searches, see SearchBackend.search_many."""
+        return await asyncio.to_thread(self.backend.search_many, requests)
+
+
+def create_async_search_client() -> AsyncSearchClient:
+    """Create an async search client for the backend selected by SEARCH_BACKEND.
+
+    Must be called from within a running event loop.
+    """
+    backend = os.getenv("SEARCH_BACKEND", "meilisearch")
+    if backend == "meilisearch":
+        return AsyncMeilisearchClient()
+    return ThreadedSearchClient(create_search_service())
+
+
+# Process-wide client, replaced when used from a different event loop
+_async_search_client: Optional[AsyncSearchClient] = None
+
+
+def get_async_search_client() -> AsyncSearchClient:
+    """Get the shared async search client for the running event loop.
+
+    The API creates it in its lifespan; other callers (e.g. enrichment run
+    from the CLI) get one created on first use.
+    """
+    global _async_search_client
+    loop = asyncio.get_running_loop()
+    if _async_search_client is None or _async_search_client.loop is not loop:
+        _async_search_client = create_async_search_client()
+    return _async_search_client
+
+
+async def close_async_search_client() -> None:
+    """Close the shared async search client, if any."""
+    global _async_search_client
+    if _async_search_client is not None:
+        await _async_search_client.aclose()
+        _async_search_client = None
+
+
+async def get_search_client() -> AsyncSearchClient:
+    """FastAPI dependency providing the shared async search client."""
+    return get_async_search_client()
+
+
+class SearchCache:
+    """Bounded LRU cache of search results with a time-to-live.
+
+    Keys are (entity type, normalized query, limit, semantic ratio). The cache
+    is process-local; other processes announce index changes through
+    SearchIndexChangedEvent, which each API worker handles by invalidating.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock=time.monotonic,
+    ):
+        """Initialize SearchCache.
+
+        Args:
+            max_entries: Maximum number of cached results, 0 disables caching.
+                Defaults to SEARCH_CACHE_SIZE env var or 10000.
+            ttl: Seconds a result stays valid. Defaults to SEARCH_CACHE_TTL
+                env var or 300.
+            clock: Monotonic time source
+        """
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(os.getenv("SEARCH_CACHE_SIZE", "10000"))
+        )
+        self.ttl = (
+            ttl if ttl is not None else float(os.getenv("SEARCH_CACHE_TTL", "300"))
+        )
+        self.clock = clock
+        self._entries: OrderedDict[tuple, tuple[float, list[str]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(
+        entity_type: Optional[str], query: str, limit: int, semantic_ratio: float
+    ) -> tuple:
+        """Build a cache key, normalizing case and whitespace of the query."""
+        return (entity_type, " ".join(query.casefold().split()), limit, semantic_ratio)
+
+    def get(self, key: tuple) -> Optional[list[str]]:
+        """Get a cached result, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(entry[1])
+
+    def put(self, key: tuple, result: list[str]) -> None:
+        """Store a result, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (self.clock() + self.ttl, list(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self.invalidations += 1
+
+    def handle_event(self, payload: dict) -> None:
+        """Event bus handler invalidating the cache when the index changes."""
+        if payload.get("type") == "search_index_changed":
+            self.invalidate()
+
+    def stats(self) -> dict:
+        """Hit-rate metrics of this process's cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "invalidations": self.invalidations,
+        }
+
+
+# Process-wide cache in front of find_similar
+search_cache = SearchCache()
+
+
+def notify_index_changed(session) -> None:
+    """Invalidate cached search results in this and every API process.
+
+    The notification is sent in the caller's transaction, so other processes
+    only drop their caches once the change is committed.
+    """
+    from .sse import SearchIndexChangedEvent, event_bus
+
+    search_cache.invalidate()
+    event_bus.notify(SearchIndexChangedEvent(), session)
@@ -0,0 +1,396 @@
+"""Turn archived pages into clean text and Wikipedia sections for extraction.
+
+extract_main_text() reduces a page to the text of its main content, without
+navigation, reference lists and other site chrome, one block per line.
+Extraction configurations only need parts of a biography: dates and
+birthplaces are nearly always in the lead or the infobox, positions in the
+career sections. segment_html() splits Wikipedia articles so each
+configuration can be routed only its parts, keeping prompts small on long
+articles.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+import lxml.html
+from lxml import etree
+
+from .models.base import PropertyType
+from .wikidata.date import WikidataDate
+
+logger = logging.getLogger(__name__)
+
+# Characters per token, for estimating the size of routed content
+CHARS_PER_TOKEN = 4
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Elements holding no article prose: page chrome, Wikipedia reference lists,
+# navigation boxes, edit links and anything hidden
+_NOISE_XPATH = etree.XPath(
+    " | ".join(
+        [
+            "//script",
+            "//style",
+            "//noscript",
+            "//template",
+            "//nav",
+            "//footer",
+            "//*[@hidden]",
+            "//*[contains(translate(@style, ' ', ''), 'display:none')]",
+            "//*[@id='mw-navigation' or @id='mw-panel' or @id='footer'"
+            " or @id='catlinks' or @id='siteNotice' or @id='toc']",
+        ]
+        + [
+            f"//*[{_has_class(name)}]"
+            for name in (
+                "mw-editsection",
+                "mw-jump-link",
+                "reference",
+                "references",
+                "reflist",
+                "navbox",
+                "vertical-navbox",
+                "metadata",
+                "noprint",
+                "mw-empty-elt",
+                "printfooter",
+                "catlinks",
+            )
+        ]
+    )
+)
+
+_WIKIPEDIA_CONTENT_XPATH = etree.XPath(
+    f"//*[@id='mw-content-text']//div[{_has_class('mw-parser-output')}]"
+)
+_MAIN_XPATH = etree.XPath("//main | //article | //*[@role='main']")
+_INFOBOX_XPATH = etree.XPath(f".//table[{_has_class('infobox')}]")
+
+# hCard microformat classes of the birth and death date templates; the dates
+# are rendered as hidden ISO dates whatever the article's language
+_INFOBOX_DATE_CLASSES = {
+    "bday": PropertyType.BIRTH_DATE,
+    "dday": PropertyType.DEATH_DATE,
+}
+# Age shown by birth date templates of living people
+_LIVING_XPATH = etree.XPath(f".//*[{_has_class('ForceAgeToShow')}]")
+
+# Elements whose content starts on a new line
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "aside", "blockquote", "pre",
+    "ul", "ol", "li", "dl", "dt", "dd", "table", "tr", "caption", "figure",
+    "figcaption", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "br",
+}  # fmt: skip
+
+# Elements whose content is separated from its neighbours by a space
+_CELL_TAGS = {"td", "th"}
+
+# Headings of career sections, matched as lowercase substrings; covers the
+# languages with the most politician articles
+CAREER_KEYWORDS = (
+    "career",
+    "politic",
+    "office",
+    "minister",
+    "parliament",
+    "election",
+    "presiden",
+    "tenure",
+    "mandat",
+    "karriere",
+    "laufbahn",
+    "carrière",
+    "carrera",
+    "carriera",
+    "carreira",
+    "kariera",
+    "polityk",
+    "politiek",
+    "loopbaan",
+    "карьер",
+    "деятельност",
+    "політич",
+)
+
+# Headings of sections about the person's origins and private life
+BIOGRAPHY_KEYWORDS = (
+    "early life",
+    "personal",
+    "biograph",
+    "family",
+    "background",
+    "leben",
+    "biografi",
+    "vie ",
+    "jeunesse",
+    "vida",
+    "życiorys",
+    "биограф",
+)
+
+
+@dataclass
+class Section:
+    """A headed section of an article, including its subsections."""
+
+    heading: str
+    text: str
+
+
+@dataclass
+class InfoboxDate:
+    """A date read from the machine-readable markup of an infobox."""
+
+    type: PropertyType
+    value: str
+    # Visible text of the infobox row holding the date
+    quote: str
+
+
+@dataclass
+class SegmentedPage:
+    """The parts of a Wikipedia article relevant to extraction."""
+
+    lead: str
+    infobox: str
+    sections: list[Section] = field(default_factory=list)
+    infobox_dates: list[InfoboxDate] = field(default_factory=list)
+    # The infobox shows the person's current age
+    living: bool = False
+
+
+@dataclass
+class ContentRoute:
+    """Which parts of a segmented page an extraction configuration receives.
+
+    Args:
+        lead: Include the lead paragraphs
+        infobox: Include the infobox
+        section_keywords: Include sections whose heading contains one of these
+        all_sections_fallback: Include every section if none matches
+        token_budget: Maximum estimated tokens of routed content
+    """
+
+    lead: bool = True
+    infobox: bool = True
+    section_keywords: tuple[str, ...] = ()
+    all_sections_fallback: bool = False
+    token_budget: int = 2000
+
+
+def _drop_noise(document) -> None:
+    """Strip everything that isn't content from a parsed page."""
+    for element in _NOISE_XPATH(document):
+        # drop_tree keeps the text following the element
+        element.drop_tree()
+
+
+def _parse(html_content: str):
+    """Parse a page and strip everything that isn't content."""
+    document = lxml.html.document_fromstring(html_content)
+    _drop_noise(document)
+    return document
+
+
+def _text(element) -> str:
+    """Text of an element, one line per block and whitespace normalized."""
+    pieces = []
+
+    def walk(node):
+        block = node.tag in _BLOCK_TAGS
+        separator = "\n" if block else " " if node.tag in _CELL_TAGS else ""
+        pieces.append(separator)
+        if node.text and isinstance(node.tag, str):
+            pieces.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                pieces.append(child.tail)
+        pieces.append(separator)
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(pieces).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _inline_text(element) -> str:
+    """Text of an element on a single line."""
+    return " ".join(_text(element).split())
+
+
+def extract_main_text(html_content: str) -> str:
+    """Extract the main content of a page as clean text.
+
+    Uses the article body of Wikipedia pages, otherwise the page's main or
+    article element, falling back to the whole document. Navigation,
+    reference lists, edit links and hidden elements are dropped; every
+    paragraph, list item and table row ends up on its own line.
+    """
+    if not html_content or not html_content.strip():
+        return ""
+    try:
+        document = _parse(html_content)
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"Error parsing page: {e}")
+        return ""
+    roots = _WIKIPEDIA_CONTENT_XPATH(document) or _MAIN_XPATH(document)
+    return _text(roots[0] if roots else document)
+
+
+def _heading_text(element) -> Optional[str]:
+    """Heading text of a section heading element, or None for other elements."""
+    if element.tag == "h2":
+        return _inline_text(element)
+    if element.tag == "div" and "mw-heading2" in element.classes:
+        heading = element.find("h2")
+        return _inline_text(heading) if heading is not None else None
+    return None
+
+
+def _infobox_date_rows(infobox) -> list[tuple]:
+    """Find the birth and death dates of an infobox.
+
+    Only unambiguous dates are returned: a single valid date per type, inside
+    an infobox row whose visible text can back it up as a quote.
+
+    Returns:
+        Tuples of property type, date and the row holding it
+    """
+    found = []
+    for css_class, property_type in _INFOBOX_DATE_CLASSES.items():
+        elements = infobox.xpath(f".//*[{_has_class(css_class)}]")
+        if len(elements) != 1:
+            continue
+        value = _inline_text(elements[0])
+        try:
+            WikidataDate.validate_date_format(value)
+        except ValueError:
+            continue
+        row = next(elements[0].iterancestors("tr"), None)
+        if row is not None:
+            found.append((property_type, value, row))
+    return found
+
+
+def segment_html(html_content: str) -> Optional[SegmentedPage]:
+    """Split an archived Wikipedia page into lead, infobox and sections.
+
+    Sections are split at second-level headings; deeper subsections stay part
+    of their parent section.
+
+    Returns:
+        The segmented page, or None if it doesn't look like a Wikipedia article
+    """
+    try:
+        document = lxml.html.document_fromstring(html_content)
+        roots = _WIKIPEDIA_CONTENT_XPATH(document)
+        if not roots:
+            return None
+        body = roots[0]
+
+        # Date markup is hidden, so read it before hidden elements are dropped
+        infoboxes = _INFOBOX_XPATH(body)
+        date_rows = _infobox_date_rows(infoboxes[0]) if infoboxes else []
+        living = bool(infoboxes and _LIVING_XPATH(infoboxes[0]))
+        _drop_noise(document)
+
+        infobox = ""
+        infobox_dates = [
+            InfoboxDate(type=property_type, value=value, quote=_inline_text(row))
+            for property_type, value, row in date_rows
+        ]
+        if infoboxes:
+            rows = [_inline_text(row) for row in infoboxes[0].iter("tr")]
+            infobox = "\n".join(row for row in rows if row)
+            infoboxes[0].drop_tree()
+
+        lead_parts: list[str] = []
+        sections: list[Section] = []
+        for element in body:
+            if not isinstance(element.tag, str):
+                continue
+            heading = _heading_text(element)
+            if heading is not None:
+                sections.append(Section(heading=heading, text=""))
+                continue
+            text = _text(element)
+            if not text:
+                continue
+            if sections:
+                current = sections[-1]
+                current.text = f"{current.text}\n{text}" if current.text else text
+            elif element.tag == "p":
+                lead_parts.append(text)
+
+        page = SegmentedPage(
+            lead="\n".join(lead_parts),
+            infobox=infobox,
+            sections=[section for section in sections if section.text],
+            infobox_dates=infobox_dates,
+            living=living
+            and not any(date.type == PropertyType.DEATH_DATE for date in infobox_dates),
+        )
+        if not page.lead and not page.sections:
+            return None
+        return page
+
+    except Exception as e:
+        logger.warning(f"Error segmenting page: {e}")
+        return None
+
+
+def _matches(heading: str, keywords: tuple[str, ...]) -> bool:
+    heading = heading.lower()
+    return any(keyword in heading for keyword in keywords)
+
+
+def route_content(
+    page: Optional[SegmentedPage], route: Optional[ContentRoute], full_text: str
+) -> str:
+    """Assemble the content an extraction configuration receives.
+
+    Parts are added in page order until the token budget is spent; the part
+    crossing the budget is cut off. Falls back to the full text when there is
+    no segmented page or route, or the route selects nothing.
+
+    Args:
+        page: Segmented page, or None if segmentation failed
+        route: Parts to include, or None for the full text
+        full_text: Flattened text of the whole page
+
+    Returns:
+        Text content for the configuration's prompt
+    """
+    if page is None or route is None:
+        return full_text
+
+    parts = []
+    if route.infobox and page.infobox:
+        parts.append(page.infobox)
+    if route.lead and page.lead:
+        parts.append(page.lead)
+
+    sections = [
+        section
+        for section in page.sections
+        if _matches(section.heading, route.section_keywords)
+    ]
+    if not sections and route.all_sections_fallback:
+        sections = page.sections
+    parts.extend(f"{section.heading}\n{section.text}" for section in sections)
+
+    if not parts:
+        return full_text
+
+    content = "\n\n".join(parts)
+    max_chars = route.token_budget * CHARS_PER_TOKEN
+    if len(content) > max_chars:
+        # Cut at a word boundary
+        content = re.sub(r"\s+\S*$", "", content[:max_chars])
+    return content
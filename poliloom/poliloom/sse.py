@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 from dataclasses import asdict, dataclass, field
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 import psycopg
 from psycopg import sql
@@ -52,11 +52,19 @@ class EvaluationCountEvent(Event):
     total: int = 0
 
 
+@dataclass
+class SearchIndexChangedEvent(Event):
+    """Broadcast when documents were added to or removed from the search index."""
+
+    type: str = field(init=False, default="search_index_changed")
+
+
 class EventBus:
     """Manages SSE subscriptions and the PostgreSQL LISTEN task."""
 
     def __init__(self) -> None:
         self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._handlers: List[Callable[[dict], None]] = []
         self._task: asyncio.Task | None = None
 
     @staticmethod
@@ -87,8 +95,21 @@ class EventBus:
             if not queues:
                 del self._subscribers[user_id]
 
+    def add_handler(self, handler: Callable[[dict], None]) -> None:
+        """Call a handler for every event this worker receives, e.g. to drop caches."""
+        self._handlers.append(handler)
+
+    def remove_handler(self, handler: Callable[[dict], None]) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
     def _fanout(self, payload: dict) -> None:
-        """Fan out a deserialized event to all local subscribers."""
+        """Fan out a deserialized event to local handlers and subscribers."""
+        for handler in self._handlers:
+            try:
+                handler(payload)
+            except Exception:
+                log.warning("SSE event handler failed", exc_info=True)
         for queues in self._subscribers.values():
             for queue in queues:
                 queue.put_nowait(payload)
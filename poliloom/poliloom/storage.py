@@ -1,16 +1,18 @@
 """Storage abstraction layer for handling both local and Google Cloud Storage."""
 
+import asyncio
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import threading
 import httpx
 import indexed_bzip2 as ibz2
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Iterator, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, Optional, Tuple
 from urllib.parse import urlparse
-from google.cloud import storage
-from google.auth import default
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,62 @@ class StorageBackend(ABC):
         """Extract a bz2 file from this backend to another backend."""
         pass
 
+    async def aexists(self, path: str) -> bool:
+        """Check if a file exists without blocking the event loop."""
+        return await asyncio.to_thread(self.exists, path)
+
+    async def aopen(self, path: str, mode: str = "rb") -> BinaryIO:
+        """Open a file without blocking the event loop.
+
+        The returned file object is synchronous; prefer aread/awrite for
+        whole-file access from async code.
+        """
+        return await asyncio.to_thread(self.open, path, mode)
+
+    async def aread(self, path: str, mode: str = "rb") -> bytes | str:
+        """Read a whole file without blocking the event loop."""
+
+        def _read():
+            with self.open(path, mode) as f:
+                return f.read()
+
+        return await asyncio.to_thread(_read)
+
+    async def awrite(self, path: str, data: bytes | str) -> None:
+        """Write a whole file without blocking the event loop."""
+        mode = "w" if isinstance(data, str) else "wb"
+
+        def _write():
+            with self.open(path, mode) as f:
+                f.write(data)
+
+        await asyncio.to_thread(_write)
+
+    @property
+    def write_chunk_size(self) -> int:
+        """Preferred size of the chunks passed to write_chunks."""
+        return 256 * 1024 * 1024
+
+    def write_chunks(self, path: str, chunks: Iterator[bytes]) -> None:
+        """Write a sequence of chunks to a file, in order.
+
+        Backends that support concurrent uploads override this.
+        """
+        with self.open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+
+def _iter_file_chunks(
+    f: BinaryIO, chunk_size: int = 256 * 1024 * 1024
+) -> Iterator[bytes]:
+    """Read a file object in chunks until EOF."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
 
 class LocalStorage(StorageBackend):
     """Local filesystem storage backend."""
@@ -120,24 +178,317 @@ class LocalStorage(StorageBackend):
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
         with ibz2.open(source_path, parallelization=os.cpu_count()) as source_file:
-            with dest_backend.open(dest_path, "wb") as dest_file:
-                # Stream in larger chunks for better performance
-                chunk_size = 256 * 1024 * 1024  # 256MB chunks
-                while True:
-                    chunk = source_file.read(chunk_size)
-                    if not chunk:
-                        break
-                    dest_file.write(chunk)
+            # Stream in larger chunks for better performance
+            dest_backend.write_chunks(
+                dest_path,
+                _iter_file_chunks(source_file, dest_backend.write_chunk_size),
+            )
 
         logger.info(f"✅ Successfully extracted {source_path} to {dest_path}")
 
 
+class BlockCache:
+    """Read-through cache of fixed-size file blocks on local disk.
+
+    Remote objects are split into aligned blocks of ``block_size`` bytes. Each
+    block is fetched once, written atomically to ``cache_dir`` and served from
+    disk afterwards. Reading a block schedules the following blocks for
+    background prefetch, so sequential readers rarely wait on the network.
+
+    The cache directory may be shared by several processes (the dump importers
+    fork one worker per chunk). Block files are touched on every hit and the
+    least recently used files are evicted by modification time once the
+    directory grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        block_size: int = 16 * 1024 * 1024,
+        max_bytes: int = 10 * 1024 * 1024 * 1024,
+        prefetch_blocks: int = 4,
+    ):
+        """Initialize the block cache.
+
+        Args:
+            cache_dir: Local directory holding cached blocks
+            block_size: Size of each cached block in bytes
+            max_bytes: Upper bound on the total size of cached blocks
+            prefetch_blocks: Number of blocks to prefetch ahead of the reader
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+
+        self.cache_dir = cache_dir
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.prefetch_blocks = prefetch_blocks
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._bytes_since_scan = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _object_dir(self, key: str) -> str:
+        """Directory holding the blocks of one object."""
+        return os.path.join(
+            self.cache_dir, hashlib.sha256(key.encode()).hexdigest()[:16]
+        )
+
+    def _block_path(self, key: str, index: int) -> str:
+        """Path of a single cached block."""
+        return os.path.join(self._object_dir(key), f"{index:08d}.blk")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the prefetch executor, recreating it after a fork."""
+        pid = os.getpid()
+        if self._executor is None or self._executor_pid != pid:
+            # Threads do not survive fork, so each process needs its own pool
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self.prefetch_blocks),
+                thread_name_prefix="block-prefetch",
+            )
+            self._executor_pid = pid
+            self._lock = threading.Lock()
+            self._in_flight = {}
+        return self._executor
+
+    def _load_block(
+        self,
+        key: str,
+        index: int,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> bytes:
+        """Return a block from disk, fetching and storing it on a miss."""
+        path = self._block_path(key, index)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            pass
+
+        start = index * self.block_size
+        end = min(start + self.block_size, size)
+        data = fetch(start, end)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._bytes_since_scan += len(data)
+            should_evict = self._bytes_since_scan >= self.block_size * 8
+        if should_evict:
+            self._evict()
+
+        return data
+
+    def _submit(
+        self,
+        key: str,
+        index: int,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> Future:
+        """Schedule a block load, reusing an in-flight load for the same block."""
+        executor = self._get_executor()
+        block_id = f"{key}:{index}"
+        with self._lock:
+            future = self._in_flight.get(block_id)
+            if future is not None:
+                return future
+            future = executor.submit(self._load_block, key, index, size, fetch)
+            self._in_flight[block_id] = future
+
+        # Registered outside the lock: already finished futures run it inline
+        future.add_done_callback(lambda _f: self._forget(block_id))
+        return future
+
+    def _forget(self, block_id: str) -> None:
+        """Drop a finished load from the in-flight table."""
+        with self._lock:
+            self._in_flight.pop(block_id, None)
+
+    def get_block(
+        self,
+        key: str,
+        index: int,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> bytes:
+        """Get a block and prefetch the blocks following it.
+
+        Args:
+            key: Identity of the cached object (path and version)
+            index: Block index within the object
+            size: Total object size in bytes
+            fetch: Callable returning the bytes in ``[start, end)`` of the object
+
+        Returns:
+            Block contents (shorter than ``block_size`` for the last block)
+        """
+        num_blocks = (size + self.block_size - 1) // self.block_size
+        future = self._submit(key, index, size, fetch)
+
+        for ahead in range(
+            index + 1, min(index + 1 + self.prefetch_blocks, num_blocks)
+        ):
+            if not os.path.exists(self._block_path(key, ahead)):
+                self._submit(key, ahead, size, fetch)
+
+        return future.result()
+
+    def read(
+        self,
+        key: str,
+        start: int,
+        end: int,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> bytes:
+        """Read the byte range ``[start, end)`` through the cache."""
+        end = min(end, size)
+        if start >= end:
+            return b""
+
+        parts = []
+        first = start // self.block_size
+        last = (end - 1) // self.block_size
+        for index in range(first, last + 1):
+            block = self.get_block(key, index, size, fetch)
+            block_start = index * self.block_size
+            parts.append(block[max(start - block_start, 0) : max(end - block_start, 0)])
+        return b"".join(parts)
+
+    def iter_blocks(
+        self,
+        key: str,
+        start: int,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> Iterator[bytes]:
+        """Yield the object contents from ``start`` to EOF, block by block."""
+        index = start // self.block_size
+        offset = start - index * self.block_size
+        num_blocks = (size + self.block_size - 1) // self.block_size
+
+        while index < num_blocks:
+            block = self.get_block(key, index, size, fetch)
+            yield block[offset:]
+            offset = 0
+            index += 1
+
+    def _evict(self) -> None:
+        """Delete least recently used blocks until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for object_dir in os.scandir(self.cache_dir):
+            if not object_dir.is_dir():
+                continue
+            for entry in os.scandir(object_dir.path):
+                if not entry.name.endswith(".blk"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        with self._lock:
+            self._bytes_since_scan = 0
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, file_size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= file_size
+
+        logger.debug(f"Evicted block cache in {self.cache_dir} down to {total} bytes")
+
+    @classmethod
+    def from_env(cls) -> Optional["BlockCache"]:
+        """Create a block cache from environment configuration.
+
+        Returns:
+            BlockCache if GCS_CACHE_DIR is set, None otherwise
+        """
+        cache_dir = os.getenv("GCS_CACHE_DIR")
+        if not cache_dir:
+            return None
+
+        return cls(
+            cache_dir=cache_dir,
+            block_size=int(os.getenv("GCS_CACHE_BLOCK_SIZE", 16 * 1024 * 1024)),
+            max_bytes=int(os.getenv("GCS_CACHE_MAX_BYTES", 10 * 1024 * 1024 * 1024)),
+            prefetch_blocks=int(os.getenv("GCS_CACHE_PREFETCH_BLOCKS", 4)),
+        )
+
+
+def _iter_lines_range(blocks: Iterator[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Split a stream of blocks beginning at ``start`` into lines.
+
+    Matches the ``readline`` semantics of ``stream_lines_range``: every line
+    starting before ``end`` is yielded in full, even if it extends past it.
+    """
+    current_pos = start
+    buffer = b""
+
+    for block in blocks:
+        buffer += block
+        line_start = 0
+        while True:
+            newline = buffer.find(b"\n", line_start)
+            if newline == -1:
+                break
+            line = buffer[line_start : newline + 1]
+            yield line
+            current_pos += len(line)
+            line_start = newline + 1
+            if current_pos >= end:
+                return
+        buffer = buffer[line_start:]
+
+    if buffer and current_pos < end:
+        yield buffer
+
+
 class GCSStorage(StorageBackend):
     """Google Cloud Storage backend."""
 
-    def __init__(self):
-        """Initialize GCS storage backend."""
+    def __init__(self, cache: Optional[BlockCache] = None):
+        """Initialize GCS storage backend.
+
+        Args:
+            cache: Optional local block cache for range reads. Defaults to
+                the cache configured through GCS_CACHE_DIR, if any.
+        """
+        self.cache = cache if cache is not None else BlockCache.from_env()
+
         try:
+            from google.auth import default
+            from google.cloud import storage
+
             # Use Application Default Credentials from environment
             credentials, project = default()
 
@@ -192,14 +543,52 @@ class GCSStorage(StorageBackend):
         # Use native blob.open() which handles streaming uploads natively
         return blob.open(mode)
 
+    def _object_version(self, path: str) -> Tuple[int, int]:
+        """Get the size and generation of a GCS file in one metadata request."""
+        bucket_name, blob_name = self._parse_gcs_path(path)
+        blob = self.client.bucket(bucket_name).blob(blob_name)
+        blob.reload()
+        return blob.size or 0, blob.generation
+
     def read_range(self, path: str, start: int, end: int) -> bytes:
         """Read a specific byte range from a GCS file."""
+        if self.cache is not None:
+            size, generation = self._object_version(path)
+            return self.cache.read(
+                self._cache_key(path, generation),
+                start,
+                end,
+                size,
+                self._range_fetcher(path, generation),
+            )
+
+        # Same [start, end) range as cached reads
+        return self._range_fetcher(path)(start, end)
+
+    def _cache_key(self, path: str, generation: int) -> str:
+        """Cache key for a GCS object version.
+
+        Every overwrite of an object gets a new generation, so replaced dumps
+        never hit stale blocks, even when their size is unchanged.
+        """
+        return f"{path}#{generation}"
+
+    def _range_fetcher(
+        self, path: str, generation: Optional[int] = None
+    ) -> Callable[[int, int], bytes]:
+        """Build a callable fetching ``[start, end)`` of a GCS object.
+
+        With a generation, reads are pinned to that version of the object, so
+        a dump replaced mid-read fails instead of mixing blocks of two files.
+        """
         bucket_name, blob_name = self._parse_gcs_path(path)
-        bucket = self.client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        blob = self.client.bucket(bucket_name).blob(blob_name, generation=generation)
+
+        def fetch(start: int, end: int) -> bytes:
+            # GCS byte ranges are inclusive of the end offset
+            return blob.download_as_bytes(start=start, end=end - 1)
 
-        # Download the specific byte range
-        return blob.download_as_bytes(start=start, end=end)
+        return fetch
 
     def download(self, source: str, destination: str) -> None:
         """Download a file from GCS to local or another GCS location."""
@@ -226,6 +615,93 @@ class GCSStorage(StorageBackend):
             blob = bucket.blob(blob_name)
             blob.download_to_filename(destination)
 
+    @property
+    def write_chunk_size(self) -> int:
+        """Upload part size in bytes (GCS_UPLOAD_PART_MB, default 32 MB)."""
+        return int(os.getenv("GCS_UPLOAD_PART_MB", "32")) * 1024 * 1024
+
+    def _iter_parts(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Split chunks larger than the part size into parts."""
+        part_size = self.write_chunk_size
+        for chunk in chunks:
+            if len(chunk) <= part_size:
+                yield chunk
+                continue
+            view = memoryview(chunk)
+            for offset in range(0, len(chunk), part_size):
+                yield bytes(view[offset : offset + part_size])
+
+    def write_chunks(self, path: str, chunks: Iterator[bytes]) -> None:
+        """Upload chunks as parallel part objects and compose them into one file.
+
+        Chunks are split into parts of ``GCS_UPLOAD_PART_MB`` and uploaded as
+        temporary part objects by a pool of ``GCS_UPLOAD_CONCURRENCY`` threads.
+        Parts in flight are bounded to twice the concurrency times the part
+        size (256 MB at the defaults). Parts are then joined with GCS compose
+        (at most 32 sources per call, so large files are composed in rounds)
+        and deleted.
+        """
+        bucket_name, blob_name = self._parse_gcs_path(path)
+        bucket = self.client.bucket(bucket_name)
+        parts_prefix = f"{blob_name}.parts/"
+        concurrency = int(os.getenv("GCS_UPLOAD_CONCURRENCY", "4"))
+        max_pending_bytes = concurrency * 2 * self.write_chunk_size
+
+        def upload_part(name: str, data: bytes):
+            part = bucket.blob(name)
+            part.upload_from_string(data, content_type="application/octet-stream")
+            return part
+
+        parts = []
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending = []
+                pending_bytes = 0
+                for index, chunk in enumerate(self._iter_parts(chunks)):
+                    # Bound memory: wait for the oldest uploads before queueing
+                    while pending and pending_bytes + len(chunk) > max_pending_bytes:
+                        future, size = pending.pop(0)
+                        parts.append(future.result())
+                        pending_bytes -= size
+                    pending.append(
+                        (
+                            executor.submit(
+                                upload_part, f"{parts_prefix}{index:06d}", chunk
+                            ),
+                            len(chunk),
+                        )
+                    )
+                    pending_bytes += len(chunk)
+                for future, _ in pending:
+                    parts.append(future.result())
+
+            logger.info(f"Uploaded {len(parts)} parts, composing {path}...")
+            self._compose(bucket, blob_name, parts, parts_prefix)
+        finally:
+            for part in bucket.list_blobs(prefix=parts_prefix):
+                part.delete()
+
+    def _compose(self, bucket, blob_name: str, parts: list, parts_prefix: str):
+        """Compose part objects into a single object, in rounds of 32."""
+        max_sources = 32
+        round_number = 0
+        while len(parts) > max_sources:
+            grouped = []
+            for i in range(0, len(parts), max_sources):
+                group = bucket.blob(
+                    f"{parts_prefix}compose-{round_number}-{i // max_sources:06d}"
+                )
+                group.compose(parts[i : i + max_sources])
+                grouped.append(group)
+            parts = grouped
+            round_number += 1
+
+        destination = bucket.blob(blob_name)
+        if parts:
+            destination.compose(parts)
+        else:
+            destination.upload_from_string(b"")
+
     def stream_lines(self, path: str) -> Iterator[str]:
         """Stream lines from a GCS file."""
         bucket_name, blob_name = self._parse_gcs_path(path)
@@ -239,6 +715,17 @@ class GCSStorage(StorageBackend):
 
     def stream_lines_range(self, path: str, start: int, end: int) -> Iterator[bytes]:
         """Stream lines from a specific byte range of a GCS file."""
+        if self.cache is not None:
+            size, generation = self._object_version(path)
+            blocks = self.cache.iter_blocks(
+                self._cache_key(path, generation),
+                start,
+                size,
+                self._range_fetcher(path, generation),
+            )
+            yield from _iter_lines_range(blocks, start, end)
+            return
+
         bucket_name, blob_name = self._parse_gcs_path(path)
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_name)
@@ -285,14 +772,11 @@ class GCSStorage(StorageBackend):
 
             # Now use indexed_bzip2 on seekable local file for parallel processing
             with ibz2.open(temp_file.name, parallelization=os.cpu_count()) as bz2_file:
-                with dest_backend.open(dest_path, "wb") as dest_file:
-                    # Stream decompressed data in large chunks
-                    chunk_size = 256 * 1024 * 1024  # 256MB chunks
-                    while True:
-                        chunk = bz2_file.read(chunk_size)
-                        if not chunk:
-                            break
-                        dest_file.write(chunk)
+                # Stream decompressed data in large chunks
+                dest_backend.write_chunks(
+                    dest_path,
+                    _iter_file_chunks(bz2_file, dest_backend.write_chunk_size),
+                )
 
         logger.info(f"✅ Successfully extracted {source_path} to {dest_path}")
 
@@ -75,6 +75,19 @@ class WikidataEntityProcessor:
                 unique_labels.add(label_data["value"])
         return list(unique_labels)
 
+    def get_label_language_counts(self) -> Dict[str, int]:
+        """Count how many languages use each label value.
+
+        Returns:
+            Dictionary mapping unique label strings to their number of languages
+        """
+        counts: Dict[str, int] = {}
+        for label_data in self._labels.values():
+            if "value" in label_data:
+                value = label_data["value"]
+                counts[value] = counts.get(value, 0) + 1
+        return counts
+
     @property
     def sitelinks(self) -> Dict[str, Any]:
         """Get the sitelinks for this entity.
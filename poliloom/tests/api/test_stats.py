@@ -66,6 +66,33 @@ class TestEvaluationCountEndpoint:
         assert data["total"] == 0
 
 
+class TestSearchCacheStatsEndpoint:
+    """Test suite for GET /stats/search-cache endpoint."""
+
+    def test_requires_authentication(self, client):
+        """Search cache stats should require authentication."""
+        response = client.get("/stats/search-cache")
+        assert response.status_code == 401
+
+    def test_returns_hit_rate(self, client, mock_auth):
+        """Search cache stats should report lookups of this worker's cache."""
+        from poliloom.search import search_cache
+
+        key = search_cache.key("Location", "Berlin", 10, 0.0)
+        search_cache.get(key)
+        search_cache.put(key, ["Q64"])
+        search_cache.get(key)
+
+        response = client.get("/stats/search-cache", headers=mock_auth)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["hits"] == 1
+        assert data["misses"] == 1
+        assert data["hit_rate"] == 0.5
+        assert data["size"] == 1
+
+
 class TestStatsEndpoint:
     """Test suite for GET /stats endpoint."""
 
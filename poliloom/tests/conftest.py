@@ -31,13 +31,13 @@ def mock_find_similar(db_session):
     This avoids needing Meilisearch in tests.
     Applied automatically to all tests.
     """
-    from poliloom.models import WikidataEntityLabel
+    from poliloom.models import WikidataEntityLabel, WikidataEntityMixin
 
     def make_mock_find_similar(model_class):
         """Create a mock find_similar that searches by labels."""
 
         @classmethod
-        def mock_find_similar(cls, query, search_service, limit=100):
+        async def mock_find_similar(cls, query, search_client, limit=100):
             query_lower = query.lower()
             results = (
                 db_session.query(WikidataEntityLabel.entity_id)
@@ -54,6 +54,13 @@ def mock_find_similar(db_session):
 
         return mock_find_similar
 
+    @classmethod
+    async def mock_find_similar_many(cls, queries, search_client, limit=100):
+        return [
+            await cls.find_similar(query, search_client, limit=limit)
+            for query in queries
+        ]
+
     # Patch find_similar on all searchable models
     with (
         patch.object(Location, "find_similar", make_mock_find_similar(Location)),
@@ -61,10 +68,20 @@ def mock_find_similar(db_session):
         patch.object(Language, "find_similar", make_mock_find_similar(Language)),
         patch.object(Position, "find_similar", make_mock_find_similar(Position)),
         patch.object(Politician, "find_similar", make_mock_find_similar(Politician)),
+        patch.object(WikidataEntityMixin, "find_similar_many", mock_find_similar_many),
     ):
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Start every test with an empty process-wide search cache."""
+    from poliloom.search import SearchCache, search_cache
+
+    search_cache.__dict__.update(SearchCache().__dict__)
+    yield
+
+
 @pytest.fixture(autouse=True)
 def mock_search_service_globally():
     """Mock SearchService globally to avoid connecting to Meilisearch in tests.
@@ -75,6 +92,7 @@ def mock_search_service_globally():
         mock_instance = SyncMock()
         mock_instance.index_documents.return_value = 1
         mock_instance.delete_documents.return_value = 0
+        mock_instance.wait_for_tasks.return_value = []
         mock_instance.search.return_value = []
         mock_class.return_value = mock_instance
         yield mock_instance
@@ -91,6 +109,30 @@ def mock_search_service():
     return service
 
 
+def stub_embedding(text: str) -> list[float]:
+    """Deterministic embedding counting the letters a-z in a text."""
+    from poliloom.search import EMBEDDING_DIMENSIONS
+
+    vector = [0.0] * EMBEDDING_DIMENSIONS
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1.0
+    # Keep every vector non-zero so cosine distance is defined
+    vector[-1] = 1.0
+    return vector
+
+
+class StubEmbedder:
+    """Embedder using stub_embedding that records the texts it embeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return [stub_embedding(text) for text in texts]
+
+
 def load_json_fixture(filename):
     """Load a JSON fixture file."""
     fixtures_dir = Path(__file__).parent / "fixtures"
@@ -0,0 +1,136 @@
+"""Tests for the MappingDecision model."""
+
+import pytest
+
+from poliloom.models import (
+    Evaluation,
+    MappingDecision,
+    Politician,
+    Position,
+    Property,
+    PropertyType,
+)
+
+NAME = "mayor of springfield"
+
+
+@pytest.fixture
+def positions(db_session):
+    for qid, name in [("Q1", "Mayor of Springfield"), ("Q2", "Mayor")]:
+        Position.create_with_entity(db_session, qid, name)
+    db_session.flush()
+
+
+@pytest.fixture
+def decide(db_session, positions):
+    """Record a decision for a new politician, optionally with a review."""
+    count = [0]
+
+    def _decide(
+        entity_id="Q1", country_id="Q30", accepted=None, name=NAME, reused=False
+    ):
+        count[0] += 1
+        politician = Politician.create_with_entity(
+            db_session, f"Q{1000 + count[0]}", f"Politician {count[0]}"
+        )
+        db_session.flush()
+        db_session.add(
+            MappingDecision(
+                entity_type="position",
+                name=name,
+                country_id=country_id,
+                entity_id=entity_id,
+                politician_id=politician.id,
+                reused=reused,
+            )
+        )
+        if accepted is not None:
+            prop = Property(
+                politician_id=politician.id,
+                type=PropertyType.POSITION,
+                entity_id=entity_id,
+            )
+            db_session.add(prop)
+            db_session.flush()
+            db_session.add(
+                Evaluation(user_id="1", is_accepted=accepted, property_id=prop.id)
+            )
+        db_session.flush()
+
+    return _decide
+
+
+def lookup(db_session, country_id="Q30", min_mappings=3):
+    return MappingDecision.lookup(
+        db_session, Position, [NAME, "other"], country_id, min_mappings
+    )
+
+
+class TestMappingDecisionLookup:
+    """Test finding confident mapping decisions."""
+
+    def test_repeated_decision_is_confident(self, db_session, decide):
+        """Test a name mapped alike for enough politicians is reused."""
+        decide()
+        decide()
+        assert lookup(db_session) == {}
+
+        decide()
+        assert lookup(db_session) == {NAME: "Q1"}
+
+    def test_reuses_dont_confirm(self, db_session, decide):
+        """Test only independent mappings count towards trusting a decision."""
+        decide()
+        decide(reused=True)
+        decide(reused=True)
+        assert lookup(db_session) == {}
+
+        decide()
+        decide()
+        assert lookup(db_session) == {NAME: "Q1"}
+
+    def test_accepted_review_is_confident(self, db_session, decide):
+        """Test a single decision is reused once a reviewer accepted it."""
+        decide(accepted=True)
+
+        assert lookup(db_session) == {NAME: "Q1"}
+
+    def test_rejected_review_vetoes(self, db_session, decide):
+        """Test a rejected decision is never reused."""
+        for _ in range(3):
+            decide()
+        decide(accepted=False)
+
+        assert lookup(db_session) == {}
+
+    def test_rejected_alternative_is_ignored(self, db_session, decide):
+        """Test targets rejected by reviewers don't make a name ambiguous."""
+        decide(entity_id="Q2", accepted=False)
+        decide(accepted=True)
+
+        assert lookup(db_session) == {NAME: "Q1"}
+
+    def test_conflicting_decisions_not_reused(self, db_session, decide):
+        """Test names mapped to several targets are left to the LLM."""
+        decide(accepted=True)
+        decide(entity_id="Q2", accepted=True)
+
+        assert lookup(db_session) == {}
+
+    def test_keyed_by_country(self, db_session, decide):
+        """Test decisions only apply to politicians of the same country."""
+        decide(accepted=True)
+
+        assert lookup(db_session, country_id="Q183") == {}
+        assert lookup(db_session, country_id=None) == {}
+
+        decide(country_id=None, accepted=True)
+        assert lookup(db_session, country_id=None) == {NAME: "Q1"}
+
+    def test_target_removed_from_hierarchy(self, db_session, decide):
+        """Test decisions for entities no longer of the type are ignored."""
+        decide(accepted=True)
+        db_session.query(Position).filter_by(wikidata_id="Q1").delete()
+        db_session.flush()
+
+        assert lookup(db_session) == {}
@@ -3,7 +3,9 @@
 from datetime import datetime, timezone
 from unittest.mock import patch
 from poliloom.models import (
+    Politician,
     Source,
+    SourceError,
     SourceStatus,
     WikidataRelation,
     RelationType,
@@ -267,3 +269,59 @@ class TestSource:
             str(second_politician.id),
         }
         assert event.status == "done"
+
+
+class TestSourceRevisions:
+    """Test reading the revisions of extracted Wikipedia articles."""
+
+    URL = "https://en.wikipedia.org/wiki/Test_Politician"
+
+    def _add_source(self, db_session, politician, oldid, days_ago, **kwargs):
+        fields = dict(status=SourceStatus.DONE, **kwargs)
+        source = Source(
+            url=self.URL,
+            permanent_url=(
+                f"https://en.wikipedia.org/w/index.php?title=Test&oldid={oldid}"
+            ),
+            fetch_timestamp=datetime(2026, 1, 31 - days_ago, tzinfo=timezone.utc),
+            **fields,
+        )
+        db_session.add(source)
+        politician.sources.append(source)
+        db_session.flush()
+        return source
+
+    def test_revision_id(self):
+        """Test the oldid is read from the permanent URL."""
+        source = Source(
+            permanent_url="https://en.wikipedia.org/w/index.php?title=A&oldid=123"
+        )
+
+        assert source.revision_id == 123
+        assert Source(permanent_url=None).revision_id is None
+        assert Source(permanent_url="https://example.com/").revision_id is None
+
+    def test_latest_successful_revision(self, db_session, sample_politician):
+        """Test the newest source processed without errors counts."""
+        self._add_source(db_session, sample_politician, 100, days_ago=3)
+        self._add_source(db_session, sample_politician, 200, days_ago=2)
+        self._add_source(
+            db_session,
+            sample_politician,
+            300,
+            days_ago=1,
+            error=SourceError.PIPELINE_ERROR,
+        )
+
+        assert Source.latest_revisions(
+            db_session, sample_politician.id, [self.URL, "https://other"]
+        ) == {self.URL: 200}
+
+    def test_other_politicians_ignored(self, db_session, sample_politician):
+        """Test only the politician's own sources count."""
+        other = Politician.create_with_entity(db_session, "Q999", "Other Politician")
+        self._add_source(db_session, other, 100, days_ago=1)
+
+        assert (
+            Source.latest_revisions(db_session, sample_politician.id, [self.URL]) == {}
+        )
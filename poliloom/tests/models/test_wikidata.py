@@ -5,6 +5,8 @@ from sqlalchemy.dialects.postgresql import insert
 from poliloom.models import WikidataEntity, WikidataRelation, RelationType
 from poliloom.models.wikidata import WikidataEntityMixin
 
+from ..conftest import StubEmbedder, stub_embedding
+
 
 class TestQueryHierarchyDescendants:
     """Test query_hierarchy_descendants functionality."""
@@ -458,6 +460,29 @@ class TestCleanupOutsideHierarchy:
         assert len(remaining) == 1
         assert remaining[0][0] == "Q200"
 
+    def test_expires_mapping_decisions(self, db_session, sample_politician):
+        """Test mapping decisions pointing at removed entities are deleted."""
+        from poliloom.models import MappingDecision, Position
+
+        self._create_hierarchy(db_session, "Q4164871", ["Q100"])
+        self._create_position_in_hierarchy(db_session, "Q200", "Q100")
+        self._create_orphan_position(db_session, "Q300")
+        for entity_id in ("Q200", "Q300"):
+            db_session.add(
+                MappingDecision(
+                    entity_type="position",
+                    name="mayor",
+                    entity_id=entity_id,
+                    politician_id=sample_politician.id,
+                )
+            )
+        db_session.flush()
+
+        Position.cleanup_outside_hierarchy(db_session)
+
+        remaining = db_session.query(MappingDecision.entity_id).all()
+        assert remaining == [("Q200",)]
+
     def test_keeps_entities_inside_hierarchy(self, db_session):
         """Test that entities with proper hierarchy relations are kept."""
         from poliloom.models import Position
@@ -939,7 +964,9 @@ class TestCleanupOutsideHierarchySearchService:
         db_session.execute(stmt)
         db_session.flush()
 
-    def test_cleanup_calls_delete_documents(self, db_session):
+    def test_cleanup_calls_delete_documents(
+        self, db_session, mock_search_service_globally
+    ):
         """Test that cleanup_outside_hierarchy calls delete_documents on search service."""
         from poliloom.models import Location
 
@@ -957,6 +984,10 @@ class TestCleanupOutsideHierarchySearchService:
 
         # Verify orphans were removed
         assert stats["entities_removed"] == 2
+        # Only from the Location index, they may still be searchable otherwise
+        call = mock_search_service_globally.delete_documents.call_args
+        assert sorted(call.args[0]) == ["Q300", "Q301"]
+        assert call.kwargs == {"entity_type": "Location"}
 
     def test_cleanup_does_not_call_delete_when_nothing_removed(self, db_session):
         """Test that nothing is removed when all entities are in hierarchy."""
@@ -1159,3 +1190,231 @@ class TestSearchIndexQuery:
         page1_ids = {r.wikidata_id for r in results_page1}
         page2_ids = {r.wikidata_id for r in results_page2}
         assert page1_ids.isdisjoint(page2_ids)
+
+    def test_streams_in_partitions(self, db_session):
+        """Test query can be streamed in fixed-size partitions via yield_per."""
+        from poliloom.search import documents_from_rows
+
+        for i in range(5):
+            self._create_location(db_session, f"Q{i}", f"Location {i}", [f"Label {i}"])
+
+        query = WikidataEntity.search_index_query()
+        result = db_session.execute(query.execution_options(yield_per=2))
+        partitions = [documents_from_rows(rows) for rows in result.partitions()]
+
+        assert [len(p) for p in partitions] == [2, 2, 1]
+        documents = [doc for partition in partitions for doc in partition]
+        assert {doc["id"] for doc in documents} == {f"Q{i}" for i in range(5)}
+        assert documents[0]["types"] == ["Location"]
+
+    def _backdate(self, db_session, wikidata_id, when):
+        """Helper to move an entity's label and type timestamps into the past."""
+        from sqlalchemy import text
+
+        from poliloom.models import Location, WikidataEntityLabel
+
+        # Keep the updated_at triggers from resetting the timestamps to now()
+        db_session.execute(text("SET LOCAL session_replication_role = replica"))
+        db_session.execute(
+            WikidataEntityLabel.__table__.update()
+            .where(WikidataEntityLabel.entity_id == wikidata_id)
+            .values(created_at=when, updated_at=when)
+        )
+        db_session.execute(
+            Location.__table__.update()
+            .where(Location.wikidata_id == wikidata_id)
+            .values(created_at=when, updated_at=when)
+        )
+        db_session.execute(text("SET LOCAL session_replication_role = DEFAULT"))
+        db_session.flush()
+
+    def test_labels_ranked_by_language_count(self, db_session):
+        """Test labels used by more languages come first."""
+        from poliloom.models import WikidataEntityLabel
+
+        self._create_location(db_session, "Q64", "Berlin", [])
+        WikidataEntityLabel.upsert_batch(
+            db_session,
+            [
+                {"entity_id": "Q64", "label": "Berlino", "language_count": 2},
+                {"entity_id": "Q64", "label": "Berlin", "language_count": 40},
+                {"entity_id": "Q64", "label": "Берлин", "language_count": 5},
+            ],
+        )
+
+        row = db_session.execute(WikidataEntity.search_index_query()).one()
+
+        assert row.labels == ["Berlin", "Берлин", "Berlino"]
+
+    def test_reimported_labels_only_touched_when_count_changes(self, db_session):
+        """Test unchanged label upserts keep updated_at, changed counts bump it."""
+        from datetime import datetime, timedelta, timezone
+
+        from poliloom.models import WikidataEntityLabel
+
+        past = datetime.now(timezone.utc) - timedelta(days=1)
+        self._create_location(db_session, "Q64", "Berlin", ["Berlin", "Berlino"])
+        self._backdate(db_session, "Q64", past)
+
+        WikidataEntityLabel.upsert_batch(
+            db_session,
+            [
+                {"entity_id": "Q64", "label": "Berlin", "language_count": 1},
+                {"entity_id": "Q64", "label": "Berlino", "language_count": 3},
+            ],
+        )
+        db_session.expire_all()
+
+        labels = {
+            label.label: label
+            for label in db_session.query(WikidataEntityLabel).filter_by(
+                entity_id="Q64"
+            )
+        }
+        assert labels["Berlin"].updated_at == past
+        assert labels["Berlino"].updated_at > past
+        assert labels["Berlino"].language_count == 3
+
+    def test_changed_since_returns_only_changed_entities(self, db_session):
+        """Test incremental query only returns entities with new labels or types."""
+        from datetime import datetime, timedelta, timezone
+
+        from poliloom.models import Location, WikidataEntityLabel
+
+        now = datetime.now(timezone.utc)
+        watermark = now - timedelta(hours=1)
+
+        self._create_location(db_session, "Q60", "New York City", ["NYC"])
+        self._create_location(db_session, "Q84", "London", ["London"])
+        self._create_location(db_session, "Q90", "Paris", ["Paris"])
+        for wikidata_id in ["Q60", "Q84", "Q90"]:
+            self._backdate(db_session, wikidata_id, now - timedelta(days=1))
+
+        # London gained a label, Paris became a location after the watermark
+        stmt = insert(WikidataEntityLabel).values(
+            [{"entity_id": "Q84", "label": "Londres"}]
+        )
+        db_session.execute(stmt)
+        db_session.execute(
+            Location.__table__.update()
+            .where(Location.wikidata_id == "Q90")
+            .values(created_at=now)
+        )
+        db_session.flush()
+
+        query = WikidataEntity.search_index_query(changed_since=watermark)
+        results = {r.wikidata_id: r for r in db_session.execute(query).fetchall()}
+
+        assert set(results) == {"Q84", "Q90"}
+        # Documents are complete, not just the new labels
+        assert set(results["Q84"].labels) == {"London", "Londres"}
+
+    def test_search_index_deleted_ids(self, db_session):
+        """Test soft-deleted entities are reported only after the watermark."""
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+
+        self._create_location(db_session, "Q60", "New York City", ["NYC"])
+        self._create_location(db_session, "Q84", "London", ["London"])
+        self._create_location(db_session, "Q90", "Paris", ["Paris"])
+
+        db_session.execute(
+            WikidataEntity.__table__.update()
+            .where(WikidataEntity.wikidata_id == "Q84")
+            .values(deleted_at=now)
+        )
+        db_session.execute(
+            WikidataEntity.__table__.update()
+            .where(WikidataEntity.wikidata_id == "Q90")
+            .values(deleted_at=now - timedelta(days=2))
+        )
+        db_session.flush()
+
+        deleted = WikidataEntity.search_index_deleted_ids(
+            db_session, now - timedelta(hours=1)
+        )
+
+        assert deleted == ["Q84"]
+
+
+class TestSearchIndexState:
+    """Test SearchIndexState watermark storage."""
+
+    def test_watermark_roundtrip(self, db_session):
+        """Test a watermark is missing until set and can be moved forward."""
+        from datetime import datetime, timedelta, timezone
+
+        from poliloom.models import SearchIndexState
+
+        assert SearchIndexState.get_watermark(db_session, "entities") is None
+
+        first = datetime.now(timezone.utc) - timedelta(hours=1)
+        SearchIndexState.set_watermark(db_session, "entities", first)
+        assert SearchIndexState.get_watermark(db_session, "entities") == first
+
+        second = first + timedelta(minutes=30)
+        SearchIndexState.set_watermark(db_session, "entities", second)
+        assert SearchIndexState.get_watermark(db_session, "entities") == second
+        assert SearchIndexState.get_watermark(db_session, "other") is None
+
+
+class TestSearchEmbedding:
+    """Test SearchEmbedding cache of document embeddings."""
+
+    def _documents(self, *label_lists):
+        return [
+            {"id": f"Q{i}", "types": ["Location"], "labels": labels}
+            for i, labels in enumerate(label_lists)
+        ]
+
+    def test_embeds_missing_texts_once(self, db_session):
+        """Test distinct uncached texts are embedded once and attached."""
+        from poliloom.models import SearchEmbedding
+        from poliloom.search import EMBEDDER_NAME
+
+        embedder = StubEmbedder()
+        documents = self._documents(["Berlin"], ["Berlin"], ["Paris", "Lutetia"])
+
+        embedded = SearchEmbedding.attach_embeddings(db_session, documents, embedder)
+
+        assert embedded == 2
+        assert embedder.calls == [["Berlin", "Paris, Lutetia"]]
+        vectors = documents[2]["_vectors"][EMBEDDER_NAME]
+        assert vectors["regenerate"] is False
+        assert vectors["embeddings"] == stub_embedding("Paris, Lutetia")
+
+    def test_keyword_only_types_not_embedded(self, db_session):
+        """Test documents only of types without semantic search get no vector."""
+        from poliloom.models import SearchEmbedding
+
+        embedder = StubEmbedder()
+        documents = [
+            {"id": "Q1", "types": ["Politician"], "labels": ["Jane Doe"]},
+            {"id": "Q2", "types": ["Politician", "Location"], "labels": ["Paris"]},
+        ]
+
+        embedded = SearchEmbedding.attach_embeddings(db_session, documents, embedder)
+
+        assert embedded == 1
+        assert embedder.calls == [["Paris"]]
+        assert "_vectors" not in documents[0]
+        assert "_vectors" in documents[1]
+
+    def test_reuses_cached_embeddings(self, db_session):
+        """Test a rebuild only embeds texts that changed since the last one."""
+        from poliloom.models import SearchEmbedding
+        from poliloom.search import EMBEDDER_NAME
+
+        SearchEmbedding.attach_embeddings(
+            db_session, self._documents(["Berlin"], ["Paris"]), StubEmbedder()
+        )
+
+        embedder = StubEmbedder()
+        documents = self._documents(["Berlin"], ["Paris", "Lutetia"])
+        embedded = SearchEmbedding.attach_embeddings(db_session, documents, embedder)
+
+        assert embedded == 1
+        assert embedder.calls == [["Paris, Lutetia"]]
+        cached = documents[0]["_vectors"][EMBEDDER_NAME]["embeddings"]
+        assert list(cached) == stub_embedding("Berlin")
@@ -1,5 +1,7 @@
 """Tests for the archiving module: page fetching, MHTML conversion, and source processing."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,6 +12,7 @@ from poliloom.archiving import (
     extract_permanent_url,
     fetch_page,
     process_source,
+    process_sources,
 )
 from poliloom.models import (
     Source,
@@ -96,7 +99,7 @@ class TestFetchPage:
         mock_playwright_cm.__aexit__ = mock_aexit
 
         with patch(
-            "poliloom.archiving.async_playwright", return_value=mock_playwright_cm
+            "playwright.async_api.async_playwright", return_value=mock_playwright_cm
         ):
             with patch("poliloom.archiving.convert_mhtml_to_html") as mock_convert:
                 mock_convert.return_value = "<html>converted</html>"
@@ -126,7 +129,7 @@ class TestFetchPage:
         mock_playwright_cm.__aexit__ = mock_aexit
 
         with patch(
-            "poliloom.archiving.async_playwright", return_value=mock_playwright_cm
+            "playwright.async_api.async_playwright", return_value=mock_playwright_cm
         ):
             with pytest.raises(PageFetchError, match="HTTP 404"):
                 await fetch_page(url)
@@ -183,7 +186,7 @@ class TestFetchPage:
         mock_playwright_cm.__aexit__ = mock_aexit
 
         with patch(
-            "poliloom.archiving.async_playwright", return_value=mock_playwright_cm
+            "playwright.async_api.async_playwright", return_value=mock_playwright_cm
         ):
             with pytest.raises(PageFetchError, match="No response"):
                 await fetch_page(url)
@@ -242,7 +245,7 @@ class TestFetchPage:
         mock_playwright_cm.__aexit__ = mock_aexit
 
         with patch(
-            "poliloom.archiving.async_playwright", return_value=mock_playwright_cm
+            "playwright.async_api.async_playwright", return_value=mock_playwright_cm
         ):
             with pytest.raises(PageFetchError, match="Timeout"):
                 await fetch_page(url)
@@ -301,7 +304,7 @@ class TestFetchPage:
         mock_playwright_cm.__aexit__ = mock_aexit
 
         with patch(
-            "poliloom.archiving.async_playwright", return_value=mock_playwright_cm
+            "playwright.async_api.async_playwright", return_value=mock_playwright_cm
         ):
             with pytest.raises(PageFetchError, match="Browser error"):
                 await fetch_page(url)
@@ -386,7 +389,7 @@ class TestConvertMhtmlToHtml:
         mhtml_content = "MHTML content here"
         expected_html = "<html>Converted content</html>"
 
-        with patch("poliloom.archiving.MHTMLConverter") as mock_converter_class:
+        with patch("unmhtml.MHTMLConverter") as mock_converter_class:
             mock_converter = Mock()
             mock_converter.convert.return_value = expected_html
             mock_converter_class.return_value = mock_converter
@@ -405,7 +408,7 @@ class TestConvertMhtmlToHtml:
         """Test that conversion errors return None."""
         mhtml_content = "MHTML content"
 
-        with patch("poliloom.archiving.MHTMLConverter") as mock_converter_class:
+        with patch("unmhtml.MHTMLConverter") as mock_converter_class:
             mock_converter = Mock()
             mock_converter.convert.side_effect = Exception("Conversion failed")
             mock_converter_class.return_value = mock_converter
@@ -430,6 +433,11 @@ def source(db_session, sample_politician):
 
 FETCHED_PAGE = FetchedPage(mhtml="<mhtml>", html="<html><body>text</body></html>")
 VALID_HTML = "<html><body>Some real text content</body></html>"
+ARTICLE_HTML = (
+    '<html><body><div id="mw-content-text"><div class="mw-parser-output">'
+    "<p>Lead paragraph.</p><h2>Career</h2><p>Elected in 2012.</p>"
+    "</div></div></body></html>"
+)
 
 
 class TestProcessSource:
@@ -609,6 +617,66 @@ class TestProcessSource:
         )
         assert source.status == SourceStatus.DONE
 
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store", new_callable=AsyncMock, return_value=3
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=ARTICLE_HTML)
+    @patch("poliloom.archiving.save_archived_content")
+    @patch("poliloom.archiving.extract_permanent_url", return_value=None)
+    @patch(
+        "poliloom.archiving.fetch_page",
+        new_callable=AsyncMock,
+        return_value=FETCHED_PAGE,
+    )
+    async def test_wikipedia_article_segmented(
+        self,
+        mock_fetch,
+        mock_perm,
+        mock_save,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+        sample_wikipedia_project,
+    ):
+        """Test Wikipedia articles are passed on split into sections."""
+        source.wikipedia_project_id = sample_wikipedia_project.wikidata_id
+        db_session.flush()
+
+        await process_source(db_session, source, sample_politician)
+
+        page = mock_extract.await_args.kwargs["page"]
+        assert page.lead == "Lead paragraph."
+        assert [section.heading for section in page.sections] == ["Career"]
+
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store", new_callable=AsyncMock, return_value=3
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=ARTICLE_HTML)
+    @patch("poliloom.archiving.save_archived_content")
+    @patch(
+        "poliloom.archiving.fetch_page",
+        new_callable=AsyncMock,
+        return_value=FETCHED_PAGE,
+    )
+    async def test_other_pages_not_segmented(
+        self,
+        mock_fetch,
+        mock_save,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+    ):
+        """Test non-Wikipedia sources are sent as full text."""
+        await process_source(db_session, source, sample_politician)
+
+        assert mock_extract.await_args.kwargs["page"] is None
+
     @pytest.mark.asyncio
     @patch(
         "poliloom.archiving.extract_and_store", new_callable=AsyncMock, return_value=3
@@ -636,3 +704,175 @@ class TestProcessSource:
             await process_source(db_session, source, sample_politician)
 
         assert observed_status == SourceStatus.PROCESSING
+
+
+@pytest.fixture
+def german_source(db_session, sample_politician):
+    """Create a second source linked to sample_politician."""
+    page = Source(
+        url="https://de.wikipedia.org/wiki/Test_Politician",
+        status=SourceStatus.PROCESSING,
+    )
+    db_session.add(page)
+    db_session.flush()
+    sample_politician.sources.append(page)
+    db_session.flush()
+    return page
+
+
+class TestProcessSources:
+    """Test consolidated processing of a politician's sources."""
+
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store_sources",
+        new_callable=AsyncMock,
+        return_value=5,
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=VALID_HTML)
+    @patch("poliloom.archiving.save_archived_content")
+    @patch(
+        "poliloom.archiving.fetch_page",
+        new_callable=AsyncMock,
+        return_value=FETCHED_PAGE,
+    )
+    async def test_sources_extracted_together(
+        self,
+        mock_fetch,
+        mock_save,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+        german_source,
+    ):
+        """Test all sources go to one extraction, the primary first."""
+        count = await process_sources(
+            db_session, [source, german_source], sample_politician
+        )
+
+        assert count == 5
+        mock_extract.assert_awaited_once()
+        documents = mock_extract.await_args.args[1]
+        assert [d.source for d in documents] == [source, german_source]
+        assert documents[0].content == "Some real text content"
+        assert source.status == german_source.status == SourceStatus.DONE
+        assert source.error is None and german_source.error is None
+
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store_sources",
+        new_callable=AsyncMock,
+        return_value=2,
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=VALID_HTML)
+    async def test_fetched_together_archived_in_turn(
+        self,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+        german_source,
+    ):
+        """Test pages are fetched concurrently but archived one at a time."""
+        german_fetched = asyncio.Event()
+
+        async def fetch(url):
+            if url == german_source.url:
+                german_fetched.set()
+            else:
+                # Only finishes if the German page is fetched meanwhile
+                await asyncio.wait_for(german_fetched.wait(), timeout=5)
+            return FETCHED_PAGE
+
+        saving = []
+
+        async def save(path_root, extension, content):
+            saving.append(path_root)
+            await asyncio.sleep(0)
+            assert saving[-1] == path_root, "sources archived concurrently"
+            return f"{path_root}.{extension}"
+
+        with (
+            patch("poliloom.archiving.fetch_page", side_effect=fetch),
+            patch("poliloom.archiving.save_archived_content", side_effect=save),
+        ):
+            await process_sources(
+                db_session, [source, german_source], sample_politician
+            )
+
+        documents = mock_extract.await_args.args[1]
+        assert [d.source for d in documents] == [source, german_source]
+        assert saving[0] == source.path_root
+        assert saving[-1] == german_source.path_root
+
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store_sources",
+        new_callable=AsyncMock,
+        return_value=2,
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=VALID_HTML)
+    @patch("poliloom.archiving.save_archived_content")
+    async def test_failed_fetch_leaves_out_source(
+        self,
+        mock_save,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+        german_source,
+    ):
+        """Test a source that can't be fetched doesn't stop the others."""
+
+        async def fetch(url):
+            if url == german_source.url:
+                raise PageFetchError(
+                    "HTTP 404", http_status_code=404, error_type="FETCH_ERROR"
+                )
+            return FETCHED_PAGE
+
+        with patch("poliloom.archiving.fetch_page", side_effect=fetch):
+            await process_sources(
+                db_session, [source, german_source], sample_politician
+            )
+
+        documents = mock_extract.await_args.args[1]
+        assert [d.source for d in documents] == [source]
+        assert german_source.error == SourceError.FETCH_ERROR
+        assert source.status == SourceStatus.DONE and source.error is None
+
+    @pytest.mark.asyncio
+    @patch(
+        "poliloom.archiving.extract_and_store_sources",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("extraction failed"),
+    )
+    @patch("poliloom.archiving.read_archived_content", return_value=VALID_HTML)
+    @patch("poliloom.archiving.save_archived_content")
+    @patch(
+        "poliloom.archiving.fetch_page",
+        new_callable=AsyncMock,
+        return_value=FETCHED_PAGE,
+    )
+    async def test_extraction_error_marks_all_sources(
+        self,
+        mock_fetch,
+        mock_save,
+        mock_read,
+        mock_extract,
+        db_session,
+        sample_politician,
+        source,
+        german_source,
+    ):
+        """Test a failed extraction is recorded on every source."""
+        count = await process_sources(
+            db_session, [source, german_source], sample_politician
+        )
+
+        assert count == 0
+        assert source.error == german_source.error == SourceError.PIPELINE_ERROR
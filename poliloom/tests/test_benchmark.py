@@ -0,0 +1,287 @@
+"""Tests for the synthetic dump generator and benchmark helpers."""
+
+import hashlib
+import os
+import tempfile
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from poliloom import dump_reader
+from poliloom.benchmark import (
+    SearchQuery,
+    run_extraction_benchmark,
+    run_text_extraction_benchmark,
+    StageResult,
+    SyntheticDumpConfig,
+    generate_synthetic_dump,
+    load_search_queries,
+    run_import_benchmark,
+    run_search_benchmark,
+)
+from poliloom.importer.politician import _is_politician, _should_import_politician
+
+SMALL_CONFIG = SyntheticDumpConfig(
+    politicians=200,
+    positions=50,
+    locations=100,
+    countries=5,
+    position_classes=10,
+    location_classes=5,
+    unrelated_entities=100,
+    heavy_fraction=0.05,
+    heavy_labels=60,
+    heavy_positions=30,
+)
+
+
+@pytest.fixture
+def dump_path():
+    """Temporary path for a generated dump."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, "dump.json")
+
+
+def read_entities(path):
+    """Read every entity of a dump through the regular dump reader."""
+    size = os.path.getsize(path)
+    return list(dump_reader.read_chunk_entities(path, 0, size))
+
+
+class TestSyntheticDump:
+    """Test synthetic dump generation."""
+
+    def test_deterministic(self, dump_path):
+        """Test that the same seed produces a byte-identical dump."""
+        generate_synthetic_dump(dump_path, SMALL_CONFIG)
+        with open(dump_path, "rb") as f:
+            first = hashlib.sha256(f.read()).hexdigest()
+
+        generate_synthetic_dump(dump_path, SMALL_CONFIG)
+        with open(dump_path, "rb") as f:
+            assert hashlib.sha256(f.read()).hexdigest() == first
+
+    def test_readable_by_dump_reader(self, dump_path):
+        """Test that every entity parses and the stats match the file."""
+        stats = generate_synthetic_dump(dump_path, SMALL_CONFIG)
+
+        entities = read_entities(dump_path)
+
+        assert len(entities) == stats.entities
+        assert stats.bytes == os.path.getsize(dump_path)
+
+    def test_politicians_recognized_by_importer(self, dump_path):
+        """Test that generated politicians pass the importer's filters."""
+        stats = generate_synthetic_dump(dump_path, SMALL_CONFIG)
+
+        politicians = [
+            entity
+            for entity in read_entities(dump_path)
+            if _is_politician(entity, frozenset())
+        ]
+
+        assert len(politicians) == stats.politicians == SMALL_CONFIG.politicians
+        assert all(_should_import_politician(p) for p in politicians)
+
+        claims = politicians[0].raw_data["claims"]
+        assert {"P569", "P19", "P27"} <= set(claims)
+
+    def test_heavy_tail(self, dump_path):
+        """Test that heavy politicians carry many labels and positions."""
+        stats = generate_synthetic_dump(dump_path, SMALL_CONFIG)
+
+        heavy = [
+            entity
+            for entity in read_entities(dump_path)
+            if len(entity.get_all_labels()) == SMALL_CONFIG.heavy_labels
+        ]
+
+        assert stats.heavy_politicians > 0
+        assert len(heavy) == stats.heavy_politicians
+        positions = heavy[0].get_truthy_claims("P39")
+        assert len(positions) == SMALL_CONFIG.heavy_positions
+        assert "qualifiers" in positions[0] and "references" in positions[0]
+
+    def test_class_hierarchy_reaches_roots(self, dump_path):
+        """Test that position classes chain up to the position root."""
+        generate_synthetic_dump(dump_path, SMALL_CONFIG)
+
+        parents = {}
+        for entity in read_entities(dump_path):
+            subclass_of = entity.get_subclass_of_ids()
+            if subclass_of:
+                parents[entity.get_wikidata_id()] = next(iter(subclass_of))
+
+        roots = set()
+        for class_id in parents:
+            while class_id in parents:
+                class_id = parents[class_id]
+            roots.add(class_id)
+
+        assert "Q4164871" in roots
+        assert roots <= {"Q4164871", "Q486972", "Q56061"}
+
+
+class TestStageResult:
+    """Test derived benchmark metrics."""
+
+    def test_rates(self):
+        """Test throughput and database share calculations."""
+        result = StageResult(
+            name="import-politicians",
+            entities=1000,
+            seconds=4.0,
+            db_seconds=4.0,
+            workers=4,
+            peak_rss_mb=100,
+            peak_worker_rss_mb=80,
+        )
+
+        assert result.entities_per_second == 250
+        assert result.db_share == 0.25
+
+
+def allocate_stage(dump_path, batch_size, num_workers):
+    """Import stand-in holding about 200 MB in its own process."""
+    data = bytearray(200 * 1024 * 1024)
+    data[::4096] = b"x" * len(data[::4096])
+
+
+def small_stage(dump_path, batch_size, num_workers):
+    """Import stand-in allocating nothing."""
+
+
+def failing_stage(dump_path, batch_size, num_workers):
+    raise ValueError("broken dump")
+
+
+class TestImportBenchmark:
+    """Test per-stage measurement of the import benchmark."""
+
+    def test_peak_rss_measured_per_stage(self):
+        """Test a large stage does not inflate the peak of the next one."""
+        results = run_import_benchmark(
+            "dump.json",
+            entities=10,
+            stages=[("large", allocate_stage), ("small", small_stage)],
+            workers=3,
+        )
+
+        large, small = results
+        assert large.peak_rss_mb > 200
+        assert small.peak_rss_mb < large.peak_rss_mb - 150
+        assert large.workers == small.workers == 3
+
+    def test_failing_stage_raises(self):
+        """Test errors of a stage are reported by the parent."""
+        with pytest.raises(RuntimeError, match="broken dump"):
+            run_import_benchmark(
+                "dump.json", entities=1, stages=[("broken", failing_stage)]
+            )
+
+
+class FixedResultsBackend:
+    """Search backend returning canned results per query."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    def search(self, query, entity_type=None, limit=100, semantic_ratio=0.0):
+        self.calls.append((query, entity_type, limit, semantic_ratio))
+        return self.results.get(query, [])[:limit]
+
+
+class TestSearchBenchmark:
+    """Test search backend comparison."""
+
+    def test_recall_against_reference(self):
+        """Test recall is the mean overlap with the reference results."""
+        reference = FixedResultsBackend({"a": ["Q1", "Q2"], "b": ["Q3"], "c": []})
+        candidate = FixedResultsBackend({"a": ["Q2", "Q9"], "b": ["Q3"], "c": ["Q4"]})
+        queries = [SearchQuery("a", "Location"), SearchQuery("b"), SearchQuery("c")]
+
+        results = run_search_benchmark(
+            {"ref": reference, "candidate": candidate},
+            queries,
+            reference="ref",
+            limit=5,
+            semantic_ratio=0.5,
+        )
+
+        assert [r.backend for r in results] == ["ref", "candidate"]
+        assert results[0].recall is None
+        # Queries without reference results are not counted
+        assert results[1].recall == 0.75
+        assert len(results[1].latencies_ms) == 3
+        assert candidate.calls[0] == ("a", "Location", 5, 0.5)
+
+    def test_load_queries(self, tmp_path):
+        """Test query files with and without entity types."""
+        path = tmp_path / "queries.tsv"
+        path.write_text("# comment\nPosition\tMayor\nBerlin\n\n", encoding="utf-8")
+
+        assert load_search_queries(str(path)) == [
+            SearchQuery("Mayor", "Position"),
+            SearchQuery("Berlin"),
+        ]
+
+
+class TestExtractionBenchmark:
+    """Test comparison of LLM extraction modes."""
+
+    async def test_tokens_and_calls_per_mode(self, sample_politician):
+        """Test usage is summed over each mode's extraction calls."""
+        usage = Mock(
+            input_tokens=1000,
+            output_tokens=50,
+            input_tokens_details=Mock(cached_tokens=600),
+        )
+        client = Mock()
+        client.responses.parse = AsyncMock(
+            return_value=Mock(output_parsed=None, usage=usage)
+        )
+
+        results = await run_extraction_benchmark(
+            client, [(sample_politician, "content", None)] * 2
+        )
+
+        per_property, single_call = results
+        assert per_property.mode == "per_property"
+        assert per_property.calls == 8
+        assert per_property.per_source(per_property.input_tokens) == 4000
+        assert per_property.cached_share == 0.6
+        assert single_call.calls == 2
+        assert single_call.per_source(single_call.output_tokens) == 50
+        assert len(single_call.latencies_ms) == 2
+
+    async def test_failed_calls_counted(self, sample_politician):
+        """Test failing calls are reported instead of aborting the run."""
+        client = Mock()
+        client.responses.parse = AsyncMock(side_effect=Exception("API Error"))
+
+        [result] = await run_extraction_benchmark(
+            client, [(sample_politician, "content", None)], modes=("single_call",)
+        )
+
+        assert result.failed_calls == 1
+        assert result.input_tokens == 0
+
+
+class TestTextExtractionBenchmark:
+    """Test comparison of page-to-text extractors."""
+
+    def test_baseline_and_lxml(self):
+        """Test both extractors run on every page and tokens are estimated."""
+        pages = [
+            "<html><body><nav>Menu entries</nav><p>Some text here.</p></body></html>"
+        ] * 3
+
+        baseline, lxml_result = run_text_extraction_benchmark(pages)
+
+        assert baseline.extractor == "beautifulsoup"
+        assert len(baseline.cpu_seconds) == 3
+        # "Menu entries Some text here." vs "Some text here."
+        assert baseline.tokens == [7] * 3
+        assert lxml_result.tokens == [3] * 3
+        assert lxml_result.mean_ms >= 0
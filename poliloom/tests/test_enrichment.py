@@ -1,9 +1,16 @@
 """Tests for enrichment module functionality."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from poliloom.enrichment import (
+    InfoboxStats,
+    SourceDocument,
+    assign_quotes,
+    extract_all,
+    extract_all_sources,
+    extract_and_store_sources,
+    extract_dates,
     extract_properties_generic,
     extract_two_stage_generic,
     store_extracted_data,
@@ -15,16 +22,22 @@ from poliloom.enrichment import (
     DATES_CONFIG,
     POSITIONS_CONFIG,
     BIRTHPLACES_CONFIG,
+    CITIZENSHIPS_CONFIG,
+    CombinedExtractionResult,
     FreeFormPosition,
     FreeFormPositionResult,
     FreeFormBirthplace,
     FreeFormBirthplaceResult,
 )
+from poliloom.segmenter import InfoboxDate, Section, SegmentedPage
 from poliloom.models import (
     Location,
+    MappingDecision,
     Position,
     Property,
     PropertyReference,
+    RelationType,
+    WikidataRelation,
 )
 
 
@@ -166,6 +179,256 @@ class TestEnrichment:
         assert positions[0].start_date == "2020"
         assert positions[0].end_date == "2024"
 
+    @pytest.mark.asyncio
+    async def test_calls_share_content_prefix(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test every extraction call starts with the same article content."""
+        inputs = []
+
+        async def mock_parse(*args, **kwargs):
+            inputs.append(kwargs["input"])
+            return Mock(output_parsed=None)
+
+        mock_openai_client.responses.parse = mock_parse
+
+        for config in (DATES_CONFIG, POSITIONS_CONFIG, CITIZENSHIPS_CONFIG):
+            await extract_properties_generic(
+                mock_openai_client, "article text", sample_politician, config
+            )
+
+        first_messages = {messages[0]["content"] for messages in inputs}
+        assert len(first_messages) == 1
+        assert "article text" in first_messages.pop()
+        assert all("article text" not in messages[-1]["content"] for messages in inputs)
+
+    @pytest.mark.asyncio
+    async def test_single_call_mode(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test one extraction call feeds dates and the mapping stage."""
+        Position.create_with_entity(
+            db_session, "Q30185", "Mayor of Springfield", labels=["Mayor"]
+        )
+        db_session.flush()
+
+        combined = CombinedExtractionResult(
+            properties=[
+                ExtractedProperty(
+                    type=PropertyType.BIRTH_DATE,
+                    value="1970-01-15",
+                    supporting_quotes=["born January 15, 1970"],
+                )
+            ],
+            positions=[
+                FreeFormPosition(
+                    name="Mayor",
+                    start_date="2020",
+                    supporting_quotes=["elected Mayor in 2020"],
+                )
+            ],
+            birthplaces=[],
+            citizenships=None,
+        )
+        text_formats = []
+
+        async def mock_parse(*args, **kwargs):
+            text_formats.append(kwargs["text_format"])
+            if kwargs["text_format"] is CombinedExtractionResult:
+                return Mock(output_parsed=combined)
+            return Mock(output_parsed=Mock(wikidata_position_qid="Q30185"))
+
+        mock_openai_client.responses.parse = mock_parse
+
+        dates, positions, birthplaces, citizenships = await extract_all(
+            mock_openai_client,
+            db_session,
+            "test content",
+            sample_politician,
+            mode="single_call",
+        )
+
+        assert text_formats[0] is CombinedExtractionResult
+        # One extraction call plus one mapping call
+        assert len(text_formats) == 2
+        assert dates[0].value == "1970-01-15"
+        assert [p.wikidata_id for p in positions] == ["Q30185"]
+        assert birthplaces == []
+        assert citizenships == []
+
+    @pytest.mark.asyncio
+    async def test_per_property_mode_calls_each_group(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test the default mode makes one extraction call per group."""
+        text_formats = []
+
+        async def mock_parse(*args, **kwargs):
+            text_formats.append(kwargs["text_format"])
+            return Mock(output_parsed=None)
+
+        mock_openai_client.responses.parse = mock_parse
+
+        await extract_all(
+            mock_openai_client,
+            db_session,
+            "test content",
+            sample_politician,
+            mode="per_property",
+        )
+
+        assert set(text_formats) == {
+            config.result_model
+            for config in (
+                DATES_CONFIG,
+                POSITIONS_CONFIG,
+                BIRTHPLACES_CONFIG,
+                CITIZENSHIPS_CONFIG,
+            )
+        }
+
+    @pytest.mark.asyncio
+    async def test_content_routed_per_config(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test each extraction only receives its parts of a segmented page."""
+        page = SegmentedPage(
+            lead="Lead.",
+            infobox="Born 1970",
+            sections=[
+                Section(heading="Early life", text="Childhood."),
+                Section(heading="Political career", text="Elected."),
+            ],
+        )
+        contents = {}
+
+        async def mock_parse(*args, **kwargs):
+            contents[kwargs["text_format"]] = kwargs["input"][0]["content"]
+            return Mock(output_parsed=None)
+
+        mock_openai_client.responses.parse = mock_parse
+
+        await extract_all(
+            mock_openai_client,
+            db_session,
+            "full text",
+            sample_politician,
+            mode="per_property",
+            page=page,
+        )
+
+        dates = contents[DATES_CONFIG.result_model]
+        positions = contents[POSITIONS_CONFIG.result_model]
+        birthplaces = contents[BIRTHPLACES_CONFIG.result_model]
+        assert "Lead." in dates and "Born 1970" in dates
+        assert "Childhood." not in dates and "Elected." not in dates
+        assert "Elected." in positions and "Childhood." not in positions
+        assert "Childhood." in birthplaces and "Elected." not in birthplaces
+        assert all("full text" not in content for content in contents.values())
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test an unknown extraction mode is rejected."""
+        with pytest.raises(ValueError):
+            await extract_all(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                mode="everything",
+            )
+
+    @pytest.mark.asyncio
+    async def test_extract_positions_searches_once(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test candidates for all extracted items are looked up in one search."""
+        Position.create_with_entity(db_session, "Q30185", "Mayor of Springfield")
+        db_session.flush()
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(name="Mayor of Springfield", supporting_quotes=["a"]),
+                FreeFormPosition(name="Dog catcher", supporting_quotes=["b"]),
+            ]
+        )
+        mapping = Mock()
+        mapping.output_parsed.wikidata_position_qid = "Q30185"
+        responses = [free_form, mapping]
+
+        async def mock_parse(*args, **kwargs):
+            return responses.pop(0)
+
+        mock_openai_client.responses.parse = mock_parse
+
+        with patch.object(
+            Position, "find_similar_many", return_value=[["Q30185"], []]
+        ) as find_similar_many:
+            positions = await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        find_similar_many.assert_called_once()
+        assert find_similar_many.call_args.args[0] == [
+            "Mayor of Springfield",
+            "Dog catcher",
+        ]
+        assert [p.wikidata_id for p in positions] == ["Q30185"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_search_falls_back_per_item(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test a failing batched search only loses the items whose search fails."""
+        Position.create_with_entity(db_session, "Q30185", "Mayor of Springfield")
+        db_session.flush()
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(name="Mayor of Springfield", supporting_quotes=["a"]),
+                FreeFormPosition(name="Dog catcher", supporting_quotes=["b"]),
+            ]
+        )
+        mapping = Mock()
+        mapping.output_parsed.wikidata_position_qid = "Q30185"
+        responses = [free_form, mapping]
+
+        async def mock_parse(*args, **kwargs):
+            return responses.pop(0)
+
+        async def find_similar(query, search_client, limit=100):
+            if query == "Dog catcher":
+                raise ConnectionError("search unavailable")
+            return ["Q30185"]
+
+        mock_openai_client.responses.parse = mock_parse
+
+        with (
+            patch.object(
+                Position,
+                "find_similar_many",
+                side_effect=ConnectionError("search unavailable"),
+            ),
+            patch.object(Position, "find_similar", side_effect=find_similar),
+        ):
+            positions = await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        assert [p.wikidata_id for p in positions] == ["Q30185"]
+
     @pytest.mark.asyncio
     async def test_extract_positions_no_results(
         self, mock_openai_client, db_session, sample_politician
@@ -246,6 +509,177 @@ class TestEnrichment:
         assert len(birthplaces) == 1
         assert birthplaces[0].wikidata_id == "Q28513"
 
+    @pytest.mark.asyncio
+    async def test_exact_match_in_country_skips_mapping_llm(
+        self,
+        mock_openai_client,
+        db_session,
+        sample_politician,
+        sample_country,
+        create_citizenship,
+    ):
+        """Test a single exact match in the politician's country is mapped locally."""
+        create_citizenship(sample_politician, sample_country)
+        Position.create_with_entity(db_session, "Q30185", "Mayor of Springfield")
+        db_session.add(
+            WikidataRelation(
+                parent_entity_id="Q30",
+                child_entity_id="Q30185",
+                relation_type=RelationType.COUNTRY,
+                statement_id="Q30185$country",
+            )
+        )
+        db_session.flush()
+        db_session.refresh(sample_politician)
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(name="Mayor of Springfield", supporting_quotes=["a"])
+            ]
+        )
+        mock_openai_client.responses.parse = AsyncMock(return_value=free_form)
+
+        with patch.object(Position, "find_similar_many", return_value=[["Q30185"]]):
+            positions = await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        assert [p.wikidata_id for p in positions] == ["Q30185"]
+        mock_openai_client.responses.parse.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_confident_decision_skips_search_and_mapping(
+        self,
+        mock_openai_client,
+        db_session,
+        sample_politician,
+        sample_country,
+        create_citizenship,
+    ):
+        """Test names mapped confidently before are mapped without search or LLM."""
+        create_citizenship(sample_politician, sample_country)
+        Position.create_with_entity(db_session, "Q30185", "Mayor of Springfield")
+        db_session.flush()
+        db_session.refresh(sample_politician)
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(
+                    name="Mayor of  springfield",
+                    start_date="2020",
+                    supporting_quotes=["a"],
+                )
+            ]
+        )
+        mock_openai_client.responses.parse = AsyncMock(return_value=free_form)
+
+        with (
+            patch.object(
+                MappingDecision,
+                "lookup",
+                return_value={"mayor of springfield": "Q30185"},
+            ) as lookup,
+            patch.object(Position, "find_similar_many") as find_similar_many,
+        ):
+            positions = await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        assert lookup.call_args.args[2:4] == (["mayor of springfield"], "Q30")
+        find_similar_many.assert_not_called()
+        mock_openai_client.responses.parse.assert_awaited_once()
+        assert [(p.wikidata_id, p.start_date) for p in positions] == [
+            ("Q30185", "2020")
+        ]
+        # The reuse is recorded for this politician too
+        decision = db_session.query(MappingDecision).one()
+        assert decision.politician_id == sample_politician.id
+        assert decision.country_id == "Q30"
+        assert decision.reused is True
+
+    @pytest.mark.asyncio
+    async def test_mapping_decisions_recorded(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test LLM mappings are stored under the normalized name."""
+        Position.create_with_entity(db_session, "Q30185", "Mayor of Springfield")
+        db_session.flush()
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(name="Mayor of Springfield", supporting_quotes=["a"])
+            ]
+        )
+        mapping = Mock()
+        mapping.output_parsed.wikidata_position_qid = "Q30185"
+        mock_openai_client.responses.parse = AsyncMock(side_effect=[free_form, mapping])
+
+        with patch.object(Position, "find_similar_many", return_value=[["Q30185"]]):
+            await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        decision = db_session.query(MappingDecision).one()
+        assert (decision.entity_type, decision.name, decision.country_id) == (
+            "position",
+            "mayor of springfield",
+            None,
+        )
+        assert decision.entity_id == "Q30185"
+        assert decision.reused is False
+
+    @pytest.mark.asyncio
+    async def test_only_top_ranked_candidates_sent(
+        self, mock_openai_client, db_session, sample_politician
+    ):
+        """Test the mapping prompt only lists the best ranked candidates."""
+        qids = [f"Q{900 + i}" for i in range(POSITIONS_CONFIG.rerank_top_k + 5)]
+        for qid in qids[:-1]:
+            Position.create_with_entity(db_session, qid, f"Minister {qid}")
+        # The closest label is found last by search
+        Position.create_with_entity(db_session, qids[-1], "Minister of Finance")
+        db_session.flush()
+
+        free_form = Mock()
+        free_form.output_parsed = FreeFormPositionResult(
+            positions=[
+                FreeFormPosition(name="Minister of Finance", supporting_quotes=["a"])
+            ]
+        )
+        mapping = Mock()
+        mapping.output_parsed.wikidata_position_qid = qids[-1]
+        mock_openai_client.responses.parse = AsyncMock(side_effect=[free_form, mapping])
+
+        with patch.object(Position, "find_similar_many", return_value=[qids]):
+            positions = await extract_two_stage_generic(
+                mock_openai_client,
+                db_session,
+                "test content",
+                sample_politician,
+                POSITIONS_CONFIG,
+            )
+
+        prompt = mock_openai_client.responses.parse.call_args.kwargs["input"][-1]
+        sent = [qid for qid in qids if f"<qid>{qid}</qid>" in prompt["content"]]
+        assert len(sent) == POSITIONS_CONFIG.rerank_top_k
+        assert qids[-1] in sent
+        assert [p.wikidata_id for p in positions] == [qids[-1]]
+
     def test_store_extracted_data_properties(
         self,
         db_session,
@@ -631,3 +1065,236 @@ class TestEnrichment:
             )
 
         assert success is False
+
+
+def date_response(*properties: tuple[PropertyType, str]) -> Mock:
+    return Mock(
+        output_parsed=Mock(
+            properties=[
+                ExtractedProperty(type=t, value=v, supporting_quotes=["quote"])
+                for t, v in properties
+            ]
+        )
+    )
+
+
+class TestInfoboxFastPath:
+    """Test dates read from infoboxes before asking the LLM."""
+
+    BIRTH = InfoboxDate(
+        type=PropertyType.BIRTH_DATE, value="1970-01-15", quote="Born 15 January 1970"
+    )
+
+    @pytest.fixture
+    def stats(self, monkeypatch):
+        stats = InfoboxStats()
+        monkeypatch.setattr("poliloom.enrichment.infobox_stats", stats)
+        return stats
+
+    @pytest.fixture
+    def client(self):
+        client = Mock()
+        client.responses.parse = AsyncMock(
+            return_value=date_response((PropertyType.BIRTH_DATE, "1970-01-15"))
+        )
+        return client
+
+    async def test_complete_infobox_skips_llm(
+        self, client, stats, sample_politician, monkeypatch
+    ):
+        """Test a living person's infobox birth date needs no LLM call."""
+        monkeypatch.setenv("INFOBOX_AUDIT_RATE", "0")
+        page = SegmentedPage(
+            lead="", infobox="", infobox_dates=[self.BIRTH], living=True
+        )
+
+        [date] = await extract_dates(client, "content", sample_politician, page)
+
+        client.responses.parse.assert_not_awaited()
+        assert date.value == "1970-01-15"
+        assert date.supporting_quotes == ["Born 15 January 1970"]
+        assert stats.stats()["hits"] == 1
+
+    async def test_audit_compares_with_llm(
+        self, client, stats, sample_politician, monkeypatch
+    ):
+        """Test audited hits still call the LLM and record agreement."""
+        monkeypatch.setenv("INFOBOX_AUDIT_RATE", "1")
+        page = SegmentedPage(
+            lead="", infobox="", infobox_dates=[self.BIRTH], living=True
+        )
+
+        await extract_dates(client, "content", sample_politician, page)
+
+        client.responses.parse.assert_awaited_once()
+        assert stats.stats()["agreements"] == 1
+        assert stats.stats()["agreement_rate"] == 1.0
+
+    async def test_partial_infobox_narrows_to_llm_answer(
+        self, client, stats, sample_politician
+    ):
+        """Test a possibly dead person still gets the LLM call."""
+        client.responses.parse = AsyncMock(
+            return_value=date_response(
+                (PropertyType.BIRTH_DATE, "1970"),
+                (PropertyType.DEATH_DATE, "2020-05-03"),
+            )
+        )
+        page = SegmentedPage(lead="", infobox="", infobox_dates=[self.BIRTH])
+
+        dates = await extract_dates(client, "content", sample_politician, page)
+
+        client.responses.parse.assert_awaited_once()
+        # The infobox date replaces the LLM's birth date
+        assert {(d.type, d.value) for d in dates} == {
+            (PropertyType.BIRTH_DATE, "1970-01-15"),
+            (PropertyType.DEATH_DATE, "2020-05-03"),
+        }
+        assert stats.stats()["partial"] == 1
+        assert stats.stats()["conflicts"] == 1
+
+    async def test_miss(self, client, stats, sample_politician):
+        """Test pages without infobox dates are counted as misses."""
+        page = SegmentedPage(lead="Lead.", infobox="")
+
+        dates = await extract_dates(client, "content", sample_politician, page)
+
+        assert [d.value for d in dates] == ["1970-01-15"]
+        assert stats.stats()["misses"] == 1
+
+
+class TestConsolidatedExtraction:
+    """Test extracting several sources of a politician in one pass."""
+
+    EN_TEXT = "Jane Doe (born 15 January 1970) was Mayor of Springfield."
+    DE_TEXT = "Jane Doe (* 15. Januar 1970) war Bürgermeisterin von Springfield."
+
+    @pytest.fixture
+    def documents(self, db_session, sample_source, create_source):
+        german = create_source("https://de.wikipedia.org/wiki/Jane_Doe")
+        return [
+            SourceDocument(source=sample_source, content=self.EN_TEXT),
+            SourceDocument(source=german, content=self.DE_TEXT),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_group_for_all_sources(
+        self, db_session, sample_politician, documents
+    ):
+        """Test every extraction call gets the content of all sources."""
+        contents = []
+
+        async def mock_parse(*args, **kwargs):
+            contents.append(kwargs["input"][0]["content"])
+            return Mock(output_parsed=None)
+
+        client = Mock()
+        client.responses.parse = mock_parse
+
+        await extract_all_sources(
+            client, db_session, documents, sample_politician, mode="per_property"
+        )
+
+        assert len(contents) == 4
+        for content in contents:
+            assert self.EN_TEXT in content and self.DE_TEXT in content
+            assert 'url="https://de.wikipedia.org/wiki/Jane_Doe"' in content
+
+    def test_quotes_assigned_to_their_source(self, documents):
+        """Test items are split by the source each quote comes from."""
+        position = FreeFormPosition(
+            name="Mayor of Springfield",
+            supporting_quotes=[
+                "was Mayor of  Springfield",
+                "war Bürgermeisterin von Springfield",
+            ],
+        )
+        birthplace = FreeFormBirthplace(
+            name="Springfield", supporting_quotes=["war Bürgermeisterin"]
+        )
+
+        english, german = assign_quotes([position, birthplace], documents)
+
+        assert [item.supporting_quotes for item in english] == [
+            ["was Mayor of  Springfield"]
+        ]
+        assert [item.supporting_quotes for item in german] == [
+            ["war Bürgermeisterin von Springfield"],
+            ["war Bürgermeisterin"],
+        ]
+
+    def test_unmatched_quotes(self, documents):
+        """Test quotes found nowhere stay with the item's sources, or are dropped."""
+        paraphrased = FreeFormBirthplace(
+            name="Springfield", supporting_quotes=["born in Springfield"]
+        )
+        mixed = FreeFormBirthplace(
+            name="Springfield",
+            supporting_quotes=["(* 15. Januar 1970)", "born in Springfield"],
+        )
+
+        english, german = assign_quotes([paraphrased, mixed], documents)
+
+        assert english == []
+        assert [item.supporting_quotes for item in german] == [
+            ["(* 15. Januar 1970)", "born in Springfield"]
+        ]
+
+    def test_infobox_dates_assigned_to_their_page(self, documents):
+        """Test infobox dates are referenced to the source whose page has them."""
+        quote = "Geboren 15. Januar 1970 in Springfield"
+        documents[1].page = SegmentedPage(
+            lead=self.DE_TEXT,
+            infobox=quote,
+            infobox_dates=[
+                InfoboxDate(
+                    type=PropertyType.BIRTH_DATE, value="1970-01-15", quote=quote
+                )
+            ],
+        )
+        birth_date = ExtractedProperty(
+            type=PropertyType.BIRTH_DATE, value="1970-01-15", supporting_quotes=[quote]
+        )
+
+        english, german = assign_quotes([birth_date], documents)
+
+        assert english == []
+        assert [item.supporting_quotes for item in german] == [[quote]]
+
+    @pytest.mark.asyncio
+    async def test_references_stored_per_source(
+        self, db_session, sample_politician, documents
+    ):
+        """Test one property gets a reference for each source quoting it."""
+        birth_date = ExtractedProperty(
+            type=PropertyType.BIRTH_DATE,
+            value="1970-01-15",
+            supporting_quotes=["born 15 January 1970", "* 15. Januar 1970"],
+        )
+
+        with (
+            patch("poliloom.enrichment.get_openai_client", new_callable=AsyncMock),
+            patch(
+                "poliloom.enrichment.extract_all_sources",
+                new_callable=AsyncMock,
+                return_value=([birth_date], [], None, []),
+            ),
+        ):
+            count = await extract_and_store_sources(
+                db_session, documents, sample_politician
+            )
+
+        assert count == 1
+        [prop] = db_session.query(Property).filter_by(
+            politician_id=sample_politician.id, type=PropertyType.BIRTH_DATE
+        )
+        quotes = {
+            ref.source_id: ref.supporting_quotes
+            for ref in db_session.query(PropertyReference).filter_by(
+                property_id=prop.id
+            )
+        }
+        assert quotes == {
+            documents[0].source.id: ["born 15 January 1970"],
+            documents[1].source.id: ["* 15. Januar 1970"],
+        }
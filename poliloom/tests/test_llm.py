@@ -0,0 +1,473 @@
+"""Tests for the LLM response cache and rate governor."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError
+from pydantic import BaseModel
+
+from poliloom import llm
+from poliloom.llm import (
+    CachingOpenAI,
+    GovernedOpenAI,
+    LLMGovernor,
+    LLMUsage,
+    ResponseCache,
+    close_openai_client,
+    get_openai_client,
+    request_hash,
+    retry_after,
+    track_usage,
+)
+from poliloom.models import LLMResponse
+
+
+class Answer(BaseModel):
+    qid: Optional[str]
+
+
+class OtherAnswer(BaseModel):
+    name: Optional[str]
+
+
+MESSAGES = [
+    {"role": "system", "content": "Map entities."},
+    {"role": "user", "content": "Berlin"},
+]
+
+
+@pytest.fixture
+def cache(db_session):
+    return ResponseCache(max_bytes=1024 * 1024, bind=db_session.connection())
+
+
+def make_client(answer: Optional[BaseModel]) -> Mock:
+    """OpenAI client mock whose parse call returns a fixed answer."""
+    client = Mock()
+    client.responses.parse = AsyncMock(return_value=Mock(output_parsed=answer))
+    return client
+
+
+async def parse(client: CachingOpenAI, text_format=Answer, effort="low"):
+    return await client.responses.parse(
+        model="gpt-test",
+        input=MESSAGES,
+        text_format=text_format,
+        reasoning={"effort": effort},
+    )
+
+
+class TestRequestHash:
+    """Test the cache key of structured calls."""
+
+    def test_identical_requests_match(self):
+        """Test equal requests share a key."""
+        assert request_hash("m", "low", MESSAGES, Answer) == request_hash(
+            "m", "low", [dict(m) for m in MESSAGES], Answer
+        )
+
+    def test_every_input_is_part_of_the_key(self):
+        """Test model, effort, prompts and schema all change the key."""
+        key = request_hash("m", "low", MESSAGES, Answer)
+
+        assert key != request_hash("other", "low", MESSAGES, Answer)
+        assert key != request_hash("m", "medium", MESSAGES, Answer)
+        assert key != request_hash("m", "low", MESSAGES[:1], Answer)
+        assert key != request_hash("m", "low", MESSAGES, OtherAnswer)
+
+
+class TestCachingOpenAI:
+    """Test structured calls answered from the cache."""
+
+    async def test_repeated_call_is_served_from_cache(self, cache):
+        """Test an identical second call doesn't reach the model."""
+        inner = make_client(Answer(qid="Q64"))
+        client = CachingOpenAI(inner, cache)
+
+        first = await parse(client)
+        second = await parse(client)
+
+        assert first.output_parsed == second.output_parsed == Answer(qid="Q64")
+        inner.responses.parse.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_different_request_misses(self, cache):
+        """Test a changed reasoning effort is a new request."""
+        inner = make_client(Answer(qid="Q64"))
+        client = CachingOpenAI(inner, cache)
+
+        await parse(client)
+        await parse(client, effort="high")
+
+        assert inner.responses.parse.await_count == 2
+
+    async def test_empty_answers_not_cached(self, cache):
+        """Test failed parses are retried on the next call."""
+        inner = make_client(None)
+        client = CachingOpenAI(inner, cache)
+
+        await parse(client)
+        await parse(client)
+
+        assert inner.responses.parse.await_count == 2
+
+    async def test_bypass(self, cache):
+        """Test a disabled cache always calls the model."""
+        cache.enabled = False
+        inner = make_client(Answer(qid="Q64"))
+        client = CachingOpenAI(inner, cache)
+
+        await parse(client)
+        await parse(client)
+
+        assert inner.responses.parse.await_count == 2
+        assert cache.stats()["hits"] == 0
+
+    async def test_database_access_off_event_loop(self, cache):
+        """Test cache lookups and stores don't block the event loop thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+        get, put = cache.get, cache.put
+
+        def recorded(method):
+            def wrapper(*args):
+                threads.append(threading.get_ident())
+                return method(*args)
+
+            return wrapper
+
+        cache.get, cache.put = recorded(get), recorded(put)
+
+        await parse(CachingOpenAI(make_client(Answer(qid="Q64")), cache))
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    def test_other_attributes_pass_through(self, cache):
+        """Test the wrapper exposes the wrapped client."""
+        inner = make_client(None)
+
+        assert CachingOpenAI(inner, cache).close is inner.close
+
+
+class TestLLMResponseEviction:
+    """Test size-based eviction of cached responses."""
+
+    def test_evicts_least_recently_used(self, db_session):
+        """Test the oldest responses beyond the size limit are deleted."""
+        now = datetime.now(timezone.utc)
+        for age, request in enumerate(["new", "middle", "old"]):
+            db_session.add(
+                LLMResponse(
+                    request_hash=request,
+                    model="m",
+                    response="x" * 10,
+                    size_bytes=10,
+                    updated_at=now - timedelta(minutes=age),
+                )
+            )
+        db_session.flush()
+
+        assert LLMResponse.evict(db_session, max_bytes=25) == 1
+
+        remaining = {r.request_hash for r in db_session.query(LLMResponse)}
+        assert remaining == {"new", "middle"}
+
+    def test_lookup_counts_hits(self, db_session):
+        """Test lookups return stored responses and count hits."""
+        LLMResponse.store(db_session, "key", "m", '{"qid": "Q1"}')
+
+        assert LLMResponse.lookup(db_session, "key") == '{"qid": "Q1"}'
+        assert LLMResponse.lookup(db_session, "missing") is None
+        assert db_session.get(LLMResponse, "key").hits == 1
+
+
+def rate_limit_error(headers: Optional[dict] = None) -> RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class FakeClock:
+    """Clock advanced by the sleeps of the code under test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        clock.now += max(delay, 0)
+        await real_sleep(0)
+
+    with patch("poliloom.llm.asyncio.sleep", sleep):
+        yield clock
+
+
+class TestRetryAfter:
+    """Test reading the delay of rate-limited calls."""
+
+    def test_milliseconds_header(self):
+        """Test retry-after-ms takes precedence."""
+        error = rate_limit_error({"retry-after-ms": "1500", "retry-after": "9"})
+
+        assert retry_after(error) == 1.5
+
+    def test_seconds_header(self):
+        """Test retry-after in seconds."""
+        assert retry_after(rate_limit_error({"retry-after": "7"})) == 7.0
+
+    def test_default_without_headers(self):
+        """Test rate limits without headers still wait."""
+        assert retry_after(rate_limit_error()) == 1.0
+
+    def test_other_errors(self):
+        """Test errors other than rate limits aren't retried."""
+        assert retry_after(ValueError("boom")) is None
+
+
+class TestLLMGovernor:
+    """Test the process-wide limits of OpenAI calls."""
+
+    async def test_concurrency_cap(self):
+        """Test no more than max_concurrency calls run at once."""
+        governor = LLMGovernor(max_concurrency=2, tokens_per_minute=0)
+        running = 0
+        peak = 0
+
+        async def send():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Mock(usage=None)
+
+        await asyncio.gather(*[governor.call(send, 10) for _ in range(6)])
+
+        assert peak == 2
+        assert governor.stats()["calls"] == 6
+
+    async def test_token_budget_waits_for_window(self, clock):
+        """Test calls beyond the budget wait until earlier ones age out."""
+        governor = LLMGovernor(max_concurrency=4, tokens_per_minute=1000, clock=clock)
+        started = []
+
+        async def send():
+            started.append(clock.now)
+            return Mock(usage=None)
+
+        for _ in range(3):
+            await governor.call(send, 400)
+
+        assert started == [0.0, 0.0, 60.0]
+
+    async def test_actual_usage_corrects_estimate(self, clock):
+        """Test reported usage replaces the estimate in the budget."""
+        governor = LLMGovernor(max_concurrency=4, tokens_per_minute=1000, clock=clock)
+        started = []
+
+        async def send():
+            started.append(clock.now)
+            return Mock(usage=Mock(total_tokens=100))
+
+        for _ in range(4):
+            await governor.call(send, 400)
+
+        assert started == [0.0, 0.0, 0.0, 0.0]
+
+    async def test_rate_limited_call_releases_reservation(self, clock):
+        """Test a retry doesn't count the rejected attempt against the budget."""
+        governor = LLMGovernor(max_concurrency=1, tokens_per_minute=1000, clock=clock)
+        attempts = []
+
+        async def send():
+            attempts.append(clock.now)
+            if len(attempts) == 1:
+                raise rate_limit_error({"retry-after": "1"})
+            return "ok"
+
+        await governor.call(send, 600)
+
+        # The retry fits the budget right after the pause
+        assert attempts == [0.0, 1.0]
+        assert governor._tokens_used(clock.now) == 600
+
+    async def test_retry_after_pauses_and_retries(self, clock):
+        """Test a rate-limited call waits for Retry-After and is retried."""
+        governor = LLMGovernor(max_concurrency=4, tokens_per_minute=0, clock=clock)
+        attempts = []
+
+        async def send():
+            attempts.append(clock.now)
+            if len(attempts) == 1:
+                raise rate_limit_error({"retry-after": "3"})
+            return "ok"
+
+        assert await governor.call(send, 10) == "ok"
+        assert attempts == [0.0, 3.0]
+        assert governor.stats()["rate_limited"] == 1
+
+    async def test_pause_applies_to_other_callers(self, clock):
+        """Test a rate limit holds back calls that start afterwards."""
+        governor = LLMGovernor(
+            max_concurrency=4, tokens_per_minute=0, max_retries=0, clock=clock
+        )
+
+        async def limited():
+            raise rate_limit_error({"retry-after": "5"})
+
+        with pytest.raises(RateLimitError):
+            await governor.call(limited, 10)
+
+        started = []
+
+        async def send():
+            started.append(clock.now)
+
+        await governor.call(send, 10)
+        assert started == [5.0]
+
+    async def test_gives_up_after_max_retries(self, clock):
+        """Test the rate limit error is raised once retries are exhausted."""
+        governor = LLMGovernor(
+            max_concurrency=1, tokens_per_minute=0, max_retries=2, clock=clock
+        )
+        send = AsyncMock(side_effect=rate_limit_error())
+
+        with pytest.raises(RateLimitError):
+            await governor.call(send, 10)
+
+        assert send.await_count == 3
+
+    async def test_other_errors_not_retried(self):
+        """Test non rate limit errors propagate immediately."""
+        governor = LLMGovernor(max_concurrency=1, tokens_per_minute=0)
+        send = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(ValueError):
+            await governor.call(send, 10)
+
+        send.assert_awaited_once()
+
+
+class TestSharedOpenAIClient:
+    """Test the process-wide governed OpenAI client."""
+
+    async def test_parse_goes_through_governor(self):
+        """Test responses.parse calls are counted by the governor."""
+        inner = make_client(Answer(qid="Q64"))
+        client = GovernedOpenAI(inner, LLMGovernor(max_concurrency=1))
+
+        response = await client.responses.parse(
+            model="gpt-test", input=MESSAGES, text_format=Answer
+        )
+
+        assert response.output_parsed == Answer(qid="Q64")
+        assert client.governor.stats()["calls"] == 1
+        assert client.close is inner.close
+
+    async def test_one_client_per_event_loop(self, monkeypatch):
+        """Test enrichments share a client that is closed once."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(llm, "_openai_client", None)
+
+        client = await get_openai_client()
+        assert await get_openai_client() is client
+        assert client.max_retries == 0
+
+        stats = await close_openai_client()
+
+        assert stats == {"calls": 0, "rate_limited": 0}
+        assert llm._openai_client is None
+        assert await close_openai_client() is None
+
+    async def test_client_of_previous_loop_closed(self, monkeypatch):
+        """Test a client left by another event loop is closed when replaced."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        previous = Mock(loop=object(), close=AsyncMock())
+        monkeypatch.setattr(llm, "_openai_client", previous)
+
+        client = await get_openai_client()
+
+        previous.close.assert_awaited_once()
+        assert client is not previous
+        await close_openai_client()
+
+
+def usage_response(input_tokens: int, cached: int, output_tokens: int) -> Mock:
+    return Mock(
+        output_parsed=Answer(qid="Q64"),
+        usage=Mock(
+            input_tokens=input_tokens,
+            input_tokens_details=Mock(cached_tokens=cached),
+            output_tokens=output_tokens,
+        ),
+    )
+
+
+class TestUsageTracking:
+    """Test counting the calls and tokens of a scope."""
+
+    async def test_calls_recorded_in_nested_scopes(self):
+        """Test a call counts for every enclosing scope, including tasks."""
+        inner = Mock()
+        inner.responses.parse = AsyncMock(return_value=usage_response(1000, 400, 50))
+        client = GovernedOpenAI(inner, LLMGovernor(max_concurrency=2))
+
+        async def call():
+            await client.responses.parse(
+                model="gpt-test", input=MESSAGES, text_format=Answer
+            )
+
+        with track_usage() as run:
+            with track_usage() as politician:
+                await asyncio.gather(call(), call())
+            await call()
+
+        assert (politician.calls, politician.input_tokens) == (2, 2000)
+        assert politician.cached_input_tokens == 800
+        assert politician.output_tokens == 100
+        assert run.calls == 3
+        await call()
+        assert run.calls == 3
+
+    async def test_cache_hits_counted(self, cache):
+        """Test answers from the response cache count as hits, not calls."""
+        inner = Mock()
+        inner.responses.parse = AsyncMock(return_value=usage_response(10, 0, 5))
+        client = CachingOpenAI(GovernedOpenAI(inner), cache)
+
+        with track_usage() as usage:
+            await parse(client)
+            await parse(client)
+
+        assert (usage.calls, usage.cache_hits) == (1, 1)
+
+    def test_cost_at_configured_prices(self, monkeypatch):
+        """Test cost uses the cached input price for cached tokens."""
+        usage = LLMUsage()
+        usage.record(usage_response(1_000_000, 400_000, 100_000))
+
+        monkeypatch.delenv("OPENAI_INPUT_PRICE", raising=False)
+        assert usage.cost() is None
+        assert "$" not in usage.summary()
+
+        monkeypatch.setenv("OPENAI_INPUT_PRICE", "1.0")
+        monkeypatch.setenv("OPENAI_CACHED_INPUT_PRICE", "0.1")
+        monkeypatch.setenv("OPENAI_OUTPUT_PRICE", "4.0")
+        assert usage.cost() == pytest.approx(0.6 + 0.04 + 0.4)
+        assert usage.summary().endswith("$1.0400")
@@ -0,0 +1,165 @@
+"""Tests for ranking mapping candidates locally."""
+
+from poliloom.models import (
+    Politician,
+    Property,
+    PropertyType,
+    RelationType,
+    WikidataEntity,
+    WikidataEntityLabel,
+    WikidataRelation,
+)
+from poliloom.rerank import (
+    MappingContext,
+    confident_match,
+    normalize_label,
+    rank_candidates,
+)
+
+
+def entity(qid: str, name: str, labels=(), **parents) -> WikidataEntity:
+    """Unsaved entity with labels and parent relations by relation type name."""
+    return WikidataEntity(
+        wikidata_id=qid,
+        name=name,
+        labels=[WikidataEntityLabel(label=label) for label in labels],
+        parent_relations=[
+            WikidataRelation(
+                parent_entity_id=parent,
+                relation_type=RelationType[relation_type.upper()],
+            )
+            for relation_type, parent in parents.items()
+        ],
+    )
+
+
+MAYOR_US = entity("Q1", "Mayor of Springfield", country="Q30", subclass_of="Q30185")
+MAYOR_AU = entity("Q2", "Mayor of Springfield", country="Q408")
+COUNCIL = entity("Q3", "Springfield City Council member", country="Q30")
+
+
+class TestNormalizeLabel:
+    """Test label normalization."""
+
+    def test_case_accents_and_punctuation(self):
+        """Test labels differing only in case, accents or punctuation match."""
+        assert normalize_label("Président  de la République!") == (
+            "president de la republique"
+        )
+        assert normalize_label("Springfield, Illinois") == "springfield illinois"
+
+
+class TestRankCandidates:
+    """Test scoring of mapping candidates."""
+
+    def test_label_similarity(self):
+        """Test candidates closer to the extracted name rank first."""
+        ranked = rank_candidates(
+            "Mayor of Springfield", [COUNCIL, MAYOR_US], MappingContext()
+        )
+
+        assert [c.entity for c in ranked] == [MAYOR_US, COUNCIL]
+        assert ranked[0].exact and not ranked[1].exact
+
+    def test_aliases_count(self):
+        """Test a matching alias is as good as a matching name."""
+        alias = entity("Q4", "Lord Mayor", labels=["Mayor of Springfield"])
+
+        [candidate] = rank_candidates("mayor of springfield", [alias], MappingContext())
+
+        assert candidate.exact
+
+    def test_country_overlap(self):
+        """Test namesakes in the politician's countries rank first."""
+        ranked = rank_candidates(
+            "Mayor of Springfield",
+            [MAYOR_AU, MAYOR_US],
+            MappingContext(countries={"Q30"}),
+        )
+
+        assert [c.entity for c in ranked] == [MAYOR_US, MAYOR_AU]
+        assert ranked[0].country_agrees and not ranked[1].country_agrees
+
+    def test_hierarchy_proximity(self):
+        """Test candidates next to the politician's existing entities rank first."""
+        ranked = rank_candidates(
+            "Mayor of Springfield",
+            [MAYOR_AU, MAYOR_US],
+            MappingContext(related={"Q30185"}),
+        )
+
+        assert [c.entity for c in ranked] == [MAYOR_US, MAYOR_AU]
+
+    def test_ties_keep_search_order(self):
+        """Test equally scored candidates stay in the given order."""
+        ranked = rank_candidates(
+            "Mayor of Springfield", [MAYOR_AU, MAYOR_US], MappingContext()
+        )
+
+        assert [c.entity for c in ranked] == [MAYOR_AU, MAYOR_US]
+
+
+class TestConfidentMatch:
+    """Test picking a candidate without the LLM."""
+
+    def test_single_exact_match_in_country(self):
+        """Test the only exact match is taken when its country agrees."""
+        ranked = rank_candidates(
+            "Mayor of Springfield",
+            [MAYOR_US, COUNCIL],
+            MappingContext(countries={"Q30"}),
+        )
+
+        assert confident_match(ranked) is MAYOR_US
+
+    def test_namesakes_go_to_llm(self):
+        """Test several exact matches are left to the LLM."""
+        ranked = rank_candidates(
+            "Mayor of Springfield",
+            [MAYOR_US, MAYOR_AU],
+            MappingContext(countries={"Q30"}),
+        )
+
+        assert confident_match(ranked) is None
+
+    def test_unknown_or_other_country_goes_to_llm(self):
+        """Test an exact match outside the politician's countries isn't trusted."""
+        for countries in (set(), {"Q408"}):
+            ranked = rank_candidates(
+                "Mayor of Springfield", [MAYOR_US], MappingContext(countries=countries)
+            )
+
+            assert confident_match(ranked) is None
+
+    def test_country_candidates(self):
+        """Test a country matches the politician's citizenship of that country."""
+        germany = entity("Q183", "Germany", labels=["Federal Republic of Germany"])
+        ranked = rank_candidates(
+            "Germany", [germany], MappingContext(countries={"Q183"})
+        )
+
+        assert confident_match(ranked) is germany
+
+
+class TestMappingContext:
+    """Test building the ranking context from a politician."""
+
+    def test_from_existing_properties(self):
+        """Test citizenships and existing entities with their parents are used."""
+        politician = Politician(
+            name="Jane Roe",
+            properties=[
+                Property(type=PropertyType.CITIZENSHIP, entity_id="Q30"),
+                Property(
+                    type=PropertyType.POSITION,
+                    entity_id="Q1",
+                    entity=MAYOR_US,
+                ),
+                Property(type=PropertyType.BIRTH_DATE, value="1970-01-01"),
+            ],
+        )
+
+        context = MappingContext.for_politician(politician, [PropertyType.POSITION])
+
+        assert context.countries == {"Q30"}
+        assert context.related == {"Q1", "Q30185"}
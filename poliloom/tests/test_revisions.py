@@ -0,0 +1,114 @@
+"""Tests for looking up the current revision of Wikipedia articles."""
+
+import httpx
+
+from poliloom.revisions import article_title, latest_revision_ids
+
+DE_URL = "https://de.wikipedia.org/wiki/Angela_Merkel"
+EN_URL = "https://en.wikipedia.org/wiki/Jos%C3%A9_Mujica"
+REDIRECT_URL = "https://en.wikipedia.org/wiki/Pepe_Mujica"
+
+
+def mediawiki_api(requests: list) -> httpx.AsyncClient:
+    """Client answering revision queries like the MediaWiki API."""
+    pages = {
+        "de.wikipedia.org": {"Angela Merkel": 250},
+        "en.wikipedia.org": {"José Mujica": 101},
+    }
+    redirects = {"Pepe Mujica": "José Mujica"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        titles = request.url.params["titles"].split("|")
+        wiki = pages[request.url.host]
+        query = {
+            "redirects": [
+                {"from": title, "to": redirects[title]}
+                for title in titles
+                if title in redirects
+            ],
+            "pages": [
+                {"title": title, "revisions": [{"revid": revision}]}
+                for title, revision in wiki.items()
+                if title in titles or title in redirects.values()
+            ]
+            + [
+                {"title": title, "missing": True}
+                for title in titles
+                if title not in wiki
+            ],
+        }
+        return httpx.Response(200, json={"query": query})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestArticleTitle:
+    """Test splitting article URLs."""
+
+    def test_article_url(self):
+        """Test the API endpoint and decoded title of an article."""
+        assert article_title(EN_URL) == (
+            "https://en.wikipedia.org/w/api.php",
+            "José Mujica",
+        )
+
+    def test_other_urls(self):
+        """Test URLs that aren't articles have no title."""
+        assert article_title("https://en.wikipedia.org/w/index.php?oldid=1") is None
+        assert article_title("https://example.com/about") is None
+
+
+class TestLatestRevisionIds:
+    """Test revision lookups against a stand-in of the MediaWiki API."""
+
+    async def test_one_request_per_wiki(self):
+        """Test articles of each wiki are looked up in one request."""
+        requests = []
+
+        revisions = await latest_revision_ids(
+            [DE_URL, EN_URL, REDIRECT_URL], client=mediawiki_api(requests)
+        )
+
+        assert revisions == {DE_URL: 250, EN_URL: 101, REDIRECT_URL: 101}
+        assert sorted(r.url.host for r in requests) == [
+            "de.wikipedia.org",
+            "en.wikipedia.org",
+        ]
+
+    async def test_missing_pages_left_out(self):
+        """Test articles without a revision aren't returned."""
+        url = "https://en.wikipedia.org/wiki/Nobody"
+
+        assert await latest_revision_ids([url], client=mediawiki_api([])) == {}
+
+    async def test_failed_lookup_left_out(self):
+        """Test a failing wiki only loses its own articles."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "de.wikipedia.org":
+                return httpx.Response(503)
+            return httpx.Response(
+                200,
+                json={
+                    "query": {
+                        "pages": [{"title": "José Mujica", "revisions": [{"revid": 7}]}]
+                    }
+                },
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await latest_revision_ids([DE_URL, EN_URL], client=client) == {EN_URL: 7}
+
+    async def test_no_articles(self):
+        """Test nothing is requested for URLs that aren't articles."""
+        requests = []
+
+        assert (
+            await latest_revision_ids(
+                ["https://example.com/"], client=mediawiki_api(requests)
+            )
+            == {}
+        )
+        assert requests == []
@@ -1,18 +1,25 @@
 """Tests for scheduling module: orchestration of the enrichment pipeline."""
 
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from poliloom.scheduling import process_next_politician, schedule_enrichment
+from poliloom.scheduling import (
+    ScheduledEnrichment,
+    process_next_politician,
+    schedule_enrichment,
+)
 from poliloom.models import Source, SourceStatus
 
 
 class TestScheduleEnrichment:
     """Test schedule_enrichment selects a politician and creates sources."""
 
-    def test_returns_none_when_no_politicians(self, db_session):
-        assert schedule_enrichment(db_session) is None
+    async def test_returns_none_when_no_politicians(self, db_session):
+        assert await schedule_enrichment(db_session) is None
 
-    def test_schedules_politician_with_wikipedia_links(
+    async def test_schedules_politician_with_wikipedia_links(
         self,
         db_session,
         sample_politician,
@@ -23,7 +30,7 @@ class TestScheduleEnrichment:
         create_citizenship(sample_politician, sample_country)
         db_session.flush()
 
-        result = schedule_enrichment(db_session)
+        result = await schedule_enrichment(db_session)
 
         assert result is not None
         assert result.politician_id == sample_politician.id
@@ -37,8 +44,82 @@ class TestScheduleEnrichment:
         pages = db_session.query(Source).filter(Source.id.in_(result.source_ids)).all()
         assert all(p.status == SourceStatus.PROCESSING for p in pages)
 
-    def test_returns_none_when_no_wikipedia_links(self, db_session, sample_politician):
-        assert schedule_enrichment(db_session) is None
+    async def test_returns_none_when_no_wikipedia_links(
+        self, db_session, sample_politician
+    ):
+        assert await schedule_enrichment(db_session) is None
+
+
+class TestUnchangedArticles:
+    """Test re-enrichment skips articles unchanged since their extraction."""
+
+    @pytest.fixture
+    def extracted(self, db_session, sample_politician, sample_wikipedia_link):
+        """A previous successful extraction of revision 100 of the article."""
+        source = Source(
+            url=sample_wikipedia_link.url,
+            permanent_url=(
+                "https://en.wikipedia.org/w/index.php?title=Test_Politician&oldid=100"
+            ),
+            fetch_timestamp=datetime.now(timezone.utc),
+            status=SourceStatus.DONE,
+        )
+        sample_politician.sources.append(source)
+        db_session.flush()
+        return source
+
+    def revisions(self, revision):
+        """Stand-in for the MediaWiki revision lookup."""
+        return patch(
+            "poliloom.scheduling.latest_revision_ids",
+            new_callable=AsyncMock,
+            side_effect=lambda urls: {url: revision for url in urls},
+        )
+
+    async def test_unchanged_article_not_fetched(
+        self, db_session, sample_politician, extracted
+    ):
+        """Test no source is created for an article at the same revision."""
+        with self.revisions(100) as lookup:
+            result = await schedule_enrichment(db_session)
+
+        lookup.assert_called_once_with([extracted.url])
+        # The politician still counts as enriched, reusing the previous extraction
+        assert result.politician_id == sample_politician.id
+        assert result.source_ids == []
+        db_session.refresh(sample_politician)
+        assert sample_politician.enriched_at is not None
+        assert [s.id for s in sample_politician.sources] == [extracted.id]
+
+    async def test_changed_article_fetched(self, db_session, extracted):
+        """Test a new revision is fetched and extracted again."""
+        with self.revisions(101):
+            result = await schedule_enrichment(db_session)
+
+        [source] = db_session.query(Source).filter(Source.id.in_(result.source_ids))
+        assert source.url == extracted.url
+        assert source.status == SourceStatus.PROCESSING
+
+    async def test_failed_lookup_fetches(self, db_session, extracted):
+        """Test articles whose revision can't be looked up are fetched."""
+        with patch(
+            "poliloom.scheduling.latest_revision_ids",
+            new_callable=AsyncMock,
+            return_value={},
+        ):
+            result = await schedule_enrichment(db_session)
+
+        assert len(result.source_ids) == 1
+
+    async def test_never_extracted_article_not_looked_up(
+        self, db_session, sample_politician, sample_wikipedia_link
+    ):
+        """Test articles without a previous extraction need no lookup."""
+        with self.revisions(100) as lookup:
+            result = await schedule_enrichment(db_session)
+
+        lookup.assert_not_called()
+        assert len(result.source_ids) == 1
 
 
 class TestProcessNextPolitician:
@@ -53,3 +134,49 @@ class TestProcessNextPolitician:
 
         db_session.refresh(sample_politician)
         assert sample_politician.enriched_at is None
+
+    @pytest.fixture
+    def scheduled(self):
+        """Stand-in for scheduling a politician with two articles."""
+        result = ScheduledEnrichment(
+            politician_id="politician", source_ids=["en", "de"], politician_name="Jane"
+        )
+        with patch(
+            "poliloom.scheduling.schedule_enrichment",
+            new_callable=AsyncMock,
+            return_value=result,
+        ):
+            yield result
+
+    @pytest.mark.asyncio
+    @patch("poliloom.scheduling.process_sources_task", new_callable=AsyncMock)
+    @patch("poliloom.scheduling.process_source_task", new_callable=AsyncMock)
+    async def test_per_source_mode(self, per_source, consolidated, scheduled):
+        """Test each article is processed on its own by default."""
+        per_source.return_value = 0
+
+        assert await process_next_politician(source_mode="per_source") is True
+
+        assert [c.args for c in per_source.await_args_list] == [
+            ("en", "politician"),
+            ("de", "politician"),
+        ]
+        consolidated.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("poliloom.scheduling.process_sources_task", new_callable=AsyncMock)
+    @patch("poliloom.scheduling.process_source_task", new_callable=AsyncMock)
+    async def test_consolidated_mode(self, per_source, consolidated, scheduled):
+        """Test all articles are processed in one pass in consolidated mode."""
+        consolidated.return_value = 0
+
+        assert await process_next_politician(source_mode="consolidated") is True
+
+        consolidated.assert_awaited_once_with(["en", "de"], "politician")
+        per_source.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_mode(self):
+        """Test an unknown source mode is rejected."""
+        with pytest.raises(ValueError):
+            await process_next_politician(source_mode="everything")
@@ -0,0 +1,873 @@
+"""Tests for the Meilisearch SearchService wrapper."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import orjson
+import pytest
+from sqlalchemy import text
+
+from poliloom.models import Location, Position, SearchEmbedding, WikidataEntityMixin
+from poliloom.search import (
+    EMBEDDER_NAME,
+    AsyncMeilisearchClient,
+    AsyncSearchClient,
+    SearchCache,
+    search_cache,
+    ThreadedSearchClient,
+    get_async_search_client,
+    PostgresSearchBackend,
+    SearchRequest,
+    SearchService,
+    create_search_service,
+    documents_from_rows,
+    embedding_hash,
+    normalize_label,
+    normalize_labels,
+    render_document,
+    searchable_types,
+)
+
+from .conftest import StubEmbedder
+
+# conftest patches find_similar_many for every test, keep the real one
+find_similar_many = WikidataEntityMixin.__dict__["find_similar_many"]
+
+
+# Searchable types of the mocked services; Politician has no embedder
+ENTITY_TYPES = {"Location": 0.3, "Country": 0.4, "Politician": 0.0}
+
+
+def make_service() -> tuple[SearchService, Mock]:
+    """SearchService with a mocked Meilisearch client."""
+    with patch("meilisearch.Client"):
+        service = SearchService(url="http://meili", entity_types=ENTITY_TYPES)
+    index = service.client.index.return_value
+    return service, index
+
+
+def task_statuses(service: SearchService, statuses: dict[int, str]) -> None:
+    """Answer task polls of a mocked service from a mutable status map."""
+    service.client.get_tasks.side_effect = lambda params: Mock(
+        results=[
+            Mock(uid=int(uid), status=statuses[int(uid)], error={"code": "x"})
+            for uid in params["uids"]
+        ]
+    )
+
+
+class TestIndexSettings:
+    """Test the per-type index setup of SearchService."""
+
+    def test_index_names(self):
+        """Test every searchable type gets its own index."""
+        service, _ = make_service()
+
+        assert service.index_names() == [
+            "entities_location",
+            "entities_country",
+            "entities_politician",
+        ]
+        assert service.index_names(["Country"]) == ["entities_country"]
+        with pytest.raises(ValueError, match="Unknown entity types: Mayor"):
+            service.index_names(["Mayor"])
+
+    def test_default_types_from_models(self):
+        """Test the searchable types follow the models' search configuration."""
+        types = searchable_types()
+
+        assert types["Location"] == Location._search_semantic_ratio
+        assert types["Position"] == Position._search_semantic_ratio
+        assert "WikidataEntity" not in types
+
+    def test_embedder_only_for_semantic_types(self, monkeypatch):
+        """Test keyword-only types are created without an embedder."""
+        monkeypatch.setenv("OPENAI_API_KEY", "key")
+        service, index = make_service()
+        service.client.wait_for_task.return_value.status = "succeeded"
+
+        service.create_index(["Location", "Politician"])
+
+        created = [c.args[0] for c in service.client.create_index.call_args_list]
+        assert created == ["entities_location", "entities_politician"]
+        location, politician = [c.args[0] for c in index.update_settings.call_args_list]
+        assert location["embedders"][EMBEDDER_NAME]["documentTemplateMaxBytes"]
+        assert "embedders" not in politician
+        assert "filterableAttributes" not in location
+
+    def test_failed_setup_raises(self):
+        """Test index setup failures are not swallowed."""
+        service, _ = make_service()
+        service.client.wait_for_task.return_value.status = "failed"
+        service.client.wait_for_task.return_value.error = {
+            "code": "index_already_exists"
+        }
+
+        with pytest.raises(RuntimeError, match="index_already_exists"):
+            service.create_index(["Politician"])
+
+
+class TestIndexDocuments:
+    """Test SearchService.index_documents."""
+
+    def test_sends_serialized_documents(self):
+        """Test documents are sent as a pre-serialized JSON payload."""
+        service, index = make_service()
+        index.add_documents_raw.return_value.task_uid = 7
+        documents = [{"id": "Q1", "types": ["Location"], "labels": ["Zürich"]}]
+
+        task_uids = service.index_documents(documents)
+
+        assert task_uids == [7]
+        service.client.index.assert_called_with("entities_location")
+        payload = index.add_documents_raw.call_args.args[0]
+        assert orjson.loads(payload) == documents
+        assert index.add_documents_raw.call_args.kwargs == {
+            "content_type": "application/json"
+        }
+
+    def test_routes_documents_to_type_indexes(self):
+        """Test entities with several types are indexed into each type's index."""
+        service, index = make_service()
+        documents = [
+            {"id": "Q1", "types": ["Location", "Country"], "labels": ["France"]},
+            {"id": "Q2", "types": ["Location"], "labels": ["Paris"]},
+        ]
+
+        service.index_documents(documents)
+
+        sent = {
+            name.args[0]: [d["id"] for d in orjson.loads(add.args[0])]
+            for name, add in zip(
+                service.client.index.call_args_list,
+                index.add_documents_raw.call_args_list,
+            )
+        }
+        assert sent == {"entities_location": ["Q1", "Q2"], "entities_country": ["Q1"]}
+
+    def test_only_selected_types(self):
+        """Test a build of some types leaves the other indexes alone."""
+        service, index = make_service()
+        documents = [
+            {"id": "Q1", "types": ["Location", "Country"], "labels": ["France"]},
+        ]
+
+        service.index_documents(documents, entity_types=["Country"])
+
+        service.client.index.assert_called_once_with("entities_country")
+
+    def test_serializes_cached_vectors(self):
+        """Test numpy vectors loaded from the embedding cache are serialized."""
+        import numpy as np
+
+        service, index = make_service()
+        vector = np.array([0.5, 0.25], dtype=np.float32)
+        documents = [
+            {
+                "id": "Q1",
+                "types": ["Location"],
+                "labels": ["Zürich"],
+                "_vectors": {"openai": {"embeddings": vector, "regenerate": False}},
+            }
+        ]
+
+        service.index_documents(documents)
+
+        payload = orjson.loads(index.add_documents_raw.call_args.args[0])
+        assert payload[0]["_vectors"]["openai"]["embeddings"] == [0.5, 0.25]
+
+    def test_vectors_dropped_without_embedder(self):
+        """Test cached vectors are not sent to indexes without an embedder."""
+        service, index = make_service()
+        documents = [
+            {
+                "id": "Q1",
+                "types": ["Politician"],
+                "labels": ["Ada"],
+                "_vectors": {"openai": {"embeddings": [0.5], "regenerate": False}},
+            }
+        ]
+
+        service.index_documents(documents)
+
+        payload = orjson.loads(index.add_documents_raw.call_args.args[0])
+        assert payload == [{"id": "Q1", "types": ["Politician"], "labels": ["Ada"]}]
+        assert "_vectors" in documents[0]
+
+    def test_empty_batch_is_skipped(self):
+        """Test that no request is made for an empty batch."""
+        service, index = make_service()
+
+        assert service.index_documents([]) == []
+        index.add_documents_raw.assert_not_called()
+
+
+class TestDeleteDocuments:
+    """Test SearchService.delete_documents."""
+
+    def test_deletes_from_all_type_indexes(self):
+        """Test deleted entities are removed from every type's index."""
+        service, index = make_service()
+
+        assert service.delete_documents(["Q1", "Q2"]) == 2
+
+        names = [c.args[0] for c in service.client.index.call_args_list]
+        assert names == service.index_names()
+        assert index.delete_documents.call_count == 3
+
+    def test_deletes_from_one_type_index(self):
+        """Test entities leaving one type stay searchable as their other types."""
+        service, index = make_service()
+
+        service.delete_documents(["Q1"], entity_type="Location")
+
+        service.client.index.assert_called_once_with("entities_location")
+        index.delete_documents.assert_called_once_with(["Q1"])
+
+
+class TestWaitForTasks:
+    """Test the task submission window of SearchService."""
+
+    @pytest.fixture(autouse=True)
+    def fast_polling(self, monkeypatch):
+        import poliloom.search
+
+        monkeypatch.setattr(poliloom.search, "TASK_POLL_INTERVAL", 0.001)
+
+    def test_reports_failed_tasks(self):
+        """Test document and delete tasks are awaited and failures returned."""
+        service, index = make_service()
+        service.task_retries = 0
+        index.add_documents_raw.return_value.task_uid = 1
+        index.delete_documents.return_value.task_uid = 2
+        task_statuses(service, {1: "succeeded", 2: "failed"})
+        service.index_documents([{"id": "Q1", "types": ["Location"], "labels": []}])
+        service.delete_documents(["Q2"], entity_type="Location")
+
+        assert service.wait_for_tasks() == [2]
+        assert service.applied_documents == 1
+        # Confirmed tasks are not awaited again
+        assert service.wait_for_tasks() == []
+
+    def test_failed_tasks_are_resubmitted(self):
+        """Test a failed batch is sent again with the same payload."""
+        service, index = make_service()
+        service.task_retries = 1
+        index.add_documents_raw.side_effect = [Mock(task_uid=1), Mock(task_uid=2)]
+        task_statuses(service, {1: "failed", 2: "succeeded"})
+        service.index_documents([{"id": "Q1", "types": ["Location"], "labels": []}])
+
+        assert service.wait_for_tasks() == []
+        assert service.retried_tasks == 1
+        assert service.applied_documents == 1
+        first, second = index.add_documents_raw.call_args_list
+        assert first == second
+
+    def test_gives_up_after_retries(self):
+        """Test a batch failing on every attempt is reported once."""
+        service, index = make_service()
+        service.task_retries = 1
+        index.add_documents_raw.side_effect = [Mock(task_uid=1), Mock(task_uid=2)]
+        task_statuses(service, {1: "failed", 2: "failed"})
+        service.index_documents([{"id": "Q1", "types": ["Location"], "labels": []}])
+
+        assert service.wait_for_tasks() == [2]
+        assert service.applied_documents == 0
+
+    def test_timeout_counts_as_failed(self):
+        """Test tasks still running at the deadline are reported."""
+        service, index = make_service()
+        index.add_documents_raw.return_value.task_uid = 5
+        task_statuses(service, {5: "processing"})
+        service.index_documents([{"id": "Q1", "types": ["Location"], "labels": []}])
+
+        assert service.wait_for_tasks(timeout_ms=50) == [5]
+
+    def test_window_blocks_submission(self, monkeypatch):
+        """Test writers wait while the window is full of unfinished tasks."""
+        import threading
+
+        monkeypatch.setenv("MEILI_MAX_PENDING_TASKS", "1")
+        service, index = make_service()
+        index.add_documents_raw.side_effect = [Mock(task_uid=1), Mock(task_uid=2)]
+        statuses = {1: "processing", 2: "succeeded"}
+        task_statuses(service, statuses)
+        document = {"id": "Q1", "types": ["Location"], "labels": []}
+        service.index_documents([document])
+
+        second = threading.Thread(target=service.index_documents, args=([document],))
+        second.start()
+        second.join(timeout=0.1)
+        assert second.is_alive()
+        assert index.add_documents_raw.call_count == 1
+
+        statuses[1] = "succeeded"
+        second.join(timeout=5)
+        assert not second.is_alive()
+        assert service.wait_for_tasks() == []
+        assert service.applied_documents == 2
+
+
+class TestSearch:
+    """Test SearchService.search."""
+
+    def test_searches_type_index(self):
+        """Test typed searches go to the type's index without a filter."""
+        service, index = make_service()
+        index.search.return_value = {"hits": [{"id": "Q64"}]}
+
+        assert service.search("Berlin", entity_type="Location", limit=5) == ["Q64"]
+        service.client.index.assert_called_once_with("entities_location")
+        assert index.search.call_args.args == ("Berlin", {"limit": 5})
+
+    def test_keyword_only_without_embedder(self):
+        """Test hybrid search is not requested from indexes without embedder."""
+        service, index = make_service()
+        index.search.return_value = {"hits": []}
+
+        service.search("Ada", entity_type="Politician", semantic_ratio=0.5)
+
+        assert "hybrid" not in index.search.call_args.args[1]
+
+    def test_cross_type_search_is_federated(self):
+        """Test searches without a type merge all indexes in one request."""
+        service, _ = make_service()
+        service.client.multi_search.return_value = {
+            "hits": [{"id": "Q142"}, {"id": "Q142"}, {"id": "Q90"}]
+        }
+
+        results = service.search("France", limit=3, semantic_ratio=0.5)
+
+        assert results == ["Q142", "Q90"]
+        queries = service.client.multi_search.call_args.args[0]
+        assert [q["indexUid"] for q in queries] == service.index_names()
+        assert all("limit" not in q for q in queries)
+        assert [("hybrid" in q) for q in queries] == [True, True, False]
+        assert service.client.multi_search.call_args.kwargs == {
+            "federation": {"limit": 3}
+        }
+
+
+class TestSearchMany:
+    """Test SearchService.search_many."""
+
+    def test_uses_multi_search(self):
+        """Test typed queries are sent in one multi-search request."""
+        service, _ = make_service()
+        service.client.multi_search.return_value = {
+            "results": [{"hits": [{"id": "Q64"}]}, {"hits": []}]
+        }
+
+        results = service.search_many(
+            [
+                SearchRequest("Berlin", entity_type="Location", limit=5),
+                SearchRequest("Paris", entity_type="Country", semantic_ratio=0.5),
+            ]
+        )
+
+        assert results == [["Q64"], []]
+        service.client.multi_search.assert_called_once()
+        queries = service.client.multi_search.call_args.args[0]
+        assert queries[0] == {
+            "indexUid": "entities_location",
+            "q": "Berlin",
+            "limit": 5,
+        }
+        assert queries[1]["hybrid"]["semanticRatio"] == 0.5
+
+    def test_cross_type_requests_federated(self):
+        """Test requests without a type get a federated search each."""
+        service, _ = make_service()
+        service.client.multi_search.side_effect = [
+            {"results": [{"hits": [{"id": "Q64"}]}]},
+            {"hits": [{"id": "Q1"}]},
+        ]
+
+        results = service.search_many(
+            [SearchRequest("Mayor"), SearchRequest("Berlin", entity_type="Location")]
+        )
+
+        assert results == [["Q1"], ["Q64"]]
+        assert service.client.multi_search.call_args.kwargs == {
+            "federation": {"limit": 100}
+        }
+
+    def test_empty(self):
+        """Test no request is made without queries."""
+        service, _ = make_service()
+
+        assert service.search_many([]) == []
+        service.client.multi_search.assert_not_called()
+
+
+class TestAsyncMeilisearchClient:
+    """Test the pooled async Meilisearch client."""
+
+    def _client(self, responses):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=orjson.dumps(responses.pop(0)))
+
+        client = AsyncMeilisearchClient(
+            url="http://meili",
+            api_key="key",
+            transport=httpx.MockTransport(handler),
+            entity_types=ENTITY_TYPES,
+        )
+        return client, requests
+
+    async def test_search(self):
+        """Test a search is posted to the index search endpoint."""
+        client, requests = self._client([{"hits": [{"id": "Q64"}]}])
+
+        results = await client.search("Berlin", entity_type="Location", limit=5)
+        await client.aclose()
+
+        assert results == ["Q64"]
+        assert requests[0].url.path == "/indexes/entities_location/search"
+        assert requests[0].headers["Authorization"] == "Bearer key"
+        assert orjson.loads(requests[0].content) == {"q": "Berlin", "limit": 5}
+
+    async def test_cross_type_search(self):
+        """Test a search without a type is a federated multi-search."""
+        client, requests = self._client([{"hits": [{"id": "Q64"}, {"id": "Q64"}]}])
+
+        results = await client.search("Berlin", limit=5)
+        await client.aclose()
+
+        assert results == ["Q64"]
+        body = orjson.loads(requests[0].content)
+        assert requests[0].url.path == "/multi-search"
+        assert body["federation"] == {"limit": 5}
+        assert len(body["queries"]) == len(ENTITY_TYPES)
+
+    async def test_search_many(self):
+        """Test batched searches use one multi-search request."""
+        client, requests = self._client(
+            [{"results": [{"hits": [{"id": "Q64"}]}, {"hits": []}]}]
+        )
+
+        results = await client.search_many(
+            [
+                SearchRequest("Berlin", entity_type="Location"),
+                SearchRequest("Paris", entity_type="Country", semantic_ratio=0.5),
+            ]
+        )
+        await client.aclose()
+
+        assert results == [["Q64"], []]
+        assert len(requests) == 1
+        assert requests[0].url.path == "/multi-search"
+        queries = orjson.loads(requests[0].content)["queries"]
+        assert [q["indexUid"] for q in queries] == [
+            "entities_location",
+            "entities_country",
+        ]
+        assert queries[1]["hybrid"]["semanticRatio"] == 0.5
+
+    async def test_http_error(self):
+        """Test server errors are raised."""
+
+        def handler(request):
+            return httpx.Response(500, content=b"{}")
+
+        client = AsyncMeilisearchClient(
+            url="http://meili", transport=httpx.MockTransport(handler)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.search("Berlin")
+        await client.aclose()
+
+
+class TestSharedAsyncSearchClient:
+    """Test the process-wide async search client."""
+
+    def test_reused_within_loop(self):
+        """Test the same client is returned within one event loop."""
+
+        async def get_twice():
+            return get_async_search_client(), get_async_search_client()
+
+        first, second = asyncio.run(get_twice())
+
+        assert first is second
+
+    def test_replaced_for_new_loop(self):
+        """Test a new client is created when a new event loop is used."""
+
+        async def get():
+            return get_async_search_client()
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    def test_enrich_command_reuses_and_closes_client(self, monkeypatch):
+        """Test one client serves a whole enrichment run and is closed after."""
+        from click.testing import CliRunner
+
+        import poliloom.cli
+        import poliloom.search
+
+        clients = []
+
+        async def process_next_politician(**kwargs):
+            clients.append(get_async_search_client())
+            return True
+
+        monkeypatch.setattr(
+            poliloom.cli, "process_next_politician", process_next_politician
+        )
+
+        result = CliRunner().invoke(
+            poliloom.cli.main, ["enrich-wikipedia", "--count", "3"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(clients) == 3 and len(set(map(id, clients))) == 1
+        assert poliloom.search._async_search_client is None
+
+    async def test_threaded_client_delegates(self):
+        """Test the threaded adapter runs the sync backend's searches."""
+        backend = Mock()
+        backend.search.return_value = ["Q1"]
+        backend.search_many.return_value = [["Q1"], []]
+        client = ThreadedSearchClient(backend)
+
+        assert await client.search("Mayor", "Position", 5, 0.5) == ["Q1"]
+        backend.search.assert_called_once_with("Mayor", "Position", 5, 0.5)
+        requests = [SearchRequest("Mayor"), SearchRequest("Berlin")]
+        assert await client.search_many(requests) == [["Q1"], []]
+
+
+class TestRenderDocument:
+    """Test rendering of the text Meilisearch embeds."""
+
+    def test_matches_document_template(self):
+        """Test labels are joined like the embedder's documentTemplate."""
+        document = {"id": "Q1", "types": ["Location"], "labels": ["Zürich", "Zurich"]}
+
+        assert render_document(document) == "Zürich, Zurich"
+
+    def test_truncated_like_document_template_max_bytes(self):
+        """Test long texts are cut to the byte limit on a character boundary."""
+        from poliloom.search import DOCUMENT_TEMPLATE_MAX_BYTES
+
+        document = {"id": "Q1", "types": ["Location"], "labels": ["ü" * 2000]}
+
+        text = render_document(document)
+
+        assert len(text.encode()) == DOCUMENT_TEMPLATE_MAX_BYTES
+        assert text == "ü" * (DOCUMENT_TEMPLATE_MAX_BYTES // 2)
+
+    def test_hash_depends_on_text(self):
+        """Test equal texts share a hash and different texts do not."""
+        assert embedding_hash("Zürich") == embedding_hash("Zürich")
+        assert embedding_hash("Zürich") != embedding_hash("Zurich")
+
+
+class TestNormalizeLabels:
+    """Test label normalization for search documents."""
+
+    def test_folds_case_diacritics_and_whitespace(self):
+        """Test Latin labels are case-folded, unaccented and collapsed."""
+        assert normalize_label("  Zürich\tCity ") == "zurich city"
+        assert normalize_label("Łódź") == "łodz"
+        assert normalize_label("STRAẞE") == "strasse"
+
+    def test_keeps_marks_of_other_scripts(self):
+        """Test combining marks outside Latin script are preserved."""
+        assert normalize_label("Йошкар-Ола") == "йошкар-ола"
+        assert normalize_label("नई दिल्ली") == "नई दिल्ली"
+
+    def test_dedup_keeps_rank_order(self):
+        """Test the first occurrence of a normalized form keeps its rank."""
+        labels = ["Zürich", "Zurich", "ZURICH", "Zurigo", " ", "Цюрих"]
+
+        assert normalize_labels(labels) == ["zurich", "zurigo", "цюрих"]
+        assert normalize_labels(labels, max_labels=2) == ["zurich", "zurigo"]
+
+    def test_documents_capped(self):
+        """Test documents carry at most max_labels normalized labels."""
+        rows = [
+            Mock(
+                wikidata_id="Q72",
+                types=["Location"],
+                labels=["Zürich", "Zurich", "Zurigo"],
+            )
+        ]
+
+        documents = documents_from_rows(rows, max_labels=1)
+
+        assert documents == [{"id": "Q72", "types": ["Location"], "labels": ["zurich"]}]
+
+
+class TestCreateSearchService:
+    """Test backend selection via SEARCH_BACKEND."""
+
+    def test_defaults_to_meilisearch(self, monkeypatch, mock_search_service_globally):
+        """Test Meilisearch is used when no backend is configured."""
+        monkeypatch.delenv("SEARCH_BACKEND", raising=False)
+
+        assert create_search_service() is mock_search_service_globally
+
+    def test_postgres(self, monkeypatch):
+        """Test the Postgres backend can be selected."""
+        monkeypatch.setenv("SEARCH_BACKEND", "postgres")
+
+        assert isinstance(create_search_service(), PostgresSearchBackend)
+
+    def test_unknown_backend(self, monkeypatch):
+        """Test an unknown backend name is rejected."""
+        monkeypatch.setenv("SEARCH_BACKEND", "elasticsearch")
+
+        with pytest.raises(ValueError):
+            create_search_service()
+
+
+class TestPostgresSearchBackend:
+    """Test the Postgres search backend against the test database."""
+
+    @pytest.fixture
+    def backend(self, db_session):
+        embedder = StubEmbedder()
+        backend = PostgresSearchBackend(bind=db_session.connection(), embedder=embedder)
+
+        Location.create_with_entity(
+            db_session, "Q64", "Berlin", labels=["Berlin", "Berlin city"]
+        )
+        Location.create_with_entity(db_session, "Q90", "Paris", labels=["Paris"])
+        Position.create_with_entity(
+            db_session, "Q1", "Mayor of Berlin", labels=["Mayor of Berlin"]
+        )
+        db_session.flush()
+
+        documents = [
+            {"id": "Q64", "types": ["Location"], "labels": ["Berlin", "Berlin city"]},
+            {"id": "Q90", "types": ["Location"], "labels": ["Paris"]},
+            {"id": "Q1", "types": ["Position"], "labels": ["Mayor of Berlin"]},
+        ]
+        SearchEmbedding.attach_embeddings(db_session, documents, embedder)
+        backend.index_documents(documents)
+        return backend
+
+    def test_semantic_search(self, backend):
+        """Test pure semantic search ranks the closest embedding first."""
+        results = backend.search("berlin", semantic_ratio=1.0)
+
+        assert results[0] == "Q64"
+        assert set(results) == {"Q64", "Q90", "Q1"}
+
+    def test_type_filter(self, backend):
+        """Test results are restricted to the requested type."""
+        results = backend.search("berlin", entity_type="Position", semantic_ratio=1.0)
+
+        assert results == ["Q1"]
+
+    def test_type_filter_recall_beyond_candidates(self, backend, monkeypatch):
+        """Test types missing from the nearest candidates are still found."""
+        import poliloom.search
+
+        monkeypatch.setattr(poliloom.search, "PG_MAX_VECTOR_CANDIDATES", 1)
+
+        results = backend.search("berlin", entity_type="Position", semantic_ratio=1.0)
+
+        assert results == ["Q1"]
+
+    def test_limit(self, backend):
+        """Test the number of results is capped."""
+        assert len(backend.search("berlin", limit=2, semantic_ratio=1.0)) == 2
+
+    def test_deleted_documents_not_returned(self, backend):
+        """Test deleted documents drop out of the results."""
+        backend.delete_documents(["Q64"])
+
+        results = backend.search("berlin", entity_type="Location", semantic_ratio=1.0)
+
+        assert results == ["Q90"]
+
+    def test_delete_one_type(self, backend, db_session):
+        """Test removing one type keeps the document for its other types."""
+        labels = ["Berlin", "Berlin city"]
+        backend.index_documents(
+            [{"id": "Q64", "types": ["Location", "Country"], "labels": labels}]
+        )
+
+        backend.delete_documents(["Q64", "Q90"], entity_type="Location")
+
+        assert backend.search("berlin", entity_type="Country", semantic_ratio=1.0) == [
+            "Q64"
+        ]
+        assert (
+            backend.search("berlin", entity_type="Location", semantic_ratio=1.0) == []
+        )
+
+    def test_keyword_search(self, backend, db_session):
+        """Test trigram keyword search matches partial labels."""
+        available = db_session.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+        if not available:
+            pytest.skip("pg_trgm extension not available")
+        db_session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+        results = backend.search("Berli", entity_type="Location")
+
+        assert results == ["Q64"]
+
+    def test_search_many_embeds_once(self, backend):
+        """Test batched searches share one embedder call and keep order."""
+        backend.embedder.calls.clear()
+
+        results = backend.search_many(
+            [
+                SearchRequest("paris", entity_type="Location", semantic_ratio=1.0),
+                SearchRequest("berlin", entity_type="Position", semantic_ratio=1.0),
+            ]
+        )
+
+        assert results[0][0] == "Q90"
+        assert results[1] == ["Q1"]
+        assert backend.embedder.calls == [["paris", "berlin"]]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingSearchClient(AsyncSearchClient):
+    """Async search client returning the query as its only hit."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def search(self, query, entity_type=None, limit=100, semantic_ratio=0.0):
+        self.requests.append(query)
+        return [query]
+
+    async def search_many(self, requests):
+        self.requests.extend(request.query for request in requests)
+        return [[request.query] for request in requests]
+
+
+class TestSearchCache:
+    """Test the LRU + TTL search result cache."""
+
+    def test_normalized_key(self):
+        """Test queries differing in case and whitespace share a key."""
+        assert SearchCache.key("Location", "  New   YORK ", 10, 0.0) == (
+            SearchCache.key("Location", "new york", 10, 0.0)
+        )
+        assert SearchCache.key("Location", "a", 10, 0.0) != (
+            SearchCache.key("Location", "a", 10, 0.5)
+        )
+
+    def test_hit_and_miss_counts(self):
+        """Test lookups are counted and the hit rate derived from them."""
+        cache = SearchCache(max_entries=10, ttl=60)
+        key = SearchCache.key("Position", "mayor", 10, 0.0)
+
+        assert cache.get(key) is None
+        cache.put(key, ["Q1"])
+        assert cache.get(key) == ["Q1"]
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_returns_copies(self):
+        """Test callers mutating a result do not alter the cached entry."""
+        cache = SearchCache(max_entries=10, ttl=60)
+        cache.put("k", ["Q1"])
+
+        cache.get("k").append("Q2")
+
+        assert cache.get("k") == ["Q1"]
+
+    def test_expires_after_ttl(self):
+        """Test entries are dropped once their time-to-live has passed."""
+        clock = FakeClock()
+        cache = SearchCache(max_entries=10, ttl=60, clock=clock)
+        cache.put("k", ["Q1"])
+
+        clock.now = 59
+        assert cache.get("k") == ["Q1"]
+        clock.now = 60
+        assert cache.get("k") is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = SearchCache(max_entries=2, ttl=60)
+        cache.put("a", ["Q1"])
+        cache.put("b", ["Q2"])
+        cache.get("a")
+        cache.put("c", ["Q3"])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ["Q1"]
+        assert cache.get("c") == ["Q3"]
+
+    def test_disabled(self):
+        """Test a cache size of zero stores nothing."""
+        cache = SearchCache(max_entries=0, ttl=60)
+        cache.put("k", ["Q1"])
+
+        assert cache.get("k") is None
+
+    def test_invalidated_by_index_change_event(self):
+        """Test the event bus handler only reacts to index changes."""
+        cache = SearchCache(max_entries=10, ttl=60)
+        cache.put("k", ["Q1"])
+
+        cache.handle_event({"type": "source_status"})
+        assert cache.get("k") == ["Q1"]
+
+        cache.handle_event({"type": "search_index_changed"})
+        assert cache.get("k") is None
+        assert cache.stats()["invalidations"] == 1
+
+
+class TestCachedFindSimilar:
+    """Test find_similar and find_similar_many go through the search cache."""
+
+    async def test_find_similar_cached(self):
+        """Test repeated queries only reach the search client once."""
+        client = CountingSearchClient()
+
+        assert await WikidataEntityMixin.find_similar("Berlin", client) == ["Berlin"]
+        assert await WikidataEntityMixin.find_similar("berlin ", client) == ["Berlin"]
+
+        assert client.requests == ["Berlin"]
+
+    async def test_find_similar_many_only_sends_misses(self):
+        """Test batched lookups only search queries missing from the cache."""
+        client = CountingSearchClient()
+        await WikidataEntityMixin.find_similar("Berlin", client)
+
+        results = await find_similar_many.__get__(None, WikidataEntityMixin)(
+            ["Paris", "BERLIN", "Rome"], client
+        )
+
+        assert results == [["Paris"], ["Berlin"], ["Rome"]]
+        assert client.requests == ["Berlin", "Paris", "Rome"]
+
+    async def test_index_change_invalidates(self, db_session):
+        """Test announcing an index change drops cached results."""
+        from poliloom.search import notify_index_changed
+
+        client = CountingSearchClient()
+        await WikidataEntityMixin.find_similar("Berlin", client)
+
+        notify_index_changed(db_session)
+        await WikidataEntityMixin.find_similar("Berlin", client)
+
+        assert client.requests == ["Berlin", "Berlin"]
+        assert search_cache.stats()["hits"] == 0
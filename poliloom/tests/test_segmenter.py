@@ -0,0 +1,227 @@
+"""Tests for turning archived pages into extraction content."""
+
+from poliloom.models import PropertyType
+from poliloom.segmenter import (
+    CAREER_KEYWORDS,
+    ContentRoute,
+    Section,
+    SegmentedPage,
+    extract_main_text,
+    route_content,
+    segment_html,
+)
+
+ARTICLE_HTML = """<html><body>
+<div id="mw-navigation">Main page Contents</div>
+<div id="mw-content-text"><div class="mw-content-ltr mw-parser-output">
+<div class="hatnote">For other people named John Doe, see John Doe (disambiguation).</div>
+<table class="infobox vcard">
+<tr><th>Born</th><td>15 January 1970<br>Springfield</td></tr>
+<tr><th>Political party</th><td>Example Party</td></tr>
+</table>
+<p>John Doe (born 15 January 1970)<sup class="reference">[1]</sup> is a politician.</p>
+<p>He has served as Mayor of Springfield since 2020.</p>
+<div class="mw-heading mw-heading2"><h2 id="Early_life">Early life</h2><span class="mw-editsection">[edit]</span></div>
+<p>Doe grew up on a farm.</p>
+<div class="mw-heading mw-heading2"><h2 id="Political_career">Political career</h2></div>
+<p>Doe was elected to the city council in 2012.</p>
+<div class="mw-heading mw-heading3"><h3 id="Mayor">Mayor</h3></div>
+<p>In 2020 he became mayor.</p>
+<h2>References</h2>
+<div class="reflist"><ol class="references"><li>A source</li></ol></div>
+<div class="navbox">Mayors of Springfield</div>
+</div></div>
+</body></html>"""
+
+
+class TestExtractMainText:
+    """Test page-to-text conversion."""
+
+    def test_wikipedia_article(self):
+        """Test only article content is kept, one block per line."""
+        text = extract_main_text(ARTICLE_HTML)
+
+        assert text.split("\n")[:4] == [
+            "For other people named John Doe, see John Doe (disambiguation).",
+            "Born 15 January 1970",
+            "Springfield",
+            "Political party Example Party",
+        ]
+        assert "John Doe (born 15 January 1970) is a politician." in text
+        assert "Political career\nDoe was elected" in text
+        for noise in ("[1]", "[edit]", "A source", "Mayors of", "Main page"):
+            assert noise not in text
+
+    def test_main_element_of_other_pages(self):
+        """Test pages outside Wikipedia are reduced to their main element."""
+        html = """<html><head><title>Site</title></head><body>
+        <nav>Home | News</nav>
+        <main><h1>Jane Roe</h1><p>Jane  Roe was   born in 1960.</p>
+        <p hidden>Draft</p><p style="display: none">Hidden</p>
+        <ul><li>Mayor</li><li>Senator</li></ul></main>
+        <footer>Copyright</footer></body></html>"""
+
+        assert extract_main_text(html) == (
+            "Jane Roe\nJane Roe was born in 1960.\nMayor\nSenator"
+        )
+
+    def test_whole_document_without_main(self):
+        """Test the whole document is used when no main content is marked."""
+        html = "<html><body><p>One</p>text<footer>Footer</footer></body></html>"
+
+        assert extract_main_text(html) == "One\ntext"
+
+    def test_empty(self):
+        """Test empty pages give no text."""
+        assert extract_main_text("") == ""
+        assert extract_main_text("<html><body>   </body></html>") == ""
+
+
+class TestSegmentHtml:
+    """Test splitting Wikipedia articles."""
+
+    def test_lead_infobox_and_sections(self):
+        """Test the article is split at second-level headings."""
+        page = segment_html(ARTICLE_HTML)
+
+        assert page.infobox == (
+            "Born 15 January 1970 Springfield\nPolitical party Example Party"
+        )
+        assert page.lead == (
+            "John Doe (born 15 January 1970) is a politician.\n"
+            "He has served as Mayor of Springfield since 2020."
+        )
+        assert [section.heading for section in page.sections] == [
+            "Early life",
+            "Political career",
+        ]
+        # Subsections stay with their parent section
+        assert page.sections[1].text == (
+            "Doe was elected to the city council in 2012.\nMayor\n"
+            "In 2020 he became mayor."
+        )
+
+    def test_references_and_navigation_dropped(self):
+        """Test references, edit links, navboxes and site chrome are left out."""
+        page = segment_html(ARTICLE_HTML)
+        text = str(page)
+
+        for noise in ("[1]", "[edit]", "A source", "Mayors of", "Main page"):
+            assert noise not in text
+
+    def test_not_an_article(self):
+        """Test pages without article content can't be segmented."""
+        assert segment_html("<html><body><p>Some text</p></body></html>") is None
+        assert segment_html("") is None
+
+
+def infobox_html(rows: str) -> str:
+    return (
+        '<html><body><div id="mw-content-text"><div class="mw-parser-output">'
+        f'<table class="infobox vcard">{rows}</table><p>Lead.</p>'
+        "</div></div></body></html>"
+    )
+
+
+LIVING_ROW = (
+    "<tr><th>Born</th><td>15 January 1970"
+    '<span style="display:none"> (<span class="bday">1970-01-15</span>)</span>'
+    '<span class="noprint ForceAgeToShow"> (age 55)</span></td></tr>'
+)
+DEATH_ROW = (
+    "<tr><th>Died</th><td>3 May 2020"
+    '<span style="display:none">(<span class="dday deathdate">2020-05-03</span>)'
+    "</span></td></tr>"
+)
+
+
+class TestInfoboxDates:
+    """Test reading dates from infobox markup."""
+
+    def test_living_person(self):
+        """Test the hidden birth date is read, quoting the visible row."""
+        page = segment_html(infobox_html(LIVING_ROW))
+
+        [date] = page.infobox_dates
+        assert date.type == PropertyType.BIRTH_DATE
+        assert date.value == "1970-01-15"
+        assert date.quote == "Born 15 January 1970"
+        assert page.living is True
+        # Hidden markup doesn't leak into the infobox text
+        assert page.infobox == "Born 15 January 1970"
+
+    def test_birth_and_death(self):
+        """Test birth and death dates are both read."""
+        birth_row = LIVING_ROW.replace(
+            '<span class="noprint ForceAgeToShow"> (age 55)</span>', ""
+        )
+        page = segment_html(infobox_html(birth_row + DEATH_ROW))
+
+        assert [(d.type, d.value) for d in page.infobox_dates] == [
+            (PropertyType.BIRTH_DATE, "1970-01-15"),
+            (PropertyType.DEATH_DATE, "2020-05-03"),
+        ]
+        assert page.living is False
+
+    def test_ambiguous_or_invalid_dates_ignored(self):
+        """Test duplicate or malformed date markup gives no date."""
+        duplicate = segment_html(infobox_html(LIVING_ROW + LIVING_ROW))
+        invalid = segment_html(
+            infobox_html(LIVING_ROW.replace("1970-01-15", "15 January 1970"))
+        )
+
+        assert duplicate.infobox_dates == []
+        assert invalid.infobox_dates == []
+
+
+class TestRouteContent:
+    """Test assembling the content of an extraction configuration."""
+
+    PAGE = SegmentedPage(
+        lead="Lead text.",
+        infobox="Born 1970",
+        sections=[
+            Section(heading="Early life", text="Childhood."),
+            Section(heading="Political career", text="Elected in 2012."),
+        ],
+    )
+
+    def test_lead_and_infobox(self):
+        """Test the default route sends only the infobox and lead."""
+        assert route_content(self.PAGE, ContentRoute(), "full") == (
+            "Born 1970\n\nLead text."
+        )
+
+    def test_matching_sections(self):
+        """Test sections are selected by heading keywords."""
+        route = ContentRoute(section_keywords=CAREER_KEYWORDS)
+
+        assert route_content(self.PAGE, route, "full") == (
+            "Born 1970\n\nLead text.\n\nPolitical career\nElected in 2012."
+        )
+
+    def test_all_sections_fallback(self):
+        """Test every section is sent when no heading matches."""
+        route = ContentRoute(section_keywords=("tenure",), all_sections_fallback=True)
+
+        content = route_content(self.PAGE, route, "full")
+
+        assert "Childhood." in content
+        assert "Elected in 2012." in content
+
+    def test_token_budget(self):
+        """Test content is cut at a word boundary within the budget."""
+        page = SegmentedPage(lead="word " * 1000, infobox="")
+
+        content = route_content(page, ContentRoute(token_budget=10), "full")
+
+        assert len(content) <= 40
+        assert content.split() == ["word"] * len(content.split())
+
+    def test_falls_back_to_full_text(self):
+        """Test the full text is sent when segmentation or routing yields nothing."""
+        empty = SegmentedPage(lead="", infobox="")
+
+        assert route_content(None, ContentRoute(), "full") == "full"
+        assert route_content(self.PAGE, None, "full") == "full"
+        assert route_content(empty, ContentRoute(), "full") == "full"
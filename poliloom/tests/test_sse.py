@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from poliloom.database import get_engine
 from poliloom.sse import (
+    SearchIndexChangedEvent,
     SourceStatusEvent,
     EnrichmentCompleteEvent,
     event_bus,
@@ -76,6 +77,25 @@ class TestSSE:
         assert payload["type"] == "enrichment_complete"
         assert payload["languages"] == ["Q1"]
 
+    def test_fanout_calls_handlers(self):
+        """Handlers see every event, a failing handler does not stop delivery."""
+        seen = []
+
+        def failing(payload):
+            raise RuntimeError("boom")
+
+        queue = event_bus.subscribe("user1")
+        event_bus.add_handler(failing)
+        event_bus.add_handler(seen.append)
+        try:
+            event_bus._fanout(asdict(SearchIndexChangedEvent()))
+        finally:
+            event_bus.remove_handler(failing)
+            event_bus.remove_handler(seen.append)
+
+        assert seen == [{"type": "search_index_changed"}]
+        assert queue.qsize() == 1
+
     def test_fanout_no_subscribers(self):
         """Should not raise when no subscribers exist."""
         event_bus._fanout(asdict(SourceStatusEvent(source_id="x", status="done")))
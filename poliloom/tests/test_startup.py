@@ -0,0 +1,83 @@
+"""Startup benchmark: heavy optional backends must not load on import."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Backends that are only needed by specific commands or code paths
+HEAVY_MODULES = [
+    "google.cloud.storage",
+    "google.auth",
+    "playwright",
+    "unmhtml",
+    "bs4",
+    "openai",
+    "dicttoxml",
+    "meilisearch",
+]
+
+
+# Budgets per entrypoint: best-of-three cumulative import time in milliseconds
+# and number of imported modules. Roughly twice what the entrypoints take on a
+# development machine, so a new heavy import fails the suite.
+STARTUP_BUDGETS = {
+    "poliloom.cli": (1500, 900),
+    "poliloom.api": (2500, 1100),
+}
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and collect -X importtime output.
+
+    Returns:
+        Mapping of imported module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartupImports:
+    """Test that entrypoints import without pulling in heavy backends."""
+
+    @pytest.mark.parametrize("entrypoint", ["poliloom.cli", "poliloom.api"])
+    def test_heavy_backends_not_imported(self, entrypoint):
+        """Test that heavy optional backends are imported lazily."""
+        times = import_times(entrypoint)
+
+        loaded = sorted(
+            name
+            for name in times
+            if any(name == m or name.startswith(f"{m}.") for m in HEAVY_MODULES)
+        )
+        total_ms = times[entrypoint] / 1000
+        assert not loaded, (
+            f"{entrypoint} eagerly imports {loaded} ({total_ms:.0f}ms total startup)"
+        )
+
+    @pytest.mark.parametrize("entrypoint", sorted(STARTUP_BUDGETS))
+    def test_startup_within_budget(self, entrypoint):
+        """Test that entrypoint import time and module count stay in budget."""
+        budget_ms, budget_modules = STARTUP_BUDGETS[entrypoint]
+
+        runs = [import_times(entrypoint) for _ in range(3)]
+        total_ms = min(times[entrypoint] for times in runs) / 1000
+        modules = len(runs[0])
+
+        assert total_ms <= budget_ms, (
+            f"{entrypoint} takes {total_ms:.0f}ms to import (budget {budget_ms}ms)"
+        )
+        assert modules <= budget_modules, (
+            f"{entrypoint} imports {modules} modules (budget {budget_modules})"
+        )
@@ -0,0 +1,343 @@
+"""Tests for storage backends and the local block cache."""
+
+import os
+import tempfile
+import threading
+
+import pytest
+
+from poliloom.storage import BlockCache, LocalStorage, _iter_lines_range
+
+
+class FakeRemote:
+    """In-memory stand-in for a remote object with range reads."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.fetches = []
+        self._lock = threading.Lock()
+
+    def fetch(self, start: int, end: int) -> bytes:
+        with self._lock:
+            self.fetches.append((start, end))
+        return self.data[start:end]
+
+
+@pytest.fixture
+def cache_dir():
+    """Temporary directory for cached blocks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+class TestBlockCache:
+    """Test BlockCache read-through behaviour."""
+
+    def test_read_matches_source(self, cache_dir):
+        """Test that reads through the cache return the exact byte range."""
+        remote = FakeRemote(bytes(range(256)) * 10)
+        cache = BlockCache(cache_dir, block_size=100, prefetch_blocks=0)
+        size = len(remote.data)
+
+        for start, end in [(0, 10), (95, 105), (0, size), (250, 2000), (2550, 3000)]:
+            assert (
+                cache.read("obj", start, end, size, remote.fetch)
+                == (remote.data[start : min(end, size)])
+            )
+
+    def test_blocks_fetched_once(self, cache_dir):
+        """Test that repeated reads are served from disk."""
+        remote = FakeRemote(b"x" * 1000)
+        cache = BlockCache(cache_dir, block_size=100, prefetch_blocks=0)
+
+        cache.read("obj", 0, 250, 1000, remote.fetch)
+        cache.read("obj", 50, 300, 1000, remote.fetch)
+
+        assert sorted(remote.fetches) == [(0, 100), (100, 200), (200, 300)]
+
+    def test_cache_shared_between_instances(self, cache_dir):
+        """Test that blocks written by one instance are reused by another."""
+        remote = FakeRemote(b"abcdefghij" * 50)
+
+        BlockCache(cache_dir, block_size=64, prefetch_blocks=0).read(
+            "obj", 0, 500, 500, remote.fetch
+        )
+        fetches = len(remote.fetches)
+        data = BlockCache(cache_dir, block_size=64, prefetch_blocks=0).read(
+            "obj", 0, 500, 500, remote.fetch
+        )
+
+        assert data == remote.data
+        assert len(remote.fetches) == fetches
+
+    def test_prefetch_loads_following_blocks(self, cache_dir):
+        """Test that reading a block prefetches the next ones."""
+        remote = FakeRemote(b"y" * 1000)
+        cache = BlockCache(cache_dir, block_size=100, prefetch_blocks=3)
+
+        cache.get_block("obj", 0, 1000, remote.fetch)
+        cache._get_executor().shutdown(wait=True)
+
+        assert sorted(remote.fetches) == [(0, 100), (100, 200), (200, 300), (300, 400)]
+
+    def test_eviction_keeps_cache_under_cap(self, cache_dir):
+        """Test that least recently used blocks are evicted past the size cap."""
+        remote = FakeRemote(os.urandom(100 * 40))
+        cache = BlockCache(cache_dir, block_size=100, max_bytes=1000, prefetch_blocks=0)
+
+        for index in range(40):
+            cache.get_block("obj", index, len(remote.data), remote.fetch)
+        cache._evict()
+
+        total = sum(
+            entry.stat().st_size
+            for object_dir in os.scandir(cache_dir)
+            for entry in os.scandir(object_dir.path)
+        )
+        assert total <= 1000
+
+        # Most recent block is still cached, the oldest was evicted
+        fetches = len(remote.fetches)
+        cache.get_block("obj", 39, len(remote.data), remote.fetch)
+        assert len(remote.fetches) == fetches
+        cache.get_block("obj", 0, len(remote.data), remote.fetch)
+        assert len(remote.fetches) == fetches + 1
+
+    def test_from_env_disabled_without_dir(self, monkeypatch):
+        """Test that the cache is disabled when GCS_CACHE_DIR is unset."""
+        monkeypatch.delenv("GCS_CACHE_DIR", raising=False)
+        assert BlockCache.from_env() is None
+
+    def test_from_env(self, monkeypatch, cache_dir):
+        """Test configuring the cache from the environment."""
+        monkeypatch.setenv("GCS_CACHE_DIR", cache_dir)
+        monkeypatch.setenv("GCS_CACHE_BLOCK_SIZE", "4096")
+        monkeypatch.setenv("GCS_CACHE_PREFETCH_BLOCKS", "2")
+
+        cache = BlockCache.from_env()
+
+        assert cache.cache_dir == cache_dir
+        assert cache.block_size == 4096
+        assert cache.prefetch_blocks == 2
+
+
+class TestCachedLineStreaming:
+    """Test line streaming over cached blocks against local file semantics."""
+
+    def test_lines_match_local_storage(self, cache_dir):
+        """Test that cached line ranges match LocalStorage.stream_lines_range."""
+        content = b"".join(
+            f'{{"id": "Q{i}", "pad": "{"z" * (i % 37)}"}},\n'.encode()
+            for i in range(200)
+        )
+        remote = FakeRemote(content)
+        cache = BlockCache(cache_dir, block_size=97, prefetch_blocks=2)
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            path = f.name
+
+        try:
+            local = LocalStorage()
+            size = len(content)
+            for start, end in [(0, size), (0, 500), (123, 1800), (1800, size)]:
+                # Chunks always start on a line boundary
+                start = content.rfind(b"\n", 0, start) + 1
+                blocks = cache.iter_blocks("obj", start, size, remote.fetch)
+                assert list(_iter_lines_range(blocks, start, end)) == list(
+                    local.stream_lines_range(path, start, end)
+                )
+        finally:
+            os.unlink(path)
+
+    def test_trailing_line_without_newline(self):
+        """Test that a final unterminated line is still yielded."""
+        blocks = iter([b"a\nb", b"c"])
+        assert list(_iter_lines_range(blocks, 0, 100)) == [b"a\n", b"bc"]
+
+
+class FakeBlob:
+    """Minimal GCS blob stand-in supporting upload, compose and range reads."""
+
+    def __init__(self, bucket, name, generation=None):
+        self.bucket = bucket
+        self.name = name
+        self.generation = generation
+        self.size = None
+
+    def upload_from_string(self, data, content_type=None):
+        self.bucket.objects[self.name] = bytes(data)
+        self.bucket.generations[self.name] = (
+            self.bucket.generations.get(self.name, 0) + 1
+        )
+
+    def reload(self):
+        self.size = len(self.bucket.objects[self.name])
+        self.generation = self.bucket.generations[self.name]
+
+    def download_as_bytes(self, start, end):
+        assert self.generation in (None, self.bucket.generations[self.name])
+        return self.bucket.objects[self.name][start : end + 1]
+
+    def compose(self, sources):
+        assert len(sources) <= 32
+        self.bucket.compose_calls += 1
+        self.bucket.objects[self.name] = b"".join(
+            self.bucket.objects[source.name] for source in sources
+        )
+
+    def delete(self):
+        del self.bucket.objects[self.name]
+
+
+class FakeBucket:
+    """In-memory GCS bucket stand-in."""
+
+    def __init__(self):
+        self.objects = {}
+        self.generations = {}
+        self.compose_calls = 0
+
+    def blob(self, name, generation=None):
+        return FakeBlob(self, name, generation)
+
+    def list_blobs(self, prefix):
+        return [
+            FakeBlob(self, name)
+            for name in list(self.objects)
+            if name.startswith(prefix)
+        ]
+
+
+class TestGCSWriteChunks:
+    """Test parallel composite uploads in GCSStorage.write_chunks."""
+
+    @pytest.fixture
+    def gcs(self, monkeypatch):
+        """GCSStorage wired to an in-memory bucket."""
+        from poliloom.storage import GCSStorage
+
+        bucket = FakeBucket()
+        storage = GCSStorage.__new__(GCSStorage)
+        storage.cache = None
+        storage.client = type("FakeClient", (), {"bucket": lambda self, name: bucket})()
+        monkeypatch.setenv("GCS_UPLOAD_CONCURRENCY", "3")
+        return storage, bucket
+
+    def test_parts_composed_in_order(self, gcs):
+        """Test that uploaded parts are joined in chunk order and cleaned up."""
+        storage, bucket = gcs
+        chunks = [f"chunk-{i};".encode() for i in range(10)]
+
+        storage.write_chunks("gs://bucket/dump.json", iter(chunks))
+
+        assert bucket.objects == {"dump.json": b"".join(chunks)}
+
+    def test_many_parts_composed_in_rounds(self, gcs):
+        """Test that more than 32 parts are composed hierarchically."""
+        storage, bucket = gcs
+        chunks = [i.to_bytes(2, "big") for i in range(100)]
+
+        storage.write_chunks("gs://bucket/dump.json", iter(chunks))
+
+        assert bucket.objects == {"dump.json": b"".join(chunks)}
+        assert bucket.compose_calls > 1
+
+    def test_large_chunks_split_into_bounded_parts(self, gcs, monkeypatch):
+        """Test chunks larger than the part size are uploaded in slices."""
+        storage, bucket = gcs
+        monkeypatch.setenv("GCS_UPLOAD_PART_MB", "1")
+        uploaded = []
+        upload = FakeBlob.upload_from_string
+
+        def record(blob, data, content_type=None):
+            uploaded.append(len(data))
+            upload(blob, data, content_type)
+
+        monkeypatch.setattr(FakeBlob, "upload_from_string", record)
+        chunks = [bytes([i]) * (2 * 1024 * 1024 + 10) for i in range(3)]
+
+        storage.write_chunks("gs://bucket/dump.json", iter(chunks))
+
+        assert bucket.objects == {"dump.json": b"".join(chunks)}
+        assert max(uploaded) <= 1024 * 1024
+        assert len(uploaded) == 9
+
+    def test_empty_input(self, gcs):
+        """Test that an empty stream produces an empty object."""
+        storage, bucket = gcs
+
+        storage.write_chunks("gs://bucket/dump.json", iter([]))
+
+        assert bucket.objects == {"dump.json": b""}
+
+
+class TestGCSCachedReads:
+    """Test GCSStorage range reads through the block cache."""
+
+    def test_same_range_as_uncached_reads(self, cache_dir):
+        """Test turning the cache on doesn't change what a range read returns."""
+        from poliloom.storage import GCSStorage
+
+        bucket = FakeBucket()
+        bucket.blob("dump.json").upload_from_string(b"0123456789")
+        path = "gs://bucket/dump.json"
+        client = type("FakeClient", (), {"bucket": lambda self, name: bucket})()
+        cached = GCSStorage.__new__(GCSStorage)
+        cached.cache = BlockCache(cache_dir, block_size=4)
+        cached.client = client
+        uncached = GCSStorage.__new__(GCSStorage)
+        uncached.cache = None
+        uncached.client = client
+
+        for start, end in [(0, 3), (2, 9), (5, 10), (0, 10)]:
+            assert uncached.read_range(path, start, end) == b"0123456789"[start:end]
+            assert cached.read_range(path, start, end) == uncached.read_range(
+                path, start, end
+            )
+
+    def test_replaced_object_of_same_size_not_stale(self, cache_dir):
+        """Test a rewritten object with an unchanged size is read afresh."""
+        from poliloom.storage import GCSStorage
+
+        bucket = FakeBucket()
+        storage = GCSStorage.__new__(GCSStorage)
+        storage.cache = BlockCache(cache_dir, block_size=4)
+        storage.client = type("FakeClient", (), {"bucket": lambda self, name: bucket})()
+        path = "gs://bucket/dump.json"
+
+        bucket.blob("dump.json").upload_from_string(b"old dump\n")
+        assert storage.read_range(path, 0, 3) == b"old"
+
+        bucket.blob("dump.json").upload_from_string(b"new dump\n")
+        assert storage.read_range(path, 0, 3) == b"new"
+        assert list(storage.stream_lines_range(path, 0, 9)) == [b"new dump\n"]
+
+
+class TestAsyncStorageAPI:
+    """Test the asyncio wrappers on StorageBackend."""
+
+    @pytest.mark.asyncio
+    async def test_write_then_read_text(self, cache_dir):
+        """Test round-tripping text through awrite and aread."""
+        storage = LocalStorage()
+        path = os.path.join(cache_dir, "nested", "page.html")
+
+        assert not await storage.aexists(path)
+        await storage.awrite(path, "<p>héllo</p>")
+
+        assert await storage.aexists(path)
+        assert await storage.aread(path, "r") == "<p>héllo</p>"
+
+    @pytest.mark.asyncio
+    async def test_write_then_read_bytes(self, cache_dir):
+        """Test round-tripping bytes and opening files asynchronously."""
+        storage = LocalStorage()
+        path = os.path.join(cache_dir, "page.mhtml")
+
+        await storage.awrite(path, b"\x00\x01")
+        assert await storage.aread(path) == b"\x00\x01"
+
+        f = await storage.aopen(path, "rb")
+        with f:
+            assert f.read() == b"\x00\x01"
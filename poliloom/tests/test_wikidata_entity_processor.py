@@ -237,6 +237,23 @@ class TestWikidataEntityProcessor:
         entity = WikidataEntityProcessor(entity_data)
         assert entity.get_entity_name() is None
 
+    def test_label_language_counts(self):
+        """Test labels are counted once per language using them."""
+        entity = WikidataEntityProcessor(
+            {
+                "id": "Q64",
+                "labels": {
+                    "en": {"value": "Berlin"},
+                    "de": {"value": "Berlin"},
+                    "fr": {"value": "Berlin"},
+                    "ru": {"value": "Берлин"},
+                    "xx": {},
+                },
+            }
+        )
+
+        assert entity.get_label_language_counts() == {"Berlin": 3, "Берлин": 1}
+
     def test_collect_parent_ids(self):
         """Test collecting parent IDs across all relation types."""
         entity = WikidataEntityProcessor(